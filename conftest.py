@@ -20,6 +20,7 @@ marks_default_skip = [mark_stress_tests]
 # http://blog.devork.be/2009/12/skipping-slow-test-by-default-in-pytest.html
 def pytest_addoption(parser):
     parser.addoption('--{0}'.format(mark_stress_tests), action='store_true', default=False, help='Run {0} tests (long)'.format(mark_stress_tests))
+    parser.addoption('--update-baselines', action='store_true', default=False, help='Update the peak memory baselines of the model benchmarks (tests/benchmarks/baselines.json)')
 
 
 def pytest_runtest_setup(item):
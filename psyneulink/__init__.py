@@ -30,22 +30,20 @@ from . import components
 from . import globals
 from . import library
 from . import scheduling
-from ._version import get_versions
+from ._version import get_versions as _get_versions
 from .components import *
 from .globals import *
-from .library import *
 from .scheduling import *
+from .globals.utilities import lazy_import_submodules as _lazy_import_submodules
 
 __all__ = list(components.__all__)
 __all__.extend(composition.__all__)
 __all__.extend(globals.__all__)
-__all__.extend(library.__all__)
 __all__.extend(scheduling.__all__)
 
-
-# set __version__ based on versioneer
-__version__ = get_versions()['version']
-del get_versions
+# the library is imported (and its names added to __all__) when one of them is first requested (e.g., psyneulink.LCA);
+# __version__ is set based on versioneer when first requested (which, in a git checkout, runs git)
+_lazy_import_submodules(__name__, ['library'], lazy_attributes={'__version__': lambda: _get_versions()['version']})
 
 # suppress numpy overflow and underflow errors
 _numpy.seterr(over='ignore', under='ignore')
@@ -408,16 +408,18 @@ from collections import Iterable, OrderedDict, UserDict
 from enum import Enum, IntEnum
 
 import numpy as np
-import typecheck as tc
 
+from psyneulink.globals import profiling
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import Context, ContextFlags, _get_time
 from psyneulink.globals.keywords import COMPONENT_INIT, CONTEXT, CONTROL_PROJECTION, DEFERRED_INITIALIZATION, FUNCTION, FUNCTION_CHECK_ARGS, FUNCTION_PARAMS, INITIALIZING, INIT_FULL_EXECUTE_METHOD, INPUT_STATES, LEARNING, LEARNING_PROJECTION, LOG_ENTRIES, MATRIX, MODULATORY_SPEC_KEYWORDS, NAME, OUTPUT_STATES, PARAMS, PARAMS_CURRENT, PREFS_ARG, SEPARATOR_BAR, SIZE, USER_PARAMS, VALUE, VARIABLE, kwComponentCategory
 from psyneulink.globals.log import LogCondition
 from psyneulink.scheduling.condition import AtTimeStep, Never
 from psyneulink.globals.preferences.componentpreferenceset import ComponentPreferenceSet, kpVerbosePref
 from psyneulink.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel, PreferenceSet
+from psyneulink.globals.profiling import ProfilerPhase
 from psyneulink.globals.registry import register_category
-from psyneulink.globals.utilities import ContentAddressableList, ReadOnlyOrderedDict, convert_all_elements_to_np_array, convert_to_np_array, get_deepcopy_with_shared_keys, is_instance_or_subclass, is_matrix, iscompatible, kwCompatibilityLength, object_has_single_value, prune_unused_args
+from psyneulink.globals.utilities import ContentAddressableList, ReadOnlyOrderedDict, cast_to_dtype, convert_all_elements_to_np_array, convert_to_np_array, get_deepcopy_with_shared_keys, is_instance_or_subclass, is_matrix, is_sparse_matrix, iscompatible, kwCompatibilityLength, object_has_single_value, prune_unused_args
 
 __all__ = [
     'Component', 'COMPONENT_BASE_CLASS', 'component_keywords', 'ComponentError', 'ComponentLog',
@@ -880,6 +882,9 @@ class Component(object):
 
     exclude_from_parameter_states = [INPUT_STATES, OUTPUT_STATES]
 
+    # Floating point dtype to which values are cast (None = no casting);  assigned by _assign_dtype
+    _dtype = None
+
     # IMPLEMENTATION NOTE: This is needed so that the State class can be used with ContentAddressableList,
     #                      which requires that the attribute used for addressing is on the class;
     #                      it is also declared as a property, so that any assignments are validated to be strings,
@@ -1560,7 +1565,7 @@ class Component(object):
         self.user_params_for_instantiation = OrderedDict()
         for param_name in sorted(list(self.user_params.keys())):
             param_value = self.user_params[param_name]
-            if isinstance(param_value, (str, np.ndarray, tuple)):
+            if isinstance(param_value, (str, np.ndarray, tuple)) or is_sparse_matrix(param_value):
                 self.user_params_for_instantiation[param_name] = param_value
             elif isinstance(param_value, Iterable):
                 self.user_params_for_instantiation[param_name] = type(self.user_params[param_name])()
@@ -1644,13 +1649,15 @@ class Component(object):
         if hasattr(self, "parameter_states"):
             if param in self.parameter_states:
                 new_state_value = self.parameter_states[param].execute(context=ContextFlags.EXECUTING)
-                self.parameter_states[param].value = new_state_value
+                self.parameter_states[param].value = cast_to_dtype(new_state_value,
+                                                                   self.parameter_states[param]._dtype)
         elif hasattr(self, "owner"):
             if hasattr(self.owner, "parameter_states"):
                 if param in self.owner.parameter_states:
                     new_state_value = self.owner.parameter_states[param].execute(
                         context=ContextFlags.EXECUTING)
-                    self.owner.parameter_states[param].value = new_state_value
+                    self.owner.parameter_states[param].value = cast_to_dtype(new_state_value,
+                                                                             self.owner.parameter_states[param]._dtype)
 
     def _check_args(self, variable=None, params=None, target_set=None, context=None):
         """validate variable and params, instantiate variable (if necessary) and assign any runtime params.
@@ -2148,7 +2155,7 @@ class Component(object):
         if variable is None:
             return variable
 
-        if not isinstance(variable, (list, np.ndarray)):
+        if not isinstance(variable, (list, np.ndarray)) and not is_sparse_matrix(variable):
             variable = np.atleast_1d(variable)
 
         try:
@@ -2723,6 +2730,31 @@ class Component(object):
             ComponentError("Reinitializing {} is not allowed because this Component is not stateful. "
                            "(It does not have an accumulator to reinitialize).".format(self.name))
 
+    def _assign_dtype(self, dtype):
+        """Cast the floating point arrays of the Component to **dtype**
+
+        Casts the arrays assigned to the Component's attributes (including the backing fields of its parameters) and
+        its `instance_defaults <Component.instance_defaults>`, and then does the same for the Components it owns
+        (e.g., its `function_object <Component.function_object>` and any `States <State>` it has).  Used by `System`
+        to implement its `dtype <System.dtype>` policy.
+        """
+        self._dtype = dtype
+
+        for attributes in (self.__dict__, self.instance_defaults.__dict__):
+            for attr, value in list(attributes.items()):
+                cast_value = cast_to_dtype(value, dtype)
+                if cast_value is not value:
+                    attributes[attr] = cast_value
+
+        owned_components = [value for value in self.__dict__.values()
+                            if isinstance(value, Component) and value is not self
+                            and getattr(value, 'owner', None) is self]
+        for states_attr in ('input_states', '_parameter_states', 'output_states'):
+            owned_components.extend(self.__dict__.get(states_attr) or [])
+
+        for component in owned_components:
+            component._assign_dtype(dtype)
+
     def execute(self, variable=None, runtime_params=None, context=None):
         return self._execute(variable=variable, runtime_params=runtime_params, context=context)
 
@@ -2769,6 +2801,24 @@ class Component(object):
 
         return value
 
+    @property
+    def random_state(self):
+        """The source of random numbers for the Component:  the `np.random.RandomState` assigned to it (e.g., by the
+        `seed <System.seed>` of a `System`) or, if none has been assigned, that of its owner or, if it has no owner,
+        the global state of `np.random`.
+        """
+        random_state = self.__dict__.get('_random_state')
+        if random_state is not None:
+            return random_state
+        owner = getattr(self, 'owner', None)
+        if isinstance(owner, Component) and owner is not self:
+            return owner.random_state
+        return np.random
+
+    @random_state.setter
+    def random_state(self, random_state):
+        self._random_state = random_state
+
     @property
     def current_execution_count(self):
         """Maintains a simple count of executions over the life of the Component,
@@ -2928,7 +2978,13 @@ class Component(object):
     @value.setter
     def value(self, assignment):
         self._value = assignment
-        self.log._log_value(assignment)
+        profiler = profiling._active_profiler
+        if profiler is None:
+            self.log._log_value(assignment)
+        else:
+            start = profiling.perf_counter()
+            self.log._log_value(assignment)
+            profiler.record(self, ProfilerPhase.LOGGING, profiling.perf_counter() - start)
 
     @property
     def verbosePref(self):
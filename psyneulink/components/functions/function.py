@@ -188,15 +188,15 @@ Class Reference
 import numbers
 import warnings
 
-from collections import namedtuple, deque
+from collections import namedtuple
 from enum import Enum, IntEnum
 from random import randint
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.component import ComponentError, DefaultsFlexibility, function_type, method_type, parameter_keywords
 from psyneulink.components.shellclasses import Function
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import ACCUMULATOR_INTEGRATOR_FUNCTION, \
     ADAPTIVE_INTEGRATOR_FUNCTION, ALL, ARGUMENT_THERAPY_FUNCTION, AUTO_ASSIGN_MATRIX, HAS_INITIALIZERS, \
@@ -228,7 +228,7 @@ from psyneulink.globals.keywords import ACCUMULATOR_INTEGRATOR_FUNCTION, \
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set, kpReportOutputPref
 from psyneulink.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel
 from psyneulink.globals.registry import register_category
-from psyneulink.globals.utilities import call_with_pruned_args, is_distance_metric, is_iterable, is_matrix, is_numeric, iscompatible, np_array_less_than_2d, parameter_spec
+from psyneulink.globals.utilities import combine_sparse_entries, convert_to_np_array, get_signature_info, is_distance_metric, is_iterable, is_matrix, is_numeric, is_sparse_matrix, iscompatible, np_array_less_than_2d, parameter_spec
 
 __all__ = [
     'AccumulatorIntegrator', 'AdaptiveIntegrator', 'ADDITIVE', 'ADDITIVE_PARAM',
@@ -779,7 +779,7 @@ class Function_Base(Function):
                                 format(self.functionOutputType, self.__class__.__name__))
 
         # Can't convert from arrays of length > 1 to number
-        if (len(self.instance_defaults.variable) > 1 and (self.functionOutputType is FunctionOutputType.RAW_NUMBER)):
+        if (self.functionOutputType is FunctionOutputType.RAW_NUMBER and len(self.instance_defaults.variable) > 1):
             raise FunctionError(
                 "{0} can't be set to return a single number since its variable has more than one number".
                 format(self.__class__.__name__))
@@ -1045,6 +1045,7 @@ class UserDefinedFunction(Function_Base):
     UserDefinedFunction(        \
          custom_function=None,  \
          default_variable=None, \
+         vectorized=False,      \
          params=None,           \
          owner=None,            \
          name=None,             \
@@ -1065,8 +1066,8 @@ class UserDefinedFunction(Function_Base):
 
     * It must have **at least one argument** (that can be a positional or a keyword argument);  this will be treated
       as the `variable <UserDefinedFunction.variable>` attribute of the UDF's `function <UserDefinedFunction.function>`.
-      When the UDF calls the function or method that it wraps, an initial attempt is made to do so with **variable**
-      as the name of the first argument; if that fails, it is called positionally.  The argument is always passed as a
+      When the UDF calls the function or method that it wraps, **variable** is passed by name if that is the name of
+      the first argument; otherwise, it is passed positionally.  The argument is always passed as a
       2d np.array, that may contain one or more items (elements in axis 0), depending upon the Component to which the
       UDF is assigned.  It is the user's responsibility to insure that the number of items expected in the first
       argument of the function or method is compatible with the circumstances in which it will be called.
@@ -1087,8 +1088,12 @@ class UserDefinedFunction(Function_Base):
     .. _UDF_Params_Context:
 
     * It may include **context** and **params** arguments;  these are not required, but can be included to receive
-      information about the current conditions of execution.  When the function or method is called, an initial attempt
-      is made to do so with these arguments; if that fails, it is called again without them.
+      information about the current conditions of execution.  They are passed to the function or method only if it
+      has arguments with those names (or accepts **kwargs**).
+
+      The signature of the function or method is analyzed only once, when the UDF is created (or its `custom_function
+      <UserDefinedFunction.custom_function>` is reassigned), to determine how it should be called;  this is not
+      repeated each time the UDF is executed.
     ..
     .. _UDF_Modulatory_Params:
 
@@ -1105,6 +1110,18 @@ class UserDefinedFunction(Function_Base):
       # IMPLEMENT INTERFACE FOR OTHER ModulationParam TYPES (i.e., for ability to add new custom ones)
       COMMENT
 
+    .. _UDF_Vectorized:
+
+    * If the function or method can compute its result for a set of variables at once (for example, if it uses only
+      numpy operations that are applied along the last axis of its first argument), this can be declared by specifying
+      **vectorized** as `True` in the constructor for the UDF.  The UDF's `execute_batch
+      <UserDefinedFunction.execute_batch>` method then passes all of the variables to it in a single call, stacked
+      along a new first axis;  otherwise, `execute_batch <UserDefinedFunction.execute_batch>` calls it once for each
+      variable.  A vectorized UDF assigned as the `cost_function <EVCControlMechanism.cost_function>` or
+      `combine_outcome_and_cost_function <EVCControlMechanism.combine_outcome_and_cost_function>` of an
+      `EVCControlMechanism` is also called once for all of the `allocation_policies <EVCControlMechanism.allocation_policy>`
+      evaluated together (see `ValueFunction.compute_batch`).
+
     .. tip::
        The format of the `variable <UserDefinedFunction.variable>` passed to the `custom_function
        <UserDefinedFunction.custom_function>` function can be verified by adding a ``print(variable)`` or
@@ -1312,6 +1329,10 @@ class UserDefinedFunction(Function_Base):
         specifies the function to "wrap." It can be any function or method, including a lambda function;
         see `above <UDF_Description>` for additional details.
 
+    vectorized : bool : default False
+        specifies whether **custom_function** can be called with a set of variables stacked along a new first axis,
+        and return the corresponding set of results (see `above <UDF_Vectorized>`).
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the function.
         This can be used to define an `additive_param <UserDefinedFunction.additive_param>` and/or
@@ -1340,6 +1361,11 @@ class UserDefinedFunction(Function_Base):
     custom_function : function
         the user-specified function: called by the Function's `owner <Function_Base.owner>` when it is executed.
 
+    vectorized : bool
+        determines whether `execute_batch <UserDefinedFunction.execute_batch>` calls `custom_function
+        <UserDefinedFunction.custom_function>` once for all of the variables, or once for each of them
+        (see `above <UDF_Vectorized>`).
+
     additive_param : str
         this contains the name of the additive_param, if one has been specified for the UDF
         (see `above <UDF_Modulatory_Params>` for details).
@@ -1387,6 +1413,7 @@ class UserDefinedFunction(Function_Base):
     def __init__(self,
                  custom_function=None,
                  default_variable=None,
+                 vectorized:bool=False,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None,
@@ -1401,9 +1428,11 @@ class UserDefinedFunction(Function_Base):
             """
             from inspect import signature, _empty
             try:
-                arg_names = custom_function.__code__.co_varnames
+                custom_function.__code__
             except AttributeError:
                 raise FunctionError("Can't get __code__ for custom_function")
+            # (use the parameters of the signature, which exclude the self argument of a bound method)
+            arg_names = get_signature_info(custom_function).parameter_names
             args = {}
             defaults = {}
             for arg_name, arg in signature(custom_function).parameters.items():
@@ -1429,6 +1458,8 @@ class UserDefinedFunction(Function_Base):
 
             return variable, args, defaults
 
+        self.vectorized = vectorized
+
         # Get variable and names of other any other args for custom_function and assign to cust_fct_params
         if params is not None and CUSTOM_FUNCTION in params:
             custom_function = params[CUSTOM_FUNCTION]
@@ -1477,6 +1508,43 @@ class UserDefinedFunction(Function_Base):
 
         self.functionOutputType = None
 
+    def _get_custom_function_caller(self):
+        """Return a function that calls custom_function with the arguments it accepts from a dict of kwargs
+
+        The signature of custom_function is analyzed only when it is first called (or is reassigned), so that this is
+        not repeated on every call;  variable is passed by name if that is the name of custom_function's first
+        argument, and positionally otherwise (unless a value is passed explicitly for the first argument by name).
+        """
+        custom_function = self.custom_function
+        if custom_function is getattr(self, '_custom_function_called', None):
+            return self._custom_function_caller
+
+        signature_info = get_signature_info(custom_function)
+        keyword_names = signature_info.keyword_names
+        first_arg = signature_info.parameter_names[0] if signature_info.parameter_names else None
+
+        if signature_info.has_kwargs_param:
+            def select_kwargs(kwargs):
+                return kwargs
+        else:
+            def select_kwargs(kwargs):
+                return {k: v for k, v in kwargs.items() if k in keyword_names}
+
+        if first_arg is None or first_arg == VARIABLE:
+            def call_custom_function(kwargs):
+                return custom_function(**select_kwargs(kwargs))
+        else:
+            def call_custom_function(kwargs):
+                if VARIABLE not in kwargs or first_arg in kwargs:
+                    return custom_function(**select_kwargs(kwargs))
+                kwargs = dict(kwargs)
+                variable = kwargs.pop(VARIABLE)
+                return custom_function(variable, **select_kwargs(kwargs))
+
+        self._custom_function_called = custom_function
+        self._custom_function_caller = call_custom_function
+        return call_custom_function
+
     def function(self, **kwargs):
 
         # Update value of parms in cust_fct_params
@@ -1487,14 +1555,40 @@ class UserDefinedFunction(Function_Base):
             else:
             # Otherwise, get current value from ParameterState (in case it is being modulated by ControlSignal(s)
                 self.cust_fct_params[param] = self.get_current_function_param(param)
-        kwargs.update(self.cust_fct_params)
+        # Arguments passed explicitly by the caller (e.g., the cost passed by a ValueFunction) take precedence
+        for param, value in self.cust_fct_params.items():
+            kwargs.setdefault(param, value)
 
-        try:
-            # Try calling with full list of args (including context and params)
-            return call_with_pruned_args(self.custom_function, **kwargs)
-        except TypeError:
-            # Try calling with just variable and cust_fct_params
-            return self.custom_function(kwargs[VARIABLE], **self.cust_fct_params)
+        return self._get_custom_function_caller()(kwargs)
+
+    def execute_batch(self, variables, **kwargs):
+        """
+        execute_batch(variables, **kwargs)
+
+        Call `custom_function <UserDefinedFunction.custom_function>` for each of a set of variables.
+
+        If the UDF is `vectorized <UserDefinedFunction.vectorized>`, **variables** are passed to `custom_function
+        <UserDefinedFunction.custom_function>` in a single call, stacked along a new first axis;  otherwise, it is
+        called once for each of them.  Any other arguments are passed to every call, as in `function
+        <UserDefinedFunction.function>`.
+
+        Arguments
+        ---------
+
+        variables : list or np.array
+            each item is used as the `variable <UserDefinedFunction.variable>` of one call to `custom_function
+            <UserDefinedFunction.custom_function>`.
+
+        Returns
+        -------
+
+        results : np.array
+            the result for each item of **variables**, stacked along the first axis.
+
+        """
+        if self.vectorized:
+            return np.asarray(self.function(variable=np.asarray(variables), **kwargs))
+        return np.array([self.function(variable=variable, **kwargs) for variable in variables])
 
 
 # region **********************************  COMBINATION FUNCTIONS  ****************************************************
@@ -3788,7 +3882,7 @@ class OneHot(TransferFunction):  # ---------------------------------------------
             if not prob_dist.any():
                 return v
             cum_sum = np.cumsum(prob_dist)
-            random_value = np.random.uniform()
+            random_value = self.random_state.uniform()
             chosen_item = next(element for element in cum_sum if element > random_value)
             chosen_in_cum_sum = np.where(cum_sum == chosen_item, 1, 0)
             if self.mode is PROB:
@@ -4155,7 +4249,7 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
         specifies a template for the value to be transformed; length must equal the number of rows of `matrix
         <LinearMatrix.matrix>`.
 
-    matrix : number, list, 1d or 2d np.ndarray, np.matrix, function, or matrix keyword : default IDENTITY_MATRIX
+    matrix : number, list, 1d or 2d np.ndarray, np.matrix, scipy.sparse matrix, function, or matrix keyword : default IDENTITY_MATRIX
         specifies matrix used to transform `variable <LinearMatrix.variable>`
         (see `matrix <LinearMatrix.matrix>` for specification details).
 
@@ -4197,11 +4291,12 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
     variable : 1d np.array
         contains value to be transformed.
 
-    matrix : 2d np.array
+    matrix : 2d np.array or scipy.sparse matrix
         matrix used to transform `variable <LinearMatrix.variable>`.
         Can be specified as any of the following:
             * number - used as the filler value for all elements of the :keyword:`matrix` (call to np.fill);
             * list of arrays, 2d np.array or np.matrix - assigned as the value of :keyword:`matrix`;
+            * scipy.sparse matrix - kept sparse (in CSR or CSC format), and used without conversion to a dense array;
             * matrix keyword - see `MatrixKeywords` for list of options.
         Rows correspond to elements of the input array (outer index), and
         columns correspond to elements of the output array (inner index).
@@ -4356,6 +4451,18 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
                     if isinstance(param_value, numbers.Number):
                         continue
 
+                    # sparse matrix provided, so check that number of rows equals length of sender vector (variable)
+                    elif is_sparse_matrix(param_value):
+                        if param_value.shape[0] != sender_len:
+                            raise FunctionError("The number of rows ({}) of the "
+                                                "matrix provided for {} function "
+                                                "of {} does not equal the length "
+                                                "({}) of the sender vector "
+                                                "(variable)".format(param_value.shape[0],
+                                                                    self.name,
+                                                                    self.owner_name,
+                                                                    sender_len))
+
                     # np.matrix or np.ndarray provided, so validate that it is numeric and check dimensions
                     elif isinstance(param_value, (list, np.ndarray, np.matrix)):
                         # get dimensions specified by:
@@ -4466,8 +4573,16 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
             if MATRIX in param_set:
                 param_value = param_set[MATRIX]
 
+                # sparse matrix specified; verify that it is compatible with variable
+                if is_sparse_matrix(param_value):
+                    if param_value.shape[0] != np.size(np.atleast_2d(self.instance_defaults.variable), 1):
+                        raise FunctionError("Specification of matrix and/or default_variable for {} is not valid. The "
+                                            "shapes of variable {} and matrix {} are not compatible for multiplication".
+                                            format(self.name, np.shape(np.atleast_2d(self.instance_defaults.variable)),
+                                                   param_value.shape))
+
                 # numeric value specified; verify that it is compatible with variable
-                if isinstance(param_value, (float, list, np.ndarray, np.matrix)):
+                elif isinstance(param_value, (float, list, np.ndarray, np.matrix)):
                     if np.size(np.atleast_2d(param_value),0)!=np.size(np.atleast_2d(self.instance_defaults.variable),1):
                         raise FunctionError("Specification of matrix and/or default_variable for {} is not valid. The "
                                             "shapes of variable {} and matrix {} are not compatible for multiplication".
@@ -4528,7 +4643,8 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
                 # receiver = sender
             receiver_len = receiver.shape[0]
 
-            matrix = get_matrix(specification, rows=sender_len, cols=receiver_len, context=context)
+            matrix = get_matrix(specification, rows=sender_len, cols=receiver_len, context=context,
+                                random_state=self.random_state)
 
             # This should never happen (should have been picked up in validate_param or above)
             if matrix is None:
@@ -4537,6 +4653,8 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
                                     format(specification, self.name, self.owner_name, MATRIX_KEYWORD_NAMES))
             else:
                 return matrix
+        elif is_sparse_matrix(specification):
+            return get_matrix(specification)
         else:
             return np.array(specification)
 
@@ -4569,6 +4687,9 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
         # Note: this calls _validate_variable and _validate_params which are overridden above;
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
         matrix = self.get_current_function_param(MATRIX)
+        if is_sparse_matrix(matrix):
+            # scipy.sparse only implements the product with the matrix on the left, so use its transpose
+            return np.asarray(matrix.T.dot(np.transpose(variable))).T
         return np.dot(variable, matrix)
 
     @staticmethod
@@ -4610,7 +4731,7 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
 #         return True
 #     return False
 
-def get_matrix(specification, rows=1, cols=1, context=None):
+def get_matrix(specification, rows=1, cols=1, context=None, random_state=None):
     """Returns matrix conforming to specification with dimensions = rows x cols or None
 
      Specification can be a matrix keyword, filler value or np.ndarray
@@ -4624,10 +4745,17 @@ def get_matrix(specification, rows=1, cols=1, context=None):
             + FULL_CONNECTIVITY_MATRIX: all 1's
             + RANDOM_CONNECTIVITY_MATRIX (random floats uniformly distributed between 0 and 1)
         + 2D list or np.ndarray of numbers
+        + scipy.sparse matrix (returned in CSR or CSC format;  other sparse formats are converted to CSR)
 
      Returns 2D np.array with length=rows in dim 0 and length=cols in dim 1, or none if specification is not recognized
     """
 
+    # Sparse matrix provided;  keep it sparse, using a format that supports efficient arithmetic and products
+    if is_sparse_matrix(specification):
+        if specification.format in {'csr', 'csc'}:
+            return specification
+        return specification.tocsr()
+
     # Matrix provided (and validated in _validate_params); convert to np.array
     if isinstance(specification, (list, np.matrix)):
         specification = np.array(specification)
@@ -4664,7 +4792,8 @@ def get_matrix(specification, rows=1, cols=1, context=None):
         return 1-np.identity(rows)
 
     if specification == RANDOM_CONNECTIVITY_MATRIX:
-        return np.random.rand(rows, cols)
+        random_state = random_state if random_state is not None else np.random
+        return random_state.rand(rows, cols)
 
     # Function is specified, so assume it uses random.rand() and call with sender_len and receiver_len
     if isinstance(specification, function_type):
@@ -4983,8 +5112,8 @@ class Integrator(IntegratorFunction):  # ---------------------------------------
     def _instantiate_attributes_before_function(self, function=None, context=None):
 
         # use np.broadcast_to to guarantee that all initializer type attributes take on the same
-        # shape as variable
-        if not np.isscalar(self.instance_defaults.variable):
+        # shape as variable (sparse matrices are left as is)
+        if not np.isscalar(self.instance_defaults.variable) and not is_sparse_matrix(self.instance_defaults.variable):
             for attr in self.initializers:
                 setattr(self, attr, np.broadcast_to(getattr(self, attr), self.instance_defaults.variable.shape).copy())
 
@@ -5032,7 +5161,11 @@ class Integrator(IntegratorFunction):  # ---------------------------------------
 
             initial_value = self.get_current_function_param(initial_value_name)
 
-            if isinstance(initial_value, (list, np.ndarray)):
+            if is_sparse_matrix(initial_value):
+                if np.shape(initial_value) != np.shape(default_variable):
+                    raise FunctionError("{}'s {} ({}) is incompatible with its default_variable ({}) ."
+                                        .format(self.name, initial_value_name, initial_value, default_variable))
+            elif isinstance(initial_value, (list, np.ndarray)):
                 if len(initial_value) != 1:
                     # np.atleast_2d may not be necessary here?
                     if np.shape(np.atleast_2d(initial_value))!= np.shape(np.atleast_2d(default_variable)):
@@ -5043,7 +5176,7 @@ class Integrator(IntegratorFunction):  # ---------------------------------------
                                     .format(self.name, initial_value_name, initial_value))
 
     def _initialize_previous_value(self, initializer):
-        self.previous_value = np.atleast_1d(initializer)
+        self.previous_value = convert_to_np_array(initializer, 1)
 
     def _try_execute_param(self, param, var):
 
@@ -5058,13 +5191,18 @@ class Integrator(IntegratorFunction):  # ---------------------------------------
         # param is one function
         elif callable(param):
             # NOTE: np.atleast_2d will cause problems if the param has "rows" of different lengths
-            new_param = []
-            for row in np.atleast_2d(var):
-                new_row = []
-                for item in row:
-                    new_row.append(param())
-                new_param.append(new_row)
-            param = new_param
+            distribution = getattr(param, '__self__', None)
+            if isinstance(distribution, DistributionFunction):
+                # draw a sample for every element of var at once
+                param = distribution.sample(np.shape(np.atleast_2d(var)), self.random_state)
+            else:
+                new_param = []
+                for row in np.atleast_2d(var):
+                    new_row = []
+                    for item in row:
+                        new_row.append(param())
+                    new_param.append(new_row)
+                param = new_param
 
         return param
 
@@ -5357,7 +5495,7 @@ class SimpleIntegrator(Integrator):  # -----------------------------------------
 
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
-        rate = np.array(self.get_current_function_param(RATE)).astype(float)
+        rate = np.asfarray(self.get_current_function_param(RATE), dtype=self._dtype or float)
 
         offset = self.get_current_function_param(OFFSET)
         if offset is None:
@@ -5588,7 +5726,7 @@ class ConstantIntegrator(Integrator):  # ---------------------------------------
         """
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
-        rate = np.array(self.rate).astype(float)
+        rate = np.asfarray(self.rate, dtype=self._dtype or float)
         offset = self.get_current_function_param(OFFSET)
         scale = self.get_current_function_param(SCALE)
         noise = self._try_execute_param(self.noise, variable)
@@ -5608,6 +5746,153 @@ class ConstantIntegrator(Integrator):  # ---------------------------------------
         return adjusted_value
 
 
+class _RingBuffer:
+    """Fixed-capacity record of the items appended to a `Buffer`, in the order in which they were appended
+
+    Items are stored as the rows of a 2d np.array (flattened to the same width), and each is written twice -- at
+    positions i and i + maxlen -- so that the most recent **maxlen** items always occupy a contiguous block of rows
+    that can be returned as a view in chronological order.  If **maxlen** is None, the array grows (doubling its
+    capacity) as items are appended.  Multiplying or adding a value to every item (`scale` and `shift`) is applied
+    lazily, by updating an affine transform of the stored rows rather than the rows themselves.
+
+    The shape of each item is recorded, so that the items are returned with their original shape if they all have the
+    same one or, if they do not, with the shape of the oldest one (as np.array does for a sequence of items that have
+    the same size but different shapes).
+    """
+
+    def __init__(self, maxlen=None, dtype=float):
+        self.maxlen = maxlen
+        self.dtype = np.dtype(dtype)
+        self._data = None
+        self._shapes = []
+        self._shape_counts = {}
+        self._start = 0
+        self._length = 0
+        self._scale = 1.0
+        self._offset = 0.0
+        self._identity = True
+        self._limit = np.finfo(self.dtype).max ** 0.25
+
+    def __len__(self):
+        return self._length
+
+    def clear(self):
+        self._start = 0
+        self._length = 0
+        self._shapes = []
+        self._shape_counts = {}
+        self._reset_transform()
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def append(self, item):
+        item = np.asarray(item, dtype=self.dtype)
+        if self._data is None:
+            capacity = 2 * self.maxlen if self.maxlen is not None else 8
+            self._data = np.zeros((capacity, item.size), dtype=self.dtype)
+        elif item.size != self._data.shape[1]:
+            raise FunctionError("Item ({}) appended to a Buffer must have the same size as those already in it ({})".
+                                format(item, self._data.shape[1]))
+        if self.maxlen == 0:
+            return
+
+        row = item.ravel()
+        if not self._identity:
+            row = (row - self._offset) / self._scale
+
+        if self.maxlen is None:
+            if self._length == len(self._data):
+                self._data = np.resize(self._data, (2 * len(self._data), self._data.shape[1]))
+            self._data[self._length] = row
+            self._shapes.append(item.shape)
+            self._length += 1
+        else:
+            if self._length < self.maxlen:
+                position = self._length
+                self._shapes.append(item.shape)
+                self._length += 1
+            else:
+                position = self._start
+                self._start = (self._start + 1) % self.maxlen
+                self._count_shape(self._shapes[position], -1)
+                self._shapes[position] = item.shape
+            self._data[position] = row
+            self._data[position + self.maxlen] = row
+        self._count_shape(item.shape, 1)
+
+    def scale(self, rate):
+        """Multiply every item by **rate**"""
+        rate = self._as_row(rate)
+        self._scale = self._scale * rate
+        self._offset = self._offset * rate
+        self._identity = False
+        scale = np.abs(self._scale)
+        if np.any(scale > self._limit) or np.any(scale < 1 / self._limit):
+            self._apply_transform()
+
+    def shift(self, noise):
+        """Add **noise** to every item"""
+        self._offset = self._offset + self._as_row(noise)
+        self._identity = False
+
+    def view(self):
+        """Return the items (with any pending transform applied) as an array with one item per row, in chronological
+        order;  this is a view of the stored rows unless a transform is pending.
+        """
+        if self._data is None:
+            return np.zeros((0,), dtype=self.dtype)
+        window = self._data[self._start:self._start + self._length]
+        if not self._identity:
+            window = window * self._scale + self._offset
+        if len(self._shape_counts) == 1:
+            return window.reshape((self._length,) + next(iter(self._shape_counts)))
+        return window.reshape((self._length,) + self._shapes[self._start % len(self._shapes)])
+
+    def copy(self):
+        """Return the items as a new array (see `view`)"""
+        values = self.view()
+        return values.copy() if self._identity else values
+
+    def items(self):
+        """Return the items as a list of arrays, each with its original shape"""
+        values = self.view().reshape(self._length, -1)
+        return [values[i].reshape(self._shapes[(self._start + i) % len(self._shapes)]) for i in range(self._length)]
+
+    def astype(self, dtype):
+        buffer = _RingBuffer(self.maxlen, dtype)
+        buffer.extend(self.items())
+        return buffer
+
+    def _count_shape(self, shape, increment):
+        count = self._shape_counts.get(shape, 0) + increment
+        if count:
+            self._shape_counts[shape] = count
+        else:
+            del self._shape_counts[shape]
+
+    def _as_row(self, value):
+        value = np.asarray(value, dtype=self.dtype)
+        if value.size == 1 or self._data is None:
+            return value.ravel()[0] if value.size == 1 else value.ravel()
+        if value.size != self._data.shape[1]:
+            raise FunctionError("Value ({}) applied to the items of a Buffer must be a scalar or have the same size as "
+                                "the items ({})".format(value, self._data.shape[1]))
+        return value.ravel()
+
+    def _apply_transform(self):
+        if self._data is not None:
+            self._data *= self._scale
+            self._data += self._offset
+        self._reset_transform()
+
+    def _reset_transform(self):
+        self._scale = 1.0
+        self._offset = 0.0
+        self._identity = True
+
+
 class Buffer(Integrator):  # ------------------------------------------------------------------------------
     """
     Buffer(                     \
@@ -5632,6 +5917,11 @@ class Buffer(Integrator):  # ---------------------------------------------------
     .. note::
        Because **rate** and **noise** are applied on every call, their effects are cumulative over calls.
 
+    The deque is implemented as a ring buffer:  a preallocated np.array with a row for each item (of capacity
+    `history <Buffer.history>`), in which the oldest item is overwritten when a new one is appended, and to which
+    **rate** and **noise** are applied lazily (as a running scale and offset for all of the items), so that the cost
+    of a call does not grow with the length of the history.
+
     Arguments
     ---------
 
@@ -5696,8 +5986,9 @@ class Buffer(Integrator):  # ---------------------------------------------------
         if the **new_previous_value** argument is not specified in the call to `reinitialize
         <IntegratorFunction.reinitialize>`.
 
-    previous_value : 1d np.array : default ClassDefaults.variable
-        state of the deque prior to appending `variable <Buffer.variable>` in the current call.
+    previous_value : np.array
+        items in the deque (one per row, oldest first) prior to appending `variable <Buffer.variable>` in the current
+        call;  this is a view of the ring buffer, so it changes when new items are appended.
 
     owner : Component
         `component <Component>` to which the Function has been assigned.
@@ -5761,9 +6052,27 @@ class Buffer(Integrator):  # ---------------------------------------------------
         self.has_initializers = True
 
     def _initialize_previous_value(self, initializer):
-        initializer = initializer or []
-        self.previous_value = deque(initializer, maxlen=self.history)
-        return self.previous_value
+        self._ring_buffer = _RingBuffer(maxlen=self.history, dtype=self._dtype or float)
+        # The deque starts out empty if the initializer is None, [] or the default (np.array([0]))
+        try:
+            empty = not initializer
+        except ValueError:
+            empty = False
+        if not empty:
+            self._ring_buffer.extend(initializer)
+        return self._ring_buffer.copy()
+
+    @property
+    def previous_value(self):
+        return self._ring_buffer.view()
+
+    @previous_value.setter
+    def previous_value(self, value):
+        self._initialize_previous_value(value)
+
+    def _assign_dtype(self, dtype):
+        super()._assign_dtype(dtype)
+        self._ring_buffer = self._ring_buffer.astype(dtype or float)
 
     def _instantiate_attributes_before_function(self, function=None, context=None):
 
@@ -5797,12 +6106,7 @@ class Buffer(Integrator):  # ---------------------------------------------------
                                 "reinitialize previous_value".format(args,
                                                                      self.name))
 
-        if reinitialization_value is None or reinitialization_value == []:
-            self.previous_value.clear()
-            self.value = deque([], maxlen=self.history)
-
-        else:
-            self.value = self._initialize_previous_value(reinitialization_value)
+        self.value = self._initialize_previous_value(reinitialization_value)
 
         return self.value
 
@@ -5830,13 +6134,13 @@ class Buffer(Integrator):  # ---------------------------------------------------
         Returns
         -------
 
-        updated value of deque : deque
+        updated value of deque : np.array
 
         """
 
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
-        rate = np.array(self.get_current_function_param(RATE)).astype(float)
+        rate = np.asfarray(self.get_current_function_param(RATE), dtype=self._dtype or float)
 
         # execute noise if it is a function
         noise = self._try_execute_param(self.get_current_function_param(NOISE), variable)
@@ -5846,17 +6150,19 @@ class Buffer(Integrator):  # ---------------------------------------------------
         if self.context.initialization_status == ContextFlags.INITIALIZING:
             return variable
 
-        self.previous_value.append(variable)
+        if self._ring_buffer.maxlen != self.history:
+            self._initialize_previous_value(self._ring_buffer.items()[-self.history:] if self.history else [])
 
-        # Apply rate and/or noise if they are specified
-        if rate != 1.0:
-            self.previous_value *= rate
-        if noise:
-            self.previous_value += noise
+        self._ring_buffer.append(variable)
 
-        self.previous_value = deque(self.previous_value, maxlen=self.history)
+        # Apply rate and/or noise if they are specified
+        if np.any(rate != 1.0):
+            self._ring_buffer.scale(rate)
+        if np.any(noise):
+            self._ring_buffer.shift(noise)
 
-        return self.previous_value
+        # Return a copy, so that the value is not changed by subsequent calls
+        return self._ring_buffer.copy()
 
 
 class AdaptiveIntegrator(Integrator):  # -------------------------------------------------------------------------------
@@ -6125,7 +6431,7 @@ class AdaptiveIntegrator(Integrator):  # ---------------------------------------
         """
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
-        rate = np.array(self.get_current_function_param(RATE)).astype(float)
+        rate = np.asfarray(self.get_current_function_param(RATE), dtype=self._dtype or float)
         offset = self.get_current_function_param(OFFSET)
         # execute noise if it is a function
         noise = self._try_execute_param(self.get_current_function_param(NOISE), variable)
@@ -6374,7 +6680,7 @@ class DriftDiffusionIntegrator(Integrator):  # ---------------------------------
         """
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
-        rate = np.array(self.get_current_function_param(RATE)).astype(float)
+        rate = np.asfarray(self.get_current_function_param(RATE), dtype=self._dtype or float)
         offset = self.get_current_function_param(OFFSET)
         noise = self.get_current_function_param(NOISE)
         threshold = self.get_current_function_param(THRESHOLD)
@@ -6383,7 +6689,7 @@ class DriftDiffusionIntegrator(Integrator):  # ---------------------------------
         previous_value = np.atleast_2d(self.previous_value)
 
         value = previous_value + rate * variable * time_step_size  \
-                + np.sqrt(time_step_size * noise) * np.random.normal()
+                + np.sqrt(time_step_size * noise) * self.random_state.normal()
 
         if np.all(abs(value) < threshold):
             adjusted_value = value + offset
@@ -6611,7 +6917,7 @@ class OrnsteinUhlenbeckIntegrator(Integrator):  # ------------------------------
         """
 
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
-        rate = np.array(self.get_current_function_param(RATE)).astype(float)
+        rate = np.asfarray(self.get_current_function_param(RATE), dtype=self._dtype or float)
         offset = self.get_current_function_param(OFFSET)
         time_step_size = self.get_current_function_param(TIME_STEP_SIZE)
         decay = self.get_current_function_param(DECAY)
@@ -6621,7 +6927,7 @@ class OrnsteinUhlenbeckIntegrator(Integrator):  # ------------------------------
 
         # dx = (lambda*x + A)dt + c*dW
         value = previous_value + (decay * previous_value - rate * variable) * time_step_size + np.sqrt(
-            time_step_size * noise) * np.random.normal()
+            time_step_size * noise) * self.random_state.normal()
 
         # If this NOT an initialization run, update the old value and time
         # If it IS an initialization run, leave as is
@@ -7641,9 +7947,12 @@ class AccumulatorIntegrator(Integrator):  # ------------------------------------
         if increment is None:
             increment = 0.0
 
-        previous_value = np.atleast_2d(self.previous_value)
-
-        value = previous_value * rate + noise + increment
+        if is_sparse_matrix(self.previous_value):
+            # Only update the stored entries of a sparse matrix, so that it remains sparse
+            value = combine_sparse_entries(self.previous_value * rate, np.add(noise, increment))
+        else:
+            previous_value = np.atleast_2d(self.previous_value)
+            value = previous_value * rate + noise + increment
 
         # If this NOT an initialization run, update the old value
         # If it IS an initialization run, leave as is
@@ -8187,7 +8496,7 @@ class AGTUtilityIntegrator(Integrator):  # -------------------------------------
 
         """
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
-        rate = np.array(self.get_current_function_param(RATE)).astype(float)
+        rate = np.asfarray(self.get_current_function_param(RATE), dtype=self._dtype or float)
         # execute noise if it is a function
         noise = self._try_execute_param(self.get_current_function_param(NOISE), variable)
         short_term_rate = self.get_current_function_param("short_term_rate")
@@ -8791,6 +9100,19 @@ class NavarroAndFuss(IntegratorFunction): # ------------------------------------
 class DistributionFunction(Function_Base):
     componentType = DIST_FUNCTION_TYPE
 
+    def sample(self, size=None, random_state=None):
+        """Return an array of samples with shape **size** drawn from the distribution (or a single sample if **size**
+        is None), using the current values of its parameters.
+
+        This draws all of the samples in a single call to **random_state** (or, if it is None, to the Function's
+        `random_state <Component.random_state>`), and returns the same values as calling the Function once for each
+        of them in sequence.
+        """
+        return self._sample(size, random_state if random_state is not None else self.random_state)
+
+    def _sample(self, size, random_state):
+        raise FunctionError("PROGRAM ERROR: {} must implement _sample()".format(self.__class__.__name__))
+
 
 class NormalDist(DistributionFunction):
     """
@@ -8895,12 +9217,12 @@ class NormalDist(DistributionFunction):
         # Validate variable and validate params
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
+        return self._sample(None, self.random_state)
+
+    def _sample(self, size, random_state):
         mean = self.get_current_function_param(DIST_MEAN)
         standard_deviation = self.get_current_function_param(STANDARD_DEVIATION)
-
-        result = np.random.normal(mean, standard_deviation)
-
-        return result
+        return random_state.normal(mean, standard_deviation, size)
 
 
 class UniformToNormalDist(DistributionFunction):
@@ -9011,18 +9333,21 @@ class UniformToNormalDist(DistributionFunction):
                  params=None,
                  context=None):
 
+        # Validate variable and validate params
+        variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
+
+        return self._sample(None, self.random_state)
+
+    def _sample(self, size, random_state):
+
         try:
             from scipy.special import erfinv
         except:
             raise FunctionError("The UniformToNormalDist function requires the SciPy package.")
 
-        # Validate variable and validate params
-        variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
-
         mean = self.get_current_function_param(DIST_MEAN)
         standard_deviation = self.get_current_function_param(STANDARD_DEVIATION)
-
-        sample = np.random.rand(1)[0]
+        sample = random_state.rand(1)[0] if size is None else random_state.random_sample(size)
         return ((np.sqrt(2) * erfinv(2 * sample - 1)) * standard_deviation) + mean
 
 class ExponentialDist(DistributionFunction):
@@ -9109,10 +9434,11 @@ class ExponentialDist(DistributionFunction):
         # Validate variable and validate params
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
-        beta = self.get_current_function_param(BETA)
-        result = np.random.exponential(beta)
+        return self._sample(None, self.random_state)
 
-        return result
+    def _sample(self, size, random_state):
+        beta = self.get_current_function_param(BETA)
+        return random_state.exponential(beta, size)
 
 
 class UniformDist(DistributionFunction):
@@ -9208,11 +9534,12 @@ class UniformDist(DistributionFunction):
         # Validate variable and validate params
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
+        return self._sample(None, self.random_state)
+
+    def _sample(self, size, random_state):
         low = self.get_current_function_param(LOW)
         high = self.get_current_function_param(HIGH)
-        result = np.random.uniform(low, high)
-
-        return result
+        return random_state.uniform(low, high, size)
 
 
 class GammaDist(DistributionFunction):
@@ -9309,12 +9636,12 @@ class GammaDist(DistributionFunction):
         # Validate variable and validate params
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
+        return self._sample(None, self.random_state)
+
+    def _sample(self, size, random_state):
         scale = self.get_current_function_param(SCALE)
         dist_shape = self.get_current_function_param(DIST_SHAPE)
-
-        result = np.random.gamma(dist_shape, scale)
-
-        return result
+        return random_state.gamma(dist_shape, scale, size)
 
 
 class WaldDist(DistributionFunction):
@@ -9409,12 +9736,12 @@ class WaldDist(DistributionFunction):
         # Validate variable and validate params
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
+        return self._sample(None, self.random_state)
+
+    def _sample(self, size, random_state):
         scale = self.get_current_function_param(SCALE)
         mean = self.get_current_function_param(DIST_MEAN)
-
-        result = np.random.wald(mean, scale)
-
-        return result
+        return random_state.wald(mean, scale, size)
 
 
 # endregion
@@ -10798,9 +11125,10 @@ class BackPropagation(LearningFunction):
        `activation_output <BackPropagation.activation_output>` (1d np.array),
        `error_signal <BackPropagation.error_signal>` (1d np.array).
 
-    activation_derivative_fct : Function or function
+    activation_derivative_fct : Function or function : default Logistic().derivative
         specifies the derivative for the function of the Mechanism that generates
-        `activation_output <BackPropagation.activation_output>`.
+        `activation_output <BackPropagation.activation_output>`;  if it is not specified, the derivative of a
+        `Logistic` Function with its default parameters is used.
 
     COMMENT:
     error_derivative : Function or function
@@ -10901,13 +11229,17 @@ class BackPropagation(LearningFunction):
     def __init__(self,
                  default_variable=None,
                  # default_variable:tc.any(list, np.ndarray),
-                 activation_derivative_fct: tc.optional(tc.any(function_type, method_type)) = Logistic().derivative,
+                 activation_derivative_fct: tc.optional(tc.any(function_type, method_type)) = None,
                  # learning_rate: tc.optional(parameter_spec) = None,
                  learning_rate=None,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None):
 
+        # Instantiated here rather than as the default value of the argument, to keep it out of import time
+        if activation_derivative_fct is None:
+            activation_derivative_fct = Logistic().derivative
+
         error_matrix=np.zeros((len(default_variable[LEARNING_ACTIVATION_OUTPUT]),
                                len(default_variable[LEARNING_ERROR_OUTPUT])))
 
@@ -10981,7 +11313,8 @@ class BackPropagation(LearningFunction):
 
             from psyneulink.components.states.parameterstate import ParameterState
             from psyneulink.components.projections.pathway.mappingprojection import MappingProjection
-            if not isinstance(error_matrix, (list, np.ndarray, np.matrix, ParameterState, MappingProjection)):
+            if not (isinstance(error_matrix, (list, np.ndarray, np.matrix, ParameterState, MappingProjection))
+                    or is_sparse_matrix(error_matrix)):
                 raise FunctionError("The {} arg for {} ({}) must be a list, 2d np.array, ParamaterState or "
                                     "MappingProjection".format(ERROR_MATRIX, self.__class__.__name__, error_matrix))
 
@@ -11006,7 +11339,8 @@ class BackPropagation(LearningFunction):
             else:
                 param_type_string = "array or matrix"
 
-            error_matrix = np.array(error_matrix)
+            if not is_sparse_matrix(error_matrix):
+                error_matrix = np.array(error_matrix)
             rows = error_matrix.shape[WT_MATRIX_SENDERS_DIM]
             cols = error_matrix.shape[WT_MATRIX_RECEIVERS_DIM]
             activity_output_len = len(self.activation_output)
@@ -11117,7 +11451,10 @@ class BackPropagation(LearningFunction):
         activation_input = np.array(self.activation_input).reshape(len(self.activation_input), 1)
 
         # Derivative of error with respect to output activity (contribution of each output unit to the error above)
-        dE_dA = np.dot(self.error_matrix, self.error_signal)
+        if is_sparse_matrix(self.error_matrix):
+            dE_dA = self.error_matrix.dot(self.error_signal)
+        else:
+            dE_dA = np.dot(self.error_matrix, self.error_signal)
 
         # Derivative of the output activity
         dA_dW = self.activation_derivative_fct(input=self.activation_input, output=self.activation_output)
@@ -132,7 +132,6 @@ Class Reference
 import warnings
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.component import function_type, method_type
 from psyneulink.components.functions.function import BackPropagation, Hebbian, Linear, PredictionErrorDeltaFunction, Reinforcement, TDLearning
@@ -146,6 +145,7 @@ from psyneulink.components.shellclasses import Function
 from psyneulink.components.states.inputstate import InputState
 from psyneulink.components.states.outputstate import OutputState
 from psyneulink.components.states.parameterstate import ParameterState
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import BACKPROPAGATION_FUNCTION, COMPARATOR_MECHANISM, HEBBIAN_FUNCTION, IDENTITY_MATRIX, LEARNING, LEARNING_MECHANISM, MATRIX, MONITOR_FOR_LEARNING, NAME, PREDICTION_ERROR_MECHANISM, PROJECTIONS, RL_FUNCTION, SAMPLE, TARGET, TDLEARNING_FUNCTION, VARIABLE, WEIGHT
 from psyneulink.library.mechanisms.processing.objective.predictionerrormechanism import PredictionErrorMechanism
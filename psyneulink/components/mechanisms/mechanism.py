@@ -114,6 +114,24 @@ mentioned above, or using one of the following:
     specified <Process_Learning_Sequence>` for a Process; and an `ObjectiveMechanism` and `ControlMechanism
     <ControlMechanism>` are created when the `controller <System.controller>` is specified for a `System`.
 
+.. _Mechanism_Cloning:
+
+Cloning a Mechanism
+~~~~~~~~~~~~~~~~~~~
+
+Models that use many identical Mechanisms can create one as a template, and then use its `clone
+<Mechanism_Base.clone>` method to create the others.  This copies the template's States, `function
+<Mechanism_Base.function>` and parameter values, rather than parsing and validating the same specifications again for
+each one, and so is considerably faster than calling the constructor repeatedly.  The copies are independent of the
+template and of each other; however, they are not assigned any Projections, other than copies of any Projections
+between the template's own States (such as the `recurrent_projection
+<RecurrentTransferMechanism.recurrent_projection>` of a `RecurrentTransferMechanism`).  Accordingly, a Mechanism can
+only be cloned before it receives or sends any other Projections and before it is assigned to a `Process` or `System`::
+
+    >>> import psyneulink as pnl
+    >>> template = pnl.TransferMechanism(size=3, function=pnl.Logistic(gain=2.0))
+    >>> hidden_units = template.clone(3, names=['H1', 'H2', 'H3'])
+
 .. _Mechanism_State_Specification:
 
 Specifying States
@@ -928,6 +946,7 @@ Class Reference
 
 """
 
+import copy
 import inspect
 import logging
 
@@ -935,16 +954,17 @@ from collections import OrderedDict
 from inspect import isclass
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.component import Component, function_type, method_type
 from psyneulink.components.functions.function import Linear
 from psyneulink.components.shellclasses import Function, Mechanism, Projection, State
 from psyneulink.components.states.inputstate import InputState, DEFER_VARIABLE_SPEC_TO_MECH_MSG
 from psyneulink.components.states.modulatorysignals.modulatorysignal import _is_modulatory_spec
-from psyneulink.components.states.outputstate import OutputState
+from psyneulink.components.states.outputstate import OutputState, _StandardOutputStateValues
 from psyneulink.components.states.parameterstate import ParameterState
 from psyneulink.components.states.state import REMOVE_STATES, _parse_state_spec
+from psyneulink.globals import profiling
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import \
     CHANGED, CURRENT_EXECUTION_COUNT, CURRENT_EXECUTION_TIME, EXECUTION_PHASE, EXECUTION_COUNT, \
@@ -954,9 +974,10 @@ from psyneulink.globals.keywords import \
     PARAMETER_STATES, PREVIOUS_VALUE, REFERENCE_VALUE, TARGET_LABELS_DICT, UNCHANGED, \
     VALUE, VARIABLE, kwMechanismComponentCategory, kwMechanismExecuteFunction
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
+from psyneulink.globals.profiling import ProfilerPhase
 from psyneulink.globals.registry import register_category, remove_instance_from_registry
 from psyneulink.globals.utilities import ContentAddressableList, ReadOnlyOrderedDict, \
-    append_type_to_name, convert_to_np_array, iscompatible, kwCompatibilityNumeric
+    append_type_to_name, cast_to_dtype, convert_to_np_array, iscompatible, kwCompatibilityNumeric
 
 __all__ = [
     'Mechanism_Base', 'MechanismError'
@@ -1339,6 +1360,10 @@ class Mechanism_Base(Mechanism):
     variableEncodingDim = 2
     valueEncodingDim = 2
 
+    # False if the result of executing the Mechanism may differ for the same inputs, parameters and stateful_attributes
+    #    of its function(s), so that a System cannot skip its execution when these are unchanged (see System_Skip_Unchanged)
+    _skippable = True
+
     stateListAttr = {InputState:INPUT_STATES,
                        ParameterState:PARAMETER_STATES,
                        OutputState:OUTPUT_STATES}
@@ -1451,7 +1476,7 @@ class Mechanism_Base(Mechanism):
             # kwMechanismAdjustFunction: self.adjust_function,
             # kwMechanismTerminateFunction: self.terminate_execute
         }
-        self.classMethodNames = self.classMethods.keys()
+        self.classMethodNames = list(self.classMethods.keys())
 
         #  Validate class methods:
         #    make sure all required ones have been implemented in (i.e., overridden by) subclass
@@ -2118,6 +2143,71 @@ class Mechanism_Base(Mechanism):
         # if hasattr(self, PREVIOUS_VALUE):
         #     self.previous_value = None
 
+    @tc.typecheck
+    def clone(self, n:tc.optional(int)=None, names:tc.optional(list)=None):
+        """
+        clone(                  \
+            n=None,             \
+            names=None          \
+            )
+
+        Create copies of the Mechanism (see `Mechanism_Cloning`).
+
+        Arguments
+        ---------
+
+        n : int : default 1 or len(**names**)
+            the number of copies to create.
+
+        names : list[str] : default None
+            names of the copies;  if it is not specified, each copy is given the name of the Mechanism, suffixed with
+            an index (see `Naming`).
+
+        Returns
+        -------
+
+        List of copies of the Mechanism : list[Mechanism]
+
+        """
+        from psyneulink.components.functions.function import FunctionRegistry, Function_Base
+        from psyneulink.components.projections.projection import ProjectionRegistry, Projection_Base
+
+        if n is None:
+            n = len(names) if names is not None else 1
+        if names is not None and len(names) != n:
+            raise MechanismError("The number of names specified for clones of {} ({}) must equal n ({})".
+                                 format(self.name, len(names), n))
+        if self.context.initialization_status != ContextFlags.INITIALIZED:
+            raise MechanismError("{} cannot be cloned until it has been fully initialized".format(self.name))
+        if self.processes or self.systems:
+            raise MechanismError("{} cannot be cloned because it has already been assigned to a Process or System".
+                                 format(self.name))
+
+        # Only Projections between States of the Mechanism (e.g., a recurrent Projection) are copied with it
+        internal_projections = []
+        for state in list(self.input_states) + list(self.parameter_states) + list(self.output_states):
+            for projection in state.path_afferents + state.mod_afferents + state.efferents:
+                if projection.sender.owner is not self or projection.receiver.owner is not self:
+                    raise MechanismError("{} cannot be cloned because it has a Projection ({}) from or to "
+                                         "another Component".format(self.name, projection.name))
+                if projection not in internal_projections:
+                    internal_projections.append(projection)
+
+        clones = []
+        for i in range(n):
+            memo = {}
+            clone = copy.deepcopy(self, memo)
+            register_category(entry=clone,
+                              base_class=Mechanism_Base,
+                              name=names[i] if names is not None else self.name,
+                              registry=MechanismRegistry,
+                              context=self.name)
+            register_category(clone.function_object, Function_Base, self.function_object.name, FunctionRegistry)
+            for projection in internal_projections:
+                register_category(memo[id(projection)], Projection_Base, projection.name, ProjectionRegistry)
+            clones.append(clone)
+        return clones
+
     def get_current_mechanism_param(self, param_name):
         if param_name == "variable":
             raise MechanismError("The method 'get_current_mechanism_param' is intended for retrieving the current "
@@ -2256,6 +2346,10 @@ class Mechanism_Base(Mechanism):
         self._update_previous_value()
         # MODIFIED 7/14/18 END
 
+        profiler = profiling._active_profiler
+        if profiler is not None:
+            start = phase_start = profiling.perf_counter()
+
         # UPDATE VARIABLE and INPUT STATE(S)
 
         # Executing or simulating Process or System, get input by updating input_states
@@ -2274,9 +2368,19 @@ class Mechanism_Base(Mechanism):
                 input = self.instance_defaults.variable
             variable = self._update_variable(self._get_variable_from_input(input))
 
+        if profiler is not None:
+            phase_end = profiling.perf_counter()
+            profiler.record(self, ProfilerPhase.INPUT_STATES, phase_end - phase_start)
+            phase_start = phase_end
+
         # UPDATE PARAMETER STATE(S)
         self._update_parameter_states(runtime_params=runtime_params, context=context)
 
+        if profiler is not None:
+            phase_end = profiling.perf_counter()
+            profiler.record(self, ProfilerPhase.PARAMETER_STATES, phase_end - phase_start)
+            phase_start = phase_end
+
         # CALL SUBCLASS _execute method AND ASSIGN RESULT TO self.value
 
         # IMPLEMENTATION NOTE: use value as buffer variable until it has been fully processed
@@ -2308,14 +2412,25 @@ class Mechanism_Base(Mechanism):
                 # return converted_to_2d
                 value = converted_to_2d
 
+        value = cast_to_dtype(value, self._dtype)
+
         # Set status based on whether self.value has changed
         self.status = value
 
         self.value = value
 
+        if profiler is not None:
+            phase_end = profiling.perf_counter()
+            profiler.record(self, ProfilerPhase.FUNCTION, phase_end - phase_start)
+            phase_start = phase_end
+
         # UPDATE OUTPUT STATE(S)
         self._update_output_states(runtime_params=runtime_params, context=context)
 
+        if profiler is not None:
+            phase_end = profiling.perf_counter()
+            profiler.record(self, ProfilerPhase.OUTPUT_STATES, phase_end - phase_start)
+
         # REPORT EXECUTION
         if self.prefs.reportOutputPref and (self.context.execution_phase &
                                             ContextFlags.PROCESSING|ContextFlags.LEARNING):
@@ -2328,6 +2443,9 @@ class Mechanism_Base(Mechanism):
         # Used by sublcasses with update_previous_value and/or convergence_function and delta
         self._current_value = value
 
+        if profiler is not None:
+            profiler.record(self, ProfilerPhase.EXECUTION, profiling.perf_counter() - start)
+
         return self.value
 
     def run(
@@ -2446,9 +2564,13 @@ class Mechanism_Base(Mechanism):
     def _update_output_states(self, runtime_params=None, context=None):
         """Execute function for each OutputState and assign result of each to corresponding item of self.output_values
 
+        The values of standard OutputStates are computed together from the Mechanism's value (see
+        `_StandardOutputStateValues`);  all others are updated by calling their update method.
         """
+        standard_output_state_values = _StandardOutputStateValues(self, runtime_params, context)
         for state in self.output_states:
-            state.update(params=runtime_params, context=context)
+            if not standard_output_state_values.update(state):
+                state.update(params=runtime_params, context=context)
 
     def initialize(self, value):
         """Assign an initial value to the Mechanism's `value <Mechanism_Base.value>` attribute and update its
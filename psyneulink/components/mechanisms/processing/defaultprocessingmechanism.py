@@ -13,9 +13,9 @@
 
 """
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.mechanisms.mechanism import Mechanism_Base
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.defaults import SystemDefaultInputValue
 from psyneulink.globals.keywords import DEFAULT_PROCESSING_MECHANISM, FUNCTION, FUNCTION_PARAMS, INTERCEPT, SLOPE
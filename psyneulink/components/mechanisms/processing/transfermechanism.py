@@ -301,7 +301,6 @@ import numbers
 from collections import Iterable
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.component import function_type, method_type
 from psyneulink.components.functions.function import \
@@ -312,6 +311,7 @@ from psyneulink.components.mechanisms.mechanism import Mechanism, MechanismError
 from psyneulink.components.mechanisms.processing.processingmechanism import ProcessingMechanism_Base
 from psyneulink.components.states.inputstate import InputState
 from psyneulink.components.states.outputstate import OutputState, PRIMARY, StandardOutputStates, standard_output_states
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import \
     DIFFERENCE, FUNCTION, INITIALIZER, MAX_ABS_INDICATOR, MAX_ABS_VAL, MAX_INDICATOR, MAX_VAL, MEAN, MEDIAN, \
@@ -919,13 +919,18 @@ class TransferMechanism(ProcessingMechanism_Base):
         # param is one function
         elif callable(param):
             # NOTE: np.atleast_2d will cause problems if the param has "rows" of different lengths
-            new_param = []
-            for row in np.atleast_2d(var):
-                new_row = []
-                for item in row:
-                    new_row.append(param())
-                new_param.append(new_row)
-            param = new_param
+            distribution = getattr(param, '__self__', None)
+            if isinstance(distribution, DistributionFunction):
+                # draw a sample for every element of var at once
+                param = distribution.sample(np.shape(np.atleast_2d(var)), self.random_state)
+            else:
+                new_param = []
+                for row in np.atleast_2d(var):
+                    new_row = []
+                    for item in row:
+                        new_row.append(param())
+                    new_param.append(new_row)
+                param = new_param
 
         return param
 
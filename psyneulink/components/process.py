@@ -449,7 +449,6 @@ import warnings
 from collections import UserList, namedtuple
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.component import Component, function_type
 from psyneulink.components.mechanisms.mechanism import MechanismList, Mechanism_Base
@@ -461,6 +460,7 @@ from psyneulink.components.shellclasses import Mechanism, Process_Base, Projecti
 from psyneulink.components.states.modulatorysignals.learningsignal import LearningSignal
 from psyneulink.components.states.parameterstate import ParameterState
 from psyneulink.components.states.state import _instantiate_state, _instantiate_state_list
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import \
     AUTO_ASSIGN_MATRIX, ENABLED, EXECUTING, FUNCTION, FUNCTION_PARAMS, INITIALIZING, INITIAL_VALUES, INTERNAL, \
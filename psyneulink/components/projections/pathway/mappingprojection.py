@@ -70,6 +70,14 @@ following ways:
     given `sender <MappingProjection.sender>` makes to the `receiver <MappingProjection.receiver>` (the number of which
     must match the length of the receiver's `variable <InputState.variable>`).
 
+  .. _Mapping_Sparse_Matrix:
+
+  * **Sparse matrix** -- a `scipy.sparse` matrix (requires that scipy be installed), with the same orientation as
+    a 2d np.array.  CSR and CSC matrices are used as is (other formats are converted to CSR), and the matrix is kept
+    sparse throughout execution:  the `function <MappingProjection.function>` computes its product without converting
+    it to a dense array, and `learning <MappingProjection_Learning>` modifies only its stored (nonzero) entries, so
+    that its sparsity pattern is preserved.  This is useful for large Projections with few nonzero weights.
+
   .. _Matrix_Keywords:
 
   * **Matrix keyword** -- used to specify a standard type of matrix without having to specify its individual
@@ -258,17 +266,18 @@ Class Reference
 import inspect
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.component import parameter_keywords
 from psyneulink.components.functions.function import AccumulatorIntegrator, LinearMatrix, get_matrix
 from psyneulink.components.projections.pathway.pathwayprojection import PathwayProjection_Base
 from psyneulink.components.projections.projection import ProjectionError, Projection_Base, projection_keywords
 from psyneulink.components.states.outputstate import OutputState
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.keywords import AUTO_ASSIGN_MATRIX, DEFAULT_MATRIX, FULL_CONNECTIVITY_MATRIX, FUNCTION, FUNCTION_PARAMS, HOLLOW_MATRIX, IDENTITY_MATRIX, INPUT_STATE, LEARNING, LEARNING_PROJECTION, MAPPING_PROJECTION, MATRIX, OUTPUT_STATE, PROCESS_INPUT_STATE, PROJECTION_SENDER, SYSTEM_INPUT_STATE, VALUE
 from psyneulink.globals.log import ContextFlags
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel
+from psyneulink.globals.utilities import is_sparse_matrix
 
 __all__ = [
     'MappingError', 'MappingProjection',
@@ -356,7 +365,7 @@ class MappingProjection(PathwayProjection_Base):
        specifies the value by which to exponentiate the MappingProjection's `value <MappingProjection.value>`
        before combining it with others (see `exponent <MappingProjection.exponent>` for additional details).
 
-    matrix : list, np.ndarray, np.matrix, function or keyword : default DEFAULT_MATRIX
+    matrix : list, np.ndarray, np.matrix, scipy.sparse matrix, function or keyword : default DEFAULT_MATRIX
         the matrix used by `function <MappingProjection.function>` (default: `LinearCombination`) to transform the
         value of the `sender <MappingProjection.sender>` into a form suitable for the `variable <InputState.variable>`
         of its `receiver <MappingProjection.receiver>`.
@@ -638,12 +647,14 @@ class MappingProjection(PathwayProjection_Base):
     def matrix(self, matrix):
         if not (isinstance(matrix, np.matrix) or
                     (isinstance(matrix,np.ndarray) and matrix.ndim == 2) or
-                    (isinstance(matrix,list) and np.array(matrix).ndim == 2)):
+                    (isinstance(matrix,list) and np.array(matrix).ndim == 2) or
+                    is_sparse_matrix(matrix)):
             raise MappingError("Matrix parameter for {} ({}) MappingProjection must be "
-                               "an np.matrix, a 2d np.array, or a correspondingly configured list".
+                               "an np.matrix, a 2d np.array, a scipy.sparse matrix, or a correspondingly configured list".
                                format(self.name, matrix))
 
-        matrix = np.array(matrix)
+        if not is_sparse_matrix(matrix):
+            matrix = np.array(matrix)
 
         # FIX: Hack to prevent recursion in calls to setter and assign_params
         self.function.__self__.paramValidationPref = PreferenceEntry(False, PreferenceLevel.INSTANCE)
@@ -386,17 +386,19 @@ import inspect
 import warnings
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.component import Component
 from psyneulink.components.shellclasses import Mechanism, Process_Base, Projection, State
 from psyneulink.components.states.modulatorysignals.modulatorysignal import _is_modulatory_spec
 from psyneulink.components.states.state import StateError
+from psyneulink.globals import profiling
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import CONTEXT, CONTROL, CONTROL_PROJECTION, CONTROL_SIGNAL, EXPONENT, GATING, GATING_PROJECTION, GATING_SIGNAL, INPUT_STATE, LEARNING, LEARNING_PROJECTION, LEARNING_SIGNAL, MAPPING_PROJECTION, MATRIX, MATRIX_KEYWORD_SET, MECHANISM, NAME, OUTPUT_STATE, OUTPUT_STATES, PARAMETER_STATE_PARAMS, PARAMS, PATHWAY, PROJECTION, PROJECTION_PARAMS, PROJECTION_SENDER, PROJECTION_TYPE, RECEIVER, SENDER, STANDARD_ARGS, STATE, STATES, WEIGHT, kwAddInputState, kwAddOutputState, kwProjectionComponentCategory
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
+from psyneulink.globals.profiling import ProfilerPhase
 from psyneulink.globals.registry import register_category
-from psyneulink.globals.utilities import ContentAddressableList, is_matrix, is_numeric, type_match
+from psyneulink.globals.utilities import ContentAddressableList, cast_to_dtype, is_matrix, is_numeric, type_match
 
 __all__ = [
     'kpProjectionTimeScaleLogEntry', 'Projection_Base', 'projection_keywords', 'PROJECTION_SPEC_KEYWORDS', 'ProjectionError',
@@ -882,6 +884,15 @@ class Projection_Base(Projection):
     def add_to(self, receiver, state, context=None):
         _add_projection_to(receiver=receiver, state=state, projection_spec=self, context=context)
 
+    def execute(self, variable=None, runtime_params=None, context=None):
+        profiler = profiling._active_profiler
+        if profiler is None:
+            return self._execute(variable=variable, runtime_params=runtime_params, context=context)
+        start = profiling.perf_counter()
+        value = self._execute(variable=variable, runtime_params=runtime_params, context=context)
+        profiler.record(self, ProfilerPhase.PROJECTION, profiling.perf_counter() - start)
+        return value
+
     def _execute(self, variable=None, runtime_params=None, context=None):
 
         if variable is None:
@@ -890,10 +901,13 @@ class Projection_Base(Projection):
         self.context.execution_phase = ContextFlags.PROCESSING
         self.context.string = context
 
-        self.value = super()._execute(
-            variable=variable,
-            runtime_params=runtime_params,
-            context=context
+        self.value = cast_to_dtype(
+            super()._execute(
+                variable=variable,
+                runtime_params=runtime_params,
+                context=context
+            ),
+            self._dtype
         )
         self.context.execution_phase = ContextFlags.IDLE
         return self.value
@@ -167,6 +167,13 @@ methods.  All of these take one or more values of `ControlSignalCosts`, each of
 How the enabled components are combined is determined by the `cost_combination_function`.  By default, the values of
 the enabled cost components are summed, however this can be modified by specifying the `cost_combination_function`.
 
+The costs of alternative allocations can be computed, without changing the ControlSignal's `cost
+<ControlSignal.cost>`, `last_intensity` or `duration_cost`, using its `compute_costs` method.  This is how the costs
+of the `allocation_policies <ControlMechanism.allocation_policy>` simulated by a ControlMechanism (such as an
+`EVCControlMechanism`) are computed:  a ControlSignal does not update its costs when it is executed during a
+simulation of its owner's `system <ControlMechanism.system>`, so that its adjustment and duration costs reflect only
+the allocations actually assigned to it.
+
     COMMENT:
     .. _ControlSignal_Toggle_Costs:
 
@@ -289,18 +296,19 @@ Class Reference
 
 """
 
+import copy
 import inspect
 import warnings
 from enum import IntEnum
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.component import function_type, method_type
+from psyneulink.globals import typechecking as tc
 # import Components
 # FIX: EVCControlMechanism IS IMPORTED HERE TO DEAL WITH COST FUNCTIONS THAT ARE DEFINED IN EVCControlMechanism
 #            SHOULD THEY BE LIMITED TO EVC??
-from psyneulink.components.functions.function import CombinationFunction, Exponential, IntegratorFunction, Linear, Reduce, SimpleIntegrator, TransferFunction, _is_modulation_param, is_function_type
+from psyneulink.components.functions.function import CombinationFunction, Exponential, IntegratorFunction, Linear, Logistic, ReLU, Reduce, SimpleIntegrator, TransferFunction, _is_modulation_param, is_function_type
 from psyneulink.components.shellclasses import Function
 from psyneulink.components.states.modulatorysignals.modulatorysignal import ModulatorySignal
 from psyneulink.components.states.outputstate import SEQUENTIAL
@@ -394,6 +402,23 @@ class ControlSignalCosts(IntEnum):
     DEFAULTS           = INTENSITY_COST
 
 
+# Functions that can be applied to an array of intensities (or allocations) in a single call
+_ELEMENTWISE_FUNCTIONS = (Exponential, Linear, Logistic, ReLU)
+
+
+def _apply_to_each(function, values):
+    """Return the result of calling **function** for each item of 1d array **values**, as a 1d array.
+
+    If **function** is the function of one of the _ELEMENTWISE_FUNCTIONS it is called once with **values**;
+    otherwise it is called with each item (as a 1d array with one item, the form of a ControlSignal's value).
+    """
+    if isinstance(getattr(function, '__self__', None), _ELEMENTWISE_FUNCTIONS):
+        result = np.asarray(function(values), dtype=float)
+        if result.shape == values.shape:
+            return result
+    return np.array([np.ravel(function(np.array([value])))[0] for value in values], dtype=float)
+
+
 class ControlSignalError(Exception):
     def __init__(self, error_value):
         self.error_value = error_value
@@ -948,9 +973,77 @@ class ControlSignal(ModulatorySignal):
 
     def update(self, params=None, context=None):
         super().update(params=params, context=context)
+        # The costs of allocations simulated by the owner are computed by compute_costs
+        system = getattr(self.owner, 'system', None)
+        if system is not None and system.context.execution_phase == ContextFlags.SIMULATION:
+            return
         if self.cost_options:
             self._compute_costs()
 
+    def compute_costs(self, allocations):
+        """Compute the `cost <ControlSignal.cost>` of each of an array of allocations.
+
+        Each cost is the one that would be assigned to the ControlSignal's `cost <ControlSignal.cost>` attribute if
+        it were next executed with the corresponding allocation (i.e., from its current `last_intensity` and `cost
+        <ControlSignal.cost>`).  None of the ControlSignal's attributes are changed, so the allocations are treated as
+        alternatives rather than as a sequence.  Functions that operate elementwise (`Linear`, `Exponential`,
+        `Logistic` and `ReLU`, and `Reduce` for the `cost_combination_function`) are called once for all of the
+        allocations;  any others are called once for each allocation.
+
+        Arguments
+        ---------
+
+        allocations : 1d np.array
+            the `allocations <ControlSignal.allocation>` for which to compute costs.
+
+        Returns
+        -------
+
+        costs : 1d np.array
+            the cost of each item of **allocations**.
+
+        """
+        allocations = np.asarray(allocations, dtype=float).reshape(-1)
+
+        if not self.cost_options:
+            return np.full(len(allocations), np.asarray(self.cost, dtype=float).item())
+
+        intensities = _apply_to_each(self.function_object.function, allocations)
+
+        cost_components = np.zeros((len(allocations), 3))
+
+        if self.cost_options & ControlSignalCosts.INTENSITY_COST:
+            cost_components[:, 0] = _apply_to_each(self.intensity_cost_function, intensities)
+
+        if self.cost_options & ControlSignalCosts.ADJUSTMENT_COST:
+            try:
+                intensity_changes = intensities - np.asarray(self.last_intensity, dtype=float).item()
+            except AttributeError:
+                intensity_changes = np.zeros_like(intensities)
+            cost_components[:, 1] = _apply_to_each(self.adjustment_cost_function, intensity_changes)
+
+        if self.cost_options & ControlSignalCosts.DURATION_COST:
+            # The duration cost is computed from the current cost, so is the same for every allocation;
+            #    restore the state of the duration_cost_function, which is advanced by computing it
+            integrator = getattr(self.duration_cost_function, '__self__', None)
+            stateful_values = {attr: copy.copy(getattr(integrator, attr))
+                               for attr in getattr(integrator, 'stateful_attributes', [])}
+            try:
+                cost_components[:, 2] = np.ravel(self.duration_cost_function(self.cost))[0]
+            finally:
+                for attr, value in stateful_values.items():
+                    setattr(integrator, attr, value)
+
+        costs = None
+        if isinstance(getattr(self.cost_combination_function, '__self__', None), Reduce):
+            # Reduce combines each row of a 2d array
+            costs = np.asarray(self.cost_combination_function(cost_components), dtype=float)
+        if costs is None or costs.shape != (len(allocations),):
+            costs = np.array([np.ravel(self.cost_combination_function(list(components)))[0]
+                              for components in cost_components], dtype=float)
+
+        return np.maximum(0.0, costs)
+
     def _compute_costs(self):
         """Compute costs based on self.value."""
 
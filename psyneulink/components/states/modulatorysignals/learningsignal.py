@@ -168,12 +168,11 @@ Class Reference
 
 """
 
-import typecheck as tc
-
 from psyneulink.components.functions.function import Linear, ModulationParam, _is_modulation_param
 from psyneulink.components.states.modulatorysignals.modulatorysignal import ModulatorySignal
 from psyneulink.components.states.outputstate import PRIMARY
 from psyneulink.components.states.state import State_Base
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import COMMAND_LINE, LEARNED_PARAM, LEARNING_PROJECTION, LEARNING_SIGNAL, OUTPUT_STATE_PARAMS, PARAMETER_STATE, PARAMETER_STATES, PROJECTION_TYPE, RECEIVER
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
@@ -587,17 +587,17 @@ Class Reference
 import warnings
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.component import Component
-from psyneulink.components.functions.function import Function, OneHot, function_type, method_type
+from psyneulink.components.functions.function import Function, Linear, OneHot, UserDefinedFunction, function_type, method_type
 from psyneulink.components.shellclasses import Mechanism
 from psyneulink.components.states.state import State_Base, _instantiate_state_list, state_type_keywords
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
-from psyneulink.globals.keywords import ALL, ASSIGN, CALCULATE, COMMAND_LINE, FUNCTION, GATING_SIGNAL, INDEX, INPUT_STATE, INPUT_STATES, MAPPING_PROJECTION, MAX_ABS_INDICATOR, MAX_ABS_VAL, MAX_INDICATOR, MAX_VAL, MEAN, MECHANISM_VALUE, MEDIAN, NAME, OUTPUT_STATE, OUTPUT_STATE_PARAMS, OWNER_VALUE, PARAMS, PARAMS_DICT, PROB, PROJECTION, PROJECTIONS, PROJECTION_TYPE, RECEIVER, REFERENCE_VALUE, RESULT, STANDARD_DEVIATION, STANDARD_OUTPUT_STATES, STATE, VALUE, VARIABLE, VARIANCE
+from psyneulink.globals.keywords import ALL, ASSIGN, CALCULATE, COMMAND_LINE, FUNCTION, GATING_SIGNAL, INDEX, INTERCEPT, INPUT_STATE, INPUT_STATES, MAPPING_PROJECTION, MAX_ABS_INDICATOR, MAX_ABS_VAL, MAX_INDICATOR, MAX_VAL, MEAN, MECHANISM_VALUE, MEDIAN, NAME, OUTPUT_STATE, OUTPUT_STATE_PARAMS, OWNER_VALUE, PARAMS, PARAMS_DICT, PROB, PROJECTION, PROJECTIONS, PROJECTION_TYPE, RECEIVER, REFERENCE_VALUE, RESULT, SLOPE, STANDARD_DEVIATION, STANDARD_OUTPUT_STATES, STATE, VALUE, VARIABLE, VARIANCE
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
-from psyneulink.globals.utilities import UtilitiesError, is_numeric, iscompatible, make_readonly_property, recursive_update
+from psyneulink.globals.utilities import UtilitiesError, cast_to_dtype, convert_to_np_array, is_numeric, iscompatible, make_readonly_property, recursive_update
 
 __all__ = [
     'OUTPUTS', 'OutputState', 'OutputStateError', 'PRIMARY', 'SEQUENTIAL',
@@ -634,27 +634,55 @@ class OUTPUTS():
     MAX_ABS_INDICATOR=MAX_INDICATOR
     PROB=PROB
 
+# Functions of the standard OutputStates
+#    (module-level functions, so that _StandardOutputStateValues can identify them and compute their values together)
+def _mean(x):
+    return np.mean(x)
+
+def _median(x):
+    return np.median(x)
+
+def _standard_deviation(x):
+    return np.std(x)
+
+def _variance(x):
+    return np.var(x)
+
+_one_hot_functions = {mode: OneHot(mode=mode) for mode in (MAX_VAL, MAX_ABS_VAL, MAX_INDICATOR, MAX_ABS_INDICATOR)}
+
+def _max_val(x):
+    return _one_hot_functions[MAX_VAL].function(x)
+
+def _max_abs_val(x):
+    return _one_hot_functions[MAX_ABS_VAL].function(x)
+
+def _max_indicator(x):
+    return _one_hot_functions[MAX_INDICATOR].function(x)
+
+def _max_abs_indicator(x):
+    return _one_hot_functions[MAX_ABS_INDICATOR].function(x)
+
 standard_output_states = [{NAME: RESULT},
                           {NAME:MEAN,
-                           FUNCTION:lambda x: np.mean(x)},
+                           FUNCTION:_mean},
                           {NAME:MEDIAN,
-                           FUNCTION:lambda x: np.median(x)},
+                           FUNCTION:_median},
                           {NAME:STANDARD_DEVIATION,
-                           FUNCTION:lambda x: np.std(x)},
+                           FUNCTION:_standard_deviation},
                           {NAME:VARIANCE,
-                           FUNCTION:lambda x: np.var(x)},
+                           FUNCTION:_variance},
                           {NAME: MECHANISM_VALUE,
                            VARIABLE: OWNER_VALUE},
                           {NAME: OWNER_VALUE,
                            VARIABLE: OWNER_VALUE},
                           {NAME: MAX_VAL,
-                           FUNCTION: OneHot(mode=MAX_VAL).function},
+                           FUNCTION: _max_val},
                           {NAME: MAX_ABS_VAL,
-                           FUNCTION: OneHot(mode=MAX_ABS_VAL).function},
+                           FUNCTION: _max_abs_val},
                           {NAME: MAX_INDICATOR,
-                           FUNCTION: OneHot(mode=MAX_INDICATOR).function},
+                           FUNCTION: _max_indicator},
                           {NAME: MAX_ABS_INDICATOR,
-                           FUNCTION: OneHot(mode=MAX_ABS_INDICATOR).function},
+                           FUNCTION: _max_abs_indicator},
                           {NAME: PROB,
                            FUNCTION: OneHot(mode=PROB).function}
                           ]
@@ -1584,6 +1612,121 @@ class StandardOutputStates():
     #     return [item[INDEX] for item in self.data]
 
 
+class _StandardOutputStateValues():
+    """Computes the values of the standard OutputStates of a Mechanism together, from its current `value
+    <Mechanism_Base.value>`
+
+    Used by `Mechanism_Base._update_output_states` in place of `OutputState.update` for any OutputState that
+    receives no Projections, for which no runtime_params are specified, whose `variable <OutputState.variable>` is
+    the Mechanism's value or an item of it, and whose `function <OutputState.function>` is a `Linear` Function or one
+    of the functions of the `standard_output_states`.  The reductions of each item of the Mechanism's value (its
+    mean, variance and maximum) are computed once and shared by all of the OutputStates that use them, and the
+    parsing of the variable and params of each OutputState (and the call to its `function_object
+    <OutputState.function_object>`) are skipped.  The values assigned are the same as those computed by
+    `OutputState.update`.
+    """
+
+    def __init__(self, owner, runtime_params=None, context=None):
+        self.owner = owner
+        self.runtime_params = runtime_params or {}
+        self.context = context
+        self._reductions = {}
+        self._execution_time = None
+
+    def update(self, state):
+        """Assign the value of **state** and return True, or return False if it is not a standard OutputState"""
+        if state.path_afferents or state.mod_afferents or state.paramsType in self.runtime_params:
+            return False
+
+        variable_spec = state._variable
+        if isinstance(variable_spec, tuple) and len(variable_spec) == 2 and variable_spec[0] == OWNER_VALUE:
+            index = variable_spec[1]
+        elif isinstance(variable_spec, str) and variable_spec == OWNER_VALUE:
+            index = ALL
+        else:
+            return False
+
+        function = state.function_object
+        if type(function) is Linear:
+            if function.functionOutputType is not None:
+                return False
+            fused_function = _StandardOutputStateValues._linear
+        elif type(function) is UserDefinedFunction and not function.cust_fct_params:
+            try:
+                fused_function = self._fused_functions[function.custom_function]
+            except (KeyError, TypeError):
+                return False
+        else:
+            return False
+
+        try:
+            variable = self.owner.value if index is ALL else self.owner.value[index]
+        except (IndexError, TypeError):
+            return False
+        # as Component._validate_variable does for the function
+        variable = convert_to_np_array(variable, 1)
+        value = fused_function(self, function, variable, index)
+
+        # Do what State.update and Component._execute do, other than executing the function
+        state.context.execution_phase = self.owner.context.execution_phase
+        state.context.string = self.owner.context.string
+        if state.context.initialization_status & ~(ContextFlags.VALIDATING | ContextFlags.INITIALIZING):
+            state._increment_execution_count()
+        # All of the OutputStates of a Mechanism are updated at the same time
+        if self._execution_time is None:
+            state._update_current_execution_time(context=self.context)
+            self._execution_time = state._current_execution_time
+        else:
+            state._current_execution_time = self._execution_time
+        function._update_variable(variable)
+        state.value = cast_to_dtype(value, state._dtype)
+        return True
+
+    def _reduction(self, name, variable, index):
+        try:
+            return self._reductions[index, name]
+        except KeyError:
+            pass
+        if name == MEAN:
+            value = np.mean(variable)
+        elif name == VARIANCE:
+            # computed as np.var does, but reusing the mean
+            value = np.mean(np.square(variable - self._reduction(MEAN, variable, index)))
+        elif name == STANDARD_DEVIATION:
+            value = np.sqrt(self._reduction(VARIANCE, variable, index))
+        elif name == MEDIAN:
+            value = np.median(variable)
+        elif name == MAX_VAL:
+            value = np.max(variable)
+        elif name == MAX_ABS_VAL:
+            value = np.max(np.absolute(variable))
+        self._reductions[index, name] = value
+        return value
+
+    def _linear(self, function, variable, index):
+        return variable * function.get_current_function_param(SLOPE) + function.get_current_function_param(INTERCEPT)
+
+    def _statistic(self, name, variable, index):
+        return self._reduction(name, variable, index)
+
+    def _one_hot(self, name, variable, index, indicator):
+        max_value = self._reduction(name, variable, index)
+        return np.where(variable == max_value, 1 if indicator else max_value, 0)
+
+    _fused_functions = {
+        _mean: lambda self, function, variable, index: self._statistic(MEAN, variable, index),
+        _median: lambda self, function, variable, index: self._statistic(MEDIAN, variable, index),
+        _standard_deviation: lambda self, function, variable, index:
+            self._statistic(STANDARD_DEVIATION, variable, index),
+        _variance: lambda self, function, variable, index: self._statistic(VARIANCE, variable, index),
+        _max_val: lambda self, function, variable, index: self._one_hot(MAX_VAL, variable, index, False),
+        _max_abs_val: lambda self, function, variable, index: self._one_hot(MAX_ABS_VAL, variable, index, False),
+        _max_indicator: lambda self, function, variable, index: self._one_hot(MAX_VAL, variable, index, True),
+        _max_abs_indicator: lambda self, function, variable, index:
+            self._one_hot(MAX_ABS_VAL, variable, index, True),
+    }
+
+
 def _parse_output_state_variable(owner, variable, output_state_name=None):
     """Return variable for OutputState based on VARIABLE entry of owner's params dict
 
@@ -735,12 +735,12 @@ import warnings
 from collections import Iterable
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.component import Component, ComponentError, DefaultsFlexibility, component_keywords, function_type, method_type
 from psyneulink.components.functions.function import CombinationFunction, Function, Linear, LinearCombination, \
     ModulationParam, _get_modulated_param, get_param_value_for_keyword
 from psyneulink.components.shellclasses import Mechanism, Process_Base, Projection, State
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import AUTO_ASSIGN_MATRIX, COMMAND_LINE, CONTEXT, CONTROL_PROJECTION_PARAMS, \
     CONTROL_SIGNAL_SPECS, DEFERRED_INITIALIZATION, EXPONENT, FUNCTION, FUNCTION_PARAMS, \
@@ -753,7 +753,7 @@ from psyneulink.globals.keywords import AUTO_ASSIGN_MATRIX, COMMAND_LINE, CONTEX
 from psyneulink.globals.preferences.componentpreferenceset import kpVerbosePref
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
 from psyneulink.globals.registry import register_category
-from psyneulink.globals.utilities import ContentAddressableList, MODULATION_OVERRIDE, Modulation, convert_all_elements_to_np_array, convert_to_np_array, get_args, get_class_attributes, is_value_spec, iscompatible, merge_param_dicts, type_match
+from psyneulink.globals.utilities import ContentAddressableList, MODULATION_OVERRIDE, Modulation, cast_to_dtype, convert_all_elements_to_np_array, convert_to_np_array, get_args, get_class_attributes, is_value_spec, iscompatible, merge_param_dicts, type_match
 
 __all__ = [
     'State_Base', 'state_keywords', 'state_type_keywords', 'StateError', 'StateRegistry'
@@ -1944,12 +1944,10 @@ class State_Base(State):
                                                                                      self.owner.name))
                 continue
 
+            # (the sender and owner are usually assigned the same execution_id object, so check identity first)
             sender_id = sender.owner._execution_id
-            if isinstance(sender.owner, Mechanism):
-                if (not sender.owner.ignore_execution_id) and (sender_id != self_id):
-                    continue
-            else:
-                if sender_id != self_id:
+            if sender_id is not self_id and sender_id != self_id:
+                if not (isinstance(sender.owner, Mechanism) and sender.owner.ignore_execution_id):
                     continue
 
             # Only accept projections from a Process to which the owner Mechanism belongs
@@ -2048,7 +2046,7 @@ class State_Base(State):
         except (KeyError, TypeError):
             function_params = None
 
-        self.value = self.execute(runtime_params=function_params, context=context)
+        self.value = cast_to_dtype(self.execute(runtime_params=function_params, context=context), self._dtype)
 
     def _get_value_label(self, labels_dict, all_states):
         subdicts = False
@@ -2751,7 +2749,7 @@ def _parse_state_spec(state_type=None,
     #      FOR ModulatorySignal: default value of ModulatorySignal (e.g, allocation or gating policy)
     # value, so use as variable of State
     elif is_value_spec(state_specification):
-        state_dict[REFERENCE_VALUE] = np.atleast_1d(state_specification)
+        state_dict[REFERENCE_VALUE] = convert_to_np_array(state_specification, 1)
 
     elif isinstance(state_specification, Iterable) or state_specification is None:
 
@@ -23,6 +23,7 @@
          * `System_Execution_Input_And_Initialization`
          * `System_Execution_Learning`
          * `System_Execution_Control`
+         * `System_Numeric_Precision`
       * `System_Class_Reference`
 
 
@@ -343,6 +344,100 @@ additional information about control). The control Components of a System can be
 `show_graph`method with its **show_control** argument assigned `True`.
 
 
+.. _System_Numeric_Precision:
+
+Numeric Precision
+~~~~~~~~~~~~~~~~~
+
+By default, the values of Components in a System are computed using 64-bit floating point numbers (np.float64).  The
+**dtype** argument of the System's constructor (or its `dtype <System.dtype>` attribute) can be used to specify a
+different floating point type -- most usefully np.float32, which halves the memory used by large `matrices
+<MappingProjection.matrix>` and speeds up their execution.  When a dtype is specified, the floating point arrays of
+every `Mechanism <Mechanism>` and `Projection <Projection>` in the System (including their `variable
+<Component.variable>`, `value <Component.value>`, the backing fields of their parameters, the `matrix
+<MappingProjection.matrix>` of MappingProjections and the stateful attributes of `Integrator` Functions) are cast to
+it, and the `value <Mechanism_Base.value>` of each Mechanism, Projection and `State` is cast to it every time it is
+updated, so that the results of the System and any values recorded in their `logs <Log>` also have that type.  Inputs
+and targets can be specified using any numeric type;  they are cast when they are conveyed to the `ORIGIN` and `TARGET`
+Mechanisms.
+
+.. note::
+   The dtype of a System is assigned to the Components it contains;  if a Mechanism or Projection belongs to more
+   than one System, the dtype most recently assigned to any of those Systems is used.
+
+.. _System_Random_Numbers:
+
+Random Numbers
+~~~~~~~~~~~~~~
+
+By default, Components that generate random numbers (e.g., the `noise <TransferMechanism.noise>` of a
+`TransferMechanism` specified using a `DistributionFunction`, the decision variable of a `DDM`, or the sampling of
+`allocation_policies <ControlMechanism.allocation_policy>` by an `EVCControlMechanism`'s search function) draw them from
+the global state of `numpy.random`, so that their values depend on every other use of it.  The **seed** argument of the
+System's constructor (or its `seed <System.seed>` attribute) can be used to assign each `Mechanism <Mechanism>` in the
+System its own `random_state <Component.random_state>` (a `numpy.random.RandomState`, that is also used by its States
+and Functions).  The state of each Mechanism is derived from the seed and the Mechanism's `name <Mechanism_Base.name>`,
+so that its stream of random numbers is independent of those of the other Mechanisms, of the order in which they were
+created or are executed, and of any other use of `numpy.random`;  running the System twice with the same seed (after
+reassigning it) produces the same results.  Note that Mechanisms created with the same name as an existing one are
+renamed (e.g., 'A-1'), and so are assigned a different stream.
+
+.. note::
+   As with `dtype <System.dtype>`, if a Mechanism belongs to more than one System, the random_state assigned by the
+   seed most recently assigned to any of those Systems is used.
+
+.. _System_Skip_Unchanged:
+
+Skipping Unchanged Mechanisms
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+In many Systems, parts of the network receive the same input on every `trial` (e.g., context or cue pathways), so
+that executing them again reproduces the values they already have.  If the System's `skip_unchanged_mechanisms
+<System.skip_unchanged_mechanisms>` attribute is `True` (it is `False` by default), then a Mechanism is not executed
+when nothing that determines its result has changed since its last execution;  its OutputStates retain their current
+values, and the skipped execution is counted in the System's `skipped_executions <System.skipped_executions>`
+attribute.  Whether anything has changed is determined as follows:
+
+* **input from other Mechanisms in the System** -- when a Mechanism is executed and the `value <OutputState.value>`
+  of any of its OutputStates changes, the Mechanisms that receive Projections from it (i.e., through its `efferents
+  <OutputState.efferents>`) are flagged as changed, and are executed the next time they are scheduled;
+
+* **all other input** -- the values of the senders of all other Projections to the Mechanism's States (e.g., from the
+  System's input, or from `ControlSignals <ControlSignal>` and `GatingSignals <GatingSignal>`), the parameters of all of
+  the Projections it receives (e.g., their `matrix <MappingProjection.matrix>`), the base values of the parameters for
+  its `ParameterStates <ParameterState>`, and the `stateful_attributes <Integrator.stateful_attributes>` of its
+  `function <Mechanism_Base.function>` and (if it has one) its `integrator_function
+  <TransferMechanism.integrator_function>` are compared with their values at the start of its last execution.  Note
+  that the last of these means that a Mechanism that integrates its input is skipped only once its integrator has
+  reached a steady state.
+
+A Mechanism is always executed if `runtime_params <Run_Runtime_Parameters>` are specified for it, if it generates
+random values (e.g., has `noise <TransferMechanism.noise>` specified as a function, or is a `DDM`), if it is a
+`LearningMechanism` or a Mechanism that learns on its own (e.g., a `LeabraMechanism`), or if any of the Projections
+it receives are subject to learning.
+
+.. note::
+   Changes to a Mechanism's parameters that do not have a ParameterState (e.g., assigning it a new function) and
+   executions of Mechanisms other than by the System (e.g., by another System to which they belong) are not detected;
+   reassigning `skip_unchanged_mechanisms <System.skip_unchanged_mechanisms>` discards the record of previous
+   executions, so that all Mechanisms are executed the next time they are scheduled.  Mechanisms that are skipped are
+   also not `logged <Log>` for that execution.
+
+.. _System_Profiling:
+
+Profiling
+~~~~~~~~~
+
+If the **profile** argument of the System's `run <System.run>` method is `True`, a `Profiler` is created for the run
+and assigned to the System's `profiler <System.profiler>` attribute.  It records the number of calls to and the time
+spent in each `phase <ProfilerPhase>` of the execution of each Component (e.g., updating a Mechanism's InputStates,
+executing its `function <Mechanism_Base.function>`, or logging its value), the time spent by the System's `Scheduler`
+in determining what to execute, the time spent in the `learning <System_Execution_Learning>` and `control
+<System_Execution_Control>` phases of execution, and the duration of each `TIME_STEP` and `TRIAL` of the run.  These
+are returned as a dictionary by the Profiler's `report <Profiler.report>` method, and as a numpy array by its `nparray
+<Profiler.nparray>` method.  Profiling is disabled by default, in which case it adds almost nothing to the time of
+execution.
+
 .. _System_Examples:
 
 Examples
@@ -434,7 +529,6 @@ import warnings
 from collections import OrderedDict, namedtuple
 
 import numpy as np
-import typecheck as tc
 
 from toposort import toposort, toposort_flatten
 
@@ -455,16 +549,20 @@ from psyneulink.components.shellclasses import Mechanism, Process_Base, System_B
 from psyneulink.components.states.inputstate import InputState
 from psyneulink.components.states.parameterstate import ParameterState
 from psyneulink.library.mechanisms.adaptive.learning.autoassociativelearningmechanism import AutoAssociativeLearningMechanism
+from psyneulink.globals import profiling
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import ALL, CONDITION, CONTROL, CONTROLLER, CYCLE, \
     EXECUTING, FUNCTION, FUNCTIONS, INITIALIZE_CYCLE, INITIALIZING, INITIAL_VALUES, \
-    INTERNAL, LABELS, LEARNING, MATRIX, MONITOR_FOR_CONTROL, ORIGIN, PROJECTIONS, ROLES, SAMPLE, SINGLETON, SYSTEM, \
-    SYSTEM_INIT, TARGET, TERMINAL, VALUES, kwSeparator, kwSystemComponentCategory
+    INTERNAL, LABELS, LEARNING, MATRIX, MONITOR_FOR_CONTROL, NOISE, ORIGIN, OUTPUT_TYPE, PROB, PROB_INDICATOR, \
+    PROJECTIONS, ROLES, SAMPLE, SINGLETON, SYSTEM, SYSTEM_INIT, TARGET, TERMINAL, VALUES, kwSeparator, \
+    kwSystemComponentCategory
 from psyneulink.globals.log import Log
 from psyneulink.globals.preferences.systempreferenceset import SystemPreferenceSet, is_sys_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
+from psyneulink.globals.profiling import Profiler, ProfilerPhase, _profile
 from psyneulink.globals.registry import register_category
-from psyneulink.globals.utilities import AutoNumber, ContentAddressableList, append_type_to_name, convert_to_np_array, iscompatible
+from psyneulink.globals.utilities import AutoNumber, ContentAddressableList, append_type_to_name, convert_to_np_array, get_random_state, iscompatible
 from psyneulink.scheduling.scheduler import Scheduler, Condition, Always
 from psyneulink.scheduling.condition import AtTimeStep, Never
 
@@ -561,6 +659,61 @@ def sys(*args, **kwargs):
     return System(processes=processes, **kwargs)
 
 
+def _is_random(spec):
+    """Return True if **spec** is a Function that generates random values, or a noise specification that includes
+    any callable (which cannot be assumed to return the same value every time it is called)
+    """
+    from psyneulink.components.functions.function import DistributionFunction, Function, MODE
+
+    if isinstance(spec, Function):
+        return (isinstance(spec, DistributionFunction)
+                or getattr(spec, MODE, None) in {PROB, PROB_INDICATOR}
+                or getattr(spec, OUTPUT_TYPE, None) in {PROB, PROB_INDICATOR})
+    if isinstance(spec, np.ndarray) and spec.dtype != object:
+        return False
+    if isinstance(spec, (list, tuple, np.ndarray)):
+        return any(_is_random(item) for item in spec)
+    return callable(spec)
+
+
+def _get_parameter_state_base_value(parameter_state):
+    """Return the value of the parameter for **parameter_state**, before it is modulated (see ParameterState._execute)"""
+    owner = parameter_state.owner
+    try:
+        return getattr(owner.function_object, '_' + parameter_state.name)
+    except AttributeError:
+        return getattr(owner, '_' + parameter_state.name, None)
+
+
+def _copy_value(value):
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, (list, tuple)):
+        return [_copy_value(item) for item in value]
+    return value
+
+
+def _values_equal(value, other):
+    """Return True if **value** and **other** are equal, including any nested lists and arrays of different shapes"""
+    if value is other:
+        return True
+    if isinstance(value, np.ndarray) and value.dtype != object and isinstance(other, np.ndarray):
+        return value.shape == other.shape and np.array_equal(value, other)
+    if np.ndim(value) == 0 and isinstance(value, np.ndarray):
+        value = value.item()
+    if np.ndim(other) == 0 and isinstance(other, np.ndarray):
+        other = other.item()
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return (isinstance(other, (list, tuple, np.ndarray)) and len(value) == len(other)
+                and all(_values_equal(v, o) for v, o in zip(value, other)))
+    if isinstance(other, (list, tuple, np.ndarray)):
+        return False
+    try:
+        return bool(value == other)
+    except (TypeError, ValueError):
+        return False
+
+
 # FIX:  IMPLEMENT DEFAULT PROCESS
 # FIX:  NEED TO CREATE THE PROJECTIONS FROM THE PROCESS TO THE FIRST MECHANISM IN PROCESS FIRST SINCE,
 # FIX:  ONCE IT IS IN THE GRAPH, IT IS NOT LONGER EASY TO DETERMINE WHICH IS WHICH IS WHICH (SINCE SETS ARE NOT ORDERED)
@@ -581,6 +734,9 @@ class System(System_Base):
         targets=None,                               \
         reinitialize_mechanisms_when=AtTimeStep(0), \
         scheduler=None,                             \
+        dtype=None,                                 \
+        seed=None,                                  \
+        skip_unchanged_mechanisms=False,            \
         params=None,                                \
         name=None,                                  \
         prefs=None)
@@ -664,6 +820,28 @@ class System(System_Base):
         or following the execution of any `Process` or System to which the LearningMechanism belongs and for which a
         `learning_rate <LearningMechanism.learning_rate>` was set).
 
+    dtype : np.dtype : default None
+        the floating point type used for the values of the Components in the System (see `System_Numeric_Precision`);
+        if it is `None`, Components use their default (np.float64).  Assigning a new value casts the values of all of
+        the Mechanisms and Projections in the System to it.
+
+    seed : int : default None
+        the seed from which the `random_state <Component.random_state>` of each Mechanism in the System is derived
+        (see `System_Random_Numbers`);  if it is `None`, Mechanisms use the global state of `numpy.random`.  Assigning
+        a new value (including the same one) reinitializes the random_states of all of the Mechanisms in the System.
+
+    skip_unchanged_mechanisms : bool : default False
+        determines whether Mechanisms are skipped when nothing that determines their result has changed since their
+        last execution (see `System_Skip_Unchanged`).  Assigning a value (including the current one) discards the
+        record of previous executions, and resets `skipped_executions <System.skipped_executions>`.
+
+    skipped_executions : Dict[Mechanism: int]
+        the number of executions of each Mechanism that have been skipped (see `System_Skip_Unchanged`).
+
+    profiler : Profiler
+        the `Profiler` for the most recent call to the System's `run <System.run>` method with **profile** = `True`
+        (see `System_Profiling`);  `None` if it has not been profiled.
+
     targets : 2d nparray
         used as template for the values of the System's `target_input_states`, and to represent the targets specified in
         the **targets** argument of System's `execute <System.execute>` and `run <System.run>` methods.
@@ -862,6 +1040,9 @@ class System(System_Base):
                  targets=None,
                  reinitialize_mechanisms_when=AtTimeStep(0),
                  scheduler=None,
+                 dtype=None,
+                 seed=None,
+                 skip_unchanged_mechanisms=False,
                  params=None,
                  name=None,
                  prefs:is_sys_pref_set=None,
@@ -934,6 +1115,11 @@ class System(System_Base):
         if self.scheduler_learning is None:
             self.scheduler_learning = Scheduler(graph=self.learning_execution_graph)
 
+        self.dtype = dtype
+        self.seed = seed
+        self.skip_unchanged_mechanisms = skip_unchanged_mechanisms
+        self.profiler = None
+
         # IMPLEMENT CORRECT REPORTING HERE
         # if self.prefs.reportOutputPref:
         #     print("\n{0} initialized with:\n- pathway: [{1}]".
@@ -2758,11 +2944,21 @@ class System(System_Base):
 
             # # TEST PRINT:
             # print("\nEXECUTING System._execute_learning\n")
-            self._execute_learning(context)
+            profiler = profiling._active_profiler
+            if profiler is None:
+                self._execute_learning(context)
+            else:
+                start = profiling.perf_counter()
+                self._execute_learning(context)
+                profiler.record(self, ProfilerPhase.LEARNING, profiling.perf_counter() - start)
 
             self.context.execution_phase = ContextFlags.IDLE
             self.context.string = self.context.string.replace(LEARNING, EXECUTING)
 
+            # Learning may have changed the outcome of simulations cached by the controller
+            if hasattr(self.controller, 'invalidate_simulation_cache'):
+                self.controller.invalidate_simulation_cache()
+
 
         # EXECUTE CONTROLLER
         # FIX: 1) RETRY APPENDING TO EXECUTE LIST AND COMPARING TO THIS VERSION
@@ -2771,11 +2967,16 @@ class System(System_Base):
         # Only call controller if this is not a controller simulation run (to avoid infinite recursion)
         if self.context.execution_phase != ContextFlags.SIMULATION and self.enable_controller:
             self.controller.context.execution_phase = ContextFlags.PROCESSING
+            profiler = profiling._active_profiler
+            if profiler is not None:
+                start = profiling.perf_counter()
             try:
                 self.controller.execute(
                     runtime_params=None,
                     context=context
                 )
+                if profiler is not None:
+                    profiler.record(self, ProfilerPhase.CONTROL, profiling.perf_counter() - start)
                 if self._report_system_output:
                     print("{0}: {1} executed".format(self.name, self.controller.name))
 
@@ -2802,7 +3003,18 @@ class System(System_Base):
                               'must be initialized before execution'.format(self.name))
         logger.debug('{0}.scheduler processing termination conditions: {1}'.format(self, termination_processing))
 
-        for next_execution_set in self.scheduler_processing.run(termination_conds=termination_processing):
+        execution_sets = self.scheduler_processing.run(termination_conds=termination_processing)
+        profiler = profiling._active_profiler
+        if profiler is not None:
+            # The time steps of simulations run by the controller are not recorded as those of the run
+            execution_sets = profiler.profile_execution_sets(
+                self,
+                execution_sets,
+                self.scheduler_processing.clock,
+                record_time_steps=self.context.execution_phase != ContextFlags.SIMULATION
+            )
+
+        for next_execution_set in execution_sets:
             logger.debug('Running next_execution_set {0}'.format(next_execution_set))
             i = 0
 
@@ -2823,6 +3035,14 @@ class System(System_Base):
                     for param in runtime_params[mechanism]:
                         if runtime_params[mechanism][param][1].is_satisfied(scheduler=self.scheduler_processing):
                             execution_runtime_params[param] = runtime_params[mechanism][param][0]
+
+                # Skip the Mechanism if nothing that determines its result has changed since its last execution
+                if self.skip_unchanged_mechanisms:
+                    execution_inputs = None if execution_runtime_params else self._get_execution_inputs(mechanism)
+                    if self._is_unchanged(mechanism, execution_inputs):
+                        self.skipped_executions[mechanism] = self.skipped_executions.get(mechanism, 0) + 1
+                        continue
+
                 mechanism.context.execution_phase = self.context.execution_phase
 
                 # FIX: DO THIS LOCALLY IN AutoAssociativeLearningMechanism?? IF SO, NEEDS TO BE ABLE TO GET EXECUTION_ID
@@ -2843,6 +3063,9 @@ class System(System_Base):
                 mechanism.function_object._runtime_params_reset = {}
                 mechanism.context.execution_phase = ContextFlags.IDLE
 
+                if self.skip_unchanged_mechanisms:
+                    self._record_execution(mechanism, execution_inputs)
+
                 if self._report_system_output and  self._report_process_output:
 
                     # REPORT COMPLETION OF PROCESS IF ORIGIN:
@@ -3014,6 +3237,7 @@ class System(System_Base):
             termination_learning=None,
             runtime_params=None,
             reinitialize_values=None,
+            profile=False,
             context=None):
 
         """Run a sequence of executions
@@ -3075,6 +3299,10 @@ class System(System_Base):
             that Mechanisms in reinitialize_values will reinitialize regardless of whether their `reinitialize_when
             <Component.reinitialize_when>` Condition is satisfied.
 
+        profile : bool : default False
+            if `True`, a `Profiler` records the time spent in each phase of the execution of each Component during
+            the run, and is assigned to the System's `profiler <System.profiler>` attribute (see `System_Profiling`).
+
         Returns
         -------
 
@@ -3095,22 +3323,28 @@ class System(System_Base):
 
         logger.debug(inputs)
 
+        profiler = None
+        if profile:
+            profiler = self.profiler = Profiler(owner=self)
+
         from psyneulink.globals.environment import run
-        return run(self,
-                   inputs=inputs,
-                   num_trials=num_trials,
-                   initialize=initialize,
-                   initial_values=initial_values,
-                   targets=targets,
-                   learning=learning,
-                   call_before_trial=call_before_trial,
-                   call_after_trial=call_after_trial,
-                   call_before_time_step=call_before_time_step,
-                   call_after_time_step=call_after_time_step,
-                   termination_processing=termination_processing,
-                   termination_learning=termination_learning,
-                   runtime_params=runtime_params,
-                   context=ContextFlags.COMPOSITION)
+        with _profile(profiler):
+            return run(self,
+                       inputs=inputs,
+                       num_trials=num_trials,
+                       initialize=initialize,
+                       initial_values=initial_values,
+                       targets=targets,
+                       learning=learning,
+                       call_before_trial=call_before_trial,
+                       call_after_trial=call_after_trial,
+                       call_before_time_step=call_before_time_step,
+                       call_after_time_step=call_after_time_step,
+                       termination_processing=termination_processing,
+                       termination_learning=termination_learning,
+                       runtime_params=runtime_params,
+                       profiler=profiler,
+                       context=ContextFlags.COMPOSITION)
 
     def _report_system_initiation(self):
         """Prints iniiation message, time_step, and list of Processes in System being executed
@@ -3484,6 +3718,148 @@ class System(System_Base):
         self.context.string = 'System.controller setter'
         self._instantiate_controller(control_mech_spec, context=ContextFlags.PROPERTY)
 
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, dtype):
+        if dtype is not None:
+            try:
+                dtype = np.dtype(dtype)
+            except TypeError:
+                dtype = None
+            if dtype is None or dtype.kind != 'f':
+                raise SystemError("dtype for {} must be a floating point type (e.g., np.float32 or np.float64)".
+                                  format(self.name))
+        self._assign_dtype(dtype)
+
+    def _assign_dtype(self, dtype):
+        """Cast the floating point arrays of all of the Mechanisms and Projections in the System to **dtype**
+
+        Includes the `controller <System.controller>` and its `objective_mechanism
+        <ControlMechanism.objective_mechanism>`, and all of the Projections to and from the States of the Mechanisms.
+        """
+        self._dtype = dtype
+
+        mechanisms = list(self.mechanisms)
+        if isinstance(self.controller, ControlMechanism):
+            mechanisms.extend([self.controller, self.controller.objective_mechanism])
+
+        components = []
+        for mechanism in mechanisms:
+            if mechanism is None or mechanism in components:
+                continue
+            components.append(mechanism)
+            for state in list(mechanism.input_states) + list(mechanism.parameter_states):
+                components.extend(projection for projection in state.path_afferents + state.mod_afferents
+                                  if projection not in components)
+            for state in mechanism.output_states:
+                components.extend(projection for projection in state.efferents if projection not in components)
+
+        for component in components:
+            component._assign_dtype(dtype)
+
+    @property
+    def seed(self):
+        return self._seed
+
+    @seed.setter
+    def seed(self, seed):
+        if seed is not None and not isinstance(seed, (int, np.integer)):
+            raise SystemError("seed for {} must be an int".format(self.name))
+        self._assign_random_states(seed)
+
+    @property
+    def skip_unchanged_mechanisms(self):
+        return self._skip_unchanged_mechanisms
+
+    @skip_unchanged_mechanisms.setter
+    def skip_unchanged_mechanisms(self, skip):
+        self._skip_unchanged_mechanisms = bool(skip)
+        self.skipped_executions = {}
+        # the inputs to each Mechanism at the start of, and its output_values after, its last execution
+        self._execution_inputs = {}
+        self._execution_outputs = {}
+        # Mechanisms flagged as changed by the execution of a Mechanism that projects to them
+        self._changed_mechanisms = set()
+
+    def _get_execution_inputs(self, mechanism):
+        """Return copies of the values that determine the result of executing **mechanism**, other than input from
+        the Mechanisms in the System (which is tracked by _changed_mechanisms), or None if it cannot be skipped
+        """
+        from psyneulink.components.projections.modulatory.learningprojection import LearningProjection
+
+        if not mechanism._skippable or getattr(mechanism, 'is_self_learner', False):
+            return None
+
+        functions = [mechanism.function_object, getattr(mechanism, 'integrator_function', None)]
+        if any(_is_random(function) for function in functions) or _is_random(getattr(mechanism, NOISE, None)):
+            return None
+
+        inputs = []
+        for state in list(mechanism._input_states) + list(mechanism._parameter_states) + list(mechanism._output_states):
+            if isinstance(state, ParameterState):
+                inputs.append(_get_parameter_state_base_value(state))
+            for projection in state.all_afferents:
+                for parameter_state in getattr(projection, 'parameter_states', []):
+                    if any(isinstance(p, LearningProjection) for p in parameter_state.mod_afferents):
+                        return None
+                    inputs.append(_get_parameter_state_base_value(parameter_state))
+                if not (isinstance(projection, MappingProjection) and projection.sender.owner in self.execution_graph):
+                    inputs.append(projection.sender.value)
+
+        for function in functions:
+            for attribute in getattr(function, 'stateful_attributes', []):
+                inputs.append(getattr(function, attribute))
+        inputs.extend([getattr(mechanism, 'integrator_mode', None), getattr(mechanism, 'clip', None)])
+
+        return _copy_value(inputs)
+
+    def _is_unchanged(self, mechanism, execution_inputs):
+        return (execution_inputs is not None
+                and mechanism not in self._changed_mechanisms
+                and mechanism in self._execution_inputs
+                and _values_equal(execution_inputs, self._execution_inputs[mechanism]))
+
+    def _record_execution(self, mechanism, execution_inputs):
+        """Record the inputs and outputs of an execution of **mechanism**, and flag the Mechanisms that receive
+        Projections from it as changed if its output_values have changed
+        """
+        self._changed_mechanisms.discard(mechanism)
+        if execution_inputs is None:
+            self._execution_inputs.pop(mechanism, None)
+        else:
+            self._execution_inputs[mechanism] = execution_inputs
+
+        output_values = mechanism.output_values
+        if mechanism in self._execution_outputs and _values_equal(output_values, self._execution_outputs[mechanism]):
+            return
+        self._execution_outputs[mechanism] = _copy_value(output_values)
+        for output_state in mechanism.output_states:
+            for projection in output_state.efferents:
+                receiver = projection.receiver.owner
+                if isinstance(receiver, Mechanism):
+                    self._changed_mechanisms.add(receiver)
+
+    def _assign_random_states(self, seed):
+        """Assign each of the Mechanisms in the System a np.random.RandomState derived from **seed** and its name
+
+        Includes the `controller <System.controller>` and its `objective_mechanism
+        <ControlMechanism.objective_mechanism>`;  if **seed** is None, the Mechanisms revert to the global state of
+        np.random.
+        """
+        self._seed = seed
+
+        mechanisms = list(self.mechanisms)
+        if isinstance(self.controller, ControlMechanism):
+            mechanisms.extend([self.controller, self.controller.objective_mechanism])
+
+        for mechanism in mechanisms:
+            if mechanism is None:
+                continue
+            mechanism.random_state = get_random_state(seed, mechanism.name) if seed is not None else None
+
     @property
     def control_signals(self):
         if self.controller is None:
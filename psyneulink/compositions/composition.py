@@ -48,6 +48,7 @@ Class Reference
 
 import collections
 import enum
+import itertools
 import logging
 import numpy as np
 import uuid
@@ -58,6 +59,7 @@ from psyneulink.components.projections.pathway.mappingprojection import MappingP
 from psyneulink.components.shellclasses import Mechanism, Projection
 from psyneulink.components.states.outputstate import OutputState
 from psyneulink.globals.context import ContextFlags
+from psyneulink.globals.environment import _InputStream, _adjust_stimulus_array, _is_input_stream
 from psyneulink.globals.keywords import HARD_CLAMP, IDENTITY_MATRIX, NO_CLAMP, PULSE_CLAMP, SOFT_CLAMP
 from psyneulink.scheduling.condition import Always
 from psyneulink.scheduling.scheduler import Scheduler
@@ -214,16 +216,20 @@ class Graph(object):
         ----------
 
         comp_to_vertex : Dict[`Component <Component>` : `Vertex`]
-            maps `Component` in the graph to the `Vertices <Vertex>` that represent them.
+            maps `Component` in the graph to the `Vertices <Vertex>` that represent them, in the order in which they
+            were added;  it is used to test membership and to add or remove Vertices without searching the Graph.
 
         vertices : List[Vertex]
-            the `Vertices <Vertex>` contained in this Graph.
+            the `Vertices <Vertex>` contained in this Graph, in the order in which they were added.
 
     '''
 
     def __init__(self):
         self.comp_to_vertex = collections.OrderedDict()  # Translate from mechanisms to related vertex
-        self.vertices = []  # List of vertices within graph
+
+    @property
+    def vertices(self):
+        return list(self.comp_to_vertex.values())
 
     def copy(self):
         '''
@@ -235,44 +241,40 @@ class Graph(object):
         '''
         g = Graph()
 
-        for vertex in self.vertices:
+        for vertex in self.comp_to_vertex.values():
             g.add_vertex(Vertex(vertex.component))
 
-        for i in range(len(self.vertices)):
-            g.vertices[i].parents = [g.comp_to_vertex[parent_vertex.component] for parent_vertex in self.vertices[i].parents]
-            g.vertices[i].children = [g.comp_to_vertex[parent_vertex.component] for parent_vertex in self.vertices[i].children]
+        for component, vertex in self.comp_to_vertex.items():
+            new_vertex = g.comp_to_vertex[component]
+            new_vertex.parents = [g.comp_to_vertex[parent_vertex.component] for parent_vertex in vertex.parents]
+            new_vertex.children = [g.comp_to_vertex[child_vertex.component] for child_vertex in vertex.children]
 
         return g
 
     def add_component(self, component):
-        if component in [vertex.component for vertex in self.vertices]:
+        if component in self.comp_to_vertex:
             logger.info('Component {1} is already in graph {0}'.format(component, self))
         else:
-            vertex = Vertex(component)
-            self.comp_to_vertex[component] = vertex
-            self.add_vertex(vertex)
+            self.add_vertex(Vertex(component))
 
     def add_vertex(self, vertex):
-        if vertex in self.vertices:
+        if self.comp_to_vertex.get(vertex.component) is vertex:
             logger.info('Vertex {1} is already in graph {0}'.format(vertex, self))
         else:
-            self.vertices.append(vertex)
             self.comp_to_vertex[vertex.component] = vertex
 
     def remove_component(self, component):
         try:
-            self.remove_vertex(self.comp_to_vertex(component))
+            self.remove_vertex(self.comp_to_vertex[component])
         except KeyError as e:
             raise CompositionError('Component {1} not found in graph {2}: {0}'.format(e, component, self))
 
     def remove_vertex(self, vertex):
-        try:
-            self.vertices.remove(vertex)
-            del self.comp_to_vertex[vertex.component]
-            # TODO:
-            #   check if this removal puts the graph in an inconsistent state
-        except ValueError as e:
-            raise CompositionError('Vertex {1} not found in graph {2}: {0}'.format(e, vertex, self))
+        if self.comp_to_vertex.get(vertex.component) is not vertex:
+            raise CompositionError('Vertex {0} not found in graph {1}'.format(vertex, self))
+        del self.comp_to_vertex[vertex.component]
+        # TODO:
+        #   check if this removal puts the graph in an inconsistent state
 
     def connect_components(self, parent, child):
         self.connect_vertices(self.comp_to_vertex[parent], self.comp_to_vertex[child])
@@ -320,6 +322,10 @@ class Composition(object):
         Arguments
         ---------
 
+        dtype : np.dtype : default None
+            specifies the floating point type used for the values of the Components in the Composition (see
+            `System_Numeric_Precision`).
+
         Attributes
         ----------
 
@@ -330,6 +336,11 @@ class Composition(object):
         mechanisms : `list[Mechanism]`
             A list of all `Mechanisms <Mechanism>` contained in this Composition
 
+        dtype : np.dtype
+            the floating point type used for the values of the `Mechanisms <Mechanism>` and `Projections
+            <Projection>` in the Composition; if it is `None`, Components use their default (np.float64).  Assigning
+            a new value casts the values of all of the Components in the Composition to it.
+
         COMMENT:
         name : str
             see `name <Composition_Name>`
@@ -340,7 +351,7 @@ class Composition(object):
 
     '''
 
-    def __init__(self):
+    def __init__(self, dtype=None):
         # core attributes
         self.name = "Composition-TestName"
         self.graph = Graph()  # Graph of the Composition
@@ -368,6 +379,26 @@ class Composition(object):
         # TBI: update self.sched whenever something is added to the composition
         self.sched = Scheduler(composition=self)
 
+        self.dtype = dtype
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, dtype):
+        if dtype is not None:
+            try:
+                dtype = np.dtype(dtype)
+            except TypeError:
+                dtype = None
+            if dtype is None or dtype.kind != 'f':
+                raise CompositionError("dtype for {} must be a floating point type (e.g., np.float32 or np.float64)".
+                                       format(self.name))
+        self._dtype = dtype
+        for vertex in self.graph.vertices:
+            vertex.component._assign_dtype(dtype)
+
     @property
     def graph_processing(self):
         '''
@@ -441,14 +472,19 @@ class Composition(object):
             mech : Mechanism
                 the Mechanism to add
         '''
-        if mech not in [vertex.component for vertex in self.graph.vertices]:  # Only add if it doesn't already exist in graph
+        if mech not in self.graph.comp_to_vertex:  # Only add if it doesn't already exist in graph
             mech.is_processing = True
             self.graph.add_component(mech)  # Set incoming edge list of mech to empty
             self.mechanisms.append(mech)
             self.mechanisms_to_roles[mech] = set()
+            if self.dtype is not None:
+                mech._assign_dtype(self.dtype)
+
+            # Keep the processing graph current, rather than rebuilding it from the full graph when it is next used
+            if not self.needs_update_graph_processing and self._graph_processing is not None:
+                self._graph_processing.add_component(mech)
 
             self.needs_update_graph = True
-            self.needs_update_graph_processing = True
             self.needs_update_scheduler_processing = True
             self.needs_update_scheduler_learning = True
 
@@ -468,7 +504,7 @@ class Composition(object):
             receiver : Mechanism
                 the receiver of **projection**
         '''
-        if projection not in [vertex.component for vertex in self.graph.vertices]:
+        if projection not in self.graph.comp_to_vertex:
             projection.is_processing = False
             projection.name = '{0} to {1}'.format(sender, receiver)
             self.graph.add_component(projection)
@@ -477,9 +513,14 @@ class Composition(object):
             self.graph.connect_components(sender, projection)
             self.graph.connect_components(projection, receiver)
             self._validate_projection(sender, projection, receiver)
+            if self.dtype is not None:
+                projection._assign_dtype(self.dtype)
+
+            # Keep the processing graph current, rather than rebuilding it from the full graph when it is next used
+            if not self.needs_update_graph_processing and self._graph_processing is not None:
+                self._add_to_processing_graph(self.graph.comp_to_vertex[projection])
 
             self.needs_update_graph = True
-            self.needs_update_graph_processing = True
             self.needs_update_scheduler_processing = True
             self.needs_update_scheduler_learning = True
 
@@ -623,14 +664,14 @@ class Composition(object):
             if graph.get_children_from_component(mech) == []:
                 self._add_mechanism_role(mech, MechanismRole.TERMINAL)
         # Identify Recurrent_init and Cycle mechanisms
-        visited = []  # Keep track of all mechanisms that have been visited
+        visited = set()  # Keep track of all mechanisms that have been visited
         for origin_mech in self.get_mechanisms_by_role(MechanismRole.ORIGIN):  # Cycle through origin mechanisms first
-            visited_current_path = []  # Track all mechanisms visited from the current origin
+            visited_current_path = set()  # Track all mechanisms visited from the current origin
             next_visit_stack = []  # Keep a stack of mechanisms to be visited next
             next_visit_stack.append(origin_mech)
             for mech in next_visit_stack:  # While the stack isn't empty
-                visited.append(mech)  # Mark the mech as visited
-                visited_current_path.append(mech)  # And visited during the current path
+                visited.add(mech)  # Mark the mech as visited
+                visited_current_path.add(mech)  # And visited during the current path
                 children = [vertex.component for vertex in graph.get_children_from_component(mech)]  # Get the children of that mechanism
                 for child in children:
                     # If the child has been visited this path and is not already initialized
@@ -641,12 +682,12 @@ class Composition(object):
                         next_visit_stack.append(child)  # Add it to the visit stack
         for mech in self.mechanisms:
             if mech not in visited:  # Check the rest of the mechanisms
-                visited_current_path = []
+                visited_current_path = set()
                 next_visit_stack = []
                 next_visit_stack.append(mech)
                 for remaining_mech in next_visit_stack:
-                    visited.append(remaining_mech)
-                    visited_current_path.append(remaining_mech)
+                    visited.add(remaining_mech)
+                    visited_current_path.add(remaining_mech)
                     children = [vertex.component for vertex in graph.get_children_from_component(remaining_mech)]
                     for child in children:
                         if child in visited_current_path:
@@ -665,43 +706,49 @@ class Composition(object):
         from the composition's full graph
         '''
         logger.debug('Updating processing graph')
-        self._graph_processing = self.graph.copy()
-        visited_vertices = set()
-        next_vertices = []  # a queue
+        self._graph_processing = Graph()
+        for vertex in self.graph.comp_to_vertex.values():
+            if vertex.component.is_processing:
+                self._graph_processing.add_component(vertex.component)
+        for vertex in self.graph.comp_to_vertex.values():
+            self._add_to_processing_graph(vertex)
 
-        unvisited_vertices = True
+        self.needs_update_graph_processing = False
 
-        while unvisited_vertices:
-            for vertex in self._graph_processing.vertices:
-                if vertex not in visited_vertices:
-                    next_vertices.append(vertex)
-                    break
-            else:
-                unvisited_vertices = False
-
-            logger.debug('processing graph vertices: {0}'.format(self._graph_processing.vertices))
-            while len(next_vertices) > 0:
-                cur_vertex = next_vertices.pop(0)
-                logger.debug('Examining vertex {0}'.format(cur_vertex))
-
-                # must check that cur_vertex is not already visited because in cycles, some nodes may be added to next_vertices twice
-                if cur_vertex not in visited_vertices and not cur_vertex.component.is_processing:
-                    for parent in cur_vertex.parents:
-                        parent.children.remove(cur_vertex)
-                        for child in cur_vertex.children:
-                            child.parents.remove(cur_vertex)
-                            self._graph_processing.connect_vertices(parent, child)
-
-                    for node in cur_vertex.parents + cur_vertex.children:
-                        logger.debug('New parents for vertex {0}: \n\t{1}\nchildren: \n\t{2}'.format(node, node.parents, node.children))
-                    logger.debug('Removing vertex {0}'.format(cur_vertex))
-                    self._graph_processing.remove_vertex(cur_vertex)
-
-                visited_vertices.add(cur_vertex)
-                # add to next_vertices (frontier) any parents and children of cur_vertex that have not been visited yet
-                next_vertices.extend([vertex for vertex in cur_vertex.parents + cur_vertex.children if vertex not in visited_vertices])
+    def _add_to_processing_graph(self, vertex):
+        '''
+        Adds to the processing graph the edges that pass through **vertex** of the full graph:  those from it to its
+        processing children if it is a processing vertex;  otherwise, those from each of the processing vertices from
+        which it is reached to each of the processing vertices that it reaches, through any other non-processing
+        vertices.  Adding them in the order in which the vertices were added to the full graph constructs the
+        processing graph, and calling it for a vertex added after the processing graph was constructed keeps it current.
+        '''
+        graph_processing = self._graph_processing
+
+        if vertex.component.is_processing:
+            for child in vertex.children:
+                if child.component.is_processing:
+                    graph_processing.connect_components(vertex.component, child.component)
+            return
+
+        def processing_neighbors(vertex, direction):
+            # the processing vertices reached from vertex through non-processing vertices, in the given direction
+            neighbors = []
+            visited = {vertex}
+            next_vertices = list(getattr(vertex, direction))
+            for next_vertex in next_vertices:
+                if next_vertex in visited:
+                    continue
+                visited.add(next_vertex)
+                if next_vertex.component.is_processing:
+                    neighbors.append(next_vertex.component)
+                else:
+                    next_vertices.extend(getattr(next_vertex, direction))
+            return neighbors
 
-        self.needs_update_graph_processing = False
+        for parent in processing_neighbors(vertex, 'parents'):
+            for child in processing_neighbors(vertex, 'children'):
+                graph_processing.connect_components(parent, child)
 
     def get_mechanisms_by_role(self, role):
         '''
@@ -801,7 +848,7 @@ class Composition(object):
                 current_origin_input_states.add(input_state)
 
                 # if there is not a corresponding CIM output state, add one
-                if input_state not in set(self.input_CIM_output_states.keys()):
+                if input_state not in self.input_CIM_output_states:
                     interface_output_state = OutputState(owner=self.input_CIM,
                                                          variable=input_state.value,
                                                          reference_value= input_state.value,
@@ -836,7 +883,7 @@ class Composition(object):
             for output_state in mech.output_states:
                 current_terminal_output_states.add(output_state)
                 # if there is not a corresponding CIM output state, add one
-                if output_state not in set(self.output_CIM_output_states.keys()):
+                if output_state not in self.output_CIM_output_states:
                     interface_output_state = OutputState(owner=self.output_CIM,
                                                          variable=output_state.value,
                                                          reference_value=output_state.value,
@@ -1225,14 +1272,20 @@ class Composition(object):
                                "mechanisms.".format(self.name, len(origin_mechanisms)))
 
         inputs, num_inputs_sets = self._adjust_stimulus_dict(inputs)
+        input_streams = {mech: stimulus for mech, stimulus in inputs.items() if isinstance(stimulus, _InputStream)}
 
         if num_trials is not None:
             num_trials = num_trials
         else:
+            # (this is None if all of the inputs are streamed, in which case the run ends when one of them is exhausted)
             num_trials = num_inputs_sets
 
         if targets is None:
             targets = {}
+        elif num_inputs_sets is None and not isinstance(targets, function_type) and \
+                not all(callable(target) for target in targets.values()):
+            raise RunError("Targets for {} must be specified as functions, since the number of its inputs is not "
+                           "known in advance (they are all specified as iterators).".format(self.name))
 
         scheduler_processing._reset_counts_total(TimeScale.RUN, execution_id)
 
@@ -1241,7 +1294,18 @@ class Composition(object):
 
         # --- RESET FOR NEXT TRIAL ---
         # by looping over the length of the list of inputs - each input represents a TRIAL
-        for trial_num in range(num_trials):
+        for trial_num in (range(num_trials) if num_trials is not None else itertools.count()):
+            # Draw the inputs from any iterators first, so that a run without num_trials ends when one is exhausted
+            execution_stimuli = {}
+            try:
+                for mech, stream in input_streams.items():
+                    execution_stimuli[mech] = next(stream)
+            except StopIteration:
+                if num_trials is None:
+                    break
+                raise RunError("The iterator of inputs for {} was exhausted after {} of the {} trials specified "
+                               "for {}.".format(mech.name, trial_num, num_trials, self.name))
+
             # Execute call before trial "hook" (user defined function)
             if call_before_trial:
                 call_before_trial()
@@ -1252,10 +1316,10 @@ class Composition(object):
         # PROCESSING ------------------------------------------------------------------------
 
             # Prepare stimuli from the outside world  -- collect the inputs for this TRIAL and store them in a dict
-            execution_stimuli = {}
-            stimulus_index = trial_num % num_inputs_sets
+            stimulus_index = trial_num % num_inputs_sets if num_inputs_sets is not None else trial_num
             for mech in inputs:
-                execution_stimuli[mech] = inputs[mech][stimulus_index]
+                if mech not in input_streams:
+                    execution_stimuli[mech] = inputs[mech][stimulus_index]
             # execute processing
             # pass along the stimuli for this trial
             trial_output = self.execute(inputs=execution_stimuli,
@@ -1279,7 +1343,7 @@ class Composition(object):
         # LEARNING ------------------------------------------------------------------------
             # Prepare targets from the outside world  -- collect the targets for this TRIAL and store them in a dict
             execution_targets = {}
-            target_index = trial_num % num_inputs_sets
+            target_index = stimulus_index
             # Assign targets:
             if targets is not None:
 
@@ -1366,6 +1430,13 @@ class Composition(object):
 
         for mech, stim_list in stimuli.items():
 
+            # Inputs provided by an iterator are validated as they are drawn, and don't determine the number of input
+            # sets
+            if _is_input_stream(stim_list):
+                adjusted_stimuli[mech] = _InputStream(mech, stim_list, mech.instance_defaults.value,
+                                                      matches=self._input_matches_variable, error_type=RunError)
+                continue
+
             check_spec_type = self._input_matches_variable(stim_list, mech.instance_defaults.value)
             # If a mechanism provided a single input, wrap it in one more list in order to represent trials
             if check_spec_type == "homogeneous" or check_spec_type == "heterogeneous":
@@ -1383,6 +1454,17 @@ class Composition(object):
                     raise RunError("Input specification for {} is not valid. The number of inputs (1) provided for {}"
                                    "conflicts with at least one other mechanism's input specification.".format(self.name,
                                                                                                                mech.name))
+            elif _adjust_stimulus_array(stim_list, mech.instance_defaults.value) is not None:
+                # A pre-shaped array is validated by its shape, and the input for each trial is a view of it
+                adjusted_stimuli[mech] = _adjust_stimulus_array(stim_list, mech.instance_defaults.value)
+
+                # verify that all mechanisms have provided the same number of inputs
+                if num_input_sets == -1:
+                    num_input_sets = len(stim_list)
+                elif num_input_sets != len(stim_list):
+                    raise RunError("Input specification for {} is not valid. The number of inputs ({}) provided for {}"
+                                   "conflicts with at least one other mechanism's input specification."
+                                   .format(self.name, len(stim_list), mech.name))
             else:
                 adjusted_stimuli[mech] = []
                 for stim in stimuli[mech]:
@@ -1413,4 +1495,9 @@ class Composition(object):
                                    "conflicts with at least one other mechanism's input specification."
                                    .format(self.name, (stimuli[mech]), mech.name))
 
+        # if all of the inputs are provided by iterators, the number of input sets is not known in advance
+        if num_input_sets == -1 and adjusted_stimuli and \
+                all(isinstance(stimulus, _InputStream) for stimulus in adjusted_stimuli.values()):
+            num_input_sets = None
+
         return adjusted_stimuli, num_input_sets
@@ -4,6 +4,7 @@ from . import keywords
 from . import kvo
 from . import log
 from . import preferences
+from . import profiling
 from . import registry
 from . import utilities
 from . import context
@@ -14,6 +15,7 @@ from .keywords import *
 from .kvo import *
 from .log import *
 from .preferences import *
+from .profiling import *
 from .registry import *
 from .utilities import *
 from .context import *
@@ -23,6 +25,7 @@ __all__.extend(keywords.__all__)
 __all__.extend(kvo.__all__)
 __all__.extend(log.__all__)
 __all__.extend(preferences.__all__)
+__all__.extend(profiling.__all__)
 __all__.extend(registry.__all__)
 __all__.extend(environment.__all__)
 __all__.extend(utilities.__all__)
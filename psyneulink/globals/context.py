@@ -98,8 +98,7 @@ from collections import namedtuple
 from enum import IntEnum
 from uuid import UUID
 
-import typecheck as tc
-
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.keywords import CONTROL, EXECUTING, EXECUTION_PHASE, FLAGS, INITIALIZATION_STATUS, INITIALIZING, LEARNING, SEPARATOR_BAR, SOURCE, VALIDATE
 from psyneulink.globals.utilities import get_deepcopy_with_shared_keys
 
@@ -114,6 +113,9 @@ STATUS = 'status'
 
 time = namedtuple('time', 'run trial pass_ time_step')
 
+# the time of a Component that is not being executed in a System
+_no_time = time(None, None, None, None)
+
 class ContextError(Exception):
     def __init__(self, error_value):
         self.error_value = error_value
@@ -570,8 +572,6 @@ def _get_time(component, context_flags):
     from psyneulink.components.states.state import State
     from psyneulink.components.projections.projection import Projection
 
-    no_time = time(None, None, None, None)
-
     # Get mechanism to which Component being logged belongs
     if isinstance(component, Mechanism):
         ref_mech = component
@@ -630,4 +630,4 @@ def _get_time(component, context_flags):
                           "when running Components within a System".format(offender))
         t = None
 
-    return t or no_time
+    return t or _no_time
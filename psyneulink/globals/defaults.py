@@ -12,15 +12,22 @@
 This is an attempt to show the value of defaultControlAllocation:  :py:print:`Defaults.defaultControlAllocation`
 """
 
+import os
+
 from enum import Enum
 
 __all__ = [
     'defaultControlAllocation', 'DefaultControlAllocationMode', 'defaultGatingPolicy', 'DefaultGatingPolicyMode',
-    'inputValueSystemDefault', 'MPI_IMPLEMENTATION', 'outputValueSystemDefault', 'SystemDefaultInputValue',
+    'inputValueSystemDefault', 'MPI_IMPLEMENTATION', 'outputValueSystemDefault', 'PRODUCTION_MODE',
+    'SystemDefaultInputValue',
 ]
 
 MPI_IMPLEMENTATION = False
 
+# Production mode (set by the PSYNEULINK_PRODUCTION_MODE environment variable before psyneulink is imported)
+#    disables runtime typechecking of arguments (see psyneulink.globals.typechecking)
+PRODUCTION_MODE = os.environ.get('PSYNEULINK_PRODUCTION_MODE', '').strip().lower() not in {'', '0', 'false', 'no', 'off'}
+
 # State values:
 inputValueSystemDefault = [0]
 outputValueSystemDefault = [0]
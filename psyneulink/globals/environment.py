@@ -324,6 +324,39 @@ Shorthand - specify **Mechanism a**'s inputs in a list because it is the only or
         s.run(inputs=input_list)
 ..
 
+.. _Run_Inputs_Arrays_and_Iterators:
+
+Pre-shaped arrays and iterators of inputs
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+For long runs, the inputs to an `ORIGIN` Mechanism can be specified in either of two forms that are not converted
+to a list before the first `TRIAL` is executed:
+
+* **a numeric np.ndarray** with one item along its first axis for each `TRIAL`, each of which has the shape of the
+  Mechanism's `external_input_values <MechanismBase.external_input_values>` (or, if that has a single item, the shape
+  of that item).  The array is validated once, by its shape and dtype, rather than item by item, and the input for
+  each `TRIAL` is a view of the array;  this includes an `np.memmap <numpy.memmap>`, so that the inputs for a run
+  can be read from disk as they are used::
+
+        inputs = np.memmap('stimuli.dat', dtype=float, mode='r', shape=(1000000, 1, 2))
+        s.run(inputs={a: inputs})
+
+* **an iterator** (such as a generator) that provides the input for one `TRIAL` each time it is advanced;  each input
+  is validated when it is drawn.  Since its length is not known in advance, the number of `TRIAL` \\s is determined by
+  the inputs for any other `ORIGIN` Mechanisms that are specified as lists or arrays;  if they are all specified as
+  iterators and **num_trials** is not specified, then the run ends when any of the iterators is exhausted (and
+  `targets <Run_Targets>` must then be specified as functions)::
+
+        def stimuli():
+            for i in range(1000000):
+                yield [[i, -i]]
+
+        s.run(inputs={a: stimuli()})
+
+Inputs specified as lists or arrays are reused in a cycle if **num_trials** is greater than their length, but those
+specified as iterators are not;  if an iterator is exhausted before **num_trials** `TRIAL` \\s have been run, a
+`RunError` is raised.
+
 .. _Run_Runtime_Parameters:
 
 Runtime Parameters
@@ -558,16 +591,18 @@ Class Reference
 """
 
 import datetime
+import itertools
 import warnings
 
-from collections import Iterable
+from collections import Iterable, Iterator
 from numbers import Number
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.component import function_type
 from psyneulink.components.shellclasses import Mechanism, Process_Base, System_Base
+from psyneulink.globals import profiling
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import INPUT_LABELS_DICT, MECHANISM, OUTPUT_LABELS_DICT, PROCESS, RUN, SAMPLE, SYSTEM, TARGET
 from psyneulink.globals.log import LogCondition
@@ -599,6 +634,7 @@ def run(obj,
         termination_processing=None,
         termination_learning=None,
         runtime_params=None,
+        profiler=None,
         context=ContextFlags.COMMAND_LINE):
     """run(                      \
     inputs,                      \
@@ -614,6 +650,7 @@ def run(obj,
     termination_processing=None, \
     termination_learning=None,   \
     runtime_params=None,         \
+    profiler=None,               \
     )
 
     Run a sequence of executions for a `Process` or `System`.
@@ -700,6 +737,9 @@ def run(obj,
 
         See `Run_Runtime_Parameters` for more details and examples of valid dictionaries.
 
+    profiler : Profiler : default None
+        the `Profiler` to which the duration of each `TRIAL` is reported (see `System_Profiling`).
+
    Returns
    -------
 
@@ -728,10 +768,12 @@ def run(obj,
                            "mechanisms.".format(obj.name, len(obj.origin_mechanisms)))
 
     inputs, num_inputs_sets = _adjust_stimulus_dict(obj, inputs)
+    input_streams = {mech: stimulus for mech, stimulus in inputs.items() if isinstance(stimulus, _InputStream)}
 
     if num_trials is not None:
         num_trials = num_trials
     else:
+        # (this is None if all of the inputs are streamed, in which case the run ends when one of them is exhausted)
         num_trials = num_inputs_sets
 
     # num_trials = num_trials or num_inputs_sets  # num_trials may be provided by user, otherwise = # of input sets
@@ -759,6 +801,9 @@ def run(obj,
             raise RunError("Target values for {} must be specified in a dictionary.".format(obj.name))
 
         # if num_targets = -1, all targets were specified as functions
+        if num_inputs_sets is None and num_targets != -1:
+            raise RunError("Target values for {} must be specified as functions, since the number of its inputs is "
+                           "not known in advance (they are all specified as iterators).".format(obj.name))
         if num_targets != num_inputs_sets and num_targets != -1:
             raise RunError("Number of target values specified ({}) for each learning sequence in {} must equal the "
                            "number of input values specified ({}) for each origin mechanism in {}."
@@ -812,7 +857,20 @@ def run(obj,
     # EXECUTE
     execution_inputs = {}
     execution_targets = {}
-    for execution in range(num_trials):
+    for execution in (range(num_trials) if num_trials is not None else itertools.count()):
+
+        # Draw the inputs from any iterators first, so that a run without num_trials ends when one is exhausted
+        try:
+            for mech, stream in input_streams.items():
+                execution_inputs[mech] = next(stream)
+        except StopIteration:
+            if num_trials is None:
+                break
+            raise RunError("The iterator of inputs for {} was exhausted after {} of the {} trials specified "
+                           "for {}.".format(mech.name, execution, num_trials, obj.name))
+
+        if profiler is not None:
+            trial_start = profiling.perf_counter()
 
         execution_id = _get_unique_id()
 
@@ -832,10 +890,11 @@ def run(obj,
                     if mechanism.reinitialize_when.is_satisfied(scheduler=obj.scheduler_processing):
                         mechanism.reinitialize(None)
 
-            input_num = execution%num_inputs_sets
+            input_num = execution % num_inputs_sets if num_inputs_sets is not None else execution
 
             for mech in inputs:
-                execution_inputs[mech] = inputs[mech][input_num]
+                if mech not in input_streams:
+                    execution_inputs[mech] = inputs[mech][input_num]
             if object_type == SYSTEM:
                 obj.inputs = execution_inputs
 
@@ -886,6 +945,9 @@ def run(obj,
                              curr_condition=LogCondition.TRIAL,
                              context=context)
 
+        if profiler is not None:
+            profiler._record_trial(profiling.perf_counter() - trial_start)
+
     try:
         obj.scheduler_processing.date_last_run_end = datetime.datetime.now()
         obj.scheduler_learning.date_last_run_end = datetime.datetime.now()
@@ -925,6 +987,60 @@ def _input_matches_external_input_state_values(input, value_to_compare):
         return "heterogeneous"
     return False
 
+def _is_input_stream(stimulus):
+    """Return True if **stimulus** is an iterator (e.g., a generator) that provides the input for each TRIAL"""
+    return isinstance(stimulus, Iterator) and not isinstance(stimulus, (str, np.ndarray))
+
+
+def _adjust_stimulus_array(stimulus, value_to_compare):
+    """Return **stimulus** as an array with the input for each TRIAL along its first axis, if it is a numeric
+    np.ndarray (including an np.memmap) with that shape;  otherwise return None.
+
+    The array is validated by its shape and dtype, rather than by examining each of its items, and is not copied.
+    """
+    if not isinstance(stimulus, np.ndarray) or stimulus.dtype.kind not in 'biuf' or stimulus.ndim < 2:
+        return None
+    value_to_compare = np.asarray(value_to_compare)
+    if value_to_compare.dtype == object:
+        return None
+    if stimulus.shape[1:] == value_to_compare.shape:
+        return stimulus
+    # e.g., [[1, 2], [3, 4]] for a Mechanism with one InputState of length 2 (one 1d input for each trial)
+    if len(value_to_compare) == 1 and stimulus.shape[1:] == value_to_compare.shape[1:]:
+        return stimulus.reshape((len(stimulus),) + value_to_compare.shape)
+    return None
+
+
+class _InputStream:
+    """Iterator over the inputs for a Mechanism provided by another iterator, each of which is validated (and, if
+    necessary, its labels are parsed or it is converted to a 2d array) as it is drawn.
+    """
+
+    def __init__(self, mechanism, stimuli, value_to_compare,
+                 matches=_input_matches_external_input_state_values, parse_labels=None, error_type=None):
+        self.mechanism = mechanism
+        self.stimuli = stimuli
+        self.value_to_compare = value_to_compare
+        self.matches = matches
+        self.parse_labels = parse_labels
+        self.error_type = error_type or RunError
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        stimulus = next(self.stimuli)
+        if self.parse_labels is not None:
+            stimulus = self.parse_labels(stimulus)
+        check_spec_type = self.matches(stimulus, self.value_to_compare)
+        if check_spec_type == "homogeneous":
+            return np.atleast_2d(stimulus)
+        elif check_spec_type == "heterogeneous":
+            return stimulus
+        raise self.error_type("Input stimulus ({}) for {} is incompatible with its external_input_values ({}).".
+                              format(stimulus, self.mechanism.name, self.value_to_compare))
+
+
 def _target_matches_input_state_variable(target, input_state_variable):
     if np.shape(np.atleast_1d(target)) == np.shape(input_state_variable):
         return True
@@ -933,11 +1049,17 @@ def _target_matches_input_state_variable(target, input_state_variable):
 def _adjust_stimulus_dict(obj, stimuli):
 
     #  STEP 0:  parse any labels into array entries
+    #           (those of inputs provided by iterators are parsed as they are drawn, and numeric arrays have none)
     need_parse_input_labels = []
+    stream_input_labels = set()
     for mech in obj.origin_mechanisms:
         if hasattr(mech, "input_labels_dict"):
             if mech.input_labels_dict is not None and mech.input_labels_dict != {}:
-                need_parse_input_labels.append(mech)
+                stimulus = stimuli.get(mech) if isinstance(stimuli, dict) else None
+                if _is_input_stream(stimulus):
+                    stream_input_labels.add(mech)
+                elif _adjust_stimulus_array(stimulus, mech.external_input_values) is None:
+                    need_parse_input_labels.append(mech)
     if len(need_parse_input_labels) > 0:
         stimuli = _parse_input_labels(obj, stimuli, need_parse_input_labels)
 
@@ -969,6 +1091,16 @@ def _adjust_stimulus_dict(obj, stimuli):
 
     for mech, stim_list in stimuli.items():
 
+        # Inputs provided by an iterator are validated as they are drawn, and don't determine the number of input sets
+        if _is_input_stream(stim_list):
+            parse_labels = None
+            if mech in stream_input_labels:
+                def parse_labels(stimulus, mech=mech):
+                    return _parse_input_labels(obj, {mech: [stimulus]}, [mech])[mech][0]
+            adjusted_stimuli[mech] = _InputStream(mech, stim_list, mech.external_input_values,
+                                                  parse_labels=parse_labels)
+            continue
+
         check_spec_type = _input_matches_external_input_state_values(stim_list, mech.external_input_values
                                                                      )
         # If a mechanism provided a single input, wrap it in one more list in order to represent trials
@@ -987,6 +1119,17 @@ def _adjust_stimulus_dict(obj, stimuli):
                 raise RunError("Input specification for {} is not valid. The number of inputs (1) provided for {} "
                                "conflicts with at least one other mechanism's input specification.".format(obj.name,
                                                                                                            mech.name))
+        elif _adjust_stimulus_array(stim_list, mech.external_input_values) is not None:
+            # A pre-shaped array is validated by its shape, and the input for each trial is a view of it
+            adjusted_stimuli[mech] = _adjust_stimulus_array(stim_list, mech.external_input_values)
+
+            # verify that all mechanisms have provided the same number of inputs
+            if num_input_sets == -1:
+                num_input_sets = len(stim_list)
+            elif num_input_sets != len(stim_list):
+                raise RunError("Input specification for {} is not valid. The number of inputs ({}) provided for {}"
+                               "conflicts with at least one other mechanism's input specification."
+                               .format(obj.name, len(stim_list), mech.name))
         else:
             adjusted_stimuli[mech] = []
             for stim in stimuli[mech]:
@@ -1018,6 +1161,11 @@ def _adjust_stimulus_dict(obj, stimuli):
                                "conflicts with at least one other mechanism's input specification."
                                .format(obj.name, (stimuli[mech]), mech.name))
 
+    # if all of the inputs are provided by iterators, the number of input sets is not known in advance
+    if num_input_sets == -1 and adjusted_stimuli and \
+            all(isinstance(stimulus, _InputStream) for stimulus in adjusted_stimuli.values()):
+        num_input_sets = None
+
     return adjusted_stimuli, num_input_sets
 
 def _adjust_target_dict(component, target_dict):
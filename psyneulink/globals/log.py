@@ -387,8 +387,8 @@ from collections import OrderedDict, namedtuple
 from enum import IntEnum
 
 import numpy as np
-import typecheck as tc
 
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags, _get_context, _get_time
 from psyneulink.globals.keywords import ALL, COMMAND_LINE, CONTEXT, INITIALIZING, LEARNING, TIME, VALUE
 from psyneulink.globals.utilities import AutoNumber, ContentAddressableList, is_component
@@ -400,6 +400,19 @@ __all__ = [
 
 LogEntry = namedtuple('LogEntry', 'time, context, value')
 
+# The context string of a LogEntry is shared by all of the entries made under the same condition, rather than being
+#    formatted anew for each one
+_context_strings = {}
+
+
+def _get_context_string(condition):
+    """Return the string with the names of the flags set in **condition**, formatting it the first time it is used"""
+    try:
+        return _context_strings[condition]
+    except KeyError:
+        context_string = _context_strings[condition] = ContextFlags._get_context_string(condition)
+        return context_string
+
 
 class LogCondition(IntEnum):
     """Used to specify the context in which a value of the Component or its attribute is `logged <Log_Conditions>`.
@@ -799,14 +812,12 @@ class Log:
                     raise LogError("PROGRAM ERROR: No condition or context specified in call to _log_value for "
                                    "{} and it has not context.flags".format(self.owner.name))
 
-            condition_string = ContextFlags._get_context_string(condition)
-
             log_pref = self.owner.prefs.logPref if self.owner.prefs else None
 
             # Get time and log value if logging condition is satisfied or called for programmatically
             if (log_pref and log_pref & condition) or condition & ContextFlags.COMMAND_LINE:
                 time = time or _get_time(self.owner, condition)
-                self.entries[self.owner.name] = LogEntry(time, condition_string, value)
+                self.entries[self.owner.name] = LogEntry(time, _get_context_string(condition), value)
 
         if not condition & ContextFlags.COMMAND_LINE:
             self.owner.prev_context = self.owner.context
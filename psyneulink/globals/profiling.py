@@ -0,0 +1,255 @@
+# Princeton University licenses this file to You under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.  You may obtain a copy of the License at:
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and limitations under the License.
+#
+#
+# ***********************************************  Profiling ***********************************************************
+
+"""
+
+Overview
+--------
+
+A Profiler records where the time goes when a `System` is `run <System.run>`.  It is created and assigned to the
+System's `profiler <System.profiler>` attribute when the System's `run <System.run>` method is called with
+**profile** = `True`, and records:
+
+  * for each Component executed, the number of calls and the wall-clock time spent in each `ProfilerPhase` of its
+    execution (e.g., updating its `InputStates <InputState>`, executing its `function <Component.function>`, or
+    logging its `value <Component.value>`);
+  ..
+  * for each `TIME_STEP` of the `processing phase <System_Execution_Processing>`, the `RUN`, `TRIAL`, `PASS` and
+    `TIME_STEP` in which it occurred, the number of Mechanisms executed in it and its duration;
+  ..
+  * the duration of each `TRIAL`, and of the `RUN` as a whole.
+
+The times recorded for a phase are inclusive: for example, the `INPUT_STATES <ProfilerPhase.INPUT_STATES>` time of a
+Mechanism includes the time spent executing the `Projections <Projection>` to its InputStates, which is also recorded
+for each of those Projections under `PROJECTION <ProfilerPhase.PROJECTION>`.  The records are returned as a dictionary
+by the Profiler's `report <Profiler.report>` method, and as a numpy structured array by its `nparray
+<Profiler.nparray>` method.  For example::
+
+    >>> import psyneulink as pnl
+    >>> A = pnl.TransferMechanism(name='A')
+    >>> S = pnl.System(processes=[pnl.Process(pathway=[A])])
+    >>> S.run(inputs={A: [[1.0], [2.0]]}, profile=True)                   #doctest: +SKIP
+    >>> S.profiler.report()['components']['A']['FUNCTION']['calls']       #doctest: +SKIP
+    2
+
+When no Profiler is active, the only cost of the instrumentation is a check of a module-level attribute in each of
+the instrumented methods.
+
+.. _Profiler_Class_Reference:
+
+Class Reference
+---------------
+
+"""
+
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from enum import IntEnum
+
+import numpy as np
+
+__all__ = [
+    'Profiler', 'ProfilerError', 'ProfilerPhase'
+]
+
+# The Profiler to which the instrumented methods report;  None when profiling is disabled
+_active_profiler = None
+
+perf_counter = time.perf_counter
+
+
+class ProfilerError(Exception):
+    def __init__(self, error_value):
+        self.error_value = error_value
+
+    def __str__(self):
+        return repr(self.error_value)
+
+
+class ProfilerPhase(IntEnum):
+    """Identifies the part of the execution of a Component to which a time recorded by a `Profiler` belongs."""
+    EXECUTION = 0
+    """The entire execution of a `Mechanism`."""
+    INPUT_STATES = 1
+    """Updating the `InputStates <InputState>` of a Mechanism (including the execution of its afferent Projections)."""
+    PARAMETER_STATES = 2
+    """Updating the `ParameterStates <ParameterState>` of a Mechanism."""
+    FUNCTION = 3
+    """Executing the `function <Mechanism_Base.function>` of a Mechanism and assigning its `value
+    <Mechanism_Base.value>`."""
+    OUTPUT_STATES = 4
+    """Updating the `OutputStates <OutputState>` of a Mechanism."""
+    PROJECTION = 5
+    """The execution of a `Projection`."""
+    LOGGING = 6
+    """Recording the `value <Component.value>` of a Component in its `Log`."""
+    SCHEDULING = 7
+    """Determining the Mechanisms to execute in each `TIME_STEP` (recorded for the System whose `Scheduler` it is)."""
+    LEARNING = 8
+    """The `learning phase <System_Execution_Learning>` of the execution of a System."""
+    CONTROL = 9
+    """The execution of the `controller <System.controller>` of a System (including any simulations it runs)."""
+
+
+class Profiler:
+    """
+    Profiler(owner=None)
+
+    Records the number of calls and wall-clock time spent in each `ProfilerPhase` of the execution of Components,
+    and the duration of each `TIME_STEP` and `TRIAL` of a `run <System.run>`.
+
+    Arguments
+    ---------
+
+    owner : System : default None
+        the `System` that is profiled.
+
+    Attributes
+    ----------
+
+    owner : System
+        the `System` that is profiled.
+
+    records : OrderedDict
+        contains an entry for each Component and `ProfilerPhase` recorded;  the key of each entry is a
+        (Component, ProfilerPhase) tuple, and its value is a list with the number of calls and total time recorded.
+
+    time_steps : ndarray
+        a structured array with a record of each `TIME_STEP` of the `processing phase <System_Execution_Processing>`
+        (other than those of simulations run by the `controller <System.controller>`);  its fields are *run*,
+        *trial*, *pass*, *time_step*, *executions* (the number of Mechanisms executed) and *time* (in seconds).
+
+    trial_times : ndarray
+        the duration, in seconds, of each `TRIAL` of the run.
+
+    run_time : float
+        the duration, in seconds, of the run.
+
+    """
+
+    _time_step_dtype = np.dtype([('run', int), ('trial', int), ('pass', int), ('time_step', int),
+                                 ('executions', int), ('time', float)])
+
+    def __init__(self, owner=None):
+        self.owner = owner
+        self.records = OrderedDict()
+        self._time_steps = []
+        self._trial_times = []
+        self.run_time = 0.0
+
+    def record(self, component, phase, elapsed):
+        """Add a call to **component** taking **elapsed** seconds in **phase** to `records <Profiler.records>`."""
+        entry = self.records.get((component, phase))
+        if entry is None:
+            self.records[(component, phase)] = [1, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+
+    def profile_execution_sets(self, owner, execution_sets, clock, record_time_steps=True):
+        """Generate the execution sets from **execution_sets**, recording the time spent in the generator under
+        `SCHEDULING <ProfilerPhase.SCHEDULING>` for **owner** and, if **record_time_steps** is `True`, the time spent
+        executing each set as a `TIME_STEP` of **clock**.
+        """
+        while True:
+            start = perf_counter()
+            try:
+                execution_set = next(execution_sets)
+            except StopIteration:
+                self.record(owner, ProfilerPhase.SCHEDULING, perf_counter() - start)
+                return
+            resumed = perf_counter()
+            self.record(owner, ProfilerPhase.SCHEDULING, resumed - start)
+            current_time = clock.time
+            time_step = (current_time.run, current_time.trial, current_time.pass_, current_time.time_step,
+                         len(execution_set))
+            yield execution_set
+            if record_time_steps:
+                self._time_steps.append(time_step + (perf_counter() - resumed,))
+
+    def _record_trial(self, elapsed):
+        self._trial_times.append(elapsed)
+
+    @property
+    def time_steps(self):
+        return np.array(self._time_steps, dtype=self._time_step_dtype)
+
+    @property
+    def trial_times(self):
+        return np.array(self._trial_times, dtype=float)
+
+    def nparray(self):
+        """Return `records <Profiler.records>` as a structured array with the fields *component* (the name of the
+        Component), *phase* (the name of the `ProfilerPhase`), *calls* and *time* (in seconds).
+        """
+        names = [component.name for component, phase in self.records] or ['']
+        dtype = np.dtype([('component', 'U{}'.format(max(len(name) for name in names))),
+                          ('phase', 'U{}'.format(max(len(phase.name) for phase in ProfilerPhase))),
+                          ('calls', int),
+                          ('time', float)])
+        return np.array([(component.name, phase.name, calls, elapsed)
+                         for (component, phase), (calls, elapsed) in self.records.items()],
+                        dtype=dtype)
+
+    def report(self):
+        """Return the results of the Profiler as a dictionary, with the entries:
+
+            * *components* -- a dictionary with an entry for each Component recorded, keyed by its name;  the value
+              of each is a dictionary with an entry for each of its `ProfilerPhases <ProfilerPhase>` recorded, keyed
+              by the phase's name, that contains its *calls* and *time* (summed over Components with the same name);
+            ..
+            * *phases* -- the *calls* and *time* recorded for each `ProfilerPhase`, summed over Components;
+            ..
+            * *time_steps* -- `time_steps <Profiler.time_steps>`;
+            ..
+            * *trials* -- `trial_times <Profiler.trial_times>`;
+            ..
+            * *run* -- `run_time <Profiler.run_time>`.
+        """
+        components = OrderedDict()
+        phases = OrderedDict()
+        for (component, phase), (calls, elapsed) in self.records.items():
+            # (States of different Components can have the same name, in which case their records are combined)
+            for totals in (components.setdefault(component.name, OrderedDict()).setdefault(phase.name,
+                                                                                           {'calls': 0, 'time': 0.0}),
+                           phases.setdefault(phase.name, {'calls': 0, 'time': 0.0})):
+                totals['calls'] += calls
+                totals['time'] += elapsed
+        return {'components': components,
+                'phases': phases,
+                'time_steps': self.time_steps,
+                'trials': self.trial_times,
+                'run': self.run_time}
+
+
+@contextmanager
+def _profile(profiler):
+    """Make **profiler** the one to which the instrumented methods report, and record the duration of the block
+    as its `run_time <Profiler.run_time>`;  if **profiler** is None, the active Profiler is left unchanged.
+    """
+    global _active_profiler
+
+    if profiler is None:
+        yield
+        return
+
+    if _active_profiler is not None:
+        raise ProfilerError("A run of {} cannot be profiled while that of {} is being profiled."
+                            .format(profiler.owner.name if profiler.owner else 'a System',
+                                    _active_profiler.owner.name if _active_profiler.owner else 'another System'))
+
+    _active_profiler = profiler
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        profiler.run_time += perf_counter() - start
+        _active_profiler = None
@@ -0,0 +1,34 @@
+# Princeton University licenses this file to You under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.  You may obtain a copy of the License at:
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and limitations under the License.
+#
+#
+# ********************************************  Type Checking  *********************************************************
+"""
+Wraps the `typecheck-decorator <https://github.com/prechelt/typecheck-decorator>`_ package, which is used to validate
+the arguments of PsyNeuLink constructors and methods.  It is imported in place of that package (as ``tc``), and provides
+the same decorator and predicates (``tc.typecheck``, ``tc.optional``, ``tc.any``, ``tc.enum``, etc.).
+
+By default, every call to a method decorated with ``@tc.typecheck`` checks its arguments against their annotations.
+This is useful while a model is being developed, but adds overhead to every call of the decorated methods, many of
+which are executed on every trial.  If the ``PSYNEULINK_PRODUCTION_MODE`` environment variable is set (to any value
+other than ``0``, ``false``, ``no`` or ``off``) before psyneulink is imported, `PRODUCTION_MODE` is True and
+``tc.typecheck`` returns the method it decorates unchanged, so that no argument checking is done at runtime::
+
+    $ PSYNEULINK_PRODUCTION_MODE=1 python my_model.py
+
+Since the decorators are applied when psyneulink is imported, production mode cannot be changed afterwards.
+"""
+
+from typecheck import *  # noqa: F401,F403
+from typecheck import optional  # noqa: F401
+
+from psyneulink.globals.defaults import PRODUCTION_MODE
+
+if PRODUCTION_MODE:
+    def typecheck(method, **kwargs):
+        """Return **method** unchanged (argument checking is disabled in production mode)."""
+        return method
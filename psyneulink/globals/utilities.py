@@ -30,6 +30,7 @@ TYPE CHECKING VALUE COMPARISON
 * `optional_parameter_spec`
 * `is_matrix
 * `is_matrix_spec`
+* `is_sparse_matrix`
 * `is_numeric`
 * `is_numeric_or_none`
 * `iscompatible`
@@ -62,6 +63,10 @@ OTHER
 * `multi_getattr`
 * `np_array_less_that_2d`
 * `convert_to_np_array`
+* `combine_sparse_entries`
+* `cast_to_dtype`
+* `get_random_state`
+* `get_signature_info`
 * `type_match`
 * `get_value_from_array`
 * `is_matrix`
@@ -72,14 +77,20 @@ OTHER
 * `make_readonly_property`
 * `get_class_attributes`
 * `insert_list`
+* `lazy_import_submodules`
 
 """
 
 import copy
+import hashlib
+import importlib
 import inspect
 import logging
 import numbers
+import sys
+import types
 import warnings
+import weakref
 
 from enum import Enum, EnumMeta, IntEnum
 
@@ -89,9 +100,9 @@ import numpy as np
 from psyneulink.globals.keywords import DISTANCE_METRICS, MATRIX_KEYWORD_VALUES, NAME, VALUE
 
 __all__ = [
-    'append_type_to_name', 'AutoNumber', 'ContentAddressableList', 'convert_to_np_array', 'convert_all_elements_to_np_array', 'get_class_attributes',
-    'get_modulationOperation_name', 'get_value_from_array', 'is_component', 'is_distance_metric', 'is_matrix',
-    'insert_list', 'is_matrix_spec',
+    'append_type_to_name', 'AutoNumber', 'cast_to_dtype', 'combine_sparse_entries', 'ContentAddressableList', 'convert_to_np_array', 'convert_all_elements_to_np_array', 'get_class_attributes',
+    'get_modulationOperation_name', 'get_random_state', 'get_signature_info', 'get_value_from_array', 'is_component', 'is_distance_metric', 'is_matrix',
+    'insert_list', 'is_matrix_spec', 'is_sparse_matrix', 'lazy_import_submodules',
     'is_modulation_operation', 'is_numeric', 'is_numeric_or_none', 'is_same_function_spec', 'is_unit_interval',
     'is_value_spec', 'iscompatible', 'kwCompatibilityLength', 'kwCompatibilityNumeric', 'kwCompatibilityType',
     'make_readonly_property', 'merge_param_dicts', 'Modulation', 'MODULATION_ADD', 'MODULATION_MULTIPLY',
@@ -257,7 +268,7 @@ def is_matrix(m):
 
     if is_matrix_spec(m):
         return True
-    if isinstance(m, (list, np.ndarray, np.matrix)):
+    if isinstance(m, (list, np.ndarray, np.matrix)) or is_sparse_matrix(m):
         return True
     if m is None or isinstance(m, (Component, dict, set)) or (inspect.isclass(m) and issubclass(m, Component)):
         return False
@@ -274,6 +285,16 @@ def is_matrix(m):
     return False
 
 
+def is_sparse_matrix(m):
+    """Return `True` if **m** is a scipy.sparse matrix
+
+    scipy is not imported by PsyNeuLink (to keep it out of the import time of the package);  if it has not been
+    imported by the caller, **m** cannot be a sparse matrix, so `False` is returned.
+    """
+    sparse = sys.modules.get('scipy.sparse')
+    return sparse is not None and sparse.issparse(m)
+
+
 def is_distance_metric(s):
     if s in DISTANCE_METRICS:
         return True
@@ -343,6 +364,12 @@ def iscompatible(candidate, reference=None, **kargs):
     :return:
     """
 
+    # Sparse matrices can't be compared elementwise, so compare their shapes (or accept them for a matrix keyword)
+    if is_sparse_matrix(candidate) or is_sparse_matrix(reference):
+        if reference is None or is_matrix_spec(reference):
+            return is_matrix(candidate)
+        return is_matrix(candidate) and np.shape(candidate) == np.shape(reference)
+
     # If the two are equal, can settle it right here
     # IMPLEMENTATION NOTE: remove the duck typing when numpy supports a direct comparison of iterables
     try:
@@ -350,7 +377,7 @@ def iscompatible(candidate, reference=None, **kargs):
             warnings.simplefilter(action='ignore', category=FutureWarning)
             if reference is not None and (candidate == reference):
                 return True
-    except ValueError:
+    except (ValueError, TypeError):
         # raise UtilitiesError("Could not compare {0} and {1}".format(candidate, reference))
         # IMPLEMENTATION NOTE: np.array generates the following error:
         # ValueError: The truth value of an array with more than one element is ambiguous. Use a.any() or a.all()
@@ -630,6 +657,10 @@ def get_deepcopy_with_shared_keys(shared_keys_iter):
         Returns
         -------
             a __deepcopy__ function
+
+        The value of a shared key is nevertheless copied if it, or the object that owns it, is copied by the same
+        call to deepcopy (e.g., when a Mechanism is copied, the owner of each of its States refers to the copy of the
+        Mechanism, and the function_object of each State is copied along with the State).
     '''
     def __deepcopy__(self, memo):
         cls = self.__class__
@@ -643,6 +674,12 @@ def get_deepcopy_with_shared_keys(shared_keys_iter):
             if k not in shared_keys_iter:
                 res_val = copy.deepcopy(v, memo)
                 setattr(result, k, res_val)
+
+        for k in shared_keys_iter:
+            if k in self.__dict__:
+                v = self.__dict__[k]
+                if id(v) in memo or id(getattr(v, 'owner', None)) in memo:
+                    setattr(result, k, copy.deepcopy(v, memo))
         return result
 
     return __deepcopy__
@@ -671,6 +708,10 @@ def convert_to_np_array(value, dimension):
     if value is None:
         return None
 
+    # Sparse matrices are already 2d, and are left sparse
+    if is_sparse_matrix(value):
+        return value
+
     if dimension is 1:
         # KAM 6/28/18: added for cases when even np does not recognize the shape/dtype
         # Needed this specifically for the following shape: variable = [[0.0], [0.0], np.array([[0.0, 0.0]])]
@@ -705,6 +746,47 @@ def convert_to_np_array(value, dimension):
     return value
 
 
+def combine_sparse_entries(matrix, other, operation=np.add):
+    """Apply **operation** to the stored entries of sparse **matrix** and the corresponding entries of **other**
+
+    **other** can be a scalar or an array with the same shape as **matrix**;  entries of **other** outside the
+    sparsity pattern of **matrix** are ignored, so the matrix returned has the same pattern and format as **matrix**.
+    """
+    result = matrix.tocoo(copy=True)
+    if np.ndim(other) != 0:
+        other = np.asarray(other)[result.row, result.col]
+    result.data = operation(result.data, other)
+    return result.asformat(matrix.format)
+
+
+def cast_to_dtype(value, dtype):
+    """Return **value** with its floating point entries cast to **dtype**
+
+    np.ndarrays and sparse matrices of floats are cast (without copying if they already have **dtype**);  the items of
+    object arrays (e.g., ragged 2d values) and lists are cast recursively (a list is copied only if any of its items
+    is cast).  Any other value is returned unchanged.
+    """
+    if dtype is None:
+        return value
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == 'f':
+            return value.astype(dtype, copy=False)
+        if value.dtype == object:
+            result = np.empty_like(value)
+            for index, item in np.ndenumerate(value):
+                result[index] = cast_to_dtype(item, dtype)
+            return result
+        return value
+    if isinstance(value, list):
+        cast_items = [cast_to_dtype(item, dtype) for item in value]
+        if any(cast_item is not item for cast_item, item in zip(cast_items, value)):
+            return cast_items
+        return value
+    if is_sparse_matrix(value) and value.dtype.kind == 'f':
+        return value.astype(dtype, copy=False)
+    return value
+
+
 def object_has_single_value(obj):
     '''
         Returns
@@ -725,7 +807,7 @@ def object_has_single_value(obj):
 
 
 def type_match(value, value_type):
-    if isinstance(value, value_type):
+    if isinstance(value, value_type) or is_sparse_matrix(value):
         return value
     if value_type in {int, np.integer, np.int64, np.int32}:
         return int(value)
@@ -751,10 +833,32 @@ def get_value_from_array(array):
     :return:
     """
 
-def random_matrix(sender, receiver, clip=1, offset=0):
+def get_random_state(seed, key):
+    """Return a np.random.RandomState for **key** (e.g., the name of a Component), derived from **seed**
+
+    The state is determined by a hash of **seed** and **key**, so that the streams of random numbers generated for
+    different keys are independent of each other, and of the order in which they are created.
+
+    Arguments
+    ----------
+    seed : int
+        specifies the seed from which the state is derived.
+
+    key : str
+        specifies the stream of random numbers for **seed**.
+
+    Returns
+    -------
+    np.random.RandomState
+    """
+    digest = hashlib.sha256('{}:{}'.format(seed, key).encode()).digest()
+    return np.random.RandomState(np.frombuffer(digest, dtype=np.uint32))
+
+
+def random_matrix(sender, receiver, clip=1, offset=0, random_state=None):
     """Generate a random matrix
 
-    Calls np.random.rand to generate a 2d np.array with random values.
+    Calls np.random.rand (or the rand method of **random_state**) to generate a 2d np.array with random values.
 
     Arguments
     ----------
@@ -770,11 +874,15 @@ def random_matrix(sender, receiver, clip=1, offset=0):
     offset : int
         specifies amount added to each entry of the matrix.
 
+    random_state : np.random.RandomState : default None
+        specifies the source of random values;  if it is None, the global state of np.random is used.
+
     Returns
     -------
     2d np.array
     """
-    return (clip * np.random.rand(sender, receiver)) + offset
+    random_state = random_state if random_state is not None else np.random
+    return (clip * random_state.rand(sender, receiver)) + offset
 
 def underscore_to_camelCase(item):
     item = item[1:]
@@ -1070,7 +1178,7 @@ class ContentAddressableList(UserList):
 
 
 def is_value_spec(spec):
-    if isinstance(spec, (numbers.Number, np.ndarray)):
+    if isinstance(spec, (numbers.Number, np.ndarray)) or is_sparse_matrix(spec):
         return True
     elif isinstance(spec, list) and is_numeric(spec):
         return True
@@ -1173,6 +1281,9 @@ def convert_all_elements_to_np_array(arr, cast_from=None, cast_to=None):
     if cast_from is not None and isinstance(arr, cast_from):
         return np.asarray(arr, dtype=cast_to)
 
+    if is_sparse_matrix(arr):
+        return arr
+
     if not isinstance(arr, collections.Iterable) or isinstance(arr, str):
         return np.array(arr)
 
@@ -1216,7 +1327,7 @@ def safe_len(arr, fallback=1):
         return fallback
 
 
-import typecheck as tc
+from psyneulink.globals import typechecking as tc
 @tc.typecheck
 def _get_arg_from_stack(arg_name:str):
     # Get arg from the stack
@@ -1247,24 +1358,66 @@ def _get_arg_from_stack(arg_name:str):
     return arg_val
 
 
-def prune_unused_args(func, args=None, kwargs=None):
-    # use the func signature to filter out arguments that aren't compatible
-    sig = inspect.signature(func)
+SignatureInfo = collections.namedtuple('SignatureInfo', ['parameter_names', 'keyword_names', 'count_positional',
+                                                           'has_args_param', 'has_kwargs_param'])
+SignatureInfo.__doc__ = """Parameters of a callable's signature, as used to determine the arguments to pass to it
+
+    parameter_names : the names of all of the parameters, in order (excluding *args and **kwargs)
+    keyword_names : the names of the parameters that can be passed by keyword
+    count_positional : the number of parameters without a default value
+    has_args_param : whether the callable accepts *args
+    has_kwargs_param : whether the callable accepts **kwargs
+"""
+
+# SignatureInfo for each function, indexed by whether it is that of a method bound to an object
+_signature_info_cache = weakref.WeakKeyDictionary()
+
+
+def get_signature_info(func):
+    """Return a `SignatureInfo` describing the parameters of **func**
+
+    The information is computed once for each function (and once for all of the methods bound to the same function),
+    so it is not recomputed for each call to a function that is called repeatedly; it is not updated if the
+    signature of the function is changed after it is first requested.
+    """
+    underlying_func = getattr(func, '__func__', func)
+    bound = underlying_func is not func
+    try:
+        return _signature_info_cache[underlying_func][bound]
+    except (KeyError, TypeError):
+        pass
 
+    parameter_names = []
+    keyword_names = set()
+    count_positional = 0
     has_args_param = False
     has_kwargs_param = False
-    count_positional = 0
-    func_kwargs_names = set()
-
-    for name, param in sig.parameters.items():
+    for name, param in inspect.signature(func).parameters.items():
         if param.kind is inspect.Parameter.VAR_POSITIONAL:
             has_args_param = True
         elif param.kind is inspect.Parameter.VAR_KEYWORD:
             has_kwargs_param = True
-        elif param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD or param.kind is inspect.Parameter.KEYWORD_ONLY:
-            if param.default is inspect.Parameter.empty:
-                count_positional += 1
-            func_kwargs_names.add(name)
+        else:
+            parameter_names.append(name)
+            if param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD or param.kind is inspect.Parameter.KEYWORD_ONLY:
+                if param.default is inspect.Parameter.empty:
+                    count_positional += 1
+                keyword_names.add(name)
+    signature_info = SignatureInfo(tuple(parameter_names), frozenset(keyword_names), count_positional,
+                                   has_args_param, has_kwargs_param)
+
+    try:
+        _signature_info_cache.setdefault(underlying_func, {})[bound] = signature_info
+    except TypeError:
+        # func can't be weakly referenced (e.g., it is a built-in function), so its information is not cached
+        pass
+    return signature_info
+
+
+def prune_unused_args(func, args=None, kwargs=None):
+    # use the func signature to filter out arguments that aren't compatible
+    signature_info = get_signature_info(func)
+    count_positional = signature_info.count_positional
 
     if args is not None:
         try:
@@ -1272,7 +1425,7 @@ def prune_unused_args(func, args=None, kwargs=None):
         except TypeError:
             args = [args]
 
-        if not has_args_param:
+        if not signature_info.has_args_param:
             num_extra_args = len(args) - count_positional
             if num_extra_args > 0:
                 logger.debug('{1} extra arguments specified to function {0}, will be ignored (values: {2})'.format(func, num_extra_args, args[-num_extra_args:]))
@@ -1283,11 +1436,8 @@ def prune_unused_args(func, args=None, kwargs=None):
     if kwargs is not None:
         kwargs = dict(kwargs)
 
-        if not has_kwargs_param:
-            filtered = set()
-            for kw in kwargs:
-                if kw not in func_kwargs_names:
-                    filtered.add(kw)
+        if not signature_info.has_kwargs_param:
+            filtered = set(kwargs) - signature_info.keyword_names
             if len(filtered) > 0:
                 logger.debug('{1} extra keyword arguments specified to function {0}, will be ignored (values: {2})'.format(func, len(filtered), filtered))
             for kw in filtered:
@@ -1301,3 +1451,75 @@ def prune_unused_args(func, args=None, kwargs=None):
 def call_with_pruned_args(func, *args, **kwargs):
     args, kwargs = prune_unused_args(func, args, kwargs)
     return func(*args, **kwargs)
+
+
+class _LazyPackage(types.ModuleType):
+    """Module type of a package that imports its lazy submodules when one of its missing attributes is first requested
+
+    Requesting any attribute that is not already defined (including ``__all__``, as done by a starred import) imports
+    each of the lazy submodules and assigns the names listed in its ``__all__`` to the package;  lazy attributes are
+    computed the first time they are requested (see `lazy_import_submodules`).
+    """
+
+    def __getattr__(self, name):
+        # Only called if name is not already an attribute of the package
+        lazy_attributes = self.__dict__['_lazy_attributes']
+        if name in lazy_attributes:
+            value = self.__dict__[name] = lazy_attributes[name]()
+            return value
+        if name.startswith('__') and name != '__all__':
+            raise AttributeError("module {!r} has no attribute {!r}".format(self.__name__, name))
+        self._import_lazy_submodules()
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError("module {!r} has no attribute {!r}".format(self.__name__, name))
+
+    def _import_lazy_submodules(self):
+        attributes = self.__dict__
+        if attributes['_lazy_submodules_imported']:
+            return
+        # Flag first, so that attribute requests made while the submodules are being imported don't recurse
+        attributes['_lazy_submodules_imported'] = True
+        try:
+            names = list(attributes['_eager_all'])
+            for submodule_name in attributes['_lazy_submodules']:
+                submodule = importlib.import_module('.' + submodule_name, self.__name__)
+                for name in submodule.__all__:
+                    attributes[name] = getattr(submodule, name)
+                names.extend(submodule.__all__)
+        except:
+            attributes['_lazy_submodules_imported'] = False
+            raise
+        attributes['__all__'] = names
+
+
+def lazy_import_submodules(package_name, submodules, lazy_attributes=None):
+    """Defer the import of **submodules** of the package **package_name** until they are needed
+
+    Replaces ``from .<submodule> import *`` (and the corresponding extension of ``__all__``) in the package's
+    ``__init__``:  the submodules are imported, and the names in their ``__all__`` assigned to the package, the first
+    time an attribute of the package that is not already defined is requested (e.g., ``psyneulink.LCA`` or a starred
+    import of the package).  Importing a submodule explicitly (e.g., ``import psyneulink.library.mechanisms``) imports
+    only that submodule and the packages that contain it.  Any ``__all__`` already defined by the package is retained
+    and extended by those of the submodules.
+
+    Arguments
+    ---------
+
+    package_name : str
+        the ``__name__`` of the package (which must already be in ``sys.modules``).
+
+    submodules : list[str]
+        the names of the submodules of the package to import lazily.
+
+    lazy_attributes : dict : default None
+        maps the names of other attributes of the package to functions (called without arguments) that compute their
+        values;  each is called the first time the attribute is requested, and its value assigned to the package.
+    """
+    package = sys.modules[package_name]
+    package.__class__ = _LazyPackage
+    package._eager_all = package.__dict__.pop('__all__', [])
+    package._lazy_submodules = list(submodules)
+    package._lazy_submodules_imported = False
+    package._lazy_attributes = dict(lazy_attributes or {})
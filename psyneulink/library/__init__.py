@@ -4,14 +4,6 @@ This module provides implementations of theory using the core components of psyn
 https://princetonuniversity.github.io/PsyNeuLink/Library.html
 '''
 
-from . import mechanisms
-from . import projections
-from . import subsystems
+from psyneulink.globals.utilities import lazy_import_submodules
 
-from .mechanisms import *
-from .projections import *
-from .subsystems import *
-
-__all__ = list(mechanisms.__all__)
-__all__.extend(projections.__all__)
-__all__.extend(subsystems.__all__)
+lazy_import_submodules(__name__, ['mechanisms', 'projections', 'subsystems'])
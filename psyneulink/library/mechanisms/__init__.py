@@ -1,8 +1,3 @@
-from . import adaptive
-from . import processing
+from psyneulink.globals.utilities import lazy_import_submodules
 
-from .adaptive import *
-from .processing import *
-
-__all__ = list(adaptive.__all__)
-__all__.extend(processing.__all__)
+lazy_import_submodules(__name__, ['adaptive', 'processing'])
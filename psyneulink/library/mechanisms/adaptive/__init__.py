@@ -1,8 +1,3 @@
-from . import control
-from . import learning
+from psyneulink.globals.utilities import lazy_import_submodules
 
-from .control import *
-from .learning import *
-
-__all__ = list(control.__all__)
-__all__.extend(learning.__all__)
+lazy_import_submodules(__name__, ['control', 'learning'])
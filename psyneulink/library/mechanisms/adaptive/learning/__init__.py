@@ -1,5 +1,3 @@
-from . import autoassociativelearningmechanism
+from psyneulink.globals.utilities import lazy_import_submodules
 
-from .autoassociativelearningmechanism import *
-
-__all__ = list(autoassociativelearningmechanism.__all__)
+lazy_import_submodules(__name__, ['autoassociativelearningmechanism'])
@@ -1,14 +1,3 @@
-from . import integrator
-from . import leabramechanism
-from . import objective
-from . import transfer
+from psyneulink.globals.utilities import lazy_import_submodules
 
-from .integrator import *
-from .leabramechanism import *
-from .objective import *
-from .transfer import *
-
-__all__ = list(integrator.__all__)
-__all__.extend(leabramechanism.__all__)
-__all__.extend(objective.__all__)
-__all__.extend(transfer.__all__)
+lazy_import_submodules(__name__, ['integrator', 'leabramechanism', 'objective', 'transfer'])
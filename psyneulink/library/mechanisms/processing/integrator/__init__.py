@@ -1,5 +1,3 @@
-from . import ddm
+from psyneulink.globals.utilities import lazy_import_submodules
 
-from .ddm import *
-
-__all__ = list(ddm.__all__)
+lazy_import_submodules(__name__, ['ddm'])
@@ -333,7 +333,6 @@ import random
 from collections import Iterable
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.component import method_type
 from psyneulink.components.functions.function import BogaczEtAl, DriftDiffusionIntegrator, Integrator, NF_Results, NavarroAndFuss, Reduce, STARTING_POINT, THRESHOLD
@@ -342,6 +341,7 @@ from psyneulink.components.mechanisms.mechanism import Mechanism_Base
 from psyneulink.components.mechanisms.processing.processingmechanism import ProcessingMechanism_Base
 from psyneulink.components.states.modulatorysignals.controlsignal import ControlSignal
 from psyneulink.components.states.outputstate import SEQUENTIAL, StandardOutputStates
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import ALLOCATION_SAMPLES, FUNCTION, FUNCTION_PARAMS, INITIALIZING, INPUT_STATE_VARIABLES, NAME, OUTPUT_STATES, OWNER_VALUE, VARIABLE, kwPreferenceSetName
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set, kpReportOutputPref
@@ -697,6 +697,9 @@ class DDM(ProcessingMechanism_Base):
 
     componentType = "DDM"
 
+    # (the decision variable is sampled for analytic solutions)
+    _skippable = False
+
     classPreferenceLevel = PreferenceLevel.SUBTYPE
     # These will override those specified in SubtypeDefaultPreferences
     classPreferences = {
@@ -1062,7 +1065,9 @@ class DDM(ProcessingMechanism_Base):
 
             # Convert ER to decision variable:
             threshold = float(self.function_object.get_current_function_param(THRESHOLD))
-            if random.random() < return_value[self.PROBABILITY_LOWER_THRESHOLD_INDEX]:
+            # (uses the random module unless a random_state has been assigned, e.g., by the seed of a System)
+            random_value = random.random() if self.random_state is np.random else self.random_state.random_sample()
+            if random_value < return_value[self.PROBABILITY_LOWER_THRESHOLD_INDEX]:
                 return_value[self.DECISION_VARIABLE_INDEX] = np.atleast_1d(-1 * threshold)
             else:
                 return_value[self.DECISION_VARIABLE_INDEX] = threshold
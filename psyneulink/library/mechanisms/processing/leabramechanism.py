@@ -18,10 +18,13 @@ network algorithm (`O'Reilly, 1996 <ftp://grey.colorado.edu/pub/oreilly/thesis/o
 info about leabra, please see `O'Reilly and Munakata, 2016 <https://grey.colorado.edu/emergent/index.php/Leabra>`_.
 
 .. note::
-    The LeabraMechanism uses the leabra Python package, which can be found
-    `here <https://github.com/benureau/leabra>`_ at Github. You may need to install the Python leabra package in order
-    to use the LeabraMechanism. While the LeabraMechanism should always match the output of an equivalent network in
-    the leabra package, the leabra package itself is still in development, so it is not guaranteed to be correct yet.
+    By default, the LeabraMechanism executes a `LeabraNetwork`, which represents the units of each layer as arrays
+    and the connections between layers as weight matrices, so that networks with hundreds of units in each layer can
+    be executed efficiently.  A network from the leabra Python package, which can be found
+    `here <https://github.com/benureau/leabra>`_ at Github and models each unit and connection as a Python object,
+    can be used instead (see `Leabra_Mechanism_Creation`);  this requires the leabra package to be installed.  The
+    two implementations use the same equations, but differ in some of the details of their numerical integration, so
+    their outputs are similar but not identical.
 
 .. _Leabra_Mechanism_Creation:
 
@@ -30,10 +33,11 @@ Creating a LeabraMechanism
 
 A LeabraMechanism can be created in two ways. Users can specify the size of the input layer (**input_size**), size
 of the output layer (**output_size**), number of hidden layers (**hidden_layers**), and sizes of the hidden layers
-(**hidden_sizes**). In this case, the LeabraMechanism will initialize the connections as uniform random values between
-0.55 and 0.95. Alternatively, users can provide a leabra Network object from the leabra package as an argument
-(**leabra_net**), in which case the **leabra_net** will be used as the network wrapped by the LeabraMechanism.
-This option requires users to be familiar with the leabra package, but allows more flexibility in specifying parameters.
+(**hidden_sizes**). In this case, the LeabraMechanism will create a `LeabraNetwork`, and initialize the connections
+as uniform random values between 0.55 and 0.95. Alternatively, users can provide a `LeabraNetwork` (e.g., with
+specified weights) or a Network object from the leabra package as an argument (**leabra_net**), in which case the
+**leabra_net** will be used as the network wrapped by the LeabraMechanism.  A Network from the leabra package
+requires users to be familiar with that package, but allows more flexibility in specifying parameters.
 In the former method of creating a LeabraMechanism, the **training_flag** argument specifies whether the network should
 be learning (updating its weights) or not.
 
@@ -90,6 +94,7 @@ Class Reference
 """
 
 import numbers
+import random
 
 import numpy as np
 
@@ -111,8 +116,9 @@ from psyneulink.globals.preferences.preferenceset import PreferenceEntry, Prefer
 from psyneulink.scheduling.time import TimeScale
 
 __all__ = [
-    'build_leabra_network', 'convert_to_2d_input', 'input_state_names', 'LeabraError', 'LeabraFunction', 'LeabraMechanism',
-    'LEARNING_TARGET', 'MAIN_INPUT', 'MAIN_OUTPUT', 'output_state_name', 'run_leabra_network', 'train_leabra_network',
+    'build_leabra_network', 'convert_to_2d_input', 'get_layer_sizes', 'input_state_names', 'LeabraError',
+    'LeabraFunction', 'LeabraMechanism', 'LeabraNetwork', 'LEARNING_TARGET', 'MAIN_INPUT', 'MAIN_OUTPUT',
+    'output_state_name', 'run_leabra_network', 'train_leabra_network',
 ]
 
 # Used to name input_states and output_states:
@@ -132,6 +138,300 @@ class LeabraError(Exception):
         return repr(self.error_value)
 
 
+def _xx1(x, gain):
+    """X-over-X-plus-1 activation function of Leabra rate-code units"""
+    x = np.maximum(gain * x, 0)
+    return x / (x + 1)
+
+
+def _noisy_xx1_table(gain, sd, step=1e-4):
+    """Return the points at which the noisy XX1 function (XX1 convolved with Gaussian noise with standard deviation
+    **sd**) is tabulated and its values at them; beyond these points it is equal to XX1.
+    """
+    half_width = 6 * sd
+    x = np.arange(-2 * half_width, 2 * half_width + step / 2, step)
+    kernel_x = np.arange(-half_width, half_width + step / 2, step)
+    kernel = np.exp(-kernel_x ** 2 / (2 * sd ** 2))
+    kernel /= np.sum(kernel)
+    values = np.convolve(_xx1(x, gain), kernel, mode='same')
+    # keep only the points at which the kernel did not extend beyond the tabulated values of XX1
+    n = len(kernel_x) // 2
+    return x[n:-n], values[n:-n]
+
+
+class LeabraNetwork:
+    """
+    LeabraNetwork(               \
+        layer_sizes,             \
+        weights=None,            \
+        training_flag=False,     \
+        quarter_size=50,         \
+        learning_rate=0.04)
+
+    Leabra network whose layers are represented by arrays of the state variables of their units, and whose
+    connections (a full projection from each layer to the next) are represented by weight matrices.  It is the
+    network built by a `LeabraMechanism` unless a network from the leabra package is specified in its **leabra_net**
+    argument, and is executed one `trial <LeabraNetwork.trial>` at a time.
+
+    Each trial consists of four quarters of `quarter_size <LeabraNetwork.quarter_size>` cycles.  The first layer is
+    clamped to the input throughout the trial;  in each cycle, the other layers update their excitatory conductances
+    from the activities of the preceding layer, their inhibitory conductances by feedforward/feedback (FFFB)
+    inhibition (the successor to k-winners-take-all inhibition in Leabra), and their membrane potentials and
+    activities (using the noisy XX1 function).  The output of the trial is the activity of the last layer at the end
+    of the third quarter (the minus phase).  If the network is learning, the last layer is then clamped to the
+    target for the fourth quarter (the plus phase), after which the weights are updated using the XCAL learning rule;
+    otherwise the fourth quarter is not run.
+
+    The constants of the units, of the inhibition and of the learning rule are class attributes, named as in the
+    leabra package, that can be overridden for an instance.
+
+    Arguments
+    ---------
+
+    layer_sizes : List[int]
+        the number of units in each layer, from the input layer to the output layer.
+
+    weights : List[2d np.array] : default uniform random values between 0.55 and 0.95
+        the weights of the connections from each layer to the next, with one row for each unit of the sending layer.
+
+    training_flag : bool : default False
+        specifies whether the network learns when it is given a target.
+
+    quarter_size : int : default 50
+        the number of cycles in each quarter of a trial.
+
+    learning_rate : float : default 0.04
+        the learning rate of the XCAL learning rule.
+
+    Attributes
+    ----------
+
+    layer_sizes : List[int]
+        the number of units in each layer.
+
+    weights : List[2d np.array]
+        the weights of the connections from each layer to the next.
+
+    training_flag : bool
+        determines whether the network learns when it is given a target.
+
+    quarter_size : int
+        the number of cycles in each quarter of a trial.
+
+    learning_rate : float
+        the learning rate of the XCAL learning rule.
+
+    """
+
+    # units
+    g_bar_e = 1.0
+    g_bar_l = 0.1
+    g_bar_i = 1.0
+    e_rev_e = 1.0
+    e_rev_l = 0.3
+    e_rev_i = 0.25
+    act_thr = 0.5
+    act_gain = 100
+    act_sd = 0.005
+    net_dt = 1 / 1.4
+    vm_dt = 1 / 3.3
+    vm_init = 0.4
+    vm_min = 0.0
+    vm_max = 2.0
+    adapt_dt = 1 / 144
+    vm_gain = 0.04
+    spike_gain = 0.00805
+    spike_rate = 0.1
+    avg_ss_dt = 1 / 2
+    avg_s_dt = 1 / 2
+    avg_m_dt = 1 / 10
+    avg_init = 0.15
+    avg_l_init = 0.4
+    avg_l_dt = 1 / 10
+    avg_l_gain = 2.5
+    avg_l_min = 0.2
+    avg_l_lrn_min = 0.0001
+    avg_l_lrn_max = 0.5
+    m_in_s = 0.1
+    # layers
+    gi = 1.8
+    ff = 1.0
+    fb = 1.0
+    fb_dt = 1 / 1.4
+    ff0 = 0.1
+    avg_act = 0.15
+    # learning
+    m_lrn = 1.0
+    d_thr = 0.0001
+    d_rev = 0.1
+    wt_sig_gain = 6.0
+    wt_sig_off = 1.0
+
+    def __init__(self, layer_sizes, weights=None, training_flag=False, quarter_size=50, learning_rate=0.04):
+        self.layer_sizes = [int(size) for size in layer_sizes]
+        if len(self.layer_sizes) < 2:
+            raise LeabraError("A LeabraNetwork must have at least two layers (an input and an output layer).")
+
+        if weights is None:
+            # (draw the seed from the random module, so that random.seed determines the weights as in the leabra package)
+            random_state = np.random.RandomState(random.getrandbits(32))
+            weights = [random_state.uniform(0.55, 0.95, (n_pre, n_post))
+                       for n_pre, n_post in zip(self.layer_sizes[:-1], self.layer_sizes[1:])]
+        weights = [np.array(w, dtype=float) for w in weights]
+        if [w.shape for w in weights] != list(zip(self.layer_sizes[:-1], self.layer_sizes[1:])):
+            raise LeabraError("The shapes of the weights ({}) do not match the sizes of the layers ({}).".
+                              format([w.shape for w in weights], self.layer_sizes))
+        self.weights = weights
+
+        self.training_flag = bool(training_flag)
+        self.quarter_size = quarter_size
+        self.learning_rate = learning_rate
+
+        # all of the units are held in one array, in which the slices of the layers start at these indices
+        self._starts = np.cumsum([0] + self.layer_sizes[:-1])
+        self._slices = [slice(start, start + size) for start, size in zip(self._starts, self.layer_sizes)]
+        # the excitatory input to each layer is scaled by the expected number of active units in the sending layer
+        self._netin_scales = [1 / max(1, int(self.avg_act * size + 0.5)) for size in self.layer_sizes[:-1]]
+        self._nxx1_x, self._nxx1_values = _noisy_xx1_table(self.act_gain, self.act_sd)
+
+        n_units = sum(self.layer_sizes)
+        self.avg_l = np.full(n_units, self.avg_l_init)
+        self._reset_activity()
+
+    def _reset_activity(self):
+        n_units = sum(self.layer_sizes)
+        self.act = np.zeros(n_units)
+        self.act_nd = np.zeros(n_units)
+        self.g_e = np.zeros(n_units)
+        self.v_m = np.full(n_units, self.vm_init)
+        self.adapt = np.zeros(n_units)
+        self.avg_ss = np.full(n_units, self.avg_init)
+        self.avg_s = np.full(n_units, self.avg_init)
+        self.avg_m = np.full(n_units, self.avg_init)
+        self.fbi = np.zeros(len(self.layer_sizes))
+
+    def _noisy_xx1(self, x):
+        return np.where(x < self._nxx1_x[-1],
+                        np.interp(x, self._nxx1_x, self._nxx1_values),
+                        _xx1(x, self.act_gain))
+
+    def _cycle(self, clamped, clamped_act):
+        """Update the state of all of the units (except those in **clamped**, whose activity is **clamped_act**)"""
+        act = self.act
+        net_raw = np.zeros_like(act)
+        for w, scale, pre, post in zip(self.weights, self._netin_scales, self._slices[:-1], self._slices[1:]):
+            net_raw[post] = scale * np.dot(act[pre], w)
+        self.g_e += self.net_dt * (net_raw - self.g_e)
+        g_e = self.g_e
+
+        # FFFB inhibition, computed for all of the layers at once
+        netin_avg = np.add.reduceat(g_e, self._starts) / self.layer_sizes
+        act_avg = np.add.reduceat(act, self._starts) / self.layer_sizes
+        self.fbi += self.fb_dt * (self.fb * act_avg - self.fbi)
+        g_i = np.repeat(self.gi * (self.ff * np.maximum(netin_avg - self.ff0, 0) + self.fbi), self.layer_sizes)
+
+        # the membrane potential is integrated exponentially (which is exact for constant conductances, and remains
+        # stable for the large conductances produced by strong inputs)
+        gc_e = self.g_bar_e * g_e
+        gc_i = self.g_bar_i * g_i
+        g_total = gc_e + self.g_bar_l + gc_i
+        v_m_inf = (gc_e * self.e_rev_e + self.g_bar_l * self.e_rev_l + gc_i * self.e_rev_i - self.adapt) / g_total
+        self.v_m += (v_m_inf - self.v_m) * -np.expm1(-self.vm_dt * g_total)
+        np.clip(self.v_m, self.vm_min, self.vm_max, out=self.v_m)
+
+        # the activity is a function of v_m below threshold, and of the excitatory conductance above it
+        g_e_thr = ((gc_i * (self.e_rev_i - self.act_thr) + self.g_bar_l * (self.e_rev_l - self.act_thr) - self.adapt)
+                   / (self.act_thr - self.e_rev_e))
+        new_act = self._noisy_xx1(np.where(self.v_m <= self.act_thr, self.v_m - self.act_thr, gc_e - g_e_thr))
+        self.act_nd += self.vm_dt * (new_act - self.act_nd)
+        self.act = np.where(clamped, clamped_act, self.act_nd)
+
+        # (the spike-driven part of the adaptation current is driven by the rate code activity)
+        self.adapt += (self.adapt_dt * (self.vm_gain * (self.v_m - self.e_rev_l) - self.adapt) +
+                       self.spike_rate * self.act_nd * self.spike_gain)
+
+        self.avg_ss += self.avg_ss_dt * (self.act - self.avg_ss)
+        self.avg_s += self.avg_s_dt * (self.avg_ss - self.avg_s)
+        self.avg_m += self.avg_m_dt * (self.avg_s - self.avg_m)
+
+    def trial(self, input_pattern, output_pattern=None):
+        """Run a trial with **input_pattern** clamped to the input layer and return the activity of the output layer
+        at the end of the minus phase;  if `training_flag <LeabraNetwork.training_flag>` is True and
+        **output_pattern** is specified, it is the target in the plus phase, after which the weights are updated.
+        """
+        if len(input_pattern) != self.layer_sizes[0]:
+            raise LeabraError("The input pattern ({}) does not match the size of the input layer ({}).".
+                              format(input_pattern, self.layer_sizes[0]))
+        learning = self.training_flag and output_pattern is not None
+        if learning and len(output_pattern) != self.layer_sizes[-1]:
+            raise LeabraError("The output pattern ({}) does not match the size of the output layer ({}).".
+                              format(output_pattern, self.layer_sizes[-1]))
+
+        self._reset_activity()
+        input_layer = self._slices[0]
+        output_layer = self._slices[-1]
+        clamped = np.zeros(len(self.act), dtype=bool)
+        clamped[input_layer] = True
+        clamped_act = np.zeros(len(self.act))
+        clamped_act[input_layer] = input_pattern
+        self.act[clamped] = clamped_act[clamped]
+
+        for quarter in range(4 if learning else 3):
+            if quarter == 3:
+                act_m = self.act[output_layer].copy()
+                avg_m_minus = self.avg_m.copy()
+                clamped[output_layer] = True
+                clamped_act[output_layer] = output_pattern
+            for cycle in range(self.quarter_size):
+                self._cycle(clamped, clamped_act)
+        if not learning:
+            act_m = self.act[output_layer].copy()
+
+        self.avg_l += self.avg_l_dt * (self.avg_l_gain * self.avg_m - self.avg_l)
+        np.maximum(self.avg_l, self.avg_l_min, out=self.avg_l)
+
+        if learning:
+            self._learn(avg_m_minus)
+        return act_m
+
+    def _xcal(self, x, th):
+        return np.where(x < self.d_thr, 0,
+                        np.where(x > th * self.d_rev, x - th, -x * (1 - self.d_rev) / self.d_rev))
+
+    def _learn(self, avg_m):
+        """Update the weights of all of the connections using the XCAL learning rule, in which the medium time-scale
+        averages (**avg_m**) are those at the end of the minus phase (so that the error-driven component of learning
+        does not depend on the number of cycles in a quarter).
+        """
+        avg_s_eff = self.m_in_s * self.avg_m + (1 - self.m_in_s) * self.avg_s
+        avg_l_lrn = self.avg_l_lrn_min + ((self.avg_l - self.avg_l_min) *
+                                          (self.avg_l_lrn_max - self.avg_l_lrn_min) /
+                                          (self.avg_l_gain - self.avg_l_min))
+        # the output layer, which receives the target, learns from the error alone
+        avg_l_lrn[self._slices[-1]] = 0
+        for w, pre, post in zip(self.weights, self._slices[:-1], self._slices[1:]):
+            srs = np.outer(avg_s_eff[pre], avg_s_eff[post])
+            srm = np.outer(avg_m[pre], avg_m[post])
+            dwt = self.learning_rate * (
+                self.m_lrn * self._xcal(srs, srm) +
+                avg_l_lrn[post] * self._xcal(srs, np.outer(avg_m[pre], self.avg_l[post]))
+            )
+            # soft bounding of the linear weights underlying the (sigmoidal) weights
+            fwt = self._linear_weights(w)
+            fwt += np.where(dwt > 0, dwt * (1 - fwt), dwt * fwt)
+            w[:] = self._sigmoid_weights(fwt)
+
+    def _sigmoid_weights(self, fwt):
+        fwt = np.clip(fwt, 0, 1)
+        with np.errstate(divide='ignore'):
+            return 1 / (1 + (self.wt_sig_off * (1 - fwt) / fwt) ** self.wt_sig_gain)
+
+    def _linear_weights(self, w):
+        w = np.clip(w, 0, 1)
+        with np.errstate(divide='ignore'):
+            return 1 / (1 + ((1 - w) / w) ** (1 / self.wt_sig_gain) / self.wt_sig_off)
+
+
 class LeabraFunction(Function_Base):
     """
     LeabraFunction(             \
@@ -152,7 +452,7 @@ class LeabraFunction(Function_Base):
     default_variable : number or np.array : default np.zeros() (array of zeros)
         specifies a template for the input to the leabra network.
 
-    network : leabra.Network
+    network : LeabraNetwork or leabra.Network
         specifies the leabra network to be used.
 
     params : Dict[param keyword: param value] : default None
@@ -173,7 +473,7 @@ class LeabraFunction(Function_Base):
     variable : number or np.array
         contains value to be transformed.
 
-    network : leabra.Network
+    network : LeabraNetwork or leabra.Network
         the leabra network that is being used
 
     owner : Mechanism
@@ -209,10 +509,6 @@ class LeabraFunction(Function_Base):
                  owner=None,
                  prefs=None):
 
-        if not leabra_available:
-            raise LeabraError('leabra python module is not installed. Please install it from '
-                              'https://github.com/benureau/leabra')
-
         if network is None:
             raise LeabraError('network was None. Cannot create function for Leabra Mechanism if network is not specified.')
 
@@ -221,9 +517,8 @@ class LeabraFunction(Function_Base):
                                                   params=params)
 
         if default_variable is None:
-            input_size = len(self.network.layers[0].units)
-            output_size = len(self.network.layers[-1].units)
-            default_variable = [np.zeros(input_size), np.zeros(output_size)]
+            layer_sizes = get_layer_sizes(self.network)
+            default_variable = [np.zeros(layer_sizes[0]), np.zeros(layer_sizes[-1])]
 
         super().__init__(default_variable=default_variable,
                          params=params,
@@ -236,8 +531,9 @@ class LeabraFunction(Function_Base):
             raise LeabraError("Input Error: the input variable ({}) was of type {}, but instead should be a list, "
                               "numpy array, or number.".format(variable, type(variable)))
 
-        input_size = len(self.network.layers[0].units)
-        output_size = len(self.network.layers[-1].units)
+        layer_sizes = get_layer_sizes(self.network)
+        input_size = layer_sizes[0]
+        output_size = layer_sizes[-1]
         if (not hasattr(self, "owner")) or (not hasattr(self.owner, "training_flag")) or self.owner.training_flag is False:
             if len(convert_to_2d_input(variable)[0]) != input_size:
                 # convert_to_2d_input(variable[0]) is just in case variable is a 2D array rather than a vector
@@ -251,9 +547,13 @@ class LeabraFunction(Function_Base):
         return variable
 
     def _validate_params(self, request_set, target_set=None, context=None):
-        if not isinstance(request_set[NETWORK], leabra.Network):
-            raise LeabraError("Error: the network given ({}) was of type {}, but instead must be a leabra Network.".
-                              format(request_set[NETWORK], type(request_set[NETWORK])))
+        if not isinstance(request_set[NETWORK], LeabraNetwork):
+            if not leabra_available:
+                raise LeabraError('leabra python module is not installed. Please install it from '
+                                  'https://github.com/benureau/leabra, or use a LeabraNetwork.')
+            if not isinstance(request_set[NETWORK], leabra.Network):
+                raise LeabraError("Error: the network given ({}) was of type {}, but instead must be a LeabraNetwork "
+                                  "or a leabra Network.".format(request_set[NETWORK], type(request_set[NETWORK])))
         super()._validate_params(request_set, target_set, context)
 
     def function(self,
@@ -264,7 +564,7 @@ class LeabraFunction(Function_Base):
 
         # HACK: otherwise the INITIALIZING function executions impact the state of the leabra network
         if self.context.initialization_status == ContextFlags.INITIALIZING:
-            output_size = len(self.network.layers[-1].units)
+            output_size = get_layer_sizes(self.network)[-1]
             return np.zeros(output_size)
 
         if (not hasattr(self, "owner")) or (not hasattr(self.owner, "training_flag")) or self.owner.training_flag is False:
@@ -278,11 +578,12 @@ class LeabraFunction(Function_Base):
                 raise LeabraError("Input Error: the input given ({}) for training was not the right format: the input "
                                   "should be a 2D array containing two vectors, corresponding to the input and the "
                                   "training target.".format(variable))
-            if len(variable[0]) != len(self.network.layers[0].units) or len(variable[1]) != len(self.network.layers[-1].units):
+            layer_sizes = get_layer_sizes(self.network)
+            if len(variable[0]) != layer_sizes[0] or len(variable[1]) != layer_sizes[-1]:
                 raise LeabraError("Input Error: the input given ({}) was not the right format: it should be a 2D array "
                                   "containing two vectors, corresponding to the input (which should be length {}) and "
                                   "the training target (which should be length {})".
-                                  format(variable, self.network.layers[0], len(self.network.layers[-1].units)))
+                                  format(variable, layer_sizes[0], layer_sizes[-1]))
             return train_leabra_network(self.network, input_pattern=variable[0], output_pattern=variable[1])
 
 
@@ -304,8 +605,9 @@ class LeabraMechanism(ProcessingMechanism_Base):
     Arguments
     ---------
 
-    leabra_net : Optional[leabra.Network]
-        a network object from the leabra package. If specified, the LeabraMechanism's network becomes **leabra_net**,
+    leabra_net : Optional[LeabraNetwork or leabra.Network]
+        a `LeabraNetwork`, or a network object from the leabra package. If specified, the LeabraMechanism's network
+        becomes **leabra_net**,
         and the other arguments that specify the network are ignored (**input_size**, **output_size**,
         **hidden_layers**, **hidden_sizes**).
 
@@ -392,9 +694,10 @@ class LeabraMechanism(ProcessingMechanism_Base):
         Lower values of quarter_size also effectively reduce the magnitude of learning weight changes during
         a given trial.
 
-    network : leabra.Network
-        the leabra.Network object which is executed by the LeabraMechanism. For more info about leabra Networks,
-        please see the `leabra package <https://github.com/benureau/leabra>` on Github.
+    network : LeabraNetwork or leabra.Network
+        the network which is executed by the LeabraMechanism:  a `LeabraNetwork` unless a leabra.Network was specified
+        in the **leabra_net** argument of its constructor. For more info about leabra Networks, please see the
+        `leabra package <https://github.com/benureau/leabra>` on Github.
 
     output_states : *ContentAddressableList[OutputState]* : default [`RESULT <TRANSFER_MECHANISM_RESULT>`]
         list of Mechanism's `OutputStates <OutputStates>`.  By default there is a single OutputState,
@@ -458,17 +761,17 @@ class LeabraMechanism(ProcessingMechanism_Base):
                  params=None,
                  name=None,
                  prefs: is_pref_set = None):
-        if not leabra_available:
-            raise LeabraError('leabra python module is not installed. Please install it from '
-                              'https://github.com/benureau/leabra')
-
         if leabra_net is not None:
             leabra_network = leabra_net
-            input_size = len(leabra_network.layers[0].units)
-            output_size = len(leabra_network.layers[-1].units)
-            hidden_layers = len(leabra_network.layers) - 2
-            hidden_sizes = list(map(lambda x: len(x.units), leabra_network.layers))[1:-2]
-            quarter_size = leabra_network.spec.quarter_size
+            layer_sizes = get_layer_sizes(leabra_network)
+            input_size = layer_sizes[0]
+            output_size = layer_sizes[-1]
+            hidden_layers = len(layer_sizes) - 2
+            hidden_sizes = layer_sizes[1:-1]
+            if isinstance(leabra_network, LeabraNetwork):
+                quarter_size = leabra_network.quarter_size
+            else:
+                quarter_size = leabra_network.spec.quarter_size
             training_flag = infer_training_flag_from_network(leabra_network)
         else:
             if hidden_sizes is None:
@@ -556,44 +859,30 @@ def convert_to_2d_input(array_like):
         return [np.array([array_like])]
 
 
-def build_leabra_network(n_input, n_output, n_hidden, hidden_sizes=None, training_flag=None, quarter_size=50):
+def get_layer_sizes(network):
+    """Return the number of units in each layer of a `LeabraNetwork` or a leabra.Network"""
+    if isinstance(network, LeabraNetwork):
+        return network.layer_sizes
+    return [len(layer.units) for layer in network.layers]
 
-    # specifications
-    learning_rule = 'leabra' if training_flag is True else None
-    unit_spec = leabra.UnitSpec(adapt_on=True, noisy_act=True)
-    layer_spec = leabra.LayerSpec(lay_inhib=True)
-    conn_spec = leabra.ConnectionSpec(proj='full', rnd_type='uniform', rnd_mean=0.75, rnd_var=0.2, lrule=learning_rule)
 
-    # input/outputs
-    input_layer = leabra.Layer(n_input, spec=layer_spec, unit_spec=unit_spec, name='input_layer')
-    output_layer = leabra.Layer(n_output, spec=layer_spec, unit_spec=unit_spec, name='output_layer')
+def build_leabra_network(n_input, n_output, n_hidden, hidden_sizes=None, training_flag=None, quarter_size=50):
 
-    # creating the required numbers of hidden layers and connections
-    layers = [input_layer]
-    connections = []
     if isinstance(hidden_sizes, numbers.Number):
         hidden_sizes = [hidden_sizes] * n_hidden
-    for i in range(n_hidden):
-        if hidden_sizes is not None:
-            hidden_size = hidden_sizes[i]
-        else:
-            hidden_size = n_input
-        hidden_layer = leabra.Layer(hidden_size, spec=layer_spec, unit_spec=unit_spec, name='hidden_layer_{}'.format(i))
-        hidden_conn = leabra.Connection(layers[-1],  hidden_layer, spec=conn_spec)
-        layers.append(hidden_layer)
-        connections.append(hidden_conn)
+    elif hidden_sizes is None:
+        hidden_sizes = [n_input] * n_hidden
 
-    last_conn = leabra.Connection(layers[-1],  output_layer, spec=conn_spec)
-    connections.append(last_conn)
-    layers.append(output_layer)
-
-    network_spec = leabra.NetworkSpec(quarter_size=quarter_size)
-    network = leabra.Network(layers=layers, connections=connections, spec=network_spec)
-
-    return network
+    return LeabraNetwork([n_input] + list(hidden_sizes[:n_hidden]) + [n_output],
+                         training_flag=training_flag is True,
+                         quarter_size=quarter_size)
 
 
 def run_leabra_network(network, input_pattern):
+    if isinstance(network, LeabraNetwork):
+        # (the network learns only if it is given a target)
+        return network.trial(input_pattern)
+
     assert len(network.layers[0].units) == len(input_pattern)
 
     # check training flag: should be handled earlier, but just in case
@@ -613,6 +902,14 @@ def run_leabra_network(network, input_pattern):
 
 
 def train_leabra_network(network, input_pattern, output_pattern):
+    if isinstance(network, LeabraNetwork):
+        training_flag = network.training_flag
+        network.training_flag = True
+        try:
+            return network.trial(input_pattern, output_pattern)
+        finally:
+            network.training_flag = training_flag
+
     assert len(network.layers[0].units) == len(input_pattern)
     assert len(network.layers[-1].units) == len(output_pattern)
 
@@ -636,11 +933,15 @@ def train_leabra_network(network, input_pattern, output_pattern):
 # infer whether the network is using the None or 'leabra' training rule
 # this currently assumes either all connections or no connections are being trained
 def infer_training_flag_from_network(network):
+    if isinstance(network, LeabraNetwork):
+        return network.training_flag
     return False if network.connections[0].spec.lrule is None else True
 
 
 def set_training(network, val):
-    if val is None or val is False:
+    if isinstance(network, LeabraNetwork):
+        network.training_flag = val is not None and val is not False
+    elif val is None or val is False:
         for conn in network.connections:
             conn.spec.lrule = None
     else:
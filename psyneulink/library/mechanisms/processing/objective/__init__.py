@@ -1,8 +1,3 @@
-from . import comparatormechanism
-from . import predictionerrormechanism
+from psyneulink.globals.utilities import lazy_import_submodules
 
-from .comparatormechanism import *
-from .predictionerrormechanism import *
-
-__all__ = list(comparatormechanism.__all__)
-__all__.extend(predictionerrormechanism.__all__)
+lazy_import_submodules(__name__, ['comparatormechanism', 'predictionerrormechanism'])
@@ -153,12 +153,12 @@ Class Reference
 from typing import Iterable
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.functions.function import PredictionErrorDeltaFunction
 from psyneulink.components.mechanisms.mechanism import Mechanism_Base
 from psyneulink.components.mechanisms.processing.objectivemechanism import OUTCOME
 from psyneulink.components.states.outputstate import OutputState
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.keywords import INITIALIZING, PREDICTION_ERROR_MECHANISM, SAMPLE, TARGET
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set, kpReportOutputPref
 from psyneulink.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel, kwPreferenceSetName
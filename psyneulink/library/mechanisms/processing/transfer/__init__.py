@@ -1,14 +1,3 @@
-from . import kwta
-from . import lca
-from . import recurrenttransfermechanism
-from . import contrastivehebbianmechanism
+from psyneulink.globals.utilities import lazy_import_submodules
 
-from .kwta import *
-from .lca import *
-from .recurrenttransfermechanism import *
-from .contrastivehebbianmechanism import *
-
-__all__ = list(kwta.__all__)
-__all__.extend(lca.__all__)
-__all__.extend(recurrenttransfermechanism.__all__)
-__all__.extend(contrastivehebbianmechanism.__all__)
+lazy_import_submodules(__name__, ['kwta', 'lca', 'recurrenttransfermechanism', 'contrastivehebbianmechanism'])
@@ -261,6 +261,29 @@ of the *minus phase*), the following computations and assignments are made:
   `minus_phase_activity <ContrastiveHebbianMechanism.minus_phase_activity>` is assigned as the `value
   <OutputState.value>` of the the *ACTIVITY_DIFFERENCE_OUTPUT* `OutputState <ContrastiveHebbian_Output>`.
 
+.. _ContrastiveHebbian_Settle:
+
+Settling a batch of patterns
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+When a ContrastiveHebbianMechanism is executed by a `Scheduler`, each pass of each phase is a separate execution of
+the Mechanism.  Its `settle <ContrastiveHebbianMechanism.settle>` method can be used instead to carry out both
+phases of a trial in a single call, for one pattern or a batch of them (e.g., for training or evaluation outside of a
+`System`).  Each pattern is processed as a separate trial, as described above, beginning with no input from the
+`recurrent_projection <ContrastiveHebbianMechanism.recurrent_projection>` and with `integrator_function
+<ContrastiveHebbianMechanism.integrator_function>` (if `integrator_mode <ContrastiveHebbianMechanism.integrator_mode>`
+is `True`) starting from `initial_value <ContrastiveHebbianMechanism.initial_value>`;  however, all of the patterns
+are updated together in each pass, and each stops being updated once it has converged.  It returns
+the `plus_phase_activity <ContrastiveHebbianMechanism.plus_phase_activity>` and `minus_phase_activity
+<ContrastiveHebbianMechanism.minus_phase_activity>` for every pattern, and leaves those attributes (as well as
+`current_activity <ContrastiveHebbianMechanism.current_activity>` and `is_finished
+<Mechanism_Base.is_finished>`) as they would be at the end of a trial for the last one.  The
+`compute_weight_changes <ContrastiveHebbianMechanism.compute_weight_changes>` method returns the changes to the
+`matrix <AutoAssociativeProjection.matrix>` of the `recurrent_projection
+<ContrastiveHebbianMechanism.recurrent_projection>` that the `learning_function
+<ContrastiveHebbianMechanism.learning_function>` generates for those patterns, and these are applied to it if
+**learn** is specified as `True` in the call to `settle <ContrastiveHebbianMechanism.settle>`.
+
 .. _ContrastiveHebbian_Learning_Execution:
 
 Learning
@@ -285,7 +308,6 @@ Class Reference
 from collections import Iterable
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.functions.function import \
     ContrastiveHebbian, Distance, Function, Hebbian, Linear, LinearCombination, is_function_type, EPSILON, get_matrix
@@ -293,6 +315,7 @@ from psyneulink.components.states.outputstate import PRIMARY, StandardOutputStat
 from psyneulink.components.mechanisms.mechanism import Mechanism
 from psyneulink.library.mechanisms.processing.transfer.recurrenttransfermechanism import \
     RecurrentTransferMechanism, RECURRENT, CONVERGENCE
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.keywords import \
     CONTRASTIVE_HEBBIAN_MECHANISM, FUNCTION, HARD_CLAMP, HOLLOW_MATRIX, \
     MAX_ABS_DIFF, NAME, SIZE, SOFT_CLAMP, TARGET, VARIABLE
@@ -1107,6 +1130,171 @@ class ContrastiveHebbianMechanism(RecurrentTransferMechanism):
 
         return variable[RECURRENT_INDEX]
 
+    def settle(self, inputs, targets=None, learn=False):
+        """Execute the `plus and minus phases <ContrastiveHebbian_Processing>` of a trial for one or more patterns,
+        and return the activity at the end of each phase.
+
+        Each pattern is settled as a separate trial that begins with no input from the `recurrent_projection
+        <ContrastiveHebbianMechanism.recurrent_projection>` (as when the Mechanism is executed by a `Scheduler`),
+        but all of the patterns are updated together in each pass, and each stops being updated once it has converged
+        (see `ContrastiveHebbian_Settle` for details).
+
+        Arguments
+        ---------
+
+        inputs : 1d or 2d array
+            pattern(s) of input for the *INPUT* `InputState <ContrastiveHebbian_Input>`;  each item of a 2d array
+            is settled as a separate trial.
+
+        targets : 1d or 2d array : default None
+            pattern(s) of input for the *TARGET* `InputState <ContrastiveHebbian_Input>`, if one `has been specified
+            <ContrastiveHebbian_Input>`; a single pattern is used for all of the **inputs**.  If it is not specified,
+            the target is an array of zeros.
+
+        learn : bool : default False
+            specifies whether the weight changes returned by `compute_weight_changes
+            <ContrastiveHebbianMechanism.compute_weight_changes>` for all of the patterns are added to the `matrix
+            <AutoAssociativeProjection.matrix>` of the `recurrent_projection
+            <ContrastiveHebbianMechanism.recurrent_projection>`.
+
+        Returns
+        -------
+
+        plus_phase_activity, minus_phase_activity : 2d np.array, 2d np.array
+            the activity at the end of the `plus phase <ContrastiveHebbian_Plus_Phase>` and `minus phase
+            <ContrastiveHebbian_Minus_Phase>` for each pattern.
+
+        """
+
+        inputs = np.atleast_2d(np.asarray(inputs, dtype=float))
+        num_patterns = len(inputs)
+        if inputs.shape[1] != self.input_size:
+            raise ContrastiveHebbianError("Length of inputs ({}) for {} must equal its {} ({})".
+                                          format(inputs.shape[1], self.name, repr(INPUT_SIZE), self.input_size))
+        if self._target_included:
+            if targets is None:
+                targets = np.zeros((num_patterns, self.target_size))
+            else:
+                targets = np.broadcast_to(np.atleast_2d(np.asarray(targets, dtype=float)),
+                                          (num_patterns, self.target_size))
+        elif targets is not None:
+            raise ContrastiveHebbianError("targets were specified for {}, but it does not have a {} InputState".
+                                          format(self.name, TARGET))
+
+        matrix = np.asarray(self.recurrent_projection.matrix, dtype=float)
+        clip = self.get_current_mechanism_param("clip")
+        noise = self.get_current_mechanism_param("noise")
+        integration_rate = self.get_current_mechanism_param("integration_rate")
+        initial_value = self.initial_value
+        if initial_value is None:
+            initial_value = np.zeros(self.recurrent_size)
+        initial_value = np.broadcast_to(np.asarray(initial_value, dtype=float), (num_patterns, self.recurrent_size))
+
+        # The first pass of a trial has no input from the recurrent_projection and is not checked for convergence;
+        #    the integrator starts from initial_value, as when the Mechanism is reinitialized at the start of a trial
+        integrator_value = np.array(initial_value)
+        activity = np.zeros((num_patterns, self.recurrent_size))
+        previous_activity = None
+        passes = np.zeros(num_patterns, dtype=int)
+        phase_activity = {}
+
+        for phase in (PLUS_PHASE, MINUS_PHASE):
+            if phase == MINUS_PHASE and not self.continuous:
+                activity = np.array(initial_value)
+                if self.integrator_mode:
+                    integrator_value = np.array(initial_value)
+
+            pending = np.arange(num_patterns)
+            while len(pending):
+                variable = self._combine_phase_input(activity[pending].dot(matrix),
+                                                     inputs[pending],
+                                                     targets[pending] if self._target_included else None,
+                                                     phase)
+                if self.integrator_mode:
+                    integrator_value[pending] = ((1 - integration_rate) * integrator_value[pending]
+                                                 + integration_rate * variable
+                                                 + self._try_execute_param(noise, variable))
+                    variable = integrator_value[pending]
+                else:
+                    variable = variable + self._try_execute_param(noise, variable)
+                value = self._clip_result(clip, self._transform_patterns(variable))
+
+                if previous_activity is None:
+                    converged = np.zeros(len(pending), dtype=bool)
+                else:
+                    converged = self._pattern_deltas(value, previous_activity[pending]) <= self.convergence_criterion
+                    exceeded = ~converged & (passes[pending] >= self.max_passes) if self.max_passes else None
+                    if exceeded is not None and exceeded.any():
+                        raise ContrastiveHebbianError("Maximum number of executions ({}) has occurred before reaching "
+                                                      "convergence_criterion ({}) for {} in pattern {}".
+                                                      format(self.max_passes, self.convergence_criterion, self.name,
+                                                             pending[exceeded][0]))
+                activity[pending] = value
+                previous_activity = np.array(activity)
+                passes[pending] += 1
+                pending = pending[~converged]
+
+            phase_activity[phase] = np.array(activity)
+
+        plus_phase_activity = phase_activity[PLUS_PHASE]
+        minus_phase_activity = phase_activity[MINUS_PHASE]
+
+        # Leave the Mechanism as it is at the end of a trial executed by a Scheduler for the last pattern
+        self.plus_phase_activity = plus_phase_activity[-1]
+        self.minus_phase_activity = minus_phase_activity[-1]
+        self.current_activity = self.plus_phase_activity
+        self.output_activity = self.current_activity[self.target_start:self.target_end]
+        self.execution_phase = PLUS_PHASE
+        self.is_finished = True
+
+        if learn:
+            self.matrix = matrix + self.compute_weight_changes(plus_phase_activity, minus_phase_activity)
+
+        return plus_phase_activity, minus_phase_activity
+
+    def compute_weight_changes(self, plus_phase_activity, minus_phase_activity):
+        """Return the changes to the `matrix <AutoAssociativeProjection.matrix>` of the `recurrent_projection
+        <ContrastiveHebbianMechanism.recurrent_projection>` for one or more pairs of plus and minus phase activity,
+        summed over the pairs.
+
+        The change for each pair is the one generated by the `learning_function
+        <ContrastiveHebbianMechanism.learning_function>` from their difference (i.e., the `value
+        <OutputState.value>` of the *ACTIVITY_DIFFERENCE_OUTPUT* `OutputState <ContrastiveHebbian_Output>`);  if it is
+        `ContrastiveHebbian` or `Hebbian`, the changes for all of the pairs are computed together.
+
+        Arguments
+        ---------
+
+        plus_phase_activity : 1d or 2d array
+            activity at the end of the `plus phase <ContrastiveHebbian_Plus_Phase>` for each pattern.
+
+        minus_phase_activity : 1d or 2d array
+            activity at the end of the `minus phase <ContrastiveHebbian_Minus_Phase>` for each pattern.
+
+        Returns
+        -------
+
+        weight changes : 2d np.array
+
+        """
+
+        return self._compute_weight_changes(np.atleast_2d(plus_phase_activity) - np.atleast_2d(minus_phase_activity))
+
+    def _combine_phase_input(self, recurrent, inputs, targets, phase):
+        """Batched version of combination_function, for use by settle"""
+        if phase == MINUS_PHASE and self.mode is SIMPLE_HEBBIAN:
+            return recurrent
+        if self.clamp == HARD_CLAMP:
+            recurrent[:, :self.input_size] = inputs
+        else:
+            recurrent[:, :self.input_size] += inputs
+        if phase == PLUS_PHASE and targets is not None and self.mode is not SIMPLE_HEBBIAN:
+            if self.clamp == HARD_CLAMP:
+                recurrent[:, self.target_start:self.target_end] = targets
+            else:
+                recurrent[:, self.target_start:self.target_end] += targets
+        return recurrent
+
     @property
     def _learning_signal_source(self):
         '''Override default to use ACTIVITY_DIFFERENCE_OUTPUT as source of learning signal
@@ -153,9 +153,9 @@ import warnings
 from collections import Iterable
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.functions.function import Logistic
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.keywords import INITIALIZING, KWTA, K_VALUE, RATIO, RESULT, THRESHOLD
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.utilities import is_numeric_or_none
@@ -124,6 +124,22 @@ Execution
 
 The execution of an LCA is identical to that of `RecurrentTransferMechanism`.
 
+.. _LCA_Races:
+
+*Simulating races*
+~~~~~~~~~~~~~~~~~~
+
+Many independent trials of an LCA can be simulated at once, outside of a `System`, using its `simulate_races
+<LCA.simulate_races>` method.  Each trial begins with the `integrator_function <LCA.integrator_function>` at
+`initial_value <LCA.initial_value>` (and the activity of the LCA at the result of its `function <LCA.function>` for
+that value), and is integrated one time step per pass, as it is when the LCA is executed repeatedly within a `trial`
+of a System, until the specified criterion -- the highest element of the activity, or its difference from the next
+highest or the average of the others (as reported by the `MAX_VS_NEXT <LCA_MAX_VS_NEXT>` and `MAX_VS_AVG
+<LCA_MAX_VS_AVG>` OutputStates) -- reaches threshold.  All of the trials that have not yet reached threshold are
+updated together in each pass, using a single matrix product with the LCA's `matrix <LCA.matrix>` and drawing `noise
+<LCA.noise>` for all of them at once.  The time at which each trial reached threshold and the element of the activity
+that was highest at that time are returned.
+
 .. _LCA_Class_Reference:
 
 Class Reference
@@ -137,12 +153,12 @@ import warnings
 from collections import Iterable
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.mechanisms.mechanism import Mechanism
 from psyneulink.components.functions.function import LCAIntegrator, Logistic, max_vs_avg, max_vs_next, NormalizingFunction
 from psyneulink.components.states.outputstate import PRIMARY, StandardOutputStates
-from psyneulink.globals.keywords import BETA, ENERGY, ENTROPY, FUNCTION, INITIALIZER, INITIALIZING, LCA, MEAN, MEDIAN, NAME, NOISE, RATE, RESULT, STANDARD_DEVIATION, TIME_STEP_SIZE, VARIANCE
+from psyneulink.globals import typechecking as tc
+from psyneulink.globals.keywords import BETA, ENERGY, ENTROPY, FUNCTION, INITIALIZER, INITIALIZING, LCA, MAX_VAL, MEAN, MEDIAN, NAME, NOISE, OFFSET, RATE, RESULT, STANDARD_DEVIATION, TIME_STEP_SIZE, VARIANCE
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.library.mechanisms.processing.transfer.recurrenttransfermechanism import RecurrentTransferMechanism
 
@@ -601,3 +617,111 @@ class LCA(RecurrentTransferMechanism):
         )
 
         return current_input
+
+    def simulate_races(self, stimuli, threshold, num_trials=None, criterion=MAX_VAL, max_time_steps=1000):
+        """Simulate a set of independent trials of the LCA, each until its activity reaches threshold, and return
+        the decision time and choice for each.
+
+        The trials are integrated together, one time step per pass, using the current parameters of the LCA and its
+        `integrator_function <LCA.integrator_function>`;  trials that have reached threshold are excluded from further
+        passes (see `LCA_Races` for details).  The LCA's own `value <Mechanism_Base.value>` and the `previous_value
+        <LCAIntegrator.previous_value>` of its `integrator_function <LCA.integrator_function>` are not changed.
+
+        Arguments
+        ---------
+
+        stimuli : 1d or 2d array
+            the external input to the LCA;  each item of a 2d array is used for a separate trial.  A 1d array (or 2d
+            array with a single item) is used for every trial, the number of which is then specified by
+            **num_trials**.
+
+        threshold : float
+            the value of **criterion** at which a trial is terminated.
+
+        num_trials : int : default None
+            specifies the number of trials; if it is `None`, a trial is run for each item of **stimuli**.
+
+        criterion : MAX_VAL, MAX_VS_NEXT or MAX_VS_AVG : default MAX_VAL
+            specifies the quantity compared with **threshold**:  the highest element of the activity (*MAX_VAL*),
+            its difference from the next highest one (*MAX_VS_NEXT*), or its difference from the average of the
+            others (*MAX_VS_AVG*).
+
+        max_time_steps : int : default 1000
+            the number of time steps after which a trial that has not reached threshold is terminated.
+
+        Returns
+        -------
+
+        decision_times, choices : 1d np.array, 1d np.array
+            the time (number of time steps multiplied by `time_step_size <LCAIntegrator.time_step_size>`) at which
+            each trial reached threshold, and the index of the element of the activity that was highest at that
+            time;  for trials that did not reach threshold, these are `nan` and -1, respectively.
+
+        """
+
+        size = len(self.matrix)
+        stimuli = np.atleast_2d(np.asarray(stimuli, dtype=float))
+        if num_trials is not None and len(stimuli) == 1:
+            stimuli = np.broadcast_to(stimuli, (num_trials, size))
+        if stimuli.ndim != 2 or stimuli.shape[1] != size:
+            raise LCAError("Stimuli for {} must be a 1d or 2d array with items of length {}".format(self.name, size))
+        if num_trials is not None and len(stimuli) != num_trials:
+            raise LCAError("Number of stimuli ({}) for {} does not match num_trials ({})".
+                           format(len(stimuli), self.name, num_trials))
+        if criterion not in {MAX_VAL, MAX_VS_NEXT, MAX_VS_AVG}:
+            raise LCAError("criterion for {} must be {}, {} or {}".format(self.name, MAX_VAL, MAX_VS_NEXT, MAX_VS_AVG))
+        num_trials = len(stimuli)
+
+        matrix = np.asarray(self.matrix, dtype=float)
+        clip = self.get_current_mechanism_param("clip")
+        noise = self.get_current_mechanism_param("noise")
+        leak = self.get_current_mechanism_param("leak")
+        time_step_size = self.get_current_mechanism_param("time_step_size")
+        integrator_function = self.integrator_function or self
+        offset = 0.0
+        if isinstance(integrator_function, LCAIntegrator):
+            offset = integrator_function.get_current_function_param(OFFSET) or 0.0
+        initial_value = self.initial_value
+        if initial_value is None:
+            initial_value = np.zeros(size)
+
+        integrator_value = np.array(np.broadcast_to(np.asarray(initial_value, dtype=float), (num_trials, size)))
+        activity = self._clip_result(clip, self._transform_patterns(integrator_value))
+
+        decision_times = np.full(num_trials, np.nan)
+        choices = np.full(num_trials, -1, dtype=int)
+        pending = np.arange(num_trials)
+        for time_step in range(1, max_time_steps + 1):
+            variable = self._combine_pattern_inputs(stimuli[pending], activity[pending].dot(matrix))
+            if self.integrator_mode:
+                integrator_value[pending] += ((leak * integrator_value[pending] + variable) * time_step_size
+                                             + integrator_function._try_execute_param(noise, variable)
+                                             * time_step_size ** 0.5
+                                             + offset)
+                variable = integrator_value[pending]
+            else:
+                variable = variable + self._try_execute_param(noise, variable)
+            value = self._clip_result(clip, self._transform_patterns(variable))
+            activity[pending] = value
+
+            finished = self._race_criterion(value, criterion) >= threshold
+            decision_times[pending[finished]] = time_step * time_step_size
+            choices[pending[finished]] = np.argmax(value[finished], axis=1)
+            pending = pending[~finished]
+            if not len(pending):
+                break
+
+        return decision_times, choices
+
+    @staticmethod
+    def _race_criterion(activity, criterion):
+        """Return the value of criterion for each item of activity"""
+        if criterion == MAX_VAL:
+            return np.max(activity, axis=1)
+        if activity.shape[1] == 1:
+            return activity[:, 0]
+        if criterion == MAX_VS_NEXT:
+            highest = np.partition(activity, -2, axis=1)
+            return highest[:, -1] - highest[:, -2]
+        maximum = np.max(activity, axis=1)
+        return maximum - (np.sum(activity, axis=1) - maximum) / (activity.shape[1] - 1)
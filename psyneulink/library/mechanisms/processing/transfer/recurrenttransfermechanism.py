@@ -160,6 +160,26 @@ System's execution.  By default, the `learning_mechanism <RecurrentTransferMecha
 and updates the `recurrent_projection <RecurrentTransferMechanism.recurrent_projection>` immediately after the
 RecurrentTransferMechanism executes.
 
+.. _Recurrent_Transfer_Patterns:
+
+*Settling and training on a set of patterns*
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A RecurrentTransferMechanism can also be executed on a set of input patterns outside of a `System`, using its
+`recall_patterns <RecurrentTransferMechanism.recall_patterns>` and `train_patterns
+<RecurrentTransferMechanism.train_patterns>` methods.  Each pattern is settled separately, beginning with no input from
+the `recurrent_projection <RecurrentTransferMechanism.recurrent_projection>` (and, in `integrator_mode
+<TransferMechanism.integrator_mode>`, from the `initial_value <TransferMechanism.initial_value>`), for either the
+specified number of passes or until the `convergence_criterion <RecurrentTransferMechanism.convergence_criterion>` is
+satisfied for it.  However, all of the patterns that have not yet settled are updated together in each pass, using a
+single matrix product with the `matrix <RecurrentTransferMechanism.matrix>` (and, if the Mechanism's `function
+<RecurrentTransferMechanism.function>` operates elementwise, a single call to it).  `train_patterns
+<RecurrentTransferMechanism.train_patterns>` then adds the sum of the weight changes generated by the
+`learning_function <RecurrentTransferMechanism.learning_function>` for the patterns in each batch to the `matrix
+<RecurrentTransferMechanism.matrix>`, and updates the `auto <RecurrentTransferMechanism.auto>` and `hetero
+<RecurrentTransferMechanism.hetero>` attributes (and the ParameterStates for all three) accordingly.  Neither method
+changes the `value <Mechanism_Base.value>` of the Mechanism, or of any of its OutputStates.
+
 .. _Recurrent_Transfer_Class_Reference:
 
 Class Reference
@@ -172,12 +192,12 @@ from collections import Iterable
 from types import MethodType
 
 import numpy as np
-import typecheck as tc
 import warnings
 
 from psyneulink.components.component import function_type, method_type
 from psyneulink.components.functions.function import \
-    Function, Distance, Hebbian, Linear, LinearCombination, Stability, UserDefinedFunction, get_matrix, is_function_type
+    ContrastiveHebbian, Distance, Exponential, Function, Hebbian, Linear, LinearCombination, Logistic, ReLU, Stability, \
+    UserDefinedFunction, get_matrix, is_function_type
 from psyneulink.components.mechanisms.adaptive.learning.learningmechanism import \
     ACTIVATION_INPUT, LEARNING_SIGNAL, LearningMechanism
 from psyneulink.components.mechanisms.mechanism import Mechanism_Base
@@ -190,9 +210,10 @@ from psyneulink.components.states.parameterstate import ParameterState
 from psyneulink.components.states.state import _instantiate_state
 from psyneulink.library.mechanisms.adaptive.learning.autoassociativelearningmechanism import \
     AutoAssociativeLearningMechanism
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.keywords import \
-    AUTO, ENERGY, ENTROPY, HETERO, HOLLOW_MATRIX, INPUT_STATE, MATRIX, MAX_ABS_DIFF, MEAN, MEDIAN, NAME, \
-    PARAMS_CURRENT, PREVIOUS_VALUE, RECURRENT_TRANSFER_MECHANISM, RESULT, STANDARD_DEVIATION, VARIANCE
+    AUTO, ENERGY, ENTROPY, FUNCTION, HETERO, HOLLOW_MATRIX, INPUT_STATE, MATRIX, MAX_ABS_DIFF, MEAN, MEDIAN, NAME, \
+    PARAMS_CURRENT, PREVIOUS_VALUE, RECURRENT_TRANSFER_MECHANISM, RESULT, STANDARD_DEVIATION, SUM, VARIANCE
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.registry import register_instance, remove_instance_from_registry
@@ -218,6 +239,9 @@ COMBINATION_FUNCTION = 'combination_function'
 UPDATE = 'UPDATE'
 CONVERGENCE = 'CONVERGENCE'
 
+# Functions that can be executed for several patterns at once (see recall_patterns)
+_ELEMENTWISE_FUNCTIONS = (Linear, Exponential, Logistic, ReLU)
+
 
 class RecurrentTransferError(Exception):
     def __init__(self, error_value):
@@ -1287,6 +1311,188 @@ class RecurrentTransferMechanism(TransferMechanism):
         if self.learning_mechanism is None:
             self.learning_enabled = False
 
+    def recall_patterns(self, patterns, num_passes=None):
+        """Settle the activity of the Mechanism for each of a set of input patterns, and return the result.
+
+        Each pattern is settled separately, beginning with no input from the `recurrent_projection
+        <RecurrentTransferMechanism.recurrent_projection>`, but all of the patterns are updated together in each pass
+        (see `Recurrent_Transfer_Patterns` for details).
+
+        Arguments
+        ---------
+
+        patterns : 1d or 2d array
+            pattern(s) of external input to the Mechanism;  each item of a 2d array is settled separately.
+
+        num_passes : int : default None
+            specifies the number of passes for which each pattern is executed;  if it is `None`, each pattern is
+            executed until the `convergence_criterion <RecurrentTransferMechanism.convergence_criterion>` is
+            satisfied (or only once, if that is `None`).
+
+        Returns
+        -------
+
+        activity : 2d np.array
+            the activity of the Mechanism at the end of settling for each pattern.
+
+        """
+        return self._settle_patterns(self._parse_patterns(patterns), num_passes)
+
+    def train_patterns(self, patterns, num_passes=None, batch_size=None):
+        """Settle the activity of the Mechanism for each of a set of input patterns, and train the `recurrent_projection
+        <RecurrentTransferMechanism.recurrent_projection>` on the results.
+
+        The patterns are settled as they are by `recall_patterns <RecurrentTransferMechanism.recall_patterns>`;  the
+        weight changes generated by the `learning_function <RecurrentTransferMechanism.learning_function>` from the
+        activity for the patterns in each batch are summed, and added to the `matrix
+        <RecurrentTransferMechanism.matrix>` before the next batch is settled (see `Recurrent_Transfer_Patterns` for
+        details).
+
+        Arguments
+        ---------
+
+        patterns : 1d or 2d array
+            pattern(s) of external input to the Mechanism;  each item of a 2d array is settled separately.
+
+        num_passes : int : default None
+            specifies the number of passes for which each pattern is executed (see `recall_patterns
+            <RecurrentTransferMechanism.recall_patterns>`).
+
+        batch_size : int : default None
+            specifies the number of patterns settled before each update of the `matrix
+            <RecurrentTransferMechanism.matrix>`;  if it is `None`, all of them are settled before it is updated.
+
+        Returns
+        -------
+
+        activity : 2d np.array
+            the activity of the Mechanism at the end of settling for each pattern.
+
+        """
+        patterns = self._parse_patterns(patterns)
+        batch_size = batch_size or len(patterns)
+        activity = np.empty(patterns.shape)
+        for start in range(0, len(patterns), batch_size):
+            batch = slice(start, start + batch_size)
+            activity[batch] = self._settle_patterns(patterns[batch], num_passes)
+            self._assign_matrix(np.asarray(self.matrix, dtype=float) + self._compute_weight_changes(activity[batch]))
+        return activity
+
+    def _parse_patterns(self, patterns):
+        patterns = np.atleast_2d(np.asarray(patterns, dtype=float))
+        if patterns.ndim != 2 or patterns.shape[1] != len(self.matrix):
+            raise RecurrentTransferError("Patterns for {} must be a 1d or 2d array with items of length {}".
+                                         format(self.name, len(self.matrix)))
+        return patterns
+
+    def _settle_patterns(self, patterns, num_passes=None):
+        """Settle each item of patterns, updating all those that have not converged together in each pass"""
+
+        num_patterns, size = patterns.shape
+        matrix = np.asarray(self.matrix, dtype=float)
+        clip = self.get_current_mechanism_param("clip")
+        noise = self.get_current_mechanism_param("noise")
+        integration_rate = self.get_current_mechanism_param("integration_rate")
+        initial_value = self.initial_value
+        if initial_value is None:
+            initial_value = np.zeros(size)
+        integrator_value = np.array(np.broadcast_to(np.asarray(initial_value, dtype=float), (num_patterns, size)))
+
+        activity = np.zeros((num_patterns, size))
+        pending = np.arange(num_patterns)
+        pass_ = 0
+        while len(pending):
+            variable = self._combine_pattern_inputs(patterns[pending], activity[pending].dot(matrix))
+            if self.integrator_mode:
+                integrator_value[pending] = ((1 - integration_rate) * integrator_value[pending]
+                                             + integration_rate * variable
+                                             + self._try_execute_param(noise, variable))
+                variable = integrator_value[pending]
+            else:
+                variable = variable + self._try_execute_param(noise, variable)
+            value = self._clip_result(clip, self._transform_patterns(variable))
+
+            if num_passes is not None or self.convergence_criterion is None:
+                converged = np.full(len(pending), pass_ + 1 >= (num_passes or 1))
+            elif pass_ == 0:
+                converged = np.zeros(len(pending), dtype=bool)
+            else:
+                converged = self._pattern_deltas(value, activity[pending]) <= self.convergence_criterion
+                if self.max_passes and pass_ >= self.max_passes and not converged.all():
+                    raise RecurrentTransferError("Maximum number of executions ({}) has occurred before reaching "
+                                                 "convergence_criterion ({}) for {} in pattern {}".
+                                                 format(self.max_passes, self.convergence_criterion, self.name,
+                                                        pending[~converged][0]))
+            activity[pending] = value
+            pending = pending[~converged]
+            pass_ += 1
+
+        return activity
+
+    def _combine_pattern_inputs(self, patterns, recurrent):
+        """Combine external and recurrent input for several patterns, as done for one by the InputState(s)"""
+        combination_function = self.combination_function
+        if (not self.has_recurrent_input_state or
+                (type(combination_function) is LinearCombination and combination_function.operation == SUM
+                 and combination_function.weights is None and combination_function.exponents is None
+                 and combination_function.scale == 1 and combination_function.offset == 0)):
+            return patterns + recurrent
+        return np.array([np.ravel(combination_function.execute(variable=[external, internal]))
+                         for external, internal in zip(patterns, recurrent)])
+
+    def _transform_patterns(self, variable):
+        """Execute function on each item of variable, at once if it operates elementwise"""
+        if isinstance(self.function_object, _ELEMENTWISE_FUNCTIONS):
+            return np.atleast_2d(self.function_object.function(variable))
+        return np.array([np.ravel(self.function_object.function(item)) for item in variable])
+
+    def _pattern_deltas(self, value, previous_value):
+        """Return the result of convergence_function for each item of value and previous_value"""
+        distance = getattr(self.convergence_function, '__self__', None)
+        if isinstance(distance, Distance) and distance.metric is MAX_ABS_DIFF:
+            return np.max(np.abs(value - previous_value), axis=1)
+        return np.array([self.convergence_function([v, p]) for v, p in zip(value, previous_value)])
+
+    def _compute_weight_changes(self, activity):
+        """Return the weight changes generated by the learning_function for each item of activity, summed over them;
+        those for Hebbian and ContrastiveHebbian are computed together.
+        """
+        activity = np.atleast_2d(activity)
+
+        learning_mechanism = getattr(self, 'learning_mechanism', None)
+        if learning_mechanism is not None:
+            learning_function = learning_mechanism.function_object
+        else:
+            learning_function = self.learning_function
+            if isinstance(learning_function, type):
+                learning_function = learning_function(default_variable=activity[0],
+                                                      learning_rate=self.learning_rate)
+
+        if not isinstance(learning_function, (ContrastiveHebbian, Hebbian)):
+            learning_function = getattr(learning_function, FUNCTION, learning_function)
+            return np.sum([learning_function(item) for item in activity], axis=0)
+
+        learning_rate = learning_function.learning_rate
+        if learning_rate is None:
+            learning_rate = learning_function.default_learning_rate
+        learning_rate = np.asarray(learning_rate, dtype=float)
+
+        if learning_rate.ndim == 1:
+            activity = activity * learning_rate
+        weight_changes = np.dot(activity.T, activity)
+        np.fill_diagonal(weight_changes, 0)
+        if learning_rate.ndim != 1:
+            weight_changes = weight_changes * learning_rate
+        return weight_changes
+
+    def _assign_matrix(self, matrix):
+        """Assign matrix, and the current values of the ParameterStates for it and for auto and hetero (if any)"""
+        self.matrix = matrix
+        self.recurrent_projection.parameter_states[MATRIX].value = np.array(self.matrix)
+        for param in [AUTO, HETERO]:
+            if param in self._parameter_states:
+                self._parameter_states[param].value = np.array(getattr(self, param))
+
     # def _execute(self, variable=None, runtime_params=None, context=None):
     #
     #     if self.context.initialization_status != ContextFlags.INITIALIZING:
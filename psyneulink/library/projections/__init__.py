@@ -1,5 +1,3 @@
-from . import pathway
+from psyneulink.globals.utilities import lazy_import_submodules
 
-from .pathway import *
-
-__all__ = list(pathway.__all__)
+lazy_import_submodules(__name__, ['pathway'])
@@ -1,8 +1,3 @@
-from . import autoassociativeprojection
-from . import maskedmappingprojection
+from psyneulink.globals.utilities import lazy_import_submodules
 
-from .autoassociativeprojection import *
-from .maskedmappingprojection import *
-
-__all__ = list(autoassociativeprojection.__all__)
-__all__.extend(maskedmappingprojection.__all__)
+lazy_import_submodules(__name__, ['autoassociativeprojection', 'maskedmappingprojection'])
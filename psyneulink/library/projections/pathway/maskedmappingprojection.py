@@ -47,7 +47,8 @@ A MaskedMappingProjection executes in the same manner as a `MappingProjection`,
 each time the Projection is executed, its `mask <MaskedMappingProjection.mask>` is applied to its `matrix
 <MaskedMappingProjection.matrix>` parameter as specified by its `mask_operation
 <MaskedMappingProjection.mask_operation>` attribute, before generating the Projection's `value
-<MaskedMappingProjection.value>`.
+<MaskedMappingProjection.value>`.  If the `matrix <MaskedMappingProjection.matrix>` is a scipy.sparse matrix, the
+mask is applied only to its stored entries, so that entries outside its sparsity pattern remain zero.
 
 .. _Masked_MappingProjection_Class_Reference:
 
@@ -58,7 +59,6 @@ Class Reference
 import numbers
 
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.component import parameter_keywords
 from psyneulink.components.functions.function import get_matrix
@@ -66,10 +66,12 @@ from psyneulink.components.projections.pathway.mappingprojection import MappingP
 from psyneulink.components.projections.projection import projection_keywords
 from psyneulink.components.shellclasses import Mechanism
 from psyneulink.components.states.outputstate import OutputState
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import DEFAULT_MATRIX, MATRIX, FUNCTION_PARAMS, MASKED_MAPPING_PROJECTION
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
+from psyneulink.globals.utilities import combine_sparse_entries, is_sparse_matrix
 
 __all__ = [
     'MaskedMappingProjection', 'MaskedMappingProjectionError',
@@ -116,9 +118,10 @@ class MaskedMappingProjection(MappingProjection):
         `primary InputState <InputState_Primary>` will be used. If it is not specified, it will be assigned in
         the context in which the Projection is used.
 
-    matrix : list, np.ndarray, np.matrix, function or keyword : default DEFAULT_MATRIX
+    matrix : list, np.ndarray, np.matrix, scipy.sparse matrix, function or keyword : default DEFAULT_MATRIX
         the matrix used by `function <MaskedMappingProjection.function>` (default: `LinearCombination`) to transform
-        the value of the `sender <MaskedMappingProjection.sender>`.
+        the value of the `sender <MaskedMappingProjection.sender>`;  if it is a scipy.sparse matrix, the `mask
+        <MaskedMappingProjection.mask>` is applied only to its stored (nonzero) entries, so that it remains sparse.
 
     mask : int, float, list, np.ndarray or np.matrix : default None
         specifies a mask to be applied to the `matrix <MaskedMappingProjection.matrix>` each time the Projection is
@@ -244,7 +247,11 @@ class MaskedMappingProjection(MappingProjection):
 
         # Apply mask to matrix using mask_operation
         if self.mask:
-            if self.mask_operation is ADD:
+            # For a sparse matrix, apply mask only to its stored entries, so that it remains sparse
+            if is_sparse_matrix(self.matrix):
+                operation = {ADD: np.add, MULTIPLY: np.multiply, EXPONENTIATE: np.power}[self.mask_operation]
+                self.matrix = combine_sparse_entries(self.matrix, self.mask, operation)
+            elif self.mask_operation is ADD:
                 self.matrix += self.mask
             elif self.mask_operation is MULTIPLY:
                 self.matrix *= self.mask
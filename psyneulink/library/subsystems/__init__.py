@@ -1,8 +1,3 @@
-from . import agt
-from . import evc
+from psyneulink.globals.utilities import lazy_import_submodules
 
-from .agt import *
-from .evc import *
-
-__all__ = list(agt.__all__)
-__all__.extend(evc.__all__)
+lazy_import_submodules(__name__, ['agt', 'evc'])
@@ -1,8 +1,3 @@
-from . import agtcontrolmechanism
-from . import lccontrolmechanism
+from psyneulink.globals.utilities import lazy_import_submodules
 
-from .agtcontrolmechanism import *
-from .lccontrolmechanism import *
-
-__all__ = list(agtcontrolmechanism.__all__)
-__all__.extend(lccontrolmechanism.__all__)
+lazy_import_submodules(__name__, ['agtcontrolmechanism', 'lccontrolmechanism'])
@@ -268,7 +268,6 @@ Class Reference
 ---------------
 
 """
-import typecheck as tc
 
 from psyneulink.components.functions.function import \
     FHNIntegrator, MULTIPLICATIVE_PARAM, ModulationParam, _is_modulation_param
@@ -277,6 +276,7 @@ from psyneulink.components.mechanisms.processing.objectivemechanism import Objec
 from psyneulink.components.projections.modulatory.controlprojection import ControlProjection
 from psyneulink.components.states.outputstate import OutputState
 from psyneulink.components.shellclasses import Mechanism, System_Base
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.keywords import \
     ALL, CONTROL, CONTROL_PROJECTIONS, CONTROL_SIGNALS, FUNCTION, INIT__EXECUTE__METHOD_ONLY, PROJECTIONS
 from psyneulink.globals.utilities import is_iterable
@@ -1,8 +1,3 @@
-from . import evcauxiliary
-from . import evccontrolmechanism
+from psyneulink.globals.utilities import lazy_import_submodules
 
-from .evcauxiliary import *
-from .evccontrolmechanism import *
-
-__all__ = list(evcauxiliary.__all__)
-__all__.extend(evccontrolmechanism.__all__)
+lazy_import_submodules(__name__, ['evcauxiliary', 'evccontrolmechanism'])
@@ -14,12 +14,12 @@ Auxiliary functions for `EVCControlMechanism`.
 """
 
 import numpy as np
-import typecheck as tc
 import warnings
 
-from psyneulink.components.functions.function import Function_Base, Buffer, Integrator
+from psyneulink.components.functions.function import Function_Base, Buffer, Integrator, LinearCombination
 from psyneulink.components.mechanisms.processing.objectivemechanism import OUTCOME
 from psyneulink.components.mechanisms.processing.integratormechanism import IntegratorMechanism
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.defaults import MPI_IMPLEMENTATION, defaultControlAllocation
 from psyneulink.globals.keywords import \
@@ -32,8 +32,11 @@ from psyneulink.globals.preferences.componentpreferenceset import is_pref_set, k
 from psyneulink.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel
 
 __all__ = [
-    'AVERAGE_INPUTS', 'CONTROL_SIGNAL_GRID_SEARCH_FUNCTION', 'CONTROLLER', 'ControlSignalGridSearch',
-    'EVCAuxiliaryError', 'EVCAuxiliaryFunction', 'WINDOW_SIZE',
+    'AllocationPolicySearchSpace', 'AVERAGE_INPUTS', 'CONTROL_SIGNAL_BAYESIAN_SEARCH_FUNCTION',
+    'CONTROL_SIGNAL_COORDINATE_ASCENT_FUNCTION', 'CONTROL_SIGNAL_GRID_SEARCH_FUNCTION',
+    'CONTROL_SIGNAL_SUCCESSIVE_HALVING_FUNCTION', 'CONTROLLER', 'ControlSignalBayesianSearch',
+    'ControlSignalCoordinateAscent', 'ControlSignalGridSearch', 'ControlSignalSearchFunction',
+    'ControlSignalSuccessiveHalving', 'EVCAuxiliaryError', 'EVCAuxiliaryFunction', 'WINDOW_SIZE',
     'kwEVCAuxFunction', 'kwEVCAuxFunctionType', 'kwValueFunction',
     'INPUT_SEQUENCE', 'OUTCOME', 'PredictionMechanism', 'PY_MULTIPROCESSING',
     'TIME_AVERAGE_INPUT', 'ValueFunction', 'FILTER_FUNCTION'
@@ -52,6 +55,9 @@ kwEVCAuxFunction = "EVC AUXILIARY FUNCTION"
 kwEVCAuxFunctionType = "EVC AUXILIARY FUNCTION TYPE"
 kwValueFunction = "EVC VALUE FUNCTION"
 CONTROL_SIGNAL_GRID_SEARCH_FUNCTION = "EVC CONTROL SIGNAL GRID SEARCH FUNCTION"
+CONTROL_SIGNAL_COORDINATE_ASCENT_FUNCTION = "EVC CONTROL SIGNAL COORDINATE ASCENT FUNCTION"
+CONTROL_SIGNAL_SUCCESSIVE_HALVING_FUNCTION = "EVC CONTROL SIGNAL SUCCESSIVE HALVING FUNCTION"
+CONTROL_SIGNAL_BAYESIAN_SEARCH_FUNCTION = "EVC CONTROL SIGNAL BAYESIAN SEARCH FUNCTION"
 CONTROLLER = 'controller'
 
 
@@ -206,16 +212,389 @@ class ValueFunction(EVCAuxiliaryFunction):
 
         return (value, outcome, cost)
 
+    def compute_batch(self, controller=None, outcomes=None, costs=None, context=None):
+        """
+        compute_batch (controller, outcomes, costs)
+
+        Calculate the EVC for each of a set of outcomes, and the costs of the `allocation_policy` that yielded it.
+
+        Returns the same values as calling `function <ValueFunction.function>` for each item of **outcomes** and the
+        corresponding row of **costs**.  If the controller's `cost_function <EVCControlMechanism.cost_function>` and
+        `combine_outcome_and_cost_function <EVCControlMechanism.combine_outcome_and_cost_function>` are both
+        `LinearCombination` Functions, and each outcome is a single value, each is called once for all of the items;
+        the same is true if both are `vectorized <UDF_Vectorized>` `UserDefinedFunctions <UserDefinedFunction>`, which
+        are passed the costs and outcomes of all of the items stacked along a new first axis.  Otherwise,
+        `function <ValueFunction.function>` is called for each item.
+
+        Arguments
+        ---------
+
+        controller : EVCControlMechanism
+            the EVCControlMechanism for which the EVCs are to be calculated.
+
+        outcomes : list of values
+            each item should be an outcome, as for the **outcome** argument of `function <ValueFunction.function>`.
+
+        costs : 2d np.array
+            each row should be the `cost <ControlSignal.cost>` of each of the controller's `ControlSignals
+            <EVCControlMechanism_ControlSignals>` (e.g., as returned by its `compute_policy_costs
+            <EVCControlMechanism.compute_policy_costs>` method) for the corresponding item of **outcomes**.
+
+        Returns
+        -------
+
+        [(EVC, outcome, cost), ...] : List[Tuple(float, float, float)]
+            one tuple for each item of **outcomes**.
+
+        """
+
+        costs = np.asarray(costs, dtype=float).reshape(len(outcomes), -1)
+
+        cost_function = controller.paramsCurrent[COST_FUNCTION]
+        combine_function = controller.paramsCurrent[COMBINE_OUTCOME_AND_COST_FUNCTION]
+
+        if (getattr(self.function, '__func__', None) is ValueFunction.function
+                and type(cost_function) is LinearCombination
+                and type(combine_function) is LinearCombination
+                and all(np.size(outcome) == 1 for outcome in outcomes)):
+            # Each row of variable is combined elementwise, so the costs and outcomes of all items are combined at once
+            aggregated_costs = np.asarray(cost_function._execute(variable=costs.T, context=context))
+            values = np.asarray(combine_function._execute(variable=[np.array(outcomes, dtype=float).reshape(-1),
+                                                                    -aggregated_costs]))
+            if aggregated_costs.shape == values.shape == (len(outcomes),):
+                return [(values[i:i + 1], outcome, aggregated_costs[i:i + 1]) for i, outcome in enumerate(outcomes)]
+
+        from psyneulink.components.functions.function import UserDefinedFunction
+
+        if (getattr(self.function, '__func__', None) is ValueFunction.function
+                and isinstance(cost_function, UserDefinedFunction) and cost_function.vectorized
+                and isinstance(combine_function, UserDefinedFunction) and combine_function.vectorized):
+            # The functions are declared to accept the costs and outcomes of all items stacked along a new first axis
+            aggregated_costs = np.asarray(cost_function._execute(controller=controller, costs=costs[:, :, np.newaxis]))
+            values = np.asarray(combine_function._execute(controller=controller,
+                                                          outcome=np.array(outcomes),
+                                                          cost=aggregated_costs))
+            if len(aggregated_costs) == len(values) == len(outcomes):
+                return [(value, outcome, cost) for value, outcome, cost in zip(values, outcomes, aggregated_costs)]
+
+        return [self.function(controller=controller, outcome=outcome, costs=cost.reshape(-1, 1), context=context)
+                for outcome, cost in zip(outcomes, costs)]
+
+
+class AllocationPolicySearchSpace:
+    """Set of all `allocation_policies <EVCControlMechanism.allocation_policy>` that can be constructed from the
+    `allocation_samples <ControlSignal.allocation_samples>` of a list of `ControlSignals <ControlSignal>`.
+
+    This is assigned to the `control_signal_search_space <EVCControlMechanism.control_signal_search_space>` attribute
+    of an `EVCControlMechanism`.  It represents the `Cartesian product <https://en.wikipedia.org/wiki/Cartesian_product>`_
+    of the `allocation_samples <ControlSignal.allocation_samples>` without constructing it:  allocation policies are
+    generated only as they are requested, either by iterating over the search space or by indexing it, so that its
+    memory footprint does not grow with the number of allocation policies.  Its `len <AllocationPolicySearchSpace>` is
+    the number of allocation policies, and indexing it with an integer returns the corresponding `allocation_policy`
+    as a 1d np.array (with one item for each ControlSignal);  indexing it with a slice returns a 2d np.array with the
+    corresponding policies.  The policies are listed in the same order as the rows of the array constructed by
+    ``np.array(np.meshgrid(*samples)).T.reshape(-1, len(samples))``, which can be obtained by calling
+    ``np.array`` on the search space.
+
+    Arguments
+    ---------
+
+    samples : list[list or 1d np.array]
+        the `allocation_samples <ControlSignal.allocation_samples>` of each ControlSignal.
+
+    Attributes
+    ----------
+
+    samples : list[1d np.array]
+        the `allocation_samples <ControlSignal.allocation_samples>` of each ControlSignal.
+
+    shape : Tuple[int, int]
+        number of allocation policies and number of ControlSignals.
+
+    """
+
+    def __init__(self, samples):
+        self.samples = [np.atleast_1d(np.asarray(s)) for s in samples]
+        num_signals = len(self.samples)
+        # Order of the dimensions, from slowest to fastest varying, that reproduces the order of np.meshgrid
+        if num_signals < 2:
+            self._order = list(range(num_signals))
+        else:
+            self._order = list(range(num_signals - 1, 1, -1)) + [0, 1]
+        self._radices = [len(self.samples[i]) for i in self._order]
+        self._dtype = np.result_type(*self.samples) if self.samples else float
+        self._len = int(np.prod(self._radices, dtype=np.int64)) if self._radices else 0
+
+    # number of policies generated at a time by policies()
+    BLOCK_SIZE = 1024
+
+    def __len__(self):
+        return self._len
+
+    @property
+    def shape(self):
+        return (len(self), len(self.samples))
+
+    def __iter__(self):
+        return self.policies()
+
+    def policies(self, start=0, stop=None):
+        """Generate the allocation policies from index **start** up to (but not including) index **stop**."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        for block_start in range(start, stop, self.BLOCK_SIZE):
+            yield from self._block(block_start, min(block_start + self.BLOCK_SIZE, stop))
+
+    def _block(self, start, stop):
+        """Return the allocation policies from index **start** up to (but not including) index **stop** as a 2d array"""
+        block = np.empty((max(stop - start, 0), len(self.samples)), dtype=self._dtype)
+        index = np.arange(start, max(start, stop), dtype=np.int64)
+        for signal, radix in zip(reversed(self._order), reversed(self._radices)):
+            index, sample_indices = np.divmod(index, radix)
+            block[:, signal] = self.samples[signal][sample_indices]
+        return block
+
+    def indices(self, index):
+        """Return the index of the sample of each ControlSignal used by the allocation policy with index **index**."""
+        sample_indices = [0] * len(self.samples)
+        for signal, radix in zip(reversed(self._order), reversed(self._radices)):
+            index, sample_indices[signal] = divmod(index, radix)
+        return sample_indices
+
+    def policy(self, sample_indices):
+        """Return the allocation policy that uses the sample of each ControlSignal with the index in
+        **sample_indices**."""
+        return np.array([samples[i] for samples, i in zip(self.samples, sample_indices)], dtype=self._dtype)
+
+    def index(self, sample_indices):
+        """Return the index of the allocation policy that uses the sample of each ControlSignal with the index in
+        **sample_indices**."""
+        index = 0
+        for signal, radix in zip(self._order, self._radices):
+            index = index * radix + sample_indices[signal]
+        return index
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            return np.asarray(self[key[0]])[(Ellipsis,) + key[1:]]
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return self._block(start, stop)
+            return np.array([self[i] for i in range(start, stop, step)],
+                            dtype=self._dtype).reshape(-1, len(self.samples))
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("index {} is out of range for search space with {} allocation policies".
+                             format(key, len(self)))
+        return self.policy(self.indices(key))
+
+    def __array__(self, dtype=None):
+        return np.asarray(self[:], dtype=dtype)
+
+    def __repr__(self):
+        return '{}({} allocation policies for {} ControlSignals)'.format(self.__class__.__name__, *self.shape)
+
+
+class _SearchResults:
+    """Record of the allocation policies evaluated by a `ControlSignalSearchFunction`, and their EVCs.
+
+    The policies and EVCs are stored in arrays preallocated for **capacity** policies (if it is known) or for
+    CHUNK_SIZE policies (if it is not), which are doubled in size whenever they are full.
+
+    """
+
+    CHUNK_SIZE = 1024
+
+    def __init__(self, num_control_signals, capacity=None):
+        capacity = capacity if capacity is not None else self.CHUNK_SIZE
+        self._values = np.empty(capacity)
+        self._policies = np.empty((capacity, num_control_signals))
+        self.count = 0
+
+    def append(self, EVC, policy):
+        if self.count == len(self._values):
+            capacity = max(2 * len(self._values), self.CHUNK_SIZE)
+            self._values = np.resize(self._values, capacity)
+            self._policies = np.resize(self._policies, (capacity, self._policies.shape[1]))
+        self._values[self.count] = EVC
+        self._policies[self.count] = np.ravel(policy)
+        self.count += 1
+
+    def allgather(self, comm):
+        """Replace the results with those of all of the processes of MPI communicator **comm**, in order of rank."""
+        self._values = np.concatenate(comm.allgather(self.values))
+        self._policies = np.concatenate(comm.allgather(self.policies))
+        self.count = len(self._values)
+
+    @property
+    def values(self):
+        return self._values[:self.count]
+
+    @property
+    def policies(self):
+        return self._policies[:self.count]
+
+
+class ControlSignalSearchFunction(EVCAuxiliaryFunction):
+    """Base class for functions that search the `control_signal_search_space
+    <EVCControlMechanism.control_signal_search_space>` of an `EVCControlMechanism` for the `allocation_policy` with
+    the maximum `EVC <EVCControlMechanism_EVC>`.
+
+    Subclasses implement `_search`, which calls `_evaluate_policy` for each `allocation_policy` it evaluates;
+    `_evaluate_policy` simulates the `system <EVCControlMechanism.system>` (using `_compute_EVC`), keeps track of the
+    policy with the maximum EVC and, if `save_all_values_and_policies <EVCControlMechanism.save_all_values_and_policies>`
+    is `True`, saves every policy evaluated and its EVC (in the EVCControlMechanism's `EVC_policies` and `EVC_values`
+    attributes).  These are saved in arrays allocated for the number of policies returned by `_max_num_policies`
+    (or in increasingly large chunks if it returns None).  The number of simulations run is reported in the
+    EVCControlMechanism's `num_simulations <EVCControlMechanism.num_simulations>` attribute.
+
+    """
+
+    def __init__(self,
+                 default_variable=None,
+                 params=None,
+                 function=None,
+                 owner=None):
+        function = function or self.function
+        super().__init__(function=function,
+                         owner=owner,
+                         context=ContextFlags.CONSTRUCTOR)
+
+    def function(
+        self,
+        controller=None,
+        variable=None,
+        runtime_params=None,
+        params=None,
+        context=None,
+    ):
+        """Search `control_signal_search_space <EVCControlMechanism.control_signal_search_space>` for the
+        `allocation_policy` with the maximum `EVC <EVCControlMechanism_EVC>`.
+
+        Return (2D np.array): the `allocation_policy` with the maximum EVC, with one item for each ControlSignal.
+
+        """
+
+        if (self.context.initialization_status == ContextFlags.INITIALIZING or
+                self.owner.context.initialization_status == ContextFlags.INITIALIZING):
+            return defaultControlAllocation
+
+        # Get value of, or set default for standard args
+        if controller is None:
+            raise EVCAuxiliaryError("Call to {}() missing controller argument".format(self.__class__.__name__))
+
+        self._begin_search(controller, variable)
+        self._search(controller, runtime_params, context)
+        self._end_search(controller)
+
+        if controller.prefs.reportOutputPref:
+            print("\nEVC simulation completed")
+
+        return self._assign_allocation_policy(controller)
+
+    def _search(self, controller, runtime_params, context):
+        raise EVCAuxiliaryError("PROGRAM ERROR: {} must implement _search()".format(self.__class__.__name__))
+
+    def _max_num_policies(self, controller):
+        """Return the maximum number of allocation policies that will be saved by the search, or None if unknown."""
+        return None
+
+    def _begin_search(self, controller, variable):
+        controller.EVC_max = None
+        controller.EVC_values = []
+        controller.EVC_policies = []
+
+        # Reset context so that System knows this is a simulation (to avoid infinitely recursive loop)
+        # FIX 3/30/18 - IS controller CORRECT FOR THIS, OR SHOULD IT BE System (controller.system)??
+        controller.context.execution_phase = ContextFlags.SIMULATION
+        controller.context.string = "{0} EXECUTING {1} of {2}".format(controller.name,
+                                                                      EVC_SIMULATION,
+                                                                      controller.system.name)
+
+        controller.EVC_max_state_values = variable.copy()
+        controller.EVC_max_policy = controller.control_signal_search_space[0] * 0.0
+
+        self._EVC_max = float('-Infinity')
+        self._EVC_max_state_values = np.empty_like(controller.input_values)
+        self._EVC_max_policy = np.empty_like(controller.control_signal_search_space[0])
+        self._results = None
+        if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
+            self._results = _SearchResults(len(controller.control_signals), self._max_num_policies(controller))
+
+    def _evaluate_policy(self, controller, allocation_vector, runtime_params, context, trials=None, costs=None):
+        """Simulate **allocation_vector** and return its EVC (averaged over **trials** of `predicted_input
+        <EVCControlMechanism.predicted_input>`; all of them if it is None), keeping track of the maximum EVC.
+        **costs** are the costs of the ControlSignals for **allocation_vector**, if they have already been computed."""
+
+        EVC, outcome, cost = _compute_EVC(args=(controller, allocation_vector, runtime_params, context, trials, costs))
+
+        if self._results is not None:
+            self._results.append(EVC, allocation_vector)
+
+        # If EVC is greater than or equal to the previous maximum:
+        # - store the current set of monitored state value in EVC_max_state_values
+        # - store the current set of control_signals in EVC_max_policy
+        # FIX: PUT ERROR HERE IF EVC AND/OR EVC_MAX ARE EMPTY (E.G., WHEN EXECUTION_ID IS WRONG)
+        if EVC >= self._EVC_max:
+            self._EVC_max = EVC
+            self._EVC_max_state_values = controller.input_values
+            self._EVC_max_policy = allocation_vector
+
+        return EVC
+
+    def _end_search(self, controller):
+        controller.EVC_max = self._EVC_max
+        controller.EVC_max_state_values = self._EVC_max_state_values
+        controller.EVC_max_policy = self._EVC_max_policy
+        if self._results is not None:
+            controller.EVC_values = self._results.values
+            controller.EVC_policies = self._results.policies
+
+    def _assign_allocation_policy(self, controller):
+
+        #region ASSIGN CONTROL SIGNAL VALUES
+
+        # Assign allocations to control_signals for optimal allocation policy:
+        EVC_maxStateValue = iter(controller.EVC_max_state_values)
+
+        # Assign max values for optimal allocation policy to controller.input_states (for reference only)
+        for i in range(len(controller.input_states)):
+            controller.input_states[controller.input_states.names[i]].value = np.atleast_1d(next(EVC_maxStateValue))
+
+
+        # Report EVC max info
+        if controller.prefs.reportOutputPref:
+            print ("\nMaximum EVC for {0}: {1} ({2} simulations)".
+                   format(controller.system.name, float(controller.EVC_max), controller.num_simulations))
+            print ("ControlProjection allocation(s) for maximum EVC:")
+            for i in range(len(controller.control_signals)):
+                print("\t{0}: {1}".format(controller.control_signals[i].name,
+                                        controller.EVC_max_policy[i]))
+            print()
+
+        #endregion
 
-class ControlSignalGridSearch(EVCAuxiliaryFunction):
+        #region ASSIGN AND RETURN allocation_policy
+        # Convert EVC_max_policy into 2d array with one control_signal allocation per item,
+        #     assign to controller.allocation_policy, and return (where it will be assigned to controller.value).
+        #     (note:  the conversion is to be consistent with use of controller.value for assignments to control_signals.value)
+        allocation_policy = np.array(controller.EVC_max_policy).reshape(len(controller.EVC_max_policy), -1)
+        controller.value = allocation_policy
+        return allocation_policy
+        #endregion
+
+
+class ControlSignalGridSearch(ControlSignalSearchFunction):
     """Conduct an exhaustive search of allocation polices and return the one with the maximum `EVC <EVCControlMechanism_EVC>`.
 
     This is the default `function <EVCControlMechanism.function>` for an EVCControlMechanism. It identifies the `allocation_policy`
     with the maximum `EVC <EVCControlMechanism_EVC>` by a conducting a grid search over every possible `allocation_policy`
     given the `allocation_samples` specified for each of its ControlSignals (i.e., the `Cartesian product
     <https://en.wikipedia.org/wiki/Cartesian_product>`_ of the `allocation <ControlSignal.allocation>` values specified
-    by the `allocation_samples` attribute of each ControlSignal).  The full set of allocation policies is stored in the
-    EVCControlMechanism's `control_signal_search_space` attribute.  The EVCControlMechanism's `run_simulation` method is used to
+    by the `allocation_samples` attribute of each ControlSignal).  The full set of allocation policies is represented by
+    the EVCControlMechanism's `control_signal_search_space` attribute, which generates each policy as it is needed.
+    The EVCControlMechanism's `run_simulation` method is used to
     simulate its `system <EVCControlMechanism.system>` under each `allocation_policy` in `control_signal_search_space`,
     calculate the EVC for each of those policies, and return the policy with the greatest EVC. By default, only the
     maximum EVC is saved and returned.  However, setting the `save_all_values_and_policies` attribute to `True` saves
@@ -266,22 +645,14 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
 
     The ControlSignalGridSearch function returns the `allocation_policy` that yielded the maximum EVC.
     Its operation can be modified by customizing or replacing any or all of the functions referred to above
-    (also see `EVCControlMechanism_Functions`).
+    (also see `EVCControlMechanism_Functions`).  Since the number of allocation policies grows exponentially with the
+    number of ControlSignals, one of the other `search functions <EVCControlMechanism_Search_Functions>` can be used
+    to find the `allocation_policy` with the maximum EVC using fewer simulations.
 
     """
 
     componentName = CONTROL_SIGNAL_GRID_SEARCH_FUNCTION
 
-    def __init__(self,
-                 default_variable=None,
-                 params=None,
-                 function=None,
-                 owner=None):
-        function = function or self.function
-        super().__init__(function=function,
-                         owner=owner,
-                         context=ContextFlags.CONSTRUCTOR)
-
     def function(
         self,
         controller=None,
@@ -304,37 +675,26 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
 
         .. note::
             * runtime_params is used for self.__execute (that calculates the EVC for each call to System.execute);
-              it is NOT used for System.execute -- that uses the runtime_params provided for the Mechanisms in each
+              it is NOT used for System.execute -- that uses the runtime_params provided for the Mechanisms in each
               Process.configuration
 
         Return (2D np.array): value of outputState for each monitored state (in self.input_states) for EVC_max
 
         """
+        return super().function(controller=controller,
+                                variable=variable,
+                                runtime_params=runtime_params,
+                                params=params,
+                                context=context)
 
-        if (self.context.initialization_status == ContextFlags.INITIALIZING or
-                self.owner.context.initialization_status == ContextFlags.INITIALIZING):
-            return defaultControlAllocation
-
-        # Get value of, or set default for standard args
-        if controller is None:
-            raise EVCAuxiliaryError("Call to ControlSignalGridSearch() missing controller argument")
-
-        #region RUN SIMULATION
+    def _search(self, controller, runtime_params, context):
 
-        controller.EVC_max = None
-        controller.EVC_values = []
-        controller.EVC_policies = []
+        search_space = controller.control_signal_search_space
 
-        # Reset context so that System knows this is a simulation (to avoid infinitely recursive loop)
-        # FIX 3/30/18 - IS controller CORRECT FOR THIS, OR SHOULD IT BE System (controller.system)??
-        controller.context.execution_phase = ContextFlags.SIMULATION
-        controller.context.string = "{0} EXECUTING {1} of {2}".format(controller.name,
-                                                                      EVC_SIMULATION,
-                                                                      controller.system.name)
         # Print progress bar
         if controller.prefs.reportOutputPref:
             progress_bar_rate_str = ""
-            search_space_size = len(controller.control_signal_search_space)
+            search_space_size = len(search_space)
             progress_bar_rate = int(10 ** (np.log10(search_space_size)-2))
             if progress_bar_rate > 1:
                 progress_bar_rate_str = str(progress_bar_rate) + " "
@@ -343,8 +703,6 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
 
         # Evaluate all combinations of control_signals (policies)
         sample = 0
-        controller.EVC_max_state_values = variable.copy()
-        controller.EVC_max_policy = controller.control_signal_search_space[0] * 0.0
 
         # Parallelize using multiprocessing.Pool
         # NOTE:  currently fails on attempt to pickle lambda functions
@@ -352,57 +710,37 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
         if PY_MULTIPROCESSING:
             EVC_pool = Pool()
             results = EVC_pool.map(_compute_EVC, [(controller, arg, runtime_params, context)
-                                                 for arg in controller.control_signal_search_space])
+                                                 for arg in search_space])
+            return
 
-        else:
+        # Parallelize using MPI
+        start, end = self._get_chunk(search_space)
 
-            # Parallelize using MPI
-            if MPI_IMPLEMENTATION:
-                Comm = MPI.COMM_WORLD
-                rank = Comm.Get_rank()
-                size = Comm.Get_size()
-
-                chunk_size = (len(controller.control_signal_search_space) + (size-1)) // size
-                print("Rank: {}\nChunk size: {}".format(rank, chunk_size))
-                start = chunk_size * rank
-                end = chunk_size * (rank+1)
-                if start > len(controller.control_signal_search_space):
-                    start = len(controller.control_signal_search_space)
-                if end > len(controller.control_signal_search_space):
-                    end = len(controller.control_signal_search_space)
-            else:
-                start = 0
-                end = len(controller.control_signal_search_space)
-
-            if MPI_IMPLEMENTATION:
-                print("START: {0}\nEND: {1}".format(start,end))
-
-            #region EVALUATE EVC
-
-            # Compute EVC for each allocation policy in control_signal_search_space
-            # Notes on MPI:
-            # * breaks up search into chunks of size chunk_size for each process (rank)
-            # * each process computes max for its chunk and returns
-            # * result for each chunk contains EVC max and associated allocation policy for that chunk
-
-            result = None
-            EVC_max = float('-Infinity')
-            EVC_max_policy = np.empty_like(controller.control_signal_search_space[0])
-            EVC_max_state_values = np.empty_like(controller.input_values)
-            max_value_state_policy_tuple = (EVC_max, EVC_max_state_values, EVC_max_policy)
-            # FIX:  INITIALIZE TO FULL LENGTH AND ASSIGN DEFAULT VALUES (MORE EFFICIENT):
-            EVC_values = np.array([])
-            EVC_policies = np.array([[]])
-
-            # # TEST PRINT EVC:
-            # inputs = []
-            # for i in controller.predicted_input.values():
-            #     inputs.append(repr(i).replace('\n', ''))
-            # print("\nEVC SIMULATION for Inputs: {}".format(inputs))
-
-            for allocation_vector in controller.control_signal_search_space[start:end,:]:
-            # for iter in range(rank, len(controller.control_signal_search_space), size):
-            #     allocation_vector = controller.control_signal_search_space[iter,:]:
+        if MPI_IMPLEMENTATION:
+            print("Rank: {}\nChunk size: {}".format(MPI.COMM_WORLD.Get_rank(), end - start))
+            print("START: {0}\nEND: {1}".format(start,end))
+
+        #region EVALUATE EVC
+
+        # Compute EVC for each allocation policy in control_signal_search_space
+        # Notes on MPI:
+        # * breaks up search into chunks of size chunk_size for each process (rank)
+        # * each process computes max for its chunk and returns
+        # * result for each chunk contains EVC max and associated allocation policy for that chunk
+
+        # # TEST PRINT EVC:
+        # inputs = []
+        # for i in controller.predicted_input.values():
+        #     inputs.append(repr(i).replace('\n', ''))
+        # print("\nEVC SIMULATION for Inputs: {}".format(inputs))
+
+        # Policies are generated a block at a time, rather than constructing the full search space,
+        #    and the costs of the policies in each block are computed together
+        for block_start in range(start, end, search_space.BLOCK_SIZE):
+            allocation_vectors = search_space[block_start:min(block_start + search_space.BLOCK_SIZE, end)]
+            costs = controller.compute_policy_costs(allocation_vectors)
+
+            for allocation_vector, allocation_costs in zip(allocation_vectors, costs):
 
                 if controller.prefs.reportOutputPref:
                     increment_progress_bar = (progress_bar_rate < 1) or not (sample % progress_bar_rate)
@@ -411,117 +749,351 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
                 sample +=1
 
                 # Calculate EVC for specified allocation policy
-                result_tuple = _compute_EVC(args=(controller, allocation_vector,
-                                                  runtime_params,
-                                                  context))
-                EVC, outcome, cost = result_tuple
-
-                EVC_max = max(EVC, EVC_max)
-                # max_result([t1, t2], key=lambda x: x1)
-
-
-                # Add to list of EVC values and allocation policies if save option is set
-                if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
-                    # FIX:  ASSIGN BY INDEX (MORE EFFICIENT)
-                    EVC_values = np.append(EVC_values, np.atleast_1d(EVC), axis=0)
-                    # Save policy associated with EVC for each process, as order of chunks
-                    #     might not correspond to order of policies in control_signal_search_space
-                    if len(EVC_policies[0])==0:
-                        EVC_policies = np.atleast_2d(allocation_vector)
-                    else:
-                        EVC_policies = np.append(EVC_policies, np.atleast_2d(allocation_vector), axis=0)
-
-                # If EVC is greater than the previous value:
-                # - store the current set of monitored state value in EVC_max_state_values
-                # - store the current set of control_signals in EVC_max_policy
-                # if EVC_max > EVC:
-                # FIX: PUT ERROR HERE IF EVC AND/OR EVC_MAX ARE EMPTY (E.G., WHEN EXECUTION_ID IS WRONG)
-                if EVC == EVC_max:
-                    # Keep track of state values and allocation policy associated with EVC max
-                    # EVC_max_state_values = controller.input_value.copy()
-                    # EVC_max_policy = allocation_vector.copy()
-                    EVC_max_state_values = controller.input_values
-                    EVC_max_policy = allocation_vector
-                    max_value_state_policy_tuple = (EVC_max, EVC_max_state_values, EVC_max_policy)
-
-            # # TEST PRINT EVC:
-            # print("EVC_max: {}\tASSOCIATED allocation_policy: {}\n".format(EVC_max, EVC_max_policy))
-
-            #endregion
-
-            # Aggregate, reduce and assign global results
-
-            if MPI_IMPLEMENTATION:
-                # combine max result tuples from all processes and distribute to all processes
-                max_tuples = Comm.allgather(max_value_state_policy_tuple)
-                # get tuple with "EVC max of maxes"
-                max_of_max_tuples = max(max_tuples, key=lambda max_tuple: max_tuple[0])
-                # get EVC_max, state values and allocation policy associated with "max of maxes"
-                controller.EVC_max = max_of_max_tuples[0]
-                controller.EVC_max_state_values = max_of_max_tuples[1]
-                controller.EVC_max_policy = max_of_max_tuples[2]
-
-                if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
-                    controller.EVC_values = np.concatenate(Comm.allgather(EVC_values), axis=0)
-                    controller.EVC_policies = np.concatenate(Comm.allgather(EVC_policies), axis=0)
-            else:
-                controller.EVC_max = EVC_max
-                controller.EVC_max_state_values = EVC_max_state_values
-                controller.EVC_max_policy = EVC_max_policy
-                if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
-                    controller.EVC_values = EVC_values
-                    controller.EVC_policies = EVC_policies
-            # # TEST PRINT:
-            # import re
-            # print("\nFINAL:\n\tmax tuple:\n\t\tEVC_max: {}\n\t\tEVC_max_state_values: {}\n\t\tEVC_max_policy: {}".
-            #       format(re.sub('[\[,\],\n]','',str(max_value_state_policy_tuple[0])),
-            #              re.sub('[\[,\],\n]','',str(max_value_state_policy_tuple[1])),
-            #              re.sub('[\[,\],\n]','',str(max_value_state_policy_tuple[2]))),
-            #       flush=True)
-
-            # FROM MIKE ANDERSON (ALTERNTATIVE TO allgather:  REDUCE USING A FUNCTION OVER LOCAL VERSION)
-            # a = np.random.random()
-            # mymax=Comm.allreduce(a, MPI.MAX)
-            # print(mymax)
+                self._evaluate_policy(controller, allocation_vector, runtime_params, context, costs=allocation_costs)
 
-        if controller.prefs.reportOutputPref:
-            print("\nEVC simulation completed")
-    #endregion
+        # # TEST PRINT EVC:
+        # print("EVC_max: {}\tASSOCIATED allocation_policy: {}\n".format(EVC_max, EVC_max_policy))
 
-        # -----------------------------------------------------------------
+        #endregion
 
-        #region ASSIGN CONTROL SIGNAL VALUES
+    def _get_chunk(self, search_space):
+        """Return the start and end of the part of **search_space** evaluated by this process"""
+        if not MPI_IMPLEMENTATION:
+            return 0, len(search_space)
 
-        # Assign allocations to control_signals for optimal allocation policy:
-        EVC_maxStateValue = iter(controller.EVC_max_state_values)
+        Comm = MPI.COMM_WORLD
+        rank = Comm.Get_rank()
+        size = Comm.Get_size()
 
-        # Assign max values for optimal allocation policy to controller.input_states (for reference only)
-        for i in range(len(controller.input_states)):
-            controller.input_states[controller.input_states.names[i]].value = np.atleast_1d(next(EVC_maxStateValue))
+        chunk_size = (len(search_space) + (size-1)) // size
+        start = min(chunk_size * rank, len(search_space))
+        end = min(chunk_size * (rank+1), len(search_space))
+        return start, end
 
+    def _max_num_policies(self, controller):
+        start, end = self._get_chunk(controller.control_signal_search_space)
+        return end - start
 
-        # Report EVC max info
-        if controller.prefs.reportOutputPref:
-            print ("\nMaximum EVC for {0}: {1}".format(controller.system.name, float(controller.EVC_max)))
-            print ("ControlProjection allocation(s) for maximum EVC:")
-            for i in range(len(controller.control_signals)):
-                print("\t{0}: {1}".format(controller.control_signals[i].name,
-                                        controller.EVC_max_policy[i]))
-            print()
+    def _end_search(self, controller):
 
-        #endregionj
+        # Aggregate, reduce and assign global results
 
-        # # TEST PRINT:
-        # print ("\nEND OF TRIAL 1 EVC outputState: {0}\n".format(controller.outputState.value))
+        if MPI_IMPLEMENTATION:
+            Comm = MPI.COMM_WORLD
+            # combine max result tuples from all processes and distribute to all processes
+            max_tuples = Comm.allgather((self._EVC_max, self._EVC_max_state_values, self._EVC_max_policy))
+            # get tuple with "EVC max of maxes"
+            max_of_max_tuples = max(max_tuples, key=lambda max_tuple: max_tuple[0])
+            # get EVC_max, state values and allocation policy associated with "max of maxes"
+            self._EVC_max, self._EVC_max_state_values, self._EVC_max_policy = max_of_max_tuples
 
-        #region ASSIGN AND RETURN allocation_policy
-        # Convert EVC_max_policy into 2d array with one control_signal allocation per item,
-        #     assign to controller.allocation_policy, and return (where it will be assigned to controller.value).
-        #     (note:  the conversion is to be consistent with use of controller.value for assignments to control_signals.value)
-        allocation_policy = np.array(controller.EVC_max_policy).reshape(len(controller.EVC_max_policy), -1)
-        controller.value = allocation_policy
-        return allocation_policy
-        #endregion
+            if self._results is not None:
+                # Save policy associated with EVC for each process, as order of chunks
+                #     might not correspond to order of policies in control_signal_search_space
+                self._results.allgather(Comm)
+
+        # FROM MIKE ANDERSON (ALTERNTATIVE TO allgather:  REDUCE USING A FUNCTION OVER LOCAL VERSION)
+        # a = np.random.random()
+        # mymax=Comm.allreduce(a, MPI.MAX)
+        # print(mymax)
+
+        super()._end_search(controller)
+
+
+class ControlSignalCoordinateAscent(ControlSignalSearchFunction):
+    """
+    ControlSignalCoordinateAscent(  \
+        max_iterations=None)
+
+    Search for the `allocation_policy` with the maximum `EVC <EVCControlMechanism_EVC>` one ControlSignal at a time.
+
+    Starting from the allocation policy made up of the `allocation_samples <ControlSignal.allocation_samples>` closest
+    to the current `allocation <ControlSignal.allocation>` of each ControlSignal, each iteration evaluates, for each
+    ControlSignal in turn, every one of its `allocation_samples <ControlSignal.allocation_samples>` while the
+    allocations of the other ControlSignals are held fixed, and moves to the sample with the greatest EVC.  The search
+    ends when an iteration fails to increase the EVC (i.e., at a policy that cannot be improved by changing the
+    allocation of any single ControlSignal) or after **max_iterations** iterations.  Each iteration requires at most
+    as many simulations as the total number of `allocation_samples <ControlSignal.allocation_samples>` over all of
+    the ControlSignals (no allocation policy is simulated more than once), rather than their product as for
+    `ControlSignalGridSearch`.  The policy found is the one with the maximum EVC if the EVC is a concave (or, more
+    generally, coordinate-wise unimodal) function of the allocations;  otherwise, it may be a local maximum.
+
+    Arguments
+    ---------
+
+    max_iterations : int : default None
+        the maximum number of iterations;  if it is None, the search continues until the EVC fails to increase.
+
+    """
+
+    componentName = CONTROL_SIGNAL_COORDINATE_ASCENT_FUNCTION
+
+    def __init__(self,
+                 max_iterations=None,
+                 default_variable=None,
+                 params=None,
+                 function=None,
+                 owner=None):
+        super().__init__(default_variable=default_variable, params=params, function=function, owner=owner)
+        self.max_iterations = max_iterations
+
+    def _search(self, controller, runtime_params, context):
+        search_space = controller.control_signal_search_space
+        EVCs = {}
+
+        def evaluate(sample_indices):
+            key = tuple(sample_indices)
+            if key not in EVCs:
+                EVCs[key] = self._evaluate_policy(controller, search_space.policy(key), runtime_params, context)
+            return EVCs[key]
+
+        # Start from the samples closest to the current allocation of each ControlSignal
+        current = []
+        for control_signal, samples in zip(controller.control_signals, search_space.samples):
+            allocation = np.ravel(control_signal.variable if control_signal.variable is not None else samples)[0]
+            current.append(int(np.argmin(np.abs(samples - allocation))))
+        current_EVC = evaluate(current)
+
+        iteration = 0
+        while self.max_iterations is None or iteration < self.max_iterations:
+            iteration += 1
+            improved = False
+            for signal, samples in enumerate(search_space.samples):
+                candidates = []
+                for sample_index in range(len(samples)):
+                    candidate = list(current)
+                    candidate[signal] = sample_index
+                    candidates.append((evaluate(candidate), candidate))
+                best_EVC, best = max(candidates, key=lambda candidate: candidate[0])
+                if best_EVC > current_EVC:
+                    current, current_EVC = best, best_EVC
+                    improved = True
+            if not improved:
+                break
+
+
+class ControlSignalSuccessiveHalving(ControlSignalSearchFunction):
+    """
+    ControlSignalSuccessiveHalving(  \
+        num_candidates=None,         \
+        min_trials=1,                \
+        reduction_factor=2)
+
+    Search for the `allocation_policy` with the maximum `EVC <EVCControlMechanism_EVC>` by repeatedly discarding the
+    allocation policies with the lowest EVCs, and evaluating the remaining ones using more trials.
+
+    The search begins with **num_candidates** allocation policies drawn at random (without replacement) from
+    `control_signal_search_space <EVCControlMechanism.control_signal_search_space>` (or all of them if
+    **num_candidates** is None or exceeds its size), each of which is evaluated using the first **min_trials** trials
+    of `predicted_input <EVCControlMechanism.predicted_input>`.  In each subsequent round, the fraction
+    1/**reduction_factor** of the policies with the greatest EVC are retained, and evaluated using
+    **reduction_factor** times as many trials (up to the total number in `predicted_input
+    <EVCControlMechanism.predicted_input>`), until a single policy remains.  The trials of a policy evaluated in a
+    previous round are not simulated again.  This concentrates simulations on the most promising policies when the
+    EVC is estimated from several trials of `predicted_input <EVCControlMechanism.predicted_input>` (e.g., if its
+    `prediction_mechanisms <EVCControlMechanism.prediction_mechanisms>` use *INPUT_SEQUENCE*);  if there is only one
+    trial, it evaluates each of the **num_candidates** policies once.
+
+    Arguments
+    ---------
+
+    num_candidates : int : default None
+        the number of allocation policies evaluated in the first round;  if it is None, all of the policies in
+        `control_signal_search_space <EVCControlMechanism.control_signal_search_space>` are used.
+
+    min_trials : int : default 1
+        the number of trials of `predicted_input <EVCControlMechanism.predicted_input>` used to evaluate each
+        allocation policy in the first round.
+
+    reduction_factor : int : default 2
+        the factor by which the number of allocation policies is reduced, and the number of trials used to evaluate
+        each is increased, in each round.
+
+    """
+
+    componentName = CONTROL_SIGNAL_SUCCESSIVE_HALVING_FUNCTION
+
+    def __init__(self,
+                 num_candidates=None,
+                 min_trials=1,
+                 reduction_factor=2,
+                 default_variable=None,
+                 params=None,
+                 function=None,
+                 owner=None):
+        if reduction_factor < 2:
+            raise EVCAuxiliaryError("reduction_factor for {} ({}) must be at least 2".
+                                    format(self.__class__.__name__, reduction_factor))
+        super().__init__(default_variable=default_variable, params=params, function=function, owner=owner)
+        self.num_candidates = num_candidates
+        self.min_trials = min_trials
+        self.reduction_factor = reduction_factor
+
+    def _search(self, controller, runtime_params, context):
+        search_space = controller.control_signal_search_space
+        num_trials = len(next(iter(controller.predicted_input.values())))
+
+        if self.num_candidates is None or self.num_candidates >= len(search_space):
+            candidates = list(range(len(search_space)))
+        else:
+            candidates = [int(i) for i in controller.random_state.choice(len(search_space), self.num_candidates,
+                                                                         replace=False)]
+        initial_candidates = list(candidates)
+
+        # Sum of the EVCs over the trials used to evaluate each candidate so far, the number of those trials,
+        #    and the values of the monitored OutputStates for the last of them
+        EVC_sums = {index: 0.0 for index in candidates}
+        trials_used = {index: 0 for index in candidates}
+        state_values = {}
+
+        trials = min(self.min_trials, num_trials)
+        while True:
+            for index in candidates:
+                if trials_used[index] < trials:
+                    new_trials = range(trials_used[index], trials)
+                    EVC = _compute_EVC(args=(controller, search_space[index], runtime_params, context, new_trials))[0]
+                    EVC_sums[index] += float(EVC) * len(new_trials)
+                    trials_used[index] = trials
+                    state_values[index] = controller.input_values
+            if len(candidates) == 1:
+                break
+            candidates.sort(key=lambda index: EVC_sums[index] / trials_used[index], reverse=True)
+            candidates = candidates[:max(1, len(candidates) // self.reduction_factor)]
+            trials = min(trials * self.reduction_factor, num_trials)
+
+        best = candidates[0]
+        self._EVC_max = EVC_sums[best] / trials_used[best]
+        self._EVC_max_state_values = state_values[best]
+        self._EVC_max_policy = search_space[best]
+
+        # Save the final estimate of the EVC for each of the candidates
+        if self._results is not None:
+            for index in initial_candidates:
+                self._results.append(EVC_sums[index] / trials_used[index], search_space[index])
+
+    def _max_num_policies(self, controller):
+        size = len(controller.control_signal_search_space)
+        return size if self.num_candidates is None else min(self.num_candidates, size)
+
+
+class ControlSignalBayesianSearch(ControlSignalSearchFunction):
+    """
+    ControlSignalBayesianSearch(  \
+        num_initial_samples=5,    \
+        max_simulations=25,       \
+        exploration=2.0,          \
+        length_scale=0.25,        \
+        max_candidates=10000)
+
+    Search for the `allocation_policy` with the maximum `EVC <EVCControlMechanism_EVC>` using a Gaussian process model
+    of the EVC as a function of the allocation policy.
+
+    The search begins by evaluating **num_initial_samples** allocation policies drawn at random from
+    `control_signal_search_space <EVCControlMechanism.control_signal_search_space>`.  A Gaussian process (with a
+    squared exponential kernel, and each ControlSignal's `allocation_samples <ControlSignal.allocation_samples>`
+    rescaled to the range 0 to 1) is then fit to the EVCs of the policies evaluated so far, and the policy not yet
+    evaluated with the greatest upper confidence bound (the mean of its predicted EVC plus **exploration** times
+    its standard deviation) is evaluated next.  This is repeated until **max_simulations** policies have been
+    evaluated, or all of the policies in `control_signal_search_space
+    <EVCControlMechanism.control_signal_search_space>` have been evaluated.  If the search space has more than
+    **max_candidates** policies, the upper confidence bound is computed for a random sample of that many policies
+    in each step.
+
+    Arguments
+    ---------
+
+    num_initial_samples : int : default 5
+        the number of allocation policies, drawn at random, evaluated before the Gaussian process is used.
+
+    max_simulations : int : default 25
+        the maximum number of allocation policies evaluated.
+
+    exploration : float : default 2.0
+        the weight of the standard deviation of the predicted EVC in the upper confidence bound;  larger values favor
+        policies about which less is known over those predicted to have a greater EVC.
+
+    length_scale : float : default 0.25
+        the length scale of the squared exponential kernel (over allocations rescaled to the range 0 to 1).
+
+    max_candidates : int : default 10000
+        the maximum number of policies for which the upper confidence bound is computed in each step.
+
+    """
+
+    componentName = CONTROL_SIGNAL_BAYESIAN_SEARCH_FUNCTION
+
+    def __init__(self,
+                 num_initial_samples=5,
+                 max_simulations=25,
+                 exploration=2.0,
+                 length_scale=0.25,
+                 max_candidates=10000,
+                 default_variable=None,
+                 params=None,
+                 function=None,
+                 owner=None):
+        super().__init__(default_variable=default_variable, params=params, function=function, owner=owner)
+        self.num_initial_samples = num_initial_samples
+        self.max_simulations = max_simulations
+        self.exploration = exploration
+        self.length_scale = length_scale
+        self.max_candidates = max_candidates
+
+    def _max_num_policies(self, controller):
+        return min(self.max_simulations, len(controller.control_signal_search_space))
+
+    def _scale(self, search_space, indices):
+        """Return the allocation policies with the specified indices, rescaled to the range 0 to 1."""
+        policies = np.array([search_space[i] for i in indices], dtype=float)
+        low = np.array([np.min(s) for s in search_space.samples], dtype=float)
+        span = np.array([np.ptp(s) for s in search_space.samples], dtype=float)
+        span[span == 0] = 1
+        return (policies - low) / span
+
+    def _kernel(self, x, y):
+        squared_distances = np.sum((x[:, np.newaxis, :] - y[np.newaxis, :, :]) ** 2, axis=-1)
+        return np.exp(-0.5 * squared_distances / self.length_scale ** 2)
+
+    def _search(self, controller, runtime_params, context):
+        search_space = controller.control_signal_search_space
+        size = len(search_space)
+        max_simulations = min(self.max_simulations, size)
+
+        evaluated = [int(i) for i in controller.random_state.choice(size,
+                                                                    min(self.num_initial_samples, max_simulations),
+                                                                    replace=False)]
+        EVCs = [float(self._evaluate_policy(controller, search_space[i], runtime_params, context))
+                for i in evaluated]
+
+        while len(evaluated) < max_simulations:
+            # Candidate policies that have not yet been evaluated
+            if size <= self.max_candidates:
+                candidates = np.setdiff1d(np.arange(size), evaluated)
+            else:
+                candidates = np.setdiff1d(controller.random_state.choice(size, self.max_candidates, replace=False),
+                                          evaluated)
+            if not len(candidates):
+                continue
+
+            # Fit Gaussian process to (standardized) EVCs of evaluated policies
+            x = self._scale(search_space, evaluated)
+            y = np.array(EVCs)
+            y_mean = np.mean(y)
+            y_std = np.std(y) or 1.0
+            K = self._kernel(x, x) + 1e-6 * np.eye(len(x))
+            L = np.linalg.cholesky(K)
+            alpha = np.linalg.solve(L.T, np.linalg.solve(L, (y - y_mean) / y_std))
+
+            # Upper confidence bound of candidates
+            x_candidates = self._scale(search_space, candidates)
+            K_candidates = self._kernel(x_candidates, x)
+            mean = K_candidates.dot(alpha)
+            v = np.linalg.solve(L, K_candidates.T)
+            std = np.sqrt(np.maximum(1 - np.sum(v ** 2, axis=0), 0))
+            next_policy = int(candidates[np.argmax(mean + self.exploration * std)])
+
+            evaluated.append(next_policy)
+            EVCs.append(float(self._evaluate_policy(controller, search_space[next_policy], runtime_params, context)))
 
 
 def _compute_EVC(args):
@@ -538,13 +1110,21 @@ def _compute_EVC(args):
         allocation_vector (1D np.array): allocation policy for which to compute EVC
         runtime_params (dict): runtime params passed to ctlr.update
         context (value): context passed to ctlr.update
+        trials (range): optional -- trials of ctrl.predicted_input to simulate (default: all of them)
+        costs (1D np.array): optional -- cost of each ControlSignal for allocation_vector
+            (default: computed by ctlr.compute_policy_costs)
 
     Returns (float, float, float):
         (EVC_current, outcome, aggregated_costs)
 
     """
 
-    ctlr, allocation_vector, runtime_params, context = args
+    ctlr, allocation_vector, runtime_params, context = args[:4]
+    trials = args[4] if len(args) > 4 else None
+    costs = args[5] if len(args) > 5 else None
+    if costs is None:
+        costs = ctlr.compute_policy_costs([allocation_vector])[0]
+    ctlr.control_signal_costs[:] = np.reshape(costs, ctlr.control_signal_costs.shape)
     # # TEST PRINT:
     # print("Allocation vector: {}\nPredicted input: {}".
     #       format(allocation_vector, [mech.outputState.value for mech in ctlr.predicted_input]),
@@ -555,8 +1135,9 @@ def _compute_EVC(args):
 
     origin_mechs = list(ctlr.predicted_input.keys())
     # number of trials' worth of inputs in predicted_input should be the same for all ORIGIN Mechanisms, so use first:
-    num_trials = len(ctlr.predicted_input[origin_mechs[0]])
-    EVC_list = []
+    if trials is None:
+        trials = range(len(ctlr.predicted_input[origin_mechs[0]]))
+    num_trials = len(trials)
 
 
     # FIX: 6/16/18: ADD PREDICTION MECHANISM HERE IF IT'S FUNCTION IS STATEFUL
@@ -581,23 +1162,33 @@ def _compute_EVC(args):
 
     # Run simulation trial by trial in order to get EVC for each trial
     # IMPLEMENTATION NOTE:  Consider calling execute rather than run (for efficiency)
-    for i in range(num_trials):
+    outcomes = []
+    for i in trials:
         inputs = {key:value[i] for key, value in ctlr.predicted_input.items()}
 
-        outcome = ctlr.run_simulation(inputs=inputs,
-                                      allocation_vector=allocation_vector,
-                                      runtime_params=runtime_params,
-                                      reinitialize_values=reinitialization_values,
-                                      context=context)
-        EVC_list.append(ctlr.paramsCurrent[VALUE_FUNCTION].function(controller=ctlr,
-                                                                  outcome=outcome,
-                                                                  costs=ctlr.control_signal_costs,
-                                                                  context=context))
-        # assert True
-        # # TEST PRINT EVC:
-        # print ("Trial: {}\tInput: {}\tAllocation: {}\tOutcome: {}\tCost: {}\tEVC: {}".
-        #        format(i, list(inputs.values())[0], allocation_vector,
-        #               EVC_list[i][1], EVC_list[i][2], EVC_list[i][0]))
+        outcomes.append(ctlr.run_simulation(inputs=inputs,
+                                            allocation_vector=allocation_vector,
+                                            runtime_params=runtime_params,
+                                            reinitialize_values=reinitialization_values,
+                                            context=context))
+
+    # The costs are the same for every trial, so the EVCs of all of them are calculated together
+    value_function = ctlr.paramsCurrent[VALUE_FUNCTION]
+    if hasattr(value_function, 'compute_batch'):
+        EVC_list = value_function.compute_batch(controller=ctlr,
+                                                outcomes=outcomes,
+                                                costs=np.tile(np.ravel(costs), (num_trials, 1)),
+                                                context=context)
+    else:
+        EVC_list = [value_function.function(controller=ctlr,
+                                            outcome=outcome,
+                                            costs=ctlr.control_signal_costs,
+                                            context=context)
+                    for outcome in outcomes]
+    # # TEST PRINT EVC:
+    # for i, (EVC, outcome, cost) in enumerate(EVC_list):
+    #     print ("Trial: {}\tAllocation: {}\tOutcome: {}\tCost: {}\tEVC: {}".
+    #            format(i, allocation_vector, outcome, cost, EVC))
 
     # Re-assign values of reinitialization attributes to their value at entry
     for mechanism in reinitialization_values:
@@ -263,6 +263,16 @@ greatest EVC value. The following steps are used to calculate the EVC for each `
       sum of the costs from the outcome to generate the EVC;  this too can be configured (see
       `combine_outcome_and_cost_function <EVCControlMechanism.combine_outcome_and_cost_function>`).
 
+.. _EVCControlMechanism_Calculate_EVC:
+
+  The costs of the ControlSignals for an `allocation_policy <EVCControlMechanism.allocation_policy>` are computed
+  using the EVCControlMechanism's `compute_policy_costs <EVCControlMechanism.compute_policy_costs>` method, from the
+  `cost <ControlSignal.cost>` and `last_intensity <ControlSignal.last_intensity>` of each ControlSignal when the
+  search began (the ControlSignals do not update their costs during simulations);  `ControlSignalGridSearch` computes
+  them for a block of allocation policies at a time.  The EVCs for all of the trials simulated for an
+  `allocation_policy <EVCControlMechanism.allocation_policy>` are calculated in a single call to the `compute_batch
+  <ValueFunction.compute_batch>` method of the `value_function <EVCControlMechanism.value_function>`.
+
 In addition to modifying the default functions (as noted above), any or all of them can be replaced with a custom
 function to modify how the `allocation_policy <EVCControlMechanism.allocation_policy>` is determined, so long as the
 custom function accepts arguments and returns values that are compatible with any other functions that call that
@@ -281,6 +291,57 @@ function (see note below).
        function assignment. Therefore, once assigned, it too must be referenced as
        ``<EVCControlMechanism>.<function_attribute>.function``.
 
+.. _EVCControlMechanism_Search_Functions:
+
+Search Functions
+^^^^^^^^^^^^^^^^
+
+The number of allocation policies evaluated by `ControlSignalGridSearch` is the product of the number of
+`allocation_samples <ControlSignal.allocation_samples>` for each ControlSignal, and so grows exponentially with the
+number of ControlSignals.  The allocation policies are generated as they are evaluated (see
+`AllocationPolicySearchSpace`), so the search does not require memory proportional to their number;  however, each
+requires at least one simulation of the `system <EVCControlMechanism.system>`.  The following functions can be
+assigned as the EVCControlMechanism's `function <EVCControlMechanism.function>` to search for the `allocation_policy`
+with the maximum `EVC <EVCControlMechanism_EVC>` using fewer simulations, at the risk of not finding it:
+
+  * `ControlSignalCoordinateAscent` -- evaluates the `allocation_samples <ControlSignal.allocation_samples>` of one
+    ControlSignal at a time, holding the allocations of the others fixed, until the EVC cannot be increased;
+  ..
+  * `ControlSignalSuccessiveHalving` -- evaluates a random subset of allocation policies, and repeatedly discards
+    half of them, evaluating the others with more trials of `predicted_input <EVCControlMechanism.predicted_input>`;
+  ..
+  * `ControlSignalBayesianSearch` -- uses a Gaussian process model of the EVC fit to the policies evaluated so far
+    to choose the next policy to evaluate.
+
+These are specified as an instance of the function (e.g., ``function=ControlSignalCoordinateAscent(max_iterations=3)``)
+to assign values to their parameters.  The number of simulations run to determine the current `allocation_policy
+<EVCControlMechanism.allocation_policy>` is recorded in the EVCControlMechanism's `num_simulations
+<EVCControlMechanism.num_simulations>` attribute.
+
+.. _EVCControlMechanism_Simulation_Cache:
+
+Caching Simulation Outcomes
+^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+If the `predicted_input <EVCControlMechanism.predicted_input>` repeats across `TRIAL`\ s (e.g., if the stimuli are
+drawn from a small set), the same allocation policies are simulated with the same inputs on each of those trials.
+Specifying the **simulation_cache_size** argument of the EVCControlMechanism's constructor stores the outcome of up
+to that number of simulations (the values of its `monitored_output_states
+<EVCControlMechanism.monitored_output_states>`), and reuses them in place of running the `system
+<EVCControlMechanism.system>` when `run_simulation <EVCControlMechanism.run_simulation>` is called again with the same
+inputs, `allocation_policy <EVCControlMechanism.allocation_policy>`, and values of the `System`'s stateful attributes
+(rounded to **simulation_cache_decimals** decimal places); when the cache is full, the least recently used outcome is
+discarded.  The `costs <ControlSignal.cost>` of the ControlSignals are computed separately from the simulations (see
+`EVCControlMechanism_Calculate_EVC`), so they are not affected by the cache.  The number
+of outcomes reused and simulated are recorded in the `simulation_cache_hits <EVCControlMechanism.simulation_cache_hits>`
+and `simulation_cache_misses <EVCControlMechanism.simulation_cache_misses>` attributes, respectively.
+
+The cache assumes that the outcome of a simulation is determined by these values, which is not the case if the
+`system <EVCControlMechanism.system>` has sources of noise, or if its parameters are changed between trials.  The
+cache is cleared automatically after learning occurs in the `system <EVCControlMechanism.system>`;  if any other
+parameters are changed, `invalidate_simulation_cache <EVCControlMechanism.invalidate_simulation_cache>` should be
+called.
+
 .. _EVCControlMechanism_ControlSignals:
 
 ControlSignals
@@ -374,8 +435,11 @@ Class Reference
 
 """
 
+import copy
+
+from collections import OrderedDict
+
 import numpy as np
-import typecheck as tc
 
 from psyneulink.components.component import function_type
 from psyneulink.components.functions.function import ModulationParam, _is_modulation_param, Buffer
@@ -387,13 +451,15 @@ from psyneulink.components.states.outputstate import OutputState
 from psyneulink.components.states.parameterstate import ParameterState
 from psyneulink.components.states.modulatorysignals.controlsignal import ControlSignalCosts
 from psyneulink.components.shellclasses import Function, System_Base
+from psyneulink.globals import typechecking as tc
 from psyneulink.globals.context import ContextFlags
 from psyneulink.globals.keywords import CONTROL, CONTROLLER, COST_FUNCTION, EVC_MECHANISM,\
     INIT_FUNCTION_METHOD_ONLY, PARAMETER_STATES, PREDICTION_MECHANISM, PREDICTION_MECHANISMS, SUM
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
 from psyneulink.globals.utilities import ContentAddressableList, is_iterable
-from psyneulink.library.subsystems.evc.evcauxiliary import ControlSignalGridSearch, ValueFunction, PredictionMechanism
+from psyneulink.library.subsystems.evc.evcauxiliary import \
+    AllocationPolicySearchSpace, ControlSignalGridSearch, PredictionMechanism, ValueFunction
 
 __all__ = [
     'EVCControlMechanism', 'EVCError',
@@ -408,6 +474,20 @@ class EVCError(Exception):
         return repr(self.error_value)
 
 
+def _quantize(value, decimals):
+    """Return a hashable version of value, with its elements rounded to decimals decimal places"""
+    try:
+        value = np.asarray(value, dtype=float)
+    except (TypeError, ValueError):
+        # ragged or non-numeric values
+        try:
+            return tuple(_quantize(item, decimals) for item in value)
+        except TypeError:
+            return value
+    # adding 0.0 converts -0.0 to 0.0, so that they hash the same
+    return value.shape, (np.round(value, decimals) + 0.0).tobytes()
+
+
 class EVCControlMechanism(ControlMechanism):
     """EVCControlMechanism(                                            \
     system=True,                                                       \
@@ -418,6 +498,8 @@ class EVCControlMechanism(ControlMechanism):
     cost_function=LinearCombination(operation=SUM),                    \
     combine_outcome_and_cost_function=LinearCombination(operation=SUM) \
     save_all_values_and_policies=:keyword:`False`,                     \
+    simulation_cache_size=None,                                        \
+    simulation_cache_decimals=6,                                       \
     control_signals=None,                                              \
     params=None,                                                       \
     name=None,                                                         \
@@ -532,6 +614,14 @@ class EVCControlMechanism(ControlMechanism):
     save_all_values_and_policies : bool : default False
         specifes whether to save every `allocation_policy` tested in `EVC_policies` and their values in `EVC_values`.
 
+    simulation_cache_size : int : default None
+        specifies the maximum number of simulation outcomes to store for reuse (see
+        `EVCControlMechanism_Simulation_Cache`);  if it is `None` or 0, outcomes are not cached.
+
+    simulation_cache_decimals : int : default 6
+        specifies the number of decimal places to which inputs, allocations and stateful values are rounded when
+        comparing them with those of a cached simulation outcome.
+
     control_signals : ControlSignal specification or List[ControlSignal specification, ...]
         specifies the parameters to be controlled by the EVCControlMechanism
         (see `ControlSignal_Specification` for details of specification).
@@ -604,6 +694,8 @@ class EVCControlMechanism(ControlMechanism):
         `control_signal_search_space` attribute), by executing the System (using `run_simulation`) for each
         combination, evaluating the result using `value_function`, and returning the `allocation_policy` that yielded
         the greatest `EVC <EVCControlMechanism_EVC>` value (see `EVCControlMechanism_Default_Configuration` for additional details).
+        Other `search functions <EVCControlMechanism_Search_Functions>` can be used to find the `allocation_policy`
+        with fewer simulations.
         If a custom function is specified, it must accommodate a **controller** argument that specifies an EVCControlMechanism
         (and provides access to its attributes, including `control_signal_search_space`), and must return an array with
         the same format (number and type of elements) as the EVCControlMechanism's `allocation_policy` attribute.
@@ -678,13 +770,19 @@ class EVCControlMechanism(ControlMechanism):
         **outcome** argument that is a 1d array with the outcome of the current `allocation_policy`; and a **cost**
         argument that is 1d array with the cost of the current `allocation_policy`.
 
-    control_signal_search_space : 2d np.array
-        an array each item of which is an `allocation_policy`.  By default, it is assigned the set of all possible
-        allocation policies, using np.meshgrid to construct all permutations of `ControlSignal` values from the set
-        specified for each by its `allocation_samples <EVCControlMechanism.allocation_samples>` attribute.
+    control_signal_search_space : AllocationPolicySearchSpace
+        the set of all possible allocation policies, that is all combinations of `ControlSignal` values from the set
+        specified for each by its `allocation_samples <EVCControlMechanism.allocation_samples>` attribute.  Each
+        item is an `allocation_policy`;  these are generated as they are accessed (see `AllocationPolicySearchSpace`).
 
     EVC_max : 1d np.array with single value
-        the maximum `EVC <EVCControlMechanism_EVC>` value over all allocation policies in `control_signal_search_space`.
+        the maximum `EVC <EVCControlMechanism_EVC>` value over all allocation policies evaluated in
+        `control_signal_search_space`.
+
+    num_simulations : int
+        the number of simulations of the `system <EVCControlMechanism.system>` (i.e., calls to `run_simulation
+        <EVCControlMechanism.run_simulation>`) used to determine the current `allocation_policy
+        <EVCControlMechanism.allocation_policy>` and `EVC_max`.
 
     EVC_max_state_values : 2d np.array
         an array of the values for the OutputStates in `monitored_output_states` using the `allocation_policy` that
@@ -706,6 +804,25 @@ class EVCControlMechanism(ControlMechanism):
     EVC_values :  1d np.array
         array of `EVC <EVCControlMechanism_EVC>` values, each of which corresponds to an `allocation_policy` in `EVC_policies`;
 
+    simulation_cache : OrderedDict
+        the simulation outcomes stored for reuse, ordered from least to most recently used (see
+        `EVCControlMechanism_Simulation_Cache`).
+
+    simulation_cache_size : int or None
+        the maximum number of outcomes stored in `simulation_cache <EVCControlMechanism.simulation_cache>`.
+
+    simulation_cache_decimals : int
+        the number of decimal places to which values are rounded when looking up an outcome in `simulation_cache
+        <EVCControlMechanism.simulation_cache>`.
+
+    simulation_cache_hits : int
+        the number of calls to `run_simulation <EVCControlMechanism.run_simulation>` for which an outcome was found in
+        `simulation_cache <EVCControlMechanism.simulation_cache>`.
+
+    simulation_cache_misses : int
+        the number of calls to `run_simulation <EVCControlMechanism.run_simulation>` that simulated the `system
+        <EVCControlMechanism.system>` while `simulation_cache <EVCControlMechanism.simulation_cache>` was enabled.
+
     allocation_policy : 2d np.array : defaultControlAllocation
         determines the value assigned as the `variable <ControlSignal.variable>` for each `ControlSignal` and its
         associated `ControlProjection`.  Each item of the array must be a 1d array (usually containing a scalar)
@@ -760,6 +877,8 @@ class EVCControlMechanism(ControlMechanism):
                  cost_function=LinearCombination(operation=SUM),
                  combine_outcome_and_cost_function=LinearCombination(operation=SUM),
                  save_all_values_and_policies:bool=False,
+                 simulation_cache_size:tc.optional(int)=None,
+                 simulation_cache_decimals:int=6,
                  control_signals:tc.optional(tc.any(is_iterable, ParameterState))=None,
                  modulation:tc.optional(_is_modulation_param)=ModulationParam.MULTIPLICATIVE,
                  params=None,
@@ -775,6 +894,12 @@ class EVCControlMechanism(ControlMechanism):
                                                   save_all_values_and_policies=save_all_values_and_policies,
                                                   params=params)
 
+        self.simulation_cache = OrderedDict()
+        self.simulation_cache_size = simulation_cache_size
+        self.simulation_cache_decimals = simulation_cache_decimals
+        self.simulation_cache_hits = 0
+        self.simulation_cache_misses = 0
+
         super().__init__(system=system,
                          objective_mechanism=objective_mechanism,
                          monitor_for_control=monitor_for_control,
@@ -785,6 +910,8 @@ class EVCControlMechanism(ControlMechanism):
                          name=name,
                          prefs=prefs)
 
+        self.num_simulations = 0
+
     def _validate_params(self, request_set, target_set=None, context=None):
         '''Validate prediction_mechanisms'''
 
@@ -1000,7 +1127,7 @@ class EVCControlMechanism(ControlMechanism):
         Update prediction mechanisms
         Construct control_signal_search_space (from allocation_samples of each item in control_signals):
             * get `allocation_samples` for each ControlSignal in `control_signals`
-            * construct `control_signal_search_space`: a 2D np.array of control allocation policies, each policy of
+            * construct `control_signal_search_space`: an AllocationPolicySearchSpace of control allocation policies, each policy of
               which is a different combination of values, one from the `allocation_samples` of each ControlSignal.
         Call self.function -- default is ControlSignalGridSearch
         Return an allocation_policy
@@ -1013,20 +1140,16 @@ class EVCControlMechanism(ControlMechanism):
         # CONSTRUCT SEARCH SPACE
 
         control_signal_sample_lists = []
-        control_signals = self.control_signals
 
         # Get allocation_samples for all ControlSignals
-        num_control_signals = len(control_signals)
-
         for control_signal in self.control_signals:
             control_signal_sample_lists.append(control_signal.allocation_samples)
 
         # Construct control_signal_search_space:  set of all permutations of ControlProjection allocations
         #                                     (one sample from the allocationSample of each ControlProjection)
-        # Reference for implementation below:
-        # http://stackoverflow.com/questions/1208118/using-numpy-to-build-an-array-of-all-combinations-of-two-arrays
-        self.control_signal_search_space = \
-            np.array(np.meshgrid(*control_signal_sample_lists)).T.reshape(-1,num_control_signals)
+        # Note: the policies are generated as they are needed by the search function, rather than all at once
+        self.control_signal_search_space = AllocationPolicySearchSpace(control_signal_sample_lists)
+        self.num_simulations = 0
 
         # EXECUTE SEARCH
 
@@ -1103,27 +1226,96 @@ class EVCControlMechanism(ControlMechanism):
 
         # Implement the current allocation_policy over ControlSignals (OutputStates),
         #    by assigning allocation values to EVCControlMechanism.value, and then calling _update_output_states
+        #    (in the SIMULATION execution_phase of the System, so that the ControlSignals do not update their costs)
+        self.system.context.execution_phase = ContextFlags.SIMULATION
         for i in range(len(self.control_signals)):
             self.value[i] = np.atleast_1d(allocation_vector[i])
         self._update_output_states(runtime_params=runtime_params, context=context)
 
-        # Run simulation
-        self.system.context.execution_phase = ContextFlags.SIMULATION
-        self.system.run(inputs=inputs,
-                        reinitialize_values=reinitialize_values,
-                        context=context)
-        self.system.context.execution_phase = ContextFlags.IDLE
+        # Reuse the outcome of an identical simulation if it has been cached
+        cache_key = self._get_simulation_cache_key(inputs, allocation_vector, runtime_params, reinitialize_values)
+        if cache_key in self.simulation_cache:
+            self.simulation_cache.move_to_end(cache_key)
+            self.simulation_cache_hits += 1
+            monitored_states = copy.deepcopy(self.simulation_cache[cache_key])
 
-        # Get outcomes for current allocation_policy
-        #    = the values of the monitored output states (self.input_states)
-        # self.objective_mechanism.execute(context=EVC_SIMULATION)
-        monitored_states = self._update_input_states(runtime_params=runtime_params, context=context)
+        else:
+            # Run simulation
+            self.system.run(inputs=inputs,
+                            reinitialize_values=reinitialize_values,
+                            context=context)
+
+            # Get outcomes for current allocation_policy
+            #    = the values of the monitored output states (self.input_states)
+            # self.objective_mechanism.execute(context=EVC_SIMULATION)
+            monitored_states = self._update_input_states(runtime_params=runtime_params, context=context)
+
+            if cache_key is not None:
+                self.simulation_cache_misses += 1
+                self.simulation_cache[cache_key] = copy.deepcopy(monitored_states)
+                if len(self.simulation_cache) > self.simulation_cache_size:
+                    self.simulation_cache.popitem(last=False)
 
-        for i in range(len(self.control_signals)):
-            self.control_signal_costs[i] = self.control_signals[i].cost
+        self.system.context.execution_phase = ContextFlags.IDLE
+
+        self.num_simulations += 1
 
         return monitored_states
 
+    def compute_policy_costs(self, allocation_policies):
+        """Compute the `cost <ControlSignal.cost>` of each ControlSignal for each of an array of allocation policies.
+
+        The costs for all of the allocation policies are computed together by each ControlSignal's `compute_costs
+        <ControlSignal.compute_costs>` method, from its current state (see `ControlSignal_Costs`).
+
+        Arguments
+        ---------
+
+        allocation_policies : 2d np.array
+            each row is an `allocation_policy <EVCControlMechanism.allocation_policy>`, with one allocation for each
+            of the EVCControlMechanism's `control_signals <EVCControlMechanism.control_signals>`.
+
+        Returns
+        -------
+
+        costs : 2d np.array
+            the cost of each ControlSignal (columns) for each allocation policy (rows).
+
+        """
+        allocation_policies = np.asarray(allocation_policies, dtype=float).reshape(-1, len(self.control_signals))
+        costs = np.empty(allocation_policies.shape)
+        for i, control_signal in enumerate(self.control_signals):
+            costs[:, i] = control_signal.compute_costs(allocation_policies[:, i])
+        return costs
+
+    def _get_simulation_cache_key(self, inputs, allocation_vector, runtime_params, reinitialize_values):
+        """Return the key for the outcome of a simulation in simulation_cache, or None if it should not be cached
+
+        The key is built from the inputs, the allocation_vector and the values of the stateful attributes to which
+        the System's Mechanisms are reinitialized for the simulation, each rounded to simulation_cache_decimals
+        decimal places.  The prediction Mechanisms are not executed in a simulation, so their stateful attributes
+        are not included.  Simulations with runtime_params are not cached.
+        """
+        if not self.simulation_cache_size or runtime_params:
+            return None
+
+        decimals = self.simulation_cache_decimals
+        stateful_values = tuple((mechanism.name, _quantize(value, decimals))
+                                for mechanism, value in (reinitialize_values or {}).items()
+                                if mechanism not in self.prediction_mechanisms.mechanisms)
+        return (tuple((mechanism.name, _quantize(value, decimals)) for mechanism, value in inputs.items()),
+                _quantize(allocation_vector, decimals),
+                stateful_values)
+
+    def invalidate_simulation_cache(self):
+        """Discard all of the outcomes stored in `simulation_cache <EVCControlMechanism.simulation_cache>`.
+
+        This is called by the `system <EVCControlMechanism.system>` after learning occurs, and should be called
+        if any other parameters of the `system <EVCControlMechanism.system>` that affect the outcome of a simulation
+        are changed (see `EVCControlMechanism_Simulation_Cache`).
+        """
+        self.simulation_cache.clear()
+
     # The following implementation of function attributes as properties insures that even if user sets the value of a
     #    function directly (i.e., without using assign_params), it will still be wrapped as a UserDefinedFunction.
     # This is done to insure they can be called by value_function in the same way as the defaults
@@ -533,9 +533,12 @@ class Scheduler(object):
             # only reset the values underneath the current scope
             # this works because the enum is set so that higher granularities of time have lower values
             if ts.value <= time_scale.value:
-                for c in self.counts_total[execution_id][ts]:
-                    logger.debug('resetting counts_total[{0}][{1}] to 0'.format(ts, c))
-                    self.counts_total[execution_id][ts][c] = 0
+                counts = self.counts_total[execution_id][ts]
+                if logger.isEnabledFor(logging.DEBUG):
+                    for c in counts:
+                        logger.debug('resetting counts_total[{0}][{1}] to 0'.format(ts, c))
+                for c in counts:
+                    counts[c] = 0
 
     def _reset_counts_useable(self, execution_id=None):
         if execution_id is None:
@@ -648,9 +651,20 @@ class Scheduler(object):
         self._reset_counts_useable(execution_id)
         self._reset_counts_total(TimeScale.TRIAL, execution_id)
 
+        # The counts, execution list and clock for execution_id are looked up once for the run, rather than for each
+        #    node and time step;  they are updated in place, so the Conditions that look them up see the same objects
+        counts_total = self.counts_total[execution_id]
+        counts_useable = self.counts_useable[execution_id]
+        execution_list = self.execution_list[execution_id]
+        clock = self.clocks[execution_id]
+        conditions = self.condition_set.conditions
+        trial_termination_cond = termination_conds[TimeScale.TRIAL]
+        run_termination_cond = termination_conds[TimeScale.RUN]
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+
         while (
-            not termination_conds[TimeScale.TRIAL].is_satisfied(scheduler=self, execution_id=execution_id)
-            and not termination_conds[TimeScale.RUN].is_satisfied(scheduler=self, execution_id=execution_id)
+            not trial_termination_cond.is_satisfied(scheduler=self, execution_id=execution_id)
+            and not run_termination_cond.is_satisfied(scheduler=self, execution_id=execution_id)
         ):
             self._reset_counts_total(TimeScale.PASS, execution_id)
 
@@ -659,8 +673,8 @@ class Scheduler(object):
 
             while (
                 cur_index_consideration_queue < len(self.consideration_queue)
-                and not termination_conds[TimeScale.TRIAL].is_satisfied(scheduler=self, execution_id=execution_id)
-                and not termination_conds[TimeScale.RUN].is_satisfied(scheduler=self, execution_id=execution_id)
+                and not trial_termination_cond.is_satisfied(scheduler=self, execution_id=execution_id)
+                and not run_termination_cond.is_satisfied(scheduler=self, execution_id=execution_id)
             ):
                 # all nodes to be added during this time step
                 cur_time_step_exec = set()
@@ -677,58 +691,62 @@ class Scheduler(object):
                 while True:
                     cur_consideration_set_has_changed = False
                     for current_node in cur_consideration_set:
-                        logger.debug('cur time_step exec: {0}'.format(cur_time_step_exec))
-                        for n in self.counts_useable[execution_id]:
-                            logger.debug('Counts of {0} useable by'.format(n))
-                            for n2 in self.counts_useable[execution_id][n]:
-                                logger.debug('\t{0}: {1}'.format(n2, self.counts_useable[execution_id][n][n2]))
+                        if log_debug:
+                            logger.debug('cur time_step exec: {0}'.format(cur_time_step_exec))
+                            for n in counts_useable:
+                                logger.debug('Counts of {0} useable by'.format(n))
+                                for n2 in counts_useable[n]:
+                                    logger.debug('\t{0}: {1}'.format(n2, counts_useable[n][n2]))
 
                         # only add each node once during a single time step, this also serves
                         # to prevent infinitely cascading adds
                         if current_node not in cur_time_step_exec:
-                            if self.condition_set.conditions[current_node].is_satisfied(scheduler=self, execution_id=execution_id):
-                                logger.debug('adding {0} to execution list'.format(current_node))
-                                logger.debug('cur time_step exec pre add: {0}'.format(cur_time_step_exec))
+                            if conditions[current_node].is_satisfied(scheduler=self, execution_id=execution_id):
+                                if log_debug:
+                                    logger.debug('adding {0} to execution list'.format(current_node))
+                                    logger.debug('cur time_step exec pre add: {0}'.format(cur_time_step_exec))
                                 cur_time_step_exec.add(current_node)
-                                logger.debug('cur time_step exec post add: {0}'.format(cur_time_step_exec))
+                                if log_debug:
+                                    logger.debug('cur time_step exec post add: {0}'.format(cur_time_step_exec))
                                 execution_list_has_changed = True
                                 cur_consideration_set_has_changed = True
 
                                 for ts in TimeScale:
-                                    self.counts_total[execution_id][ts][current_node] += 1
+                                    counts_total[ts][current_node] += 1
                                 # current_node's node is added to the execution queue, so we now need to
                                 # reset all of the counts useable by current_node's node to 0
-                                for n in self.counts_useable[execution_id]:
-                                    self.counts_useable[execution_id][n][current_node] = 0
+                                for n in counts_useable:
+                                    counts_useable[n][current_node] = 0
                                 # and increment all of the counts of current_node's node useable by other
                                 # nodes by 1
-                                for n in self.counts_useable[execution_id]:
-                                    self.counts_useable[execution_id][current_node][n] += 1
+                                counts_useable_by_current_node = counts_useable[current_node]
+                                for n in counts_useable_by_current_node:
+                                    counts_useable_by_current_node[n] += 1
                     # do-while condition
                     if not cur_consideration_set_has_changed:
                         break
 
                 # add a new time step at each step in a pass, if the time step would not be empty
                 if len(cur_time_step_exec) >= 1:
-                    self.execution_list[execution_id].append(cur_time_step_exec)
-                    yield self.execution_list[execution_id][-1]
+                    execution_list.append(cur_time_step_exec)
+                    yield execution_list[-1]
 
-                    self.clocks[execution_id]._increment_time(TimeScale.TIME_STEP)
+                    clock._increment_time(TimeScale.TIME_STEP)
 
                 cur_index_consideration_queue += 1
 
             # if an entire pass occurs with nothing running, add an empty time step
             if not execution_list_has_changed:
-                self.execution_list[execution_id].append(set())
-                yield self.execution_list[execution_id][-1]
+                execution_list.append(set())
+                yield execution_list[-1]
 
-                self.clocks[execution_id]._increment_time(TimeScale.TIME_STEP)
+                clock._increment_time(TimeScale.TIME_STEP)
 
-            self.clocks[execution_id]._increment_time(TimeScale.PASS)
+            clock._increment_time(TimeScale.PASS)
 
-        self.clocks[execution_id]._increment_time(TimeScale.TRIAL)
+        clock._increment_time(TimeScale.TRIAL)
 
-        if termination_conds[TimeScale.RUN].is_satisfied(scheduler=self, execution_id=execution_id):
+        if run_termination_cond.is_satisfied(scheduler=self, execution_id=execution_id):
             self.date_last_run_end = datetime.datetime.now()
 
         return self.execution_list[execution_id]
@@ -23,7 +23,6 @@ or :class:`Scheduler.clock.simple_time <SimpleTime>`
 
 import enum
 import functools
-import types
 
 __all__ = [
     'Clock', 'TimeScale', 'Time', 'SimpleTime', 'TimeHistoryTree', 'TimeScaleError'
@@ -186,7 +185,7 @@ class Clock:
         return self._simple_time
 
 
-class Time(types.SimpleNamespace):
+class Time:
     '''
     Represents an instance of time, having values for each :class:`TimeScale`
 
@@ -208,6 +207,10 @@ class Time(types.SimpleNamespace):
             the `TimeScale.TIME_STEP` value
 
     '''
+    # A Time is created for every Clock and updated at every TIME_STEP, so its values are kept in slots rather than in
+    #    a dict for each instance
+    __slots__ = ('time_step', 'pass_', 'trial', 'run', 'life')
+
     _time_scale_attr_map = {
         TimeScale.TIME_STEP: 'time_step',
         TimeScale.PASS: 'pass_',
@@ -216,8 +219,43 @@ class Time(types.SimpleNamespace):
         TimeScale.LIFE: 'life'
     }
 
+    # the attributes reset when each TimeScale is incremented (i.e., those of the finer grained TimeScales)
+    _reset_attrs_map = {
+        TimeScale.TIME_STEP: (),
+        TimeScale.PASS: ('time_step',),
+        TimeScale.TRIAL: ('time_step', 'pass_'),
+        TimeScale.RUN: ('time_step', 'pass_', 'trial'),
+        TimeScale.LIFE: ('time_step', 'pass_', 'trial', 'run')
+    }
+
     def __init__(self, time_step=0, pass_=0, trial=0, run=0, life=0):
-        super().__init__(time_step=time_step, pass_=pass_, trial=trial, run=run, life=life)
+        self.time_step = time_step
+        self.pass_ = pass_
+        self.trial = trial
+        self.run = run
+        self.life = life
+
+    def __repr__(self):
+        return 'Time(life={0}, pass_={1}, run={2}, time_step={3}, trial={4})'.format(
+            self.life, self.pass_, self.run, self.time_step, self.trial
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, Time):
+            return self._as_tuple() == other._as_tuple()
+        return NotImplemented
+
+    # Times are mutable, so they are not hashable (use _as_tuple to get a hashable copy)
+    __hash__ = None
+
+    def _as_tuple(self):
+        '''
+        Returns
+        -------
+            the values of this Time, packed into a tuple ordered from the coarsest (`TimeScale.LIFE`) to the finest \
+            (`TimeScale.TIME_STEP`) grain : tuple(int)
+        '''
+        return (self.life, self.run, self.trial, self.pass_, self.time_step)
 
     def _get_by_time_scale(self, time_scale):
         '''
@@ -247,7 +285,8 @@ class Time(types.SimpleNamespace):
         '''
         Increments the value of **time_scale** in this Time by one
         '''
-        self._set_by_time_scale(time_scale, self._get_by_time_scale(time_scale) + 1)
+        attr = self._time_scale_attr_map[time_scale]
+        setattr(self, attr, getattr(self, attr) + 1)
         self._reset_by_time_scale(time_scale)
 
     def _reset_by_time_scale(self, time_scale):
@@ -256,21 +295,28 @@ class Time(types.SimpleNamespace):
         e.g. _reset_by_time_scale(TimeScale.TRIAL) will set the values for
         TimeScale.PASS and TimeScale.TIME_STEP to 0
         '''
-        for relative_time_scale in TimeScale:
-            # this works because the enum is set so that higher granularities of time have lower values
-            if relative_time_scale >= time_scale:
-                continue
+        for attr in self._reset_attrs_map[time_scale]:
+            setattr(self, attr, 0)
 
-            self._set_by_time_scale(relative_time_scale, 0)
 
-
-class SimpleTime(types.SimpleNamespace):
+class SimpleTime:
     '''
     A subset class of `Time`, used to provide simple access to only
     `run <Time.run>`, `trial <Time.trial>`, and `time_step <Time.time_step>`
     '''
+    __slots__ = ('run', 'trial', 'time_step')
+
     def __init__(self, run=0, trial=0, time_step=0):
-        super().__init__(run=0, trial=0, time_step=0)
+        self.run = run
+        self.trial = trial
+        self.time_step = time_step
+
+    def __eq__(self, other):
+        if isinstance(other, SimpleTime):
+            return (self.run, self.trial, self.time_step) == (other.run, other.trial, other.time_step)
+        return NotImplemented
+
+    __hash__ = None
 
     # override __repr__ because this class is used only for cosmetic simplicity
     # based on a Time object
@@ -309,7 +355,8 @@ class TimeHistoryTree:
             None represents no parent (i.e. root node)
 
         current_time : `Time`
-            a `Time` object that represents the current time in the tree
+            a `Time` object that represents the current time in the tree \
+            (None if **enable_current_time** is `False`)
 
         total_times : dict{:class:`TimeScale`: int}
             stores the total number of units of :class:`TimeScale`\\ s that have \
@@ -322,6 +369,10 @@ class TimeHistoryTree:
             sets this tree to maintain a `Time` object. If this tree is not
             a root (i.e. **time_scale** is `TimeScale.LIFE`)
     '''
+    # A node is created for every TRIAL (by default), so the attributes are kept in slots rather than in a dict
+    __slots__ = ('current_time', 'index', 'time_scale', 'max_depth', 'parent', 'child_time_scale', 'children',
+                 'total_times', '_has_children')
+
     def __init__(
         self,
         time_scale=TimeScale.LIFE,
@@ -330,16 +381,16 @@ class TimeHistoryTree:
         parent=None,
         enable_current_time=True
     ):
-        if enable_current_time:
-            self.current_time = Time()
+        self.current_time = Time() if enable_current_time else None
         self.index = index
         self.time_scale = time_scale
         self.max_depth = max_depth
         self.parent = parent
 
         self.child_time_scale = TimeScale.get_child(time_scale)
+        self._has_children = self.child_time_scale >= max_depth
 
-        if self.child_time_scale >= max_depth:
+        if self._has_children:
             self.children = [
                 TimeHistoryTree(
                     self.child_time_scale,
@@ -363,7 +414,7 @@ class TimeHistoryTree:
             time_scale : :class:`TimeScale`
                 the unit of time to increment
         '''
-        if self.child_time_scale >= self.max_depth:
+        if self._has_children:
             if time_scale == self.child_time_scale:
                 self.children.append(
                     TimeHistoryTree(
@@ -377,12 +428,9 @@ class TimeHistoryTree:
             else:
                 self.children[-1].increment_time(time_scale)
         self.total_times[time_scale] += 1
-        try:
+        # not all of these objects have time tracking
+        if self.current_time is not None:
             self.current_time._increment_by_time_scale(time_scale)
-            self.simple_time._increment_by_time_scale(time_scale)
-        except AttributeError:
-            # not all of these objects have time tracking
-            pass
 
     def get_total_times_relative(
         self,
@@ -418,9 +466,7 @@ class TimeHistoryTree:
                 )
             )
 
-        try:
-            self.current_time
-        except AttributeError:
+        if self.current_time is None:
             raise TimeScaleError(
                 'get_total_times_relative should only be called on a TimeHistoryTree with enable_current_time set to True'
             )
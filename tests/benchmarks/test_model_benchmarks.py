@@ -0,0 +1,270 @@
+"""
+Benchmarks for canonical models, drawn from the tests and Scripts/Models, that together cover the core execution
+paths: control (Stroop/EVC), learning (multilayer backpropagation and the Rumelhart semantic network), the
+LC/NE model of Gilzenrat et al. (2002), settling of recurrent Mechanisms (KWTA and LCA) and the DDM.
+
+For each model, three things are measured:
+
+    * its construction time (benchmark group "Model construction");
+    * the latency of a single trial, and the trials per second that corresponds to (group "Model trial");
+    * the peak memory allocated by constructing it and running a few trials, which is compared with the baselines
+      in baselines.json.
+
+Like the other benchmarks in the tests, the timings are only collected if pytest-benchmark is enabled, e.g.::
+
+    pytest tests/benchmarks --benchmark-enable --benchmark-autosave
+
+saves the timings (in .benchmarks/), and::
+
+    pytest tests/benchmarks --benchmark-enable --benchmark-compare --benchmark-compare-fail=mean:25%
+
+fails any benchmark whose mean time is more than 25% slower than in the last saved run.  Since the peak memory does
+not depend on the machine, its baselines are kept with the tests;  they are updated by running the tests with
+--update-baselines.
+"""
+import json
+import os
+import tracemalloc
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import psyneulink as pnl
+import pytest
+
+from psyneulink.library.mechanisms.processing.transfer.kwta import KWTA
+from psyneulink.library.mechanisms.processing.transfer.lca import LCA
+from psyneulink.scheduling.time import TimeScale
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), 'baselines.json')
+
+# The peak memory of a model may exceed its baseline by this proportion before the test fails
+PEAK_MEMORY_TOLERANCE = 0.25
+
+# The number of trials run to measure the peak memory of a model
+MEMORY_TRIALS = 5
+
+# A model, and the arguments to its run method for a single trial
+Workload = namedtuple('Workload', 'system, trial')
+
+
+def stroop_evc():
+    Input = pnl.TransferMechanism(name='Input')
+    Reward = pnl.TransferMechanism(output_states=[pnl.RESULT, pnl.MEAN, pnl.VARIANCE], name='Reward')
+    control_signal_params = {pnl.ALLOCATION_SAMPLES: np.arange(0.1, 1.01, 0.3)}
+    Decision = pnl.DDM(
+        function=pnl.BogaczEtAl(
+            drift_rate=(1.0, pnl.ControlProjection(function=pnl.Linear,
+                                                   control_signal_params=control_signal_params)),
+            threshold=(1.0, pnl.ControlProjection(function=pnl.Linear,
+                                                  control_signal_params=control_signal_params)),
+            noise=0.5,
+            starting_point=0,
+            t0=0.45
+        ),
+        output_states=[pnl.DECISION_VARIABLE, pnl.RESPONSE_TIME, pnl.PROBABILITY_UPPER_THRESHOLD],
+        name='Decision'
+    )
+    S = pnl.System(
+        processes=[pnl.Process(size=1, pathway=[Input, pnl.IDENTITY_MATRIX, Decision], name='TaskExecutionProcess'),
+                   pnl.Process(size=1, pathway=[Reward], name='RewardProcess')],
+        controller=pnl.EVCControlMechanism,
+        enable_controller=True,
+        monitor_for_control=[Reward, Decision.PROBABILITY_UPPER_THRESHOLD, (Decision.RESPONSE_TIME, -1, 1)],
+        name='EVC System'
+    )
+    return Workload(S, {'inputs': {Input: [0.5], Reward: [20]}})
+
+
+def multilayer_backprop():
+    Input_Layer = pnl.TransferMechanism(name='Input Layer', function=pnl.Logistic, size=2)
+    Hidden_Layer_1 = pnl.TransferMechanism(name='Hidden Layer_1', function=pnl.Logistic, size=5)
+    Hidden_Layer_2 = pnl.TransferMechanism(name='Hidden Layer_2', function=pnl.Logistic, size=4)
+    Output_Layer = pnl.TransferMechanism(name='Output Layer', function=pnl.Logistic, size=3)
+    p = pnl.Process(
+        pathway=[Input_Layer,
+                 (np.arange(2 * 5).reshape((2, 5)) + 1) / (2 * 5),
+                 Hidden_Layer_1,
+                 (np.arange(5 * 4).reshape((5, 4)) + 1) / (5 * 4),
+                 Hidden_Layer_2,
+                 (np.arange(4 * 3).reshape((4, 3)) + 1) / (4 * 3),
+                 Output_Layer],
+        clamp_input=pnl.SOFT_CLAMP,
+        learning=pnl.LEARNING,
+        learning_rate=1.0,
+        target=[0, 0, 1]
+    )
+    S = pnl.System(processes=[p], learning_rate=1.0, name='Multilayer System')
+    return Workload(S, {'inputs': {Input_Layer: [[-1, 30]]}, 'targets': {Output_Layer: [[0, 0, 1]]}})
+
+
+def rumelhart_semantic_network():
+    rep_in = pnl.TransferMechanism(size=10, name='REP_IN')
+    rel_in = pnl.TransferMechanism(size=11, name='REL_IN')
+    rep_hidden = pnl.TransferMechanism(size=4, function=pnl.Logistic, name='REP_HIDDEN')
+    rel_hidden = pnl.TransferMechanism(size=5, function=pnl.Logistic, name='REL_HIDDEN')
+    outputs = [pnl.TransferMechanism(size=size, function=pnl.Logistic, name=name)
+               for name, size in [('REP_OUT', 10), ('PROP_OUT', 12), ('QUAL_OUT', 13), ('ACT_OUT', 14)]]
+    processes = [pnl.Process(pathway=[rep_in, rep_hidden, rel_hidden], learning=pnl.LEARNING),
+                 pnl.Process(pathway=[rel_in, rel_hidden], learning=pnl.LEARNING)]
+    processes.extend(pnl.Process(pathway=[rel_hidden, output], learning=pnl.LEARNING) for output in outputs)
+    S = pnl.System(processes=processes, name='Semantic Network')
+    targets = {output: [np.ones(len(output.instance_defaults.variable[0]))] for output in outputs}
+    return Workload(S, {'inputs': {rep_in: [np.ones(10)], rel_in: [np.ones(11)]}, 'targets': targets})
+
+
+def gilzenrat_lc():
+    # Parameters as in Scripts/Models/GilzenratModel.py (for the high coherence mode)
+    C = 0.95
+    d = 0.5
+    dt = 0.02
+    SD = 0.1
+    initial_v = (0.07 - (1 - C) * d) / C
+
+    input_layer = pnl.TransferMechanism(size=2, initial_value=np.array([[0.0, 0.0]]), name='INPUT LAYER')
+    decision_layer = LCA(size=2,
+                         time_step_size=dt,
+                         leak=-1.0,
+                         self_excitation=1.0,
+                         competition=1.0,
+                         function=pnl.Logistic(bias=0.0),
+                         noise=pnl.NormalDist(standard_dev=SD).function,
+                         integrator_mode=True,
+                         name='DECISION LAYER')
+    response_layer = LCA(size=1,
+                         time_step_size=dt,
+                         leak=-1.0,
+                         self_excitation=2.0,
+                         function=pnl.Logistic(bias=2.0),
+                         noise=pnl.NormalDist(standard_dev=SD).function,
+                         integrator_mode=True,
+                         name='RESPONSE')
+    decision_process = pnl.Process(pathway=[input_layer,
+                                            np.array([[1.0, 0.33], [0.33, 1.0]]),
+                                            decision_layer,
+                                            np.array([[1.84], [0.0]]),
+                                            response_layer],
+                                   name='DECISION PROCESS')
+    LC = pnl.LCControlMechanism(
+        integration_method="EULER",
+        threshold_FHN=0.5,
+        uncorrelated_activity_FHN=d,
+        base_level_gain=0.5,
+        scaling_factor_gain=3.0,
+        time_step_size_FHN=dt,
+        mode_FHN=C,
+        time_constant_v_FHN=0.05,
+        time_constant_w_FHN=5.0,
+        a_v_FHN=-1.0,
+        b_v_FHN=1.0,
+        c_v_FHN=1.0,
+        d_v_FHN=0.0,
+        e_v_FHN=-1.0,
+        f_v_FHN=1.0,
+        a_w_FHN=1.0,
+        b_w_FHN=-1.0,
+        c_w_FHN=0.0,
+        t_0_FHN=0.0,
+        initial_v_FHN=initial_v,
+        initial_w_FHN=0.14,
+        objective_mechanism=pnl.ObjectiveMechanism(
+            function=pnl.Linear,
+            monitored_output_states=[(decision_layer, None, None, np.array([[0.3], [0.0]]))],
+            name='LC ObjectiveMechanism'
+        ),
+        modulated_mechanisms=[decision_layer, response_layer],
+        name='LC'
+    )
+    S = pnl.System(processes=[decision_process, pnl.Process(pathway=[LC])],
+                   reinitialize_mechanisms_when=pnl.Never(),
+                   name='Gilzenrat System')
+    return Workload(S, {'inputs': {input_layer: [[1.0, 0.0]]}})
+
+
+def kwta_settling():
+    K = KWTA(size=10, k_value=3, threshold=0.5, ratio=0.5, integrator_mode=True, name='K')
+    S = pnl.System(processes=[pnl.Process(pathway=[K])], name='KWTA System')
+    return Workload(S, {'inputs': {K: [np.linspace(0.0, 1.0, 10)]},
+                        'termination_processing': {TimeScale.TRIAL: pnl.AfterNCalls(K, 50)}})
+
+
+def lca_settling():
+    L = LCA(size=10, leak=0.5, competition=1.0, self_excitation=0.5, time_step_size=0.1,
+            integrator_mode=True, name='L')
+    S = pnl.System(processes=[pnl.Process(pathway=[L])], name='LCA System')
+    return Workload(S, {'inputs': {L: [np.linspace(0.0, 1.0, 10)]},
+                        'termination_processing': {TimeScale.TRIAL: pnl.AfterNCalls(L, 50)}})
+
+
+def ddm():
+    mechanisms = [pnl.DDM(function=pnl.BogaczEtAl(drift_rate=float(i), threshold=10.0 * i, starting_point=0.0),
+                          name='DDM_{}'.format(i))
+                  for i in range(1, 4)]
+    S = pnl.System(processes=[pnl.Process(pathway=[mechanisms[0], pnl.IDENTITY_MATRIX, mechanisms[1],
+                                                   pnl.FULL_CONNECTIVITY_MATRIX, mechanisms[2]])],
+                   name='DDM System')
+    return Workload(S, {'inputs': {mechanisms[0]: [[30.0]]}})
+
+
+MODELS = OrderedDict([
+    ('Stroop EVC', stroop_evc),
+    ('Multilayer backprop', multilayer_backprop),
+    ('Rumelhart semantic network', rumelhart_semantic_network),
+    ('Gilzenrat LC', gilzenrat_lc),
+    ('KWTA settling', kwta_settling),
+    ('LCA settling', lca_settling),
+    ('DDM', ddm),
+])
+
+
+def _peak_memory(build):
+    """Return the peak memory, in bytes, allocated by constructing a model and running MEMORY_TRIALS trials of it"""
+    # (the model is built and run once beforehand, so that allocations made only the first time, e.g., by caches or
+    #  imports, are not counted)
+    workload = build()
+    workload.system.run(**workload.trial)
+
+    tracemalloc.start()
+    try:
+        workload = build()
+        for i in range(MEMORY_TRIALS):
+            workload.system.run(**workload.trial)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.benchmark(group="Model construction")
+@pytest.mark.parametrize('model', MODELS)
+def test_construction(benchmark, model):
+    workload = benchmark.pedantic(MODELS[model], rounds=5, iterations=1)
+    assert isinstance(workload.system, pnl.System)
+
+
+@pytest.mark.benchmark(group="Model trial")
+@pytest.mark.parametrize('model', MODELS)
+def test_trial(benchmark, model):
+    workload = MODELS[model]()
+    benchmark(workload.system.run, **workload.trial)
+    if benchmark.stats is not None:
+        benchmark.extra_info['trials_per_second'] = 1 / benchmark.stats.stats.mean
+    assert len(workload.system.results) >= 1
+
+
+@pytest.mark.parametrize('model', MODELS)
+def test_peak_memory(model, request):
+    peak_memory = _peak_memory(MODELS[model]) / 1024
+
+    with open(BASELINES_PATH) as baselines_file:
+        baselines = json.load(baselines_file)
+
+    if request.config.getoption('--update-baselines'):
+        baselines['peak_memory_KiB'][model] = int(np.ceil(peak_memory))
+        with open(BASELINES_PATH, 'w') as baselines_file:
+            json.dump(baselines, baselines_file, indent=4, sort_keys=True)
+            baselines_file.write('\n')
+        return
+
+    baseline = baselines['peak_memory_KiB'][model]
+    assert peak_memory <= baseline * (1 + PEAK_MEMORY_TOLERANCE), \
+        "The peak memory of {} ({:.0f} KiB) exceeds its baseline ({} KiB) by more than {:.0%}.".format(
+            model, peak_memory, baseline, PEAK_MEMORY_TOLERANCE)
@@ -12,7 +12,7 @@ from psyneulink.components.mechanisms.processing.processingmechanism import Proc
 from psyneulink.library.mechanisms.processing.transfer.recurrenttransfermechanism import RecurrentTransferMechanism
 from psyneulink.components.projections.pathway.mappingprojection import MappingProjection
 from psyneulink.components.states.inputstate import InputState
-from psyneulink.compositions.composition import Composition, CompositionError, MechanismRole
+from psyneulink.compositions.composition import Composition, CompositionError, MechanismRole, RunError
 from psyneulink.compositions.pathwaycomposition import PathwayComposition
 from psyneulink.compositions.systemcomposition import SystemComposition
 from psyneulink.scheduling.condition import EveryNCalls
@@ -724,6 +724,75 @@ class TestGraph:
                 comp.graph_processing.comp_to_vertex[B],
             ])
 
+        def test_incremental_matches_rebuilt(self):
+            comp = Composition()
+            A = TransferMechanism(name='composition-pytests-A')
+            B = TransferMechanism(name='composition-pytests-B')
+            C = TransferMechanism(name='composition-pytests-C')
+            comp.add_mechanism(A)
+            comp.add_mechanism(B)
+            comp.add_projection(A, MappingProjection(), B)
+            # the processing graph is updated as Components are added once it has been constructed
+            graph_processing = comp.graph_processing
+            comp.add_mechanism(C)
+            comp.add_projection(B, MappingProjection(), C)
+            comp.add_projection(C, MappingProjection(), A)
+            assert comp.graph_processing is graph_processing
+
+            def edges(graph):
+                return {v.component: ([p.component for p in v.parents], [c.component for c in v.children])
+                        for v in graph.vertices}
+
+            incremental = edges(graph_processing)
+            comp._update_processing_graph()
+            assert comp.graph_processing is not graph_processing
+            assert edges(comp.graph_processing) == incremental
+            assert incremental[A] == ([C], [B])
+
+    def test_remove_component(self):
+        comp = Composition()
+        A = TransferMechanism(name='composition-pytests-A')
+        B = TransferMechanism(name='composition-pytests-B')
+        comp.add_mechanism(A)
+        comp.add_mechanism(B)
+        comp.graph.remove_component(A)
+        assert comp.graph.vertices == [comp.graph.comp_to_vertex[B]]
+        with pytest.raises(CompositionError):
+            comp.graph.remove_component(A)
+
+
+class _Node:
+    # stands in for a Mechanism or a Projection, so that the size of a Composition is not limited by their construction
+    def __init__(self, sender=None, receiver=None):
+        if sender is not None:
+            self.sender = _State(sender)
+            self.receiver = _State(receiver)
+
+
+class _State:
+    def __init__(self, owner):
+        self.owner = owner
+
+
+@pytest.mark.benchmark(group="Composition construction")
+@pytest.mark.parametrize('count', [1000, 5000, 20000])
+def test_construction_benchmark(benchmark, count):
+    nodes = [_Node() for i in range(count)]
+    edges = [_Node(nodes[i], nodes[i + 1]) for i in range(count - 1)]
+
+    def construct():
+        comp = Composition()
+        for node in nodes:
+            comp.add_mechanism(node)
+        for sender, edge, receiver in zip(nodes, edges, nodes[1:]):
+            comp.add_projection(sender, edge, receiver)
+        comp.graph_processing
+        return comp
+
+    comp = benchmark.pedantic(construct, rounds=3)
+    assert len(comp.graph_processing.vertices) == count
+    assert comp.graph_processing.get_parents_from_component(nodes[-1])[0].component is nodes[-2]
+
 
 class TestRun:
 
@@ -924,6 +993,47 @@ class TestRun:
         )
         assert 125 == output[0][0]
 
+    @pytest.mark.parametrize('form', ['generator', 'array'])
+    def test_run_2_mechanisms_inputs_from_generator_or_array(self, form):
+        comp = Composition()
+        A = TransferMechanism(name="A [transfer]", function=Linear(slope=2.0))
+        B = TransferMechanism(name="B [transfer]", function=Linear(slope=5.0))
+        comp.add_mechanism(A)
+        comp.add_mechanism(B)
+        comp.add_projection(A, MappingProjection(sender=A, receiver=B), B)
+        comp._analyze_graph()
+        if form == 'generator':
+            inputs_dict = {A: (i for i in [1, 2, 3, 4])}
+        else:
+            inputs_dict = {A: np.array([[1.0], [2.0], [3.0], [4.0]])}
+        sched = Scheduler(composition=comp)
+        trial_inputs = []
+        output = comp.run(
+            inputs=inputs_dict,
+            scheduler_processing=sched,
+            call_after_trial=lambda: trial_inputs.append(float(A.input_state.value))
+        )
+
+        assert 40.0 == output[0][0]
+        assert trial_inputs == [1.0, 2.0, 3.0, 4.0]
+
+    def test_run_2_mechanisms_exhausted_generator(self):
+        comp = Composition()
+        A = TransferMechanism(name="A [transfer]", function=Linear(slope=2.0))
+        B = TransferMechanism(name="B [transfer]", function=Linear(slope=5.0))
+        comp.add_mechanism(A)
+        comp.add_mechanism(B)
+        comp.add_projection(A, MappingProjection(sender=A, receiver=B), B)
+        comp._analyze_graph()
+        sched = Scheduler(composition=comp)
+        with pytest.raises(RunError) as error_text:
+            comp.run(
+                inputs={A: (i for i in [1, 2])},
+                scheduler_processing=sched,
+                num_trials=3
+            )
+        assert 'exhausted after 2 of the 3 trials' in str(error_text.value)
+
     def test_run_2_mechanisms_double_trial_specs(self):
         comp = Composition()
         A = IntegratorMechanism(default_variable=1.0, function=Linear(slope=5.0))
@@ -0,0 +1,158 @@
+import numpy as np
+import psyneulink as pnl
+import pytest
+
+from psyneulink.components.states.modulatorysignals.controlsignal import ControlSignalCosts, _apply_to_each
+
+SAMPLES = np.linspace(0.1, 1.0, 4)
+
+
+def _evc_system(cost_function=None):
+    control_signal_params = {pnl.ALLOCATION_SAMPLES: SAMPLES}
+    Input = pnl.TransferMechanism(name='Input')
+    Reward = pnl.TransferMechanism(name='Reward')
+    Decision = pnl.DDM(
+        function=pnl.BogaczEtAl(
+            drift_rate=(1.0, pnl.ControlProjection(control_signal_params=control_signal_params)),
+            threshold=(1.0, pnl.ControlProjection(control_signal_params=control_signal_params)),
+            t0=0.45
+        ),
+        output_states=[pnl.DECISION_VARIABLE, pnl.RESPONSE_TIME, pnl.PROBABILITY_UPPER_THRESHOLD],
+        name='Decision'
+    )
+    controller_args = {'save_all_values_and_policies': True}
+    if cost_function is not None:
+        controller_args['cost_function'] = cost_function
+    return pnl.System(
+        processes=[pnl.Process(size=1, pathway=[Input, pnl.IDENTITY_MATRIX, Decision]),
+                   pnl.Process(size=1, pathway=[Reward])],
+        controller=pnl.EVCControlMechanism(**controller_args),
+        enable_controller=True,
+        monitor_for_control=[Reward, Decision.PROBABILITY_UPPER_THRESHOLD, (Decision.RESPONSE_TIME, -1, 1)]
+    ), Input, Reward
+
+
+def _cost_after_update(control_signal, allocation):
+    """Return the cost computed by updating control_signal with allocation, leaving its state unchanged"""
+    integrator = control_signal.duration_cost_function.__self__
+    saved = {attr: getattr(control_signal, attr, None)
+             for attr in ['value', 'cost', 'last_intensity', 'last_cost', 'last_duration_cost',
+                          'intensity_cost', 'adjustment_cost', 'duration_cost']}
+    previous_value = integrator.previous_value
+    control_signal.value = control_signal.function_object.function(np.array([allocation]))
+    control_signal._compute_costs()
+    cost = float(np.ravel(control_signal.cost)[0])
+    for attr, value in saved.items():
+        setattr(control_signal, attr, value)
+    integrator.previous_value = previous_value
+    return cost
+
+
+class _LinearCombinationSubclass(pnl.LinearCombination):
+    pass
+
+
+def test_apply_to_each():
+    values = np.array([0.1, 0.5, 2.0])
+    assert np.allclose(_apply_to_each(pnl.Exponential(rate=2).function, values), np.exp(2 * values))
+    assert np.allclose(_apply_to_each(lambda x: np.sum(x) ** 2, values), values ** 2)
+
+
+class TestControlSignalCosts:
+
+    @pytest.mark.parametrize('cost_options', [
+        [ControlSignalCosts.INTENSITY_COST],
+        [ControlSignalCosts.ADJUSTMENT_COST],
+        [ControlSignalCosts.DURATION_COST],
+        [ControlSignalCosts.INTENSITY_COST, ControlSignalCosts.ADJUSTMENT_COST, ControlSignalCosts.DURATION_COST],
+    ])
+    def test_compute_costs_matches_update(self, cost_options):
+        S, Input, Reward = _evc_system()
+        control_signal = S.controller.control_signals[0]
+        control_signal.assign_costs(cost_options)
+        S.run(inputs={Input: [[0.5], [0.3]], Reward: [[20], [10]]})
+        expected = [_cost_after_update(control_signal, allocation) for allocation in SAMPLES]
+        assert np.allclose(control_signal.compute_costs(SAMPLES), expected)
+
+    def test_compute_costs_leaves_state_unchanged(self):
+        S, Input, Reward = _evc_system()
+        control_signal = S.controller.control_signals[0]
+        control_signal.assign_costs([ControlSignalCosts.ADJUSTMENT_COST, ControlSignalCosts.DURATION_COST])
+        S.run(inputs={Input: [0.5], Reward: [20]})
+        last_intensity = np.copy(control_signal.last_intensity)
+        cost = np.copy(control_signal.cost)
+        previous_value = np.copy(control_signal.duration_cost_function.__self__.previous_value)
+        control_signal.compute_costs(SAMPLES)
+        assert np.array_equal(control_signal.last_intensity, last_intensity)
+        assert np.array_equal(control_signal.cost, cost)
+        assert np.array_equal(control_signal.duration_cost_function.__self__.previous_value, previous_value)
+
+    def test_simulations_do_not_change_costs(self):
+        S, Input, Reward = _evc_system()
+        control_signal = S.controller.control_signals[0]
+        control_signal.assign_costs([ControlSignalCosts.ADJUSTMENT_COST])
+        S.run(inputs={Input: [0.5], Reward: [20]})
+        # The adjustment cost is relative to the intensity before the trial, not the last one simulated
+        assert np.allclose(control_signal.adjustment_cost, 0)
+        assert np.allclose(control_signal.last_intensity, S.controller.EVC_max_policy[0])
+
+    def test_compute_policy_costs(self):
+        S, Input, Reward = _evc_system()
+        S.run(inputs={Input: [0.5], Reward: [20]})
+        policies = np.array(S.controller.control_signal_search_space)
+        costs = S.controller.compute_policy_costs(policies)
+        assert costs.shape == policies.shape
+        for i, control_signal in enumerate(S.controller.control_signals):
+            assert np.allclose(costs[:, i], control_signal.compute_costs(policies[:, i]))
+
+
+class TestValueFunctionBatch:
+
+    # (the costs are combined for all of the items at once by a LinearCombination, but not by a subclass of it)
+    @pytest.mark.parametrize('cost_function', [None,
+                                               lambda: pnl.LinearCombination(operation=pnl.PRODUCT),
+                                               lambda: _LinearCombinationSubclass(operation=pnl.SUM)])
+    def test_compute_batch_matches_function(self, cost_function):
+        S, Input, Reward = _evc_system(cost_function and cost_function())
+        controller = S.controller
+        outcomes = [np.array([[x]]) for x in [-2.5, 0.5, 3.0]]
+        costs = np.array([[1.0, 2.0], [0.5, 0.1], [3.0, 0.0]])
+        batch = controller.value_function.compute_batch(controller=controller, outcomes=outcomes, costs=costs)
+        for (EVC, outcome, cost), expected_outcome, policy_costs in zip(batch, outcomes, costs):
+            expected = controller.value_function.function(controller=controller,
+                                                          outcome=expected_outcome,
+                                                          costs=policy_costs.reshape(-1, 1))
+            assert np.allclose(np.asarray(EVC, dtype=float), np.asarray(expected[0], dtype=float))
+            assert np.allclose(cost, expected[2])
+
+    @pytest.mark.parametrize('vectorized', [False, True])
+    def test_compute_batch_with_vectorized_udfs(self, vectorized):
+        calls = []
+
+        def sum_costs(costs):
+            calls.append(costs)
+            return np.sum(costs, axis=-2) if np.ndim(costs) > 1 else np.sum(costs)
+
+        def subtract_cost(outcome=0, cost=0):
+            return np.asarray(outcome, dtype=float).reshape(np.shape(cost)) - cost
+
+        S, Input, Reward = _evc_system(pnl.UserDefinedFunction(custom_function=sum_costs, vectorized=vectorized))
+        controller = S.controller
+        controller.combine_outcome_and_cost_function = pnl.UserDefinedFunction(custom_function=subtract_cost,
+                                                                               vectorized=vectorized)
+        del calls[:]
+        outcomes = [np.array([[x]]) for x in [-2.5, 0.5, 3.0]]
+        costs = np.array([[1.0, 2.0], [0.5, 0.1], [3.0, 0.0]])
+        batch = controller.value_function.compute_batch(controller=controller, outcomes=outcomes, costs=costs)
+        assert len(calls) == (1 if vectorized else 3)
+        assert np.allclose([EVC for EVC, outcome, cost in batch], [[-5.5], [-0.1], [0.0]])
+        assert np.allclose([cost for EVC, outcome, cost in batch], [[3.0], [0.6], [3.0]])
+
+
+@pytest.mark.benchmark(group="ControlSignal costs")
+def test_compute_policy_costs_benchmark(benchmark):
+    S, Input, Reward = _evc_system()
+    for control_signal in S.controller.control_signals:
+        control_signal.assign_costs([ControlSignalCosts.INTENSITY_COST, ControlSignalCosts.ADJUSTMENT_COST])
+    policies = np.random.random((1024, 2))
+    benchmark(S.controller.compute_policy_costs, policies)
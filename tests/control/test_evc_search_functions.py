@@ -0,0 +1,141 @@
+import numpy as np
+import psyneulink as pnl
+import pytest
+
+from psyneulink.library.subsystems.evc import evcauxiliary
+from psyneulink.library.subsystems.evc.evcauxiliary import AllocationPolicySearchSpace, ControlSignalBayesianSearch, \
+    ControlSignalCoordinateAscent, ControlSignalGridSearch, ControlSignalSuccessiveHalving, _SearchResults
+
+NUM_SAMPLES = 5
+
+
+def _run_evc_system(function):
+    np.random.seed(0)
+    samples = np.linspace(0.1, 1.0, NUM_SAMPLES)
+    Input = pnl.TransferMechanism(name='Input')
+    Reward = pnl.TransferMechanism(output_states=[pnl.RESULT, pnl.MEAN, pnl.VARIANCE], name='Reward')
+    Decision = pnl.DDM(
+        function=pnl.BogaczEtAl(
+            drift_rate=(1.0, pnl.ControlProjection(function=pnl.Linear,
+                                                   control_signal_params={pnl.ALLOCATION_SAMPLES: samples})),
+            threshold=(1.0, pnl.ControlProjection(function=pnl.Linear,
+                                                  control_signal_params={pnl.ALLOCATION_SAMPLES: samples})),
+            noise=0.5,
+            starting_point=0,
+            t0=0.45
+        ),
+        output_states=[pnl.DECISION_VARIABLE, pnl.RESPONSE_TIME, pnl.PROBABILITY_UPPER_THRESHOLD],
+        name='Decision'
+    )
+    S = pnl.System(
+        processes=[pnl.Process(size=1, pathway=[Input, pnl.IDENTITY_MATRIX, Decision]),
+                   pnl.Process(size=1, pathway=[Reward])],
+        controller=pnl.EVCControlMechanism(function=function, save_all_values_and_policies=True),
+        enable_controller=True,
+        monitor_for_control=[Reward, Decision.PROBABILITY_UPPER_THRESHOLD, (Decision.RESPONSE_TIME, -1, 1)]
+    )
+    S.run(inputs={Input: [0.5], Reward: [20]})
+    return S.controller
+
+
+def _values(controller):
+    return np.asarray(controller.EVC_values, dtype=float)
+
+
+def _max(controller):
+    return float(np.asarray(controller.EVC_max, dtype=float))
+
+
+class TestAllocationPolicySearchSpace:
+
+    @pytest.mark.parametrize('samples', [
+        [[1, 2, 3]],
+        [[1, 2, 3], [0.1, 0.2]],
+        [[1, 2, 3], [0.1, 0.2], [10, 20, 30, 40]],
+        [[1, 2], [0.1, 0.2, 0.3], [10, 20], [5, 6, 7]],
+    ])
+    def test_matches_meshgrid(self, samples):
+        search_space = AllocationPolicySearchSpace(samples)
+        expected = np.array(np.meshgrid(*samples)).T.reshape(-1, len(samples))
+        assert len(search_space) == len(expected)
+        assert search_space.shape == expected.shape
+        assert np.array_equal(np.array(search_space), expected)
+        assert np.array_equal(list(search_space), expected)
+        assert np.array_equal(search_space[-1], expected[-1])
+        assert np.array_equal(search_space[1:3, :], expected[1:3, :])
+        for i in range(len(expected)):
+            assert search_space.index(search_space.indices(i)) == i
+
+    def test_large_search_space_is_not_constructed(self):
+        search_space = AllocationPolicySearchSpace([np.arange(20)] * 6)
+        assert len(search_space) == 20 ** 6
+        assert np.array_equal(search_space[len(search_space) - 1], [19] * 6)
+
+    def test_index_out_of_range(self):
+        with pytest.raises(IndexError):
+            AllocationPolicySearchSpace([[1, 2], [3, 4]])[4]
+
+
+class TestSearchFunctions:
+
+    def test_grid_search(self):
+        controller = _run_evc_system(ControlSignalGridSearch)
+        assert controller.num_simulations == NUM_SAMPLES ** 2
+        assert len(controller.EVC_values) == NUM_SAMPLES ** 2
+        assert np.allclose(_max(controller), np.max(_values(controller)))
+        assert np.allclose(controller.EVC_max_policy, controller.EVC_policies[np.argmax(_values(controller))])
+
+    def test_coordinate_ascent(self):
+        grid = _run_evc_system(ControlSignalGridSearch)
+        controller = _run_evc_system(ControlSignalCoordinateAscent)
+        assert controller.num_simulations < grid.num_simulations
+        assert np.allclose(_max(controller), _max(grid))
+        assert np.allclose(controller.EVC_max_policy, grid.EVC_max_policy)
+        assert np.allclose(controller.value, grid.value)
+
+    @pytest.mark.parametrize('function, num_simulations', [
+        (ControlSignalSuccessiveHalving(num_candidates=8), 8),
+        (ControlSignalBayesianSearch(num_initial_samples=3, max_simulations=8), 8),
+    ])
+    def test_budgeted_search(self, function, num_simulations):
+        grid = _run_evc_system(ControlSignalGridSearch)
+        controller = _run_evc_system(function)
+        assert controller.num_simulations == num_simulations
+        assert len(controller.EVC_values) == num_simulations
+        # the policy returned is the best of those evaluated, and cannot be better than the best overall
+        assert np.allclose(_max(controller), np.max(_values(controller)))
+        assert _max(controller) <= _max(grid) + 1e-10
+
+    def test_successive_halving_reduction_factor(self):
+        with pytest.raises(pnl.EVCAuxiliaryError):
+            ControlSignalSuccessiveHalving(reduction_factor=1)
+
+
+class TestSearchResults:
+
+    @pytest.mark.parametrize('capacity', [None, 3, 2000])
+    def test_results_grow(self, capacity):
+        results = _SearchResults(2, capacity)
+        policies = np.random.random((1500, 2))
+        for i, policy in enumerate(policies):
+            results.append(float(i), policy)
+        assert np.array_equal(results.values, np.arange(1500))
+        assert np.array_equal(results.policies, policies)
+
+    @pytest.mark.parametrize('save_all_values_and_policies', [False, True])
+    @pytest.mark.benchmark(group="EVC grid search overhead")
+    def test_grid_search_overhead(self, benchmark, monkeypatch, save_all_values_and_policies):
+        # The overhead of searching 10^5 allocation policies, excluding the cost of simulating them
+        num_samples = 316
+        controller = _run_evc_system(ControlSignalGridSearch)
+        controller.paramsCurrent[pnl.SAVE_ALL_VALUES_AND_POLICIES] = save_all_values_and_policies
+        controller.control_signal_search_space = AllocationPolicySearchSpace([np.linspace(0, 1, num_samples)] * 2)
+        monkeypatch.setattr(evcauxiliary, '_compute_EVC', lambda args: (float(np.sum(args[1])), 0.0, 0.0))
+
+        search = controller.function_object
+        allocation_policy = benchmark(search.function, controller=controller, variable=controller.variable)
+
+        assert np.allclose(allocation_policy, [[1], [1]])
+        if save_all_values_and_policies:
+            assert controller.EVC_values.shape == (num_samples ** 2,)
+            assert controller.EVC_policies.shape == (num_samples ** 2, 2)
@@ -0,0 +1,116 @@
+import numpy as np
+import psyneulink as pnl
+import pytest
+
+
+def _evc_system(simulation_cache_size=None):
+    samples = np.linspace(0.1, 1.0, 4)
+    Input = pnl.TransferMechanism(name='Input')
+    Reward = pnl.TransferMechanism(output_states=[pnl.RESULT, pnl.MEAN, pnl.VARIANCE], name='Reward')
+    Decision = pnl.DDM(
+        function=pnl.BogaczEtAl(
+            drift_rate=(1.0, pnl.ControlProjection(function=pnl.Linear,
+                                                   control_signal_params={pnl.ALLOCATION_SAMPLES: samples})),
+            threshold=(1.0, pnl.ControlProjection(function=pnl.Linear,
+                                                  control_signal_params={pnl.ALLOCATION_SAMPLES: samples})),
+            noise=0.5,
+            starting_point=0,
+            t0=0.45
+        ),
+        output_states=[pnl.DECISION_VARIABLE, pnl.RESPONSE_TIME, pnl.PROBABILITY_UPPER_THRESHOLD],
+        name='Decision'
+    )
+    S = pnl.System(
+        processes=[pnl.Process(size=1, pathway=[Input, pnl.IDENTITY_MATRIX, Decision]),
+                   pnl.Process(size=1, pathway=[Reward])],
+        controller=pnl.EVCControlMechanism(
+            prediction_mechanisms=(pnl.PredictionMechanism, {pnl.FUNCTION: pnl.AVERAGE_INPUTS, pnl.WINDOW_SIZE: 1}),
+            simulation_cache_size=simulation_cache_size,
+            save_all_values_and_policies=True
+        ),
+        enable_controller=True,
+        monitor_for_control=[Reward, Decision.PROBABILITY_UPPER_THRESHOLD, (Decision.RESPONSE_TIME, -1, 1)]
+    )
+    return S, Input, Reward, Decision
+
+
+# two stimuli, each presented twice
+INPUTS = [[0.5], [0.3], [0.5], [0.3], [0.5]]
+REWARDS = [[20]] * len(INPUTS)
+
+
+class TestEVCSimulationCache:
+
+    def test_cache_disabled_by_default(self):
+        S, Input, Reward, Decision = _evc_system()
+        S.run(inputs={Input: INPUTS, Reward: REWARDS})
+        assert S.controller.simulation_cache_hits == S.controller.simulation_cache_misses == 0
+        assert len(S.controller.simulation_cache) == 0
+
+    def test_cached_outcomes_match_simulated_outcomes(self):
+        results = {}
+        for simulation_cache_size in [None, 100]:
+            S, Input, Reward, Decision = _evc_system(simulation_cache_size)
+            EVC_values = []
+            outputs = []
+            for i in range(len(INPUTS)):
+                output = S.run(inputs={Input: [INPUTS[i]], Reward: [REWARDS[i]]})
+                # the response time and probability of the upper threshold (the decision variable is sampled)
+                outputs.append(np.array(output[-1][1:3], dtype=float))
+                EVC_values.append(np.array(S.controller.EVC_values, dtype=float))
+            results[simulation_cache_size] = (S.controller, EVC_values, outputs)
+
+        controller, EVC_values, outputs = results[100]
+        uncached_controller, uncached_EVC_values, uncached_outputs = results[None]
+        # each of the 16 allocation policies is simulated once for each distinct predicted input
+        assert controller.simulation_cache_misses == 16 * 2
+        assert controller.simulation_cache_hits == 16 * (len(INPUTS) - 2)
+        assert controller.num_simulations == uncached_controller.num_simulations == 16
+        assert np.allclose(EVC_values, uncached_EVC_values)
+        assert np.allclose(outputs, uncached_outputs)
+
+    def test_cache_size_is_bounded(self):
+        S, Input, Reward, Decision = _evc_system(simulation_cache_size=10)
+        S.run(inputs={Input: INPUTS, Reward: REWARDS})
+        assert len(S.controller.simulation_cache) == 10
+        # the cache only holds the most recent outcomes, so repeated inputs are never found
+        assert S.controller.simulation_cache_hits == 0
+
+    def test_invalidate_simulation_cache(self):
+        S, Input, Reward, Decision = _evc_system(simulation_cache_size=100)
+        S.run(inputs={Input: INPUTS[:2], Reward: REWARDS[:2]})
+        assert len(S.controller.simulation_cache) > 0
+        S.controller.invalidate_simulation_cache()
+        assert len(S.controller.simulation_cache) == 0
+        misses = S.controller.simulation_cache_misses
+        S.run(inputs={Input: INPUTS[:1], Reward: REWARDS[:1]})
+        assert S.controller.simulation_cache_misses == misses + 16
+
+    def test_learning_invalidates_cache(self):
+        A = pnl.TransferMechanism(name='A')
+        B = pnl.TransferMechanism(name='B')
+        S = pnl.System(
+            processes=[pnl.Process(pathway=[A, B], learning=pnl.LEARNING)],
+            controller=pnl.EVCControlMechanism(
+                prediction_mechanisms=(pnl.PredictionMechanism, {pnl.FUNCTION: pnl.AVERAGE_INPUTS,
+                                                                 pnl.WINDOW_SIZE: 1}),
+                simulation_cache_size=100,
+                control_signals=[{pnl.MECHANISM: B, pnl.PARAMETER_STATES: [pnl.SLOPE],
+                                  pnl.ALLOCATION_SAMPLES: [0.5, 1.0]}]
+            ),
+            enable_controller=True,
+            monitor_for_control=[B]
+        )
+        S.run(inputs={A: [[1]] * 3}, targets={B: [[0]] * 3})
+        # the weights change on every trial, so no outcomes are reused although the input is the same
+        assert S.controller.simulation_cache_hits == 0
+        assert S.controller.simulation_cache_misses == 2 * 3
+
+
+@pytest.mark.benchmark(group="EVC simulation cache")
+@pytest.mark.parametrize('simulation_cache_size', [None, 100], ids=['uncached', 'cached'])
+def test_simulation_cache_benchmark(benchmark, simulation_cache_size):
+    def run():
+        S, Input, Reward, Decision = _evc_system(simulation_cache_size)
+        S.run(inputs={Input: INPUTS, Reward: REWARDS})
+    benchmark.pedantic(run, iterations=1, rounds=2)
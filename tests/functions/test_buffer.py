@@ -5,6 +5,7 @@ from psyneulink.components.system import System
 from psyneulink.scheduling.condition import Never
 from collections import deque
 import numpy as np
+import pytest
 
 class TestBuffer():
 
@@ -63,3 +64,47 @@ class TestBuffer():
         for i in range(5):
             assert np.allclose(expected_full_result[i], full_result[i])
 
+
+    @pytest.mark.parametrize('history', [None, 1, 4])
+    @pytest.mark.parametrize('rate, noise', [(1.0, 0.0), (0.5, 0.0), (1.0, 0.25), (0.9, 0.1), (0.0, 1.0)])
+    def test_buffer_matches_deque(self, history, rate, noise):
+        B = Buffer(default_variable=[[0.0, 0.0]], initializer=None, rate=rate, noise=noise, history=history)
+        reference = deque(maxlen=history)
+        for i in range(10):
+            variable = np.array([[i, -i]], dtype=float)
+            value = B.execute(variable)
+            reference.append(variable)
+            reference = deque(np.array(reference) * rate + np.array(noise), maxlen=history)
+            assert np.allclose(value, np.array(reference))
+            assert np.allclose(B.previous_value, np.array(reference))
+
+    def test_buffer_long_history_with_rate(self):
+        # rate is applied lazily; the pending scale factor must not underflow
+        B = Buffer(default_variable=[[0.0]], initializer=None, rate=0.5, history=3)
+        for i in range(2000):
+            value = B.execute(1.0)
+        assert np.allclose(value, [[0.5 ** 3], [0.5 ** 2], [0.5]])
+
+    def test_buffer_value_not_changed_by_later_calls(self):
+        B = Buffer(default_variable=[[0.0]], initializer=None, history=2)
+        first = B.execute(1.0)
+        B.execute(2.0)
+        B.execute(3.0)
+        assert np.allclose(first, [[[1.0]]])
+
+    def test_buffer_reinitialize(self):
+        B = Buffer(default_variable=[[0.0]], initializer=[[0.0]], history=3)
+        B.execute(1.0)
+        assert np.allclose(B.reinitialize(), [[0.0]])
+        assert np.allclose(B.reinitialize([[5.0], [6.0]]), [[5.0], [6.0]])
+        assert np.allclose(B.execute(7.0), [[5.0], [6.0], [7.0]])
+        assert len(B.reinitialize([])) == 0
+
+
+@pytest.mark.benchmark(group="Buffer")
+@pytest.mark.parametrize('history', [10, 1000])
+def test_buffer_execute(benchmark, history):
+    B = Buffer(default_variable=[[0.0] * 10], initializer=None, rate=0.9, noise=0.1, history=history)
+    for i in range(history):
+        B.execute([[float(i)] * 10])
+    benchmark(B.execute, [[1.0] * 10])
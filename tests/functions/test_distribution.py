@@ -0,0 +1,64 @@
+
+import psyneulink.components.functions.function as Function
+import psyneulink as pnl
+import numpy as np
+import pytest
+
+SIZE = 1000
+
+distributions = [
+    Function.NormalDist(mean=1.0, standard_dev=2.0),
+    Function.UniformToNormalDist(mean=1.0, standard_dev=2.0),
+    Function.ExponentialDist(beta=2.0),
+    Function.UniformDist(low=-1.0, high=3.0),
+    Function.GammaDist(scale=2.0, dist_shape=3.0),
+    Function.WaldDist(scale=2.0, mean=1.0),
+]
+
+names = [
+    "NORMAL",
+    "UNIFORM_TO_NORMAL",
+    "EXPONENTIAL",
+    "UNIFORM",
+    "GAMMA",
+    "WALD",
+]
+
+
+@pytest.mark.function
+@pytest.mark.parametrize("dist", distributions, ids=names)
+def test_sample_matches_sequential_calls(dist):
+    np.random.seed(0)
+    samples = dist.sample((3, 4))
+    np.random.seed(0)
+    expected = [[dist.function() for j in range(4)] for i in range(3)]
+    assert samples.shape == (3, 4)
+    assert np.allclose(samples, expected)
+
+
+@pytest.mark.function
+@pytest.mark.parametrize("dist", distributions, ids=names)
+def test_sample_without_size(dist):
+    np.random.seed(0)
+    sample = dist.sample()
+    np.random.seed(0)
+    assert np.isscalar(sample) or np.ndim(sample) == 0
+    assert np.allclose(sample, dist.function())
+
+
+@pytest.mark.function
+@pytest.mark.parametrize("integrator_mode", [False, True], ids=["TRANSFER", "INTEGRATOR_MODE"])
+def test_mechanism_noise_is_sampled_for_each_element(integrator_mode):
+    T = pnl.TransferMechanism(size=SIZE, noise=pnl.NormalDist(), integrator_mode=integrator_mode)
+    np.random.seed(0)
+    value = T.execute(np.zeros(SIZE))
+    np.random.seed(0)
+    assert np.allclose(value, np.random.normal(size=(1, SIZE)))
+
+
+@pytest.mark.function
+@pytest.mark.parametrize("dist", distributions, ids=names)
+@pytest.mark.benchmark(group="TransferMechanism noise")
+def test_noise_benchmark(dist, benchmark):
+    T = pnl.TransferMechanism(size=SIZE, noise=dist)
+    benchmark(T.execute, np.zeros(SIZE))
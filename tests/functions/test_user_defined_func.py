@@ -57,4 +57,78 @@ class TestUserDefFunc:
         val1 = myMech.execute(input=[1, 2, 3])
         val2 = U.execute(variable=[[1, 2, 3]])
         assert np.allclose(val1, val2)
-        assert np.allclose(val1, L.function([1, 2, 3]) + 2)
\ No newline at end of file
+        assert np.allclose(val1, L.function([1, 2, 3]) + 2)
+    def test_first_arg_not_named_variable(self):
+        def myFunction(input, amplitude=2):
+            return input * amplitude
+        myMech = ProcessingMechanism(function=myFunction, size=2, name='myMech')
+        assert np.allclose(myMech.execute(input=[1, 3]), [[2, 6]])
+
+    def test_lambda_function(self):
+        U = UserDefinedFunction(custom_function=lambda x, gain=3: x * gain, default_variable=[[0, 0]])
+        assert np.allclose(U.execute(variable=np.array([[1, 2]])), [[3, 6]])
+
+    def test_bound_method(self):
+        class Scaler:
+            def scale(self, variable, gain=3):
+                return np.asarray(variable) * gain
+        U = UserDefinedFunction(custom_function=Scaler().scale, default_variable=[[0, 0]])
+        assert 'gain' in U.cust_fct_params
+        assert np.allclose(U.execute(variable=[[1, 2]]), [[3, 6]])
+
+    def test_type_error_in_function_is_raised(self):
+        def myFunction(variable, offset=1):
+            return variable + offset
+        U = UserDefinedFunction(custom_function=myFunction, default_variable=[[0]])
+        with pytest.raises(TypeError):
+            U.execute(variable=[['a']])
+
+    def test_reassigned_custom_function(self):
+        U = UserDefinedFunction(custom_function=lambda variable: variable + 1, default_variable=np.array([[0]]))
+        assert np.allclose(U.execute(variable=np.array([[1]])), [[2]])
+        U.custom_function = lambda x: x * 10
+        assert np.allclose(U.execute(variable=np.array([[1]])), [[10]])
+
+    @pytest.mark.parametrize('vectorized', [False, True])
+    def test_execute_batch(self, vectorized):
+        calls = []
+
+        def myFunction(variable, gain=2):
+            calls.append(variable)
+            return variable * gain
+        U = UserDefinedFunction(custom_function=myFunction, default_variable=[[0, 0]], vectorized=vectorized)
+        del calls[:]
+        variables = np.arange(6.0).reshape(3, 1, 2)
+        assert np.allclose(U.execute_batch(variables), variables * 2)
+        assert len(calls) == (1 if vectorized else 3)
+
+
+def test_get_signature_info():
+    from psyneulink.globals.utilities import get_signature_info, prune_unused_args
+
+    class Owner:
+        def method(self, variable, gain=1, *args, context=None, **kwargs):
+            pass
+
+    info = get_signature_info(Owner().method)
+    assert info.parameter_names == ('variable', 'gain', 'context')
+    assert info.keyword_names == {'variable', 'gain', 'context'}
+    assert info.count_positional == 1
+    assert info.has_args_param and info.has_kwargs_param
+    assert get_signature_info(Owner().method) is info
+    assert get_signature_info(Owner.method).parameter_names == ('self', 'variable', 'gain', 'context')
+
+    def f(variable, context=None):
+        pass
+    assert prune_unused_args(f, [1, 2], {'context': 3, 'params': 4}) == ([1], {'context': 3})
+    # built-in functions can't be cached, but can still be analyzed
+    assert get_signature_info(len).parameter_names == ('obj',)
+
+
+@pytest.mark.benchmark(group="UDF")
+def test_udf_execute(benchmark):
+    def myFunction(input, gain=2, offset=1):
+        return input * gain + offset
+    U = UserDefinedFunction(custom_function=myFunction, default_variable=[[0, 0]])
+    variable = np.array([[1.0, 2.0]])
+    benchmark(U.function, variable=variable, params=None, context=None)
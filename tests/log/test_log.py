@@ -511,6 +511,16 @@ class TestLog:
         assert abs(log_dict_T1["value"][58]) >= 0.95
         assert abs(log_dict_T1["value"][57]) < 0.95
 
+    def test_log_entries_share_context(self):
+        T = pnl.TransferMechanism(name='log_test_T')
+        S = pnl.System(processes=[pnl.Process(pathway=[T])])
+        T.set_log_conditions(pnl.VALUE)
+        S.run(inputs={T: [[1.0], [2.0], [3.0]]})
+        entries = T.log.entries['log_test_T']
+        assert len(entries) == 3
+        assert all(entry.context is entries[0].context for entry in entries)
+        assert 'PROCESSING' in entries[0].context
+
 class TestClearLog:
 
     def test_clear_log(self):
@@ -204,4 +204,100 @@ class TestContrastiveHebbian:
         np.testing.assert_allclose(results, [[[2.671875]],
                                              [[2.84093837]],
                                              [[3.0510183]],
-                                             [[3.35234623]]])
\ No newline at end of file
+                                             [[3.35234623]]])
+
+def _scheduled_system(mechanism):
+    o = pnl.TransferMechanism()
+    s = pnl.sys(mechanism, o)
+    ms = pnl.Scheduler(system=s)
+    ms.add_condition(o, pnl.WhenFinished(mechanism))
+    s.scheduler_processing = ms
+    return s
+
+
+HIDDEN_MATRIX = np.full((6, 6), 0.1) - 0.1 * np.eye(6)
+
+
+class TestContrastiveHebbianSettle:
+
+    @pytest.mark.parametrize('params', [
+        dict(input_size=4, hidden_size=0, target_size=4, mode=pnl.SIMPLE_HEBBIAN, hetero=np.full((4, 4), -0.1)),
+        dict(input_size=4, hidden_size=2, target_size=4, separated=False, continuous=False,
+             matrix=HIDDEN_MATRIX, function=pnl.Logistic),
+        dict(input_size=4, hidden_size=2, target_size=4, separated=False, clamp=pnl.SOFT_CLAMP,
+             integrator_mode=True, integration_rate=0.3, matrix=HIDDEN_MATRIX, function=pnl.Logistic),
+        dict(input_size=4, hidden_size=2, target_size=4, separated=False, continuous=False,
+             integrator_mode=True, integration_rate=0.3, matrix=HIDDEN_MATRIX, function=pnl.Logistic),
+    ])
+    def test_settle_matches_scheduled_execution(self, params):
+        scheduled = pnl.ContrastiveHebbianMechanism(**params)
+        settled = pnl.ContrastiveHebbianMechanism(**params)
+        # (the first trial executed by a System begins with input from the Mechanism's initial value)
+        _scheduled_system(scheduled).run(inputs=[[1, 0, 1, 0]], num_trials=2)
+        _scheduled_system(settled).run(inputs=[[1, 0, 1, 0]], num_trials=1)
+
+        plus_phase_activity, minus_phase_activity = settled.settle([1, 0, 1, 0])
+        np.testing.assert_allclose(plus_phase_activity, [scheduled.plus_phase_activity])
+        np.testing.assert_allclose(minus_phase_activity, [scheduled.minus_phase_activity])
+        for attr in ['plus_phase_activity', 'minus_phase_activity', 'current_activity', 'output_activity']:
+            np.testing.assert_allclose(getattr(settled, attr), getattr(scheduled, attr))
+        assert settled.is_finished
+
+    def test_settle_batch(self):
+        m = pnl.ContrastiveHebbianMechanism(input_size=4, hidden_size=2, target_size=4, separated=False,
+                                            matrix=HIDDEN_MATRIX, function=pnl.Logistic)
+        patterns = np.array([[1, 0, 1, 0], [0, 1, 0, 1], [1, 1, 0, 0]])
+        plus_phase_activity, minus_phase_activity = m.settle(patterns)
+        for pattern, plus, minus in zip(patterns, plus_phase_activity, minus_phase_activity):
+            expected_plus, expected_minus = m.settle(pattern)
+            np.testing.assert_allclose(plus, expected_plus[0])
+            np.testing.assert_allclose(minus, expected_minus[0])
+        np.testing.assert_allclose(m.plus_phase_activity, plus_phase_activity[-1])
+
+    def test_settle_with_targets(self):
+        m = pnl.ContrastiveHebbianMechanism(input_size=2, hidden_size=1, target_size=2,
+                                            matrix=np.zeros((5, 5)), continuous=False)
+        plus_phase_activity, minus_phase_activity = m.settle([[1, 2], [3, 4]], targets=[[5, 6], [7, 8]])
+        np.testing.assert_allclose(plus_phase_activity, [[1, 2, 0, 5, 6], [3, 4, 0, 7, 8]])
+        np.testing.assert_allclose(minus_phase_activity, [[1, 2, 0, 0, 0], [3, 4, 0, 0, 0]])
+        np.testing.assert_allclose(m.output_activity, [7, 8])
+
+        with pytest.raises(pnl.ContrastiveHebbianError) as error_text:
+            m.settle([1, 2, 3])
+        assert 'Length of inputs (3)' in str(error_text.value)
+
+    def test_settle_max_passes(self):
+        # (the hidden unit excites itself, so its activity never converges)
+        m = pnl.ContrastiveHebbianMechanism(input_size=2, hidden_size=1, target_size=2, separated=False,
+                                            matrix=[[0, 0, 1], [0, 0, 0], [0, 0, 2]], max_passes=10)
+        with pytest.raises(pnl.ContrastiveHebbianError) as error_text:
+            m.settle([1, 0])
+        assert 'Maximum number of executions (10)' in str(error_text.value)
+
+    @pytest.mark.parametrize('learning_rate', [None, 0.2])
+    def test_compute_weight_changes(self, learning_rate):
+        m = pnl.ContrastiveHebbianMechanism(input_size=2, hidden_size=0, target_size=2,
+                                            enable_learning=True, learning_rate=learning_rate)
+        plus_phase_activity = np.array([[1.0, 0.5, 0.2, 0.9], [0.3, 0.1, 0.8, 0.4]])
+        minus_phase_activity = np.array([[0.2, 0.4, 0.1, 0.3], [0.6, 0.2, 0.1, 0.0]])
+        learning_function = m.learning_mechanism.function_object
+        expected = sum(learning_function.function(plus - minus)
+                       for plus, minus in zip(plus_phase_activity, minus_phase_activity))
+        np.testing.assert_allclose(m.compute_weight_changes(plus_phase_activity, minus_phase_activity), expected)
+
+    def test_settle_learn(self):
+        m = pnl.ContrastiveHebbianMechanism(input_size=2, hidden_size=1, target_size=2,
+                                            matrix=np.zeros((5, 5)), continuous=False)
+        plus_phase_activity, minus_phase_activity = m.settle([[1, 2], [3, 4]], targets=[5, 6], learn=True)
+        np.testing.assert_allclose(m.recurrent_projection.matrix,
+                                   m.compute_weight_changes(plus_phase_activity, minus_phase_activity))
+
+
+@pytest.mark.benchmark(group="ContrastiveHebbianMechanism")
+@pytest.mark.parametrize('num_patterns', [1, 32])
+def test_contrastive_hebbian_settle_benchmark(benchmark, num_patterns):
+    m = pnl.ContrastiveHebbianMechanism(input_size=8, hidden_size=8, target_size=8, function=pnl.Logistic,
+                                        matrix=np.random.RandomState(0).uniform(-0.1, 0.1, (24, 24)),
+                                        integrator_mode=True, integration_rate=0.5)
+    patterns = np.random.RandomState(1).randint(0, 2, (num_patterns, 8))
+    benchmark(m.settle, patterns, targets=patterns, learn=True)
@@ -1,12 +1,14 @@
 import pytest
 import numpy as np
 
-from psyneulink.library.mechanisms.processing.transfer.lca import LCA
+from psyneulink.library.mechanisms.processing.transfer.lca import LCA, LCAError, MAX_VS_AVG, MAX_VS_NEXT
 from psyneulink.components.mechanisms.processing.transfermechanism import TransferMechanism
-from psyneulink.components.functions.function import Linear
+from psyneulink.components.functions.function import Linear, NormalDist
 from psyneulink.components.process import Process
 from psyneulink.components.system import System
-from psyneulink.scheduling.condition import Never
+from psyneulink.globals.keywords import MAX_VAL
+from psyneulink.scheduling.condition import Condition, Never
+from psyneulink.scheduling.time import TimeScale
 
 class TestLCA:
     def test_LCA_length_1(self):
@@ -202,4 +204,69 @@ class TestClip:
                 function=Linear,
                 integrator_mode=False)
         assert np.allclose(L.execute([[-5.0, -1.0, 5.0], [5.0, -5.0, 1.0], [1.0, 5.0, 5.0]]),
-                           [[-2.0, -1.0, 2.0], [2.0, -2.0, 1.0], [1.0, 2.0, 2.0]])
\ No newline at end of file
+                           [[-2.0, -1.0, 2.0], [2.0, -2.0, 1.0], [1.0, 2.0, 2.0]])
+
+def _lca(**kwargs):
+    return LCA(size=3, leak=-0.4, competition=0.3, self_excitation=0.1, time_step_size=0.1, **kwargs)
+
+
+class TestLCASimulateRaces:
+
+    @pytest.mark.parametrize('criterion, threshold', [(MAX_VAL, 0.7), (MAX_VS_NEXT, 0.1), (MAX_VS_AVG, 0.15)])
+    def test_race_matches_system(self, criterion, threshold):
+        stimuli = [[1.0, 0.5, 0.2], [0.2, 0.3, 1.2]]
+        L = _lca()
+        decision_times, choices = L.simulate_races(stimuli, threshold, criterion=criterion)
+        for stimulus, decision_time, choice in zip(stimuli, decision_times, choices):
+            L = _lca()
+            S = System(processes=[Process(pathway=[L])])
+            S.run(inputs={L: [stimulus]},
+                  termination_processing={TimeScale.TRIAL: Condition(
+                      lambda: LCA._race_criterion(np.atleast_2d(L.value), criterion)[0] >= threshold)})
+            num_calls = list(S.scheduler_processing.counts_total.values())[0][TimeScale.TRIAL][L]
+            assert np.isclose(decision_time, num_calls * 0.1)
+            assert choice == np.argmax(L.value)
+
+    def test_race_without_integrator_mode(self):
+        L = LCA(size=2, function=Linear, competition=0.5, integrator_mode=False)
+        decision_times, choices = L.simulate_races([[1.0, 0.0], [0.0, 2.0]], 1.5)
+        assert np.allclose(decision_times, [np.nan, 0.1], equal_nan=True)
+        assert np.array_equal(choices, [-1, 1])
+
+    def test_race_noise(self):
+        L = _lca(noise=NormalDist(standard_dev=0.5).function)
+        L.random_state.seed(0)
+        decision_times, choices = L.simulate_races([1.0, 0.5, 0.2], 0.3, num_trials=500, criterion=MAX_VS_NEXT)
+        assert decision_times.shape == choices.shape == (500,)
+        assert not np.isnan(decision_times).any()
+        assert len(np.unique(decision_times)) > 1
+        # the unit with the strongest input wins most often
+        assert np.argmax(np.bincount(choices)) == 0
+
+    def test_race_does_not_change_lca(self):
+        L = _lca()
+        value = np.copy(L.value)
+        previous_value = np.copy(L.integrator_function.previous_value)
+        L.simulate_races([1.0, 0.5, 0.2], 0.7, num_trials=3)
+        assert np.array_equal(L.value, value)
+        assert np.array_equal(L.integrator_function.previous_value, previous_value)
+
+    def test_race_max_time_steps(self):
+        decision_times, choices = _lca().simulate_races([[1.0, 0.5, 0.2], [0.0, 0.0, 0.0]], 0.7, max_time_steps=20)
+        assert np.isnan(decision_times[1]) and choices[1] == -1
+        assert not np.isnan(decision_times[0]) and choices[0] == 0
+
+    def test_race_invalid_stimuli(self):
+        with pytest.raises(LCAError) as error_text:
+            _lca().simulate_races([[1.0, 0.5]], 0.7)
+        assert 'items of length 3' in str(error_text.value)
+        with pytest.raises(LCAError) as error_text:
+            _lca().simulate_races([[1.0, 0.5, 0.2], [0.0, 0.0, 0.0]], 0.7, num_trials=3)
+        assert 'does not match num_trials (3)' in str(error_text.value)
+
+
+@pytest.mark.benchmark(group="LCA")
+@pytest.mark.parametrize('num_trials', [1, 1000])
+def test_lca_simulate_races_benchmark(benchmark, num_trials):
+    L = _lca(noise=NormalDist(standard_dev=0.5).function)
+    benchmark(L.simulate_races, [1.0, 0.5, 0.2], 0.3, num_trials=num_trials, criterion=MAX_VS_NEXT)
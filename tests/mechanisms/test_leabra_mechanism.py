@@ -2,14 +2,9 @@ import numpy as np
 import pytest
 import random
 import copy
-try:
-    import leabra
-    leabra_available = True
-except ImportError:
-    leabra_available = False
-
-from psyneulink.library.mechanisms.processing.leabramechanism import LeabraMechanism,\
-    build_leabra_network, run_leabra_network, train_leabra_network
+
+from psyneulink.library.mechanisms.processing.leabramechanism import LeabraError, LeabraMechanism, LeabraNetwork,\
+    build_leabra_network, run_leabra_network, set_training, train_leabra_network
 from psyneulink.components.mechanisms.processing.transfermechanism import TransferMechanism
 from psyneulink.components.projections.pathway.mappingprojection import MappingProjection
 from psyneulink.components.functions.function import Linear, Logistic
@@ -17,10 +12,6 @@ from psyneulink.components.process import Process
 from psyneulink.components.system import System
 from psyneulink.globals.keywords import LEARNING
 
-@pytest.mark.skipif(
-    not leabra_available,
-    reason='leabra python module is not installed. Please install it from https://github.com/benureau/leabra'
-)
 class TestLeabraMechInit:
 
     def test_leabra_init_empty(self):
@@ -30,7 +21,8 @@ class TestLeabraMechInit:
         assert "LeabraMechanism" in L.name
         assert L.input_size == 1
         assert L.output_size == 1
-        assert val[0][0] > 0.9
+        # (the output of the single unit is limited by the inhibition within its layer)
+        assert val[0][0] > 0.5
 
     # this kind of test (execute when input_size != output_size) does not work while np.atleast_2d is being used
     # in mechanism.py. When this is fixed, I should return and reinstate these tests 11/3/17 CW
@@ -58,10 +50,6 @@ class TestLeabraMechInit:
         assert len(val[0]) == 4
 
 
-@pytest.mark.skipif(
-    not leabra_available,
-    reason='leabra python module is not installed. Please install it from https://github.com/benureau/leabra'
-)
 class TestLeabraMechRuntimeParams:
 
     def test_leabra_runtime_alone(self):
@@ -102,10 +90,6 @@ class TestLeabraMechRuntimeParams:
         pass
 
 
-@pytest.mark.skipif(
-    not leabra_available,
-    reason='leabra python module is not installed. Please install it from https://github.com/benureau/leabra'
-)
 class TestLeabraMechPrecision:
 
     def test_leabra_prec_no_train(self):
@@ -260,8 +244,7 @@ class TestLeabraMechPrecision:
         # assert np.sum(np.abs(pnl_output_net - np.array(train_data[0]))) < 0.1
 
         # set all learning rules false
-        for conn in leabra_net.connections:
-            conn.spec.lrule = None
+        set_training(leabra_net, False)
         L_net.training_flag = False
         L_spec.training_flag = False
 
@@ -275,6 +258,80 @@ class TestLeabraMechPrecision:
             diffs_net = np.abs(np.array(pnl_output_net) - np.array(leabra_output))
             assert all(diffs_spec < precision) and all(diffs_net < precision)
 
+class TestLeabraNetwork:
+
+    def test_layer_sizes(self):
+        net = build_leabra_network(5, 3, 2, hidden_sizes=[4, 6])
+        assert net.layer_sizes == [5, 4, 6, 3]
+        assert [w.shape for w in net.weights] == [(5, 4), (4, 6), (6, 3)]
+        assert all(np.all((w >= 0.55) & (w <= 0.95)) for w in net.weights)
+        L = LeabraMechanism(net)
+        assert L.hidden_layers == 2
+        assert L.hidden_sizes == [4, 6]
+        assert L.network is net
+
+    def test_same_seed_same_weights(self):
+        random.seed(4)
+        weights_1 = build_leabra_network(3, 3, 1).weights
+        random.seed(4)
+        weights_2 = build_leabra_network(3, 3, 1).weights
+        assert all(np.array_equal(w_1, w_2) for w_1, w_2 in zip(weights_1, weights_2))
+
+    def test_specified_weights(self):
+        net = LeabraNetwork([2, 2], weights=[[[0.9, 0.1], [0.1, 0.9]]])
+        output = net.trial([1, 0])
+        assert output[0] > 0.5 > output[1]
+        with pytest.raises(LeabraError) as error_text:
+            LeabraNetwork([2, 3], weights=[[[0.9, 0.1], [0.1, 0.9]]])
+        assert 'do not match the sizes of the layers' in str(error_text.value)
+
+    def test_invalid_input(self):
+        net = build_leabra_network(3, 2, 0)
+        with pytest.raises(LeabraError) as error_text:
+            net.trial([1, 2])
+        assert 'does not match the size of the input layer' in str(error_text.value)
+
+    def test_no_input_no_output(self):
+        net = build_leabra_network(4, 4, 1)
+        assert np.sum(net.trial([0, 0, 0, 0])) < 0.001
+
+    def test_learning_only_if_training(self):
+        net = build_leabra_network(4, 2, 1, training_flag=False)
+        weights = copy.deepcopy(net.weights)
+        train_leabra_network(net, [1, 1, 0, 0], [1, 0])
+        assert not net.training_flag
+        assert not all(np.array_equal(w, w_before) for w, w_before in zip(net.weights, weights))
+        weights = copy.deepcopy(net.weights)
+        run_leabra_network(net, [1, 1, 0, 0])
+        net.trial([1, 1, 0, 0], [1, 0])
+        assert all(np.array_equal(w, w_before) for w, w_before in zip(net.weights, weights))
+
+    @pytest.mark.parametrize('seed', [1, 2, 3])
+    def test_learns_to_discriminate_patterns(self, seed):
+        random.seed(seed)
+        net = build_leabra_network(4, 2, 1, hidden_sizes=6, training_flag=True)
+        inputs = [[1, 1, 0, 0], [0, 0, 1, 1]]
+        targets = [[1, 0], [0, 1]]
+        for epoch in range(20):
+            for input_pattern, target in zip(inputs, targets):
+                net.trial(input_pattern, target)
+        net.training_flag = False
+        for input_pattern, target in zip(inputs, targets):
+            output = net.trial(input_pattern)
+            assert output[np.argmax(target)] > output[np.argmin(target)]
+
+
+@pytest.mark.benchmark(group="LeabraMechanism")
+@pytest.mark.parametrize('training_flag', [False, True])
+def test_leabra_mechanism_benchmark(benchmark, training_flag):
+    random.seed(0)
+    L = LeabraMechanism(input_size=200, output_size=200, hidden_layers=1, hidden_sizes=300,
+                        training_flag=training_flag)
+    input_pattern = np.random.random(200)
+    target = np.random.random(200)
+    benchmark(L.execute, [input_pattern, target])
+
+
 # class TestLeabraMechInSystem:
 #
 #     def test_leabra_mech_learning(self):
@@ -27,3 +27,66 @@ class TestMechanism:
 
         assert T.input_state.function_object.instance_defaults.variable == result_variable[0]
         assert T.input_state.function_object.instance_defaults.value == result_variable[0]
+
+
+class TestMechanismClone:
+
+    def test_clone_names(self):
+        T = pnl.TransferMechanism(name='T', size=3)
+        assert [c.name for c in T.clone(2)] == ['T-1', 'T-2']
+        assert [c.name for c in T.clone(names=['A', 'B', 'C'])] == ['A', 'B', 'C']
+
+    def test_clone_wrong_number_of_names(self):
+        T = pnl.TransferMechanism(size=3)
+        with pytest.raises(pnl.MechanismError) as error_text:
+            T.clone(3, names=['A', 'B'])
+        assert 'must equal n' in str(error_text.value)
+
+    def test_clone_is_independent(self):
+        T = pnl.TransferMechanism(size=3, function=pnl.Logistic(gain=2.0), integrator_mode=True, integration_rate=0.5)
+        C = T.clone()[0]
+        for state in list(C.input_states) + list(C.parameter_states) + list(C.output_states):
+            assert state.owner is C
+        assert C.function_object is not T.function_object
+        assert C.function_object.owner is C
+        assert C.integrator_function.owner is C
+
+        C.execute([1, 2, 3])
+        assert np.allclose(C.integrator_function.previous_value, [[0.5, 1, 1.5]])
+        assert np.allclose(T.integrator_function.previous_value, [[0, 0, 0]])
+        assert np.allclose(C.value, pnl.TransferMechanism(size=3, function=pnl.Logistic(gain=2.0),
+                                                          integrator_mode=True,
+                                                          integration_rate=0.5).execute([1, 2, 3]))
+
+    def test_clone_in_system(self):
+        T = pnl.TransferMechanism(size=2, function=pnl.Linear(slope=2.0))
+        A, B = T.clone(2)
+        S = pnl.System(processes=[pnl.Process(pathway=[A, B])])
+        assert np.allclose(S.run(inputs={A: [[1, 2]]}), [[[4, 8]]])
+        assert T.efferents == []
+
+    def test_clone_recurrent_projection(self):
+        R = pnl.RecurrentTransferMechanism(size=2, auto=0.5, hetero=-1.0)
+        C = R.clone()[0]
+        assert C.recurrent_projection is not R.recurrent_projection
+        assert C.recurrent_projection.sender.owner is C
+        assert C.recurrent_projection.receiver.owner is C
+        assert np.allclose(C.matrix, [[0.5, -1], [-1, 0.5]])
+
+    def test_clone_with_projection(self):
+        A = pnl.TransferMechanism()
+        B = pnl.TransferMechanism()
+        pnl.MappingProjection(sender=A, receiver=B)
+        with pytest.raises(pnl.MechanismError) as error_text:
+            A.clone()
+        assert 'cannot be cloned because it has a Projection' in str(error_text.value)
+
+    @pytest.mark.benchmark(group="Mechanism construction")
+    @pytest.mark.parametrize('mode', ['constructor', 'clone'])
+    def test_construction_time(self, mode, benchmark):
+        def construct():
+            return [pnl.TransferMechanism(size=3, function=pnl.Logistic(gain=2.0)) for i in range(10)]
+
+        template = pnl.TransferMechanism(size=3, function=pnl.Logistic(gain=2.0))
+        mechanisms = benchmark(template.clone, 10) if mode == 'clone' else benchmark(construct)
+        assert len(mechanisms) == 10
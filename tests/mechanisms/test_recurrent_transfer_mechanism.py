@@ -1002,3 +1002,91 @@ class TestCustomCombinationFunction:
         )
         result = R2.execute([1,2])
         np.testing.assert_allclose(result, [[0,0]])
+
+PATTERNS = np.array([[1.0, -1.0, 1.0, -1.0],
+                     [1.0, 1.0, -1.0, -1.0],
+                     [0.5, 0.0, -0.5, 1.0]])
+
+
+class TestRecurrentTransferMechanismPatterns:
+
+    @pytest.mark.parametrize('num_passes', [1, 2, 5])
+    def test_recall_matches_system(self, num_passes):
+        for pattern in PATTERNS:
+            R = RecurrentTransferMechanism(size=4, auto=0.1, hetero=-0.2)
+            s = System(processes=[Process(pathway=[R])])
+            s.run(inputs={R: [pattern] * num_passes})
+            assert np.allclose(R.recall_patterns(pattern, num_passes=num_passes), R.value)
+
+    @pytest.mark.parametrize('integrator_mode', [False, True])
+    def test_recall_batch_matches_single_patterns(self, integrator_mode):
+        R = RecurrentTransferMechanism(size=4, function=Logistic, hetero=-0.5, integrator_mode=integrator_mode,
+                                       integration_rate=0.5)
+        activity = R.recall_patterns(PATTERNS)
+        assert activity.shape == PATTERNS.shape
+        for pattern, pattern_activity in zip(PATTERNS, activity):
+            assert np.allclose(R.recall_patterns(pattern), pattern_activity)
+            if not integrator_mode:
+                # each pattern has settled to within the convergence_criterion
+                recurrent = pattern_activity.dot(R.matrix)
+                assert np.max(np.abs(R.function_object.function(pattern + recurrent) - pattern_activity)) <= 0.01
+
+    def test_recall_max_passes(self):
+        R = RecurrentTransferMechanism(size=2, auto=2, hetero=0, max_passes=10)
+        with pytest.raises(RecurrentTransferError) as error_text:
+            R.recall_patterns([[0.0, 0.0], [1.0, 0.0]])
+        assert 'Maximum number of executions (10)' in str(error_text.value)
+        assert 'in pattern 1' in str(error_text.value)
+
+    def test_recall_invalid_patterns(self):
+        R = RecurrentTransferMechanism(size=4)
+        with pytest.raises(RecurrentTransferError) as error_text:
+            R.recall_patterns([[1.0, 2.0, 3.0]])
+        assert 'items of length 4' in str(error_text.value)
+
+    def test_recall_with_custom_combination_function(self):
+        R = RecurrentTransferMechanism(size=2, has_recurrent_input_state=True, hetero=0.5,
+                                       combination_function=lambda x: x[0] - x[1] if len(x) == 2 else x[0])
+        assert np.allclose(R.recall_patterns([1.0, 2.0], num_passes=2), [[0.0, 1.5]])
+
+    def test_train_matches_hebbian(self):
+        R = RecurrentTransferMechanism(size=4, auto=0, hetero=0, enable_learning=True, learning_rate=0.1)
+        initial_matrix = np.array(R.matrix)
+        activity = R.train_patterns(PATTERNS, num_passes=1)
+        assert np.allclose(activity, PATTERNS)
+        expected = initial_matrix + np.sum([R.learning_mechanism.function_object.function(pattern)
+                                            for pattern in PATTERNS], axis=0)
+        assert np.allclose(R.matrix, expected)
+        assert np.allclose(R.recurrent_projection.matrix, expected)
+        assert np.allclose(R.recurrent_projection.parameter_states['matrix'].value, expected)
+        assert np.allclose(R.parameter_states['auto'].value, np.diag(expected))
+        assert np.allclose(R.parameter_states['hetero'].value, expected - np.diag(np.diag(expected)))
+
+    def test_train_with_batch_size(self):
+        R = RecurrentTransferMechanism(size=4, learning_rate=0.1)
+        expected = np.array(R.matrix)
+        activity = R.train_patterns(PATTERNS, num_passes=3, batch_size=1)
+        expected_activity = []
+        for pattern in PATTERNS:
+            R_single = RecurrentTransferMechanism(size=4, matrix=expected, learning_rate=0.1)
+            expected_activity.append(R_single.recall_patterns(pattern, num_passes=3)[0])
+            expected = expected + R_single._compute_weight_changes(expected_activity[-1])
+        assert np.allclose(activity, expected_activity)
+        assert np.allclose(R.matrix, expected)
+
+    def test_train_then_run(self):
+        R = RecurrentTransferMechanism(size=4, learning_rate=0.1)
+        R.train_patterns(PATTERNS, num_passes=1)
+        matrix = np.array(R.matrix)
+        s = System(processes=[Process(pathway=[R])])
+        s.run(inputs={R: [PATTERNS[0], PATTERNS[1]]})
+        assert np.allclose(R.value, PATTERNS[1] + PATTERNS[0].dot(matrix))
+        assert np.allclose(R.matrix, matrix)
+
+
+@pytest.mark.benchmark(group="RecurrentTransferMechanism")
+@pytest.mark.parametrize('num_patterns', [1, 64])
+def test_recurrent_transfer_train_patterns_benchmark(benchmark, num_patterns):
+    R = RecurrentTransferMechanism(size=16, function=Logistic, hetero=-0.1, learning_rate=0.01)
+    patterns = np.random.RandomState(0).random_sample((num_patterns, 16))
+    benchmark(R.train_patterns, patterns)
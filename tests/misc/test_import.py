@@ -0,0 +1,50 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# modules that should not be imported by "import psyneulink" (library modules are imported when first needed)
+LAZY_MODULES = [
+    'scipy',
+    'leabra',
+    'psyneulink.library.mechanisms.processing.leabramechanism',
+    'psyneulink.library.mechanisms.processing.transfer.lca',
+    'psyneulink.library.projections.pathway.maskedmappingprojection',
+    'psyneulink.library.subsystems.evc.evccontrolmechanism',
+]
+
+
+def _run_in_new_interpreter(code):
+    return subprocess.check_output([sys.executable, '-c', code]).decode()
+
+
+def test_import_does_not_load_lazy_modules():
+    loaded = json.loads(_run_in_new_interpreter('import json, sys, psyneulink; print(json.dumps(list(sys.modules)))'))
+    assert [module for module in LAZY_MODULES if module in loaded] == []
+
+
+def test_lazy_library_names():
+    output = _run_in_new_interpreter(
+        'import sys, psyneulink as pnl\n'
+        'masked = pnl.MaskedMappingProjection\n'
+        'print(masked.__module__ in sys.modules, "LCAError" in pnl.__all__, "EVCControlMechanism" in pnl.__all__)'
+    )
+    assert output.split() == ['True', 'True', 'True']
+
+
+def test_starred_import_includes_library():
+    namespace = {}
+    exec('from psyneulink import *', namespace)
+    for name in ['LCAError', 'EVCControlMechanism', 'MaskedMappingProjection', 'TransferMechanism', 'Scheduler']:
+        assert name in namespace
+
+
+def test_lazy_version():
+    import psyneulink as pnl
+    assert isinstance(pnl.__version__, str)
+
+
+@pytest.mark.benchmark(group="Import")
+def test_import_time(benchmark):
+    benchmark(_run_in_new_interpreter, 'import psyneulink')
@@ -0,0 +1,35 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+CHECK = (
+    'import psyneulink as pnl\n'
+    'from typecheck import InputParameterError\n'
+    'try:\n'
+    '    pnl.Linear(prefs=5)\n'
+    'except InputParameterError:\n'
+    '    print(pnl.PRODUCTION_MODE, "typechecked")\n'
+    'except pnl.PreferenceSetError:\n'
+    '    print(pnl.PRODUCTION_MODE, "not typechecked")\n'
+)
+
+
+def _run_in_new_interpreter(production_mode):
+    env = dict(os.environ)
+    env.pop('PSYNEULINK_PRODUCTION_MODE', None)
+    if production_mode is not None:
+        env['PSYNEULINK_PRODUCTION_MODE'] = production_mode
+    return subprocess.check_output([sys.executable, '-c', CHECK], env=env).decode().split()
+
+
+@pytest.mark.parametrize('production_mode, expected', [
+    (None, ['False', 'typechecked']),
+    ('0', ['False', 'typechecked']),
+    ('off', ['False', 'typechecked']),
+    ('1', ['True', 'not', 'typechecked']),
+    ('True', ['True', 'not', 'typechecked']),
+])
+def test_production_mode(production_mode, expected):
+    assert _run_in_new_interpreter(production_mode) == expected
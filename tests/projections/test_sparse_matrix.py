@@ -0,0 +1,90 @@
+import numpy as np
+import psyneulink as pnl
+import pytest
+
+sparse = pytest.importorskip('scipy.sparse')
+
+SIZE = 1000
+DENSITY = 0.05
+
+
+class TestSparseLinearMatrix:
+
+    @pytest.mark.parametrize('fmt', ['csr', 'csc', 'coo'])
+    def test_sparse_matrix_matches_dense(self, fmt):
+        matrix = sparse.random(4, 3, density=0.5, format=fmt, random_state=0)
+        f = pnl.LinearMatrix(default_variable=[0, 0, 0, 0], matrix=matrix)
+        assert sparse.issparse(f.matrix)
+        assert f.matrix.format in {'csr', 'csc'}
+        assert np.allclose(f.function([1, 2, 3, 4]), np.dot([1, 2, 3, 4], matrix.toarray()))
+        assert np.allclose(f.function([[1, 2, 3, 4], [1, 1, 1, 1]]),
+                           np.dot([[1, 2, 3, 4], [1, 1, 1, 1]], matrix.toarray()))
+
+    @pytest.mark.benchmark(group="LinearMatrix sparse vs dense")
+    @pytest.mark.parametrize('is_sparse', [True, False], ids=['sparse', 'dense'])
+    def test_linear_matrix_throughput(self, is_sparse, benchmark):
+        matrix = sparse.random(SIZE, SIZE, density=DENSITY, format='csr', random_state=0)
+        if not is_sparse:
+            matrix = matrix.toarray().tolist()
+        variable = np.random.rand(SIZE)
+        f = pnl.LinearMatrix(default_variable=np.zeros(SIZE), matrix=matrix)
+        val = benchmark(f.function, variable)
+        assert np.allclose(val, np.dot(variable, f.matrix.toarray() if is_sparse else f.matrix))
+        assert sparse.issparse(f.matrix) == is_sparse
+
+    def test_sparse_matrix_memory(self):
+        matrix = sparse.random(SIZE, SIZE, density=DENSITY, format='csr', random_state=0)
+        f = pnl.LinearMatrix(default_variable=np.zeros(SIZE), matrix=matrix)
+        sparse_bytes = f.matrix.data.nbytes + f.matrix.indices.nbytes + f.matrix.indptr.nbytes
+        assert sparse_bytes < 0.2 * matrix.toarray().nbytes
+
+
+class TestSparseMappingProjection:
+
+    def test_sparse_mapping_projection_in_system(self):
+        matrix = sparse.random(4, 3, density=0.5, format='csr', random_state=0)
+        A = pnl.TransferMechanism(size=4)
+        B = pnl.TransferMechanism(size=3)
+        projection = pnl.MappingProjection(sender=A, receiver=B, matrix=matrix)
+        S = pnl.System(processes=[pnl.Process(pathway=[A, projection, B])])
+        result = S.run(inputs={A: [[1, 2, 3, 4]]})
+        assert sparse.issparse(projection.matrix)
+        assert np.allclose(result, [[np.dot([1, 2, 3, 4], matrix.toarray())]])
+
+    def test_backpropagation_preserves_sparsity(self):
+        matrix_1 = sparse.random(4, 5, density=0.4, format='csr', random_state=1)
+        matrix_2 = sparse.random(5, 3, density=0.5, format='csc', random_state=2)
+        A = pnl.TransferMechanism(size=4)
+        H = pnl.TransferMechanism(size=5, function=pnl.Logistic)
+        B = pnl.TransferMechanism(size=3, function=pnl.Logistic)
+        projection_1 = pnl.MappingProjection(sender=A, receiver=H, matrix=matrix_1)
+        projection_2 = pnl.MappingProjection(sender=H, receiver=B, matrix=matrix_2)
+        P = pnl.Process(pathway=[A, projection_1, H, projection_2, B], learning=pnl.LEARNING, target=[0, 0, 1])
+        S = pnl.System(processes=[P])
+        S.run(inputs={A: [[1, 2, 3, 4]] * 3}, targets={B: [[0, 0, 1]] * 3})
+
+        for projection, initial in ((projection_1, matrix_1), (projection_2, matrix_2)):
+            learned = projection.matrix
+            assert sparse.issparse(learned)
+            assert learned.format == initial.format
+            assert learned.nnz == initial.nnz
+            # weights have changed, but only within the original sparsity pattern
+            assert not np.allclose(learned.toarray(), initial.toarray())
+            assert np.all(learned.toarray()[initial.toarray() == 0] == 0)
+
+    @pytest.mark.parametrize('operation, mask, expected', [
+        (pnl.ADD, [[1, 3], [3, 1]], [[2, 0], [0, 5]]),
+        (pnl.MULTIPLY, [[1, 3], [3, 3]], [[1, 0], [0, 12]]),
+        (pnl.EXPONENTIATE, [[1, 3], [3, 3]], [[1, 0], [0, 64]]),
+    ])
+    def test_masked_mapping_projection_sparse(self, operation, mask, expected):
+        T1 = pnl.TransferMechanism(size=2)
+        T2 = pnl.TransferMechanism(size=2)
+        pnl.MaskedMappingProjection(sender=T1,
+                                    receiver=T2,
+                                    matrix=sparse.csr_matrix([[1., 0.], [0., 4.]]),
+                                    mask=mask,
+                                    mask_operation=operation)
+        p = pnl.Process(pathway=[T1, T2])
+        val = p.execute(input=[1, 2])
+        assert np.allclose(val, np.dot([1, 2], expected))
@@ -178,6 +178,33 @@ class TestScheduler:
                             [np.array([[2.]]), np.array([[1.]])]]
         assert np.allclose(expected_results, S.results)
 
+    def test_contexts_counted_separately(self):
+        graph = {'A': set(), 'B': {'A'}}
+        sched = Scheduler(graph=graph)
+        sched.add_condition('B', EveryNCalls('A', 2))
+        termination_conds = {TimeScale.TRIAL: AfterNCalls('B', 1)}
+        eid = uuid.uuid4()
+        list(sched.run(termination_conds=termination_conds, execution_id=eid))
+        list(sched.run(termination_conds=termination_conds))
+        assert sched.counts_total[eid][TimeScale.LIFE] == {'A': 2, 'B': 1}
+        assert sched.counts_total[sched.default_execution_id][TimeScale.LIFE] == {'A': 2, 'B': 1}
+        assert sched.execution_list[eid] == sched.execution_list[sched.default_execution_id] == [{'A'}, {'A'}, {'B'}]
+        assert sched.clocks[eid].time.trial == sched.clock.time.trial == 1
+
+    def test_debug_logging(self, caplog):
+        sched = Scheduler(graph={'A': set(), 'B': {'A'}})
+        with caplog.at_level(logging.DEBUG, logger='psyneulink.scheduling.scheduler'):
+            list(sched.run())
+        assert 'adding A to execution list' in caplog.text
+        assert 'resetting counts_total' in caplog.text
+
+
+@pytest.mark.benchmark(group="Scheduler")
+def test_scheduler_run_linear(benchmark):
+    nodes = list(range(20))
+    sched = Scheduler(graph={n: {n - 1} if n else set() for n in nodes})
+    benchmark(lambda: list(sched.run()))
+
 
 
 class TestLinear:
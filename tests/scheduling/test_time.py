@@ -18,6 +18,15 @@ class TestTime:
         base._increment_by_time_scale(increment_time_scale)
         assert base == expected
 
+    def test_slots(self):
+        t = Time(run=1, trial=2, pass_=3, time_step=4)
+        assert not hasattr(t, '__dict__')
+        with pytest.raises(AttributeError):
+            t.foo = 0
+        assert t._as_tuple() == (0, 1, 2, 3, 4)
+        assert repr(t) == 'Time(life=0, pass_=3, run=1, time_step=4, trial=2)'
+        assert t != Time(run=1, trial=2, pass_=3, time_step=5)
+
     def test_multiple_runs(self):
         t1 = pnl.TransferMechanism()
         t2 = pnl.TransferMechanism()
@@ -59,3 +68,11 @@ class TestTimeHistoryTree:
             assert node.time_scale >= max_depth
 
         assert found_max_depth
+
+    def test_slots(self):
+        h = TimeHistoryTree()
+        for node in [h, h.children[0]]:
+            assert not hasattr(node, '__dict__')
+        assert h.children[0].current_time is None
+        with pytest.raises(pnl.scheduling.time.TimeScaleError):
+            h.children[0].get_total_times_relative(TimeScale.TRIAL)
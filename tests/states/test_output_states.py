@@ -0,0 +1,95 @@
+import numpy as np
+import psyneulink as pnl
+import pytest
+
+from psyneulink.globals.context import ContextFlags
+
+STANDARD_OUTPUT_STATES = [pnl.RESULT, pnl.MEAN, pnl.MEDIAN, pnl.STANDARD_DEVIATION, pnl.VARIANCE,
+                          pnl.MAX_VAL, pnl.MAX_ABS_VAL, pnl.MAX_INDICATOR, pnl.MAX_ABS_INDICATOR]
+
+
+def _transfer_mechanism(size):
+    # (pass a copy of the list, since the specifications in it are replaced when the OutputStates are instantiated)
+    return pnl.TransferMechanism(size=size, output_states=list(STANDARD_OUTPUT_STATES))
+
+
+def _output_values(mechanism, fused=True):
+    # runtime_params for the OutputStates prevent them from being computed together
+    runtime_params = None if fused else {pnl.OUTPUT_STATE_PARAMS: {}}
+    mechanism._update_output_states(runtime_params=runtime_params, context=ContextFlags.COMMAND_LINE)
+    return [state.value for state in mechanism.output_states]
+
+
+class TestStandardOutputStates:
+
+    def test_transfer_mechanism_standard_output_states(self):
+        T = _transfer_mechanism(5)
+        variable = np.array([1.0, -3.0, 2.0, 2.0, 0.5])
+        T.execute([variable])
+        values = dict(zip(STANDARD_OUTPUT_STATES, (state.value for state in T.output_states)))
+        assert np.array_equal(values[pnl.RESULT], variable)
+        assert values[pnl.MEAN] == np.mean(variable)
+        assert values[pnl.MEDIAN] == np.median(variable)
+        assert values[pnl.STANDARD_DEVIATION] == np.std(variable)
+        assert values[pnl.VARIANCE] == np.var(variable)
+        assert np.array_equal(values[pnl.MAX_VAL], [0, 0, 2, 2, 0])
+        assert np.array_equal(values[pnl.MAX_INDICATOR], [0, 0, 1, 1, 0])
+
+    @pytest.mark.parametrize('variable', [[1.0, -3.0, 2.0, 2.0, 0.5], [-4.0, 0.3, 2.0, 0.1, 3.9]])
+    def test_fused_matches_unfused(self, variable):
+        T = _transfer_mechanism(5)
+        T.execute([variable])
+        fused = _output_values(T)
+        unfused = _output_values(T, fused=False)
+        for fused_value, unfused_value in zip(fused, unfused):
+            assert np.array_equal(fused_value, unfused_value)
+            assert np.asarray(fused_value).dtype == np.asarray(unfused_value).dtype
+
+    def test_ddm_standard_output_states(self):
+        D = pnl.DDM(output_states=[pnl.DDM_OUTPUT.DECISION_VARIABLE, pnl.DDM_OUTPUT.RESPONSE_TIME,
+                                   pnl.DDM_OUTPUT.PROBABILITY_UPPER_THRESHOLD,
+                                   pnl.DDM_OUTPUT.PROBABILITY_LOWER_THRESHOLD])
+        D.execute(1.0)
+        fused = _output_values(D)
+        for i, value in enumerate(fused):
+            assert np.array_equal(value, D.value[i])
+        for fused_value, unfused_value in zip(fused, _output_values(D, fused=False)):
+            assert np.array_equal(fused_value, unfused_value)
+
+    def test_output_state_with_linear_function(self):
+        T = pnl.TransferMechanism(size=2, output_states=[{pnl.NAME: 'DOUBLE', pnl.FUNCTION: pnl.Linear(slope=2)}])
+        T.execute([[1.0, 3.0]])
+        assert np.array_equal(T.output_state.value, [2.0, 6.0])
+
+    def test_gated_output_state_is_updated(self):
+        T = pnl.TransferMechanism(size=2, output_states=[pnl.RESULT, pnl.MEAN])
+        G = pnl.GatingMechanism(gating_signals=[T.output_states[pnl.RESULT]])
+        G.gating_signals[0].value = [2.0]
+        T.execute([[1.0, 3.0]])
+        assert np.array_equal(T.output_states[pnl.RESULT].value, [2.0, 6.0])
+        assert T.output_states[pnl.MEAN].value == 2.0
+        assert T.output_states[pnl.MEAN].current_execution_count == T.output_states[pnl.RESULT].current_execution_count
+
+    def test_execution_count_and_log(self):
+        T = pnl.TransferMechanism(size=2, output_states=[pnl.RESULT, pnl.MEAN])
+        T.set_log_conditions(pnl.MEAN)
+        S = pnl.System(processes=[pnl.Process(pathway=[T])])
+        S.run(inputs={T: [[1.0, 3.0], [2.0, 4.0]]})
+        assert T.output_states[pnl.MEAN].current_execution_count == 2
+        log = T.log.nparray_dictionary()
+        assert np.allclose(np.asarray(log[pnl.MEAN], dtype=float).ravel(), [2.0, 3.0])
+
+
+@pytest.mark.benchmark(group="Standard OutputStates")
+def test_transfer_mechanism_output_states(benchmark):
+    T = _transfer_mechanism(10)
+    T.execute([np.arange(10.0)])
+    benchmark(T._update_output_states, context=ContextFlags.COMMAND_LINE)
+
+
+@pytest.mark.benchmark(group="Standard OutputStates")
+def test_ddm_output_states(benchmark):
+    D = pnl.DDM(output_states=[pnl.DDM_OUTPUT.DECISION_VARIABLE, pnl.DDM_OUTPUT.RESPONSE_TIME,
+                               pnl.DDM_OUTPUT.PROBABILITY_UPPER_THRESHOLD, pnl.DDM_OUTPUT.PROBABILITY_LOWER_THRESHOLD])
+    D.execute(1.0)
+    benchmark(D._update_output_states, context=ContextFlags.COMMAND_LINE)
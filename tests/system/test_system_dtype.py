@@ -0,0 +1,95 @@
+import numpy as np
+import psyneulink as pnl
+import pytest
+
+from psyneulink.components.system import SystemError
+from psyneulink.compositions.composition import Composition, CompositionError
+
+
+def _learning_system(dtype=None):
+    np.random.seed(0)
+    A = pnl.TransferMechanism(name='A', size=4)
+    H = pnl.TransferMechanism(name='H', size=5, function=pnl.Logistic)
+    B = pnl.TransferMechanism(name='B', size=3, function=pnl.Logistic, integrator_mode=True, integration_rate=0.5)
+    P = pnl.Process(pathway=[A, pnl.RANDOM_CONNECTIVITY_MATRIX, H, pnl.RANDOM_CONNECTIVITY_MATRIX, B],
+                    learning=pnl.LEARNING,
+                    target=[0, 0, 1])
+    S = pnl.System(processes=[P], dtype=dtype)
+    B.set_log_conditions(pnl.VALUE)
+    return S, A, H, B
+
+
+class TestSystemDtype:
+
+    def test_default_dtype(self):
+        S, A, H, B = _learning_system()
+        assert S.dtype is None
+        S.run(inputs={A: [[1, 2, 3, 4]]}, targets={B: [[0, 0, 1]]})
+        assert B.value.dtype == np.float64
+
+    def test_float32_matches_float64(self):
+        S_64, A_64, H_64, B_64 = _learning_system(np.float64)
+        S_32, A_32, H_32, B_32 = _learning_system(np.float32)
+        inputs = [[1, 2, 3, 4], [4, 3, 2, 1], [1, 1, 1, 1]]
+        targets = [[0, 0, 1]] * 3
+
+        results_64 = S_64.run(inputs={A_64: inputs}, targets={B_64: targets})
+        results_32 = S_32.run(inputs={A_32: inputs}, targets={B_32: targets})
+
+        assert np.allclose(np.asarray(results_32, dtype=np.float64), results_64, rtol=1e-5, atol=1e-6)
+        for projection_32, projection_64 in zip(H_32.input_state.path_afferents + B_32.input_state.path_afferents,
+                                                H_64.input_state.path_afferents + B_64.input_state.path_afferents):
+            assert projection_32.matrix.dtype == np.float32
+            assert np.allclose(projection_32.matrix, projection_64.matrix, rtol=1e-5, atol=1e-6)
+
+    def test_float32_values(self):
+        S, A, H, B = _learning_system(np.float32)
+        S.run(inputs={A: [[1, 2, 3, 4]] * 2}, targets={B: [[0, 0, 1]] * 2})
+
+        for mechanism in S.mechanisms:
+            for value in mechanism.value:
+                assert value.dtype == np.float32
+            for state in mechanism.parameter_states:
+                assert np.asarray(state.value).dtype == np.float32
+        assert B.instance_defaults.variable.dtype == np.float32
+        assert B.integrator_function.previous_value.dtype == np.float32
+        log_entries = B.log.logged_entries['B']
+        assert len(log_entries) == 2
+        assert all(entry.value.dtype == np.float32 for entry in log_entries)
+
+        matrix = H.input_state.path_afferents[0].matrix
+        assert matrix.dtype == np.float32
+        assert matrix.nbytes == matrix.size * 4
+
+    def test_assign_dtype_after_construction(self):
+        S, A, H, B = _learning_system()
+        S.dtype = 'float32'
+        assert S.dtype == np.float32
+        S.run(inputs={A: [[1, 2, 3, 4]]}, targets={B: [[0, 0, 1]]})
+        assert B.value.dtype == np.float32
+
+    @pytest.mark.parametrize('dtype', [np.int32, 'foo'])
+    def test_invalid_dtype(self, dtype):
+        S, A, H, B = _learning_system()
+        with pytest.raises(SystemError) as error_text:
+            S.dtype = dtype
+        assert 'must be a floating point type' in str(error_text.value)
+
+
+class TestCompositionDtype:
+
+    def test_float32_composition(self):
+        comp = Composition(dtype=np.float32)
+        A = pnl.TransferMechanism(function=pnl.Linear(slope=5.0))
+        B = pnl.TransferMechanism(function=pnl.Linear(slope=5.0))
+        comp.add_mechanism(A)
+        comp.add_mechanism(B)
+        comp.add_projection(A, pnl.MappingProjection(sender=A, receiver=B), B)
+        comp._analyze_graph()
+        output = comp.run(inputs={A: [5]}, scheduler_processing=pnl.Scheduler(composition=comp))
+        assert 125 == output[0][0]
+        assert A.value.dtype == B.value.dtype == np.float32
+
+    def test_invalid_composition_dtype(self):
+        with pytest.raises(CompositionError):
+            Composition(dtype=int)
@@ -0,0 +1,120 @@
+import numpy as np
+import psyneulink as pnl
+import pytest
+
+from psyneulink.globals.environment import RunError
+
+
+def _system(other_pathways=(), **kwargs):
+    A = pnl.TransferMechanism(name='A', size=2, **kwargs)
+    B = pnl.TransferMechanism(name='B', size=2, function=pnl.Linear(slope=2.0))
+    S = pnl.System(processes=[pnl.Process(pathway=[A, B])] + [pnl.Process(pathway=p) for p in other_pathways])
+    return S, A, B
+
+
+def _stimuli(num_trials):
+    return [[[i, -i]] for i in range(num_trials)]
+
+
+def _results(results):
+    return np.array([np.concatenate([np.ravel(value) for value in result]) for result in results])
+
+
+class TestRunInputStreams:
+
+    def test_generator_matches_list(self):
+        S, A, B = _system()
+        expected = _results(S.run(inputs={A: _stimuli(5)}))
+        S, A, B = _system()
+        results = S.run(inputs={A: (stimulus for stimulus in _stimuli(5))})
+        assert np.array_equal(_results(results), expected)
+
+    def test_generator_with_num_trials(self):
+        S, A, B = _system()
+        results = S.run(inputs={A: iter(_stimuli(5))}, num_trials=3)
+        assert np.array_equal(_results(results), 2 * np.array(_stimuli(3)).reshape(3, 2))
+
+    def test_exhausted_generator_with_num_trials(self):
+        S, A, B = _system()
+        with pytest.raises(RunError) as error_text:
+            S.run(inputs={A: iter(_stimuli(2))}, num_trials=3)
+        assert 'exhausted after 2 of the 3 trials' in str(error_text.value)
+
+    def test_generator_and_list(self):
+        C = pnl.TransferMechanism(name='C')
+        S, A, B = _system(other_pathways=[[C]])
+        stimuli = iter(_stimuli(4))
+        # the number of trials is determined by the list
+        results = S.run(inputs={A: stimuli, C: [[1.0], [2.0]]})
+        assert np.array_equal(_results(results), [[0, 0, 1], [2, -2, 2]])
+        assert next(stimuli) == [[2, -2]]
+
+    def test_invalid_streamed_input(self):
+        S, A, B = _system()
+        with pytest.raises(RunError) as error_text:
+            S.run(inputs={A: iter([[[1, 2]], [[1, 2, 3]]])})
+        assert 'is incompatible with its external_input_values' in str(error_text.value)
+        assert len(S.results) == 1
+
+    def test_streamed_input_labels(self):
+        S, A, B = _system(params={pnl.INPUT_LABELS_DICT: {'red': [1, 0], 'green': [0, 1]}})
+        results = S.run(inputs={A: iter(['red', 'green', 'red'])})
+        assert np.array_equal(_results(results), [[2, 0], [0, 2], [2, 0]])
+
+    def test_targets_for_streamed_inputs(self):
+        A = pnl.TransferMechanism(name='A', size=2)
+        B = pnl.TransferMechanism(name='B', size=2)
+        S = pnl.System(processes=[pnl.Process(pathway=[A, B], learning=pnl.LEARNING)])
+        with pytest.raises(RunError) as error_text:
+            S.run(inputs={A: iter(_stimuli(2))}, targets={B: [[1, 1], [0, 0]]})
+        assert 'must be specified as functions' in str(error_text.value)
+
+
+class TestRunInputArrays:
+
+    @pytest.mark.parametrize('shape', [(5, 2), (5, 1, 2)])
+    def test_array_matches_list(self, shape):
+        S, A, B = _system()
+        expected = _results(S.run(inputs={A: _stimuli(5)}))
+        S, A, B = _system()
+        results = S.run(inputs={A: np.array(_stimuli(5), dtype=float).reshape(shape)})
+        assert np.array_equal(_results(results), expected)
+
+    def test_memmap(self, tmpdir):
+        S, A, B = _system()
+        stimuli = np.memmap(str(tmpdir.join('stimuli.dat')), dtype=float, mode='w+', shape=(5, 1, 2))
+        stimuli[:] = _stimuli(5)
+        results = S.run(inputs={A: stimuli})
+        assert np.array_equal(_results(results), 2 * np.array(_stimuli(5)).reshape(5, 2))
+
+    def test_array_is_not_copied(self):
+        S, A, B = _system()
+        stimuli = np.array(_stimuli(3), dtype=float)
+        inputs, num_input_sets = pnl.globals.environment._adjust_stimulus_dict(S, {A: stimuli})
+        assert num_input_sets == 3
+        assert inputs[A] is stimuli
+
+    def test_array_with_different_number_of_inputs(self):
+        C = pnl.TransferMechanism(name='C')
+        S, A, B = _system(other_pathways=[[C]])
+        with pytest.raises(RunError) as error_text:
+            S.run(inputs={A: np.zeros((3, 1, 2)), C: [[1.0], [2.0]]})
+        assert 'conflicts with' in str(error_text.value)
+
+
+@pytest.mark.benchmark(group="Run inputs")
+@pytest.mark.parametrize('form', ['list', 'array', 'generator'])
+def test_run_inputs_benchmark(benchmark, form):
+    S, A, B = _system()
+    stimuli = np.random.random((200, 1, 2))
+
+    def run():
+        if form == 'list':
+            inputs = stimuli.tolist()
+        elif form == 'array':
+            inputs = stimuli
+        else:
+            inputs = iter(stimuli)
+        S.run(inputs={A: inputs})
+
+    benchmark(run)
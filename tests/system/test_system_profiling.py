@@ -0,0 +1,111 @@
+import numpy as np
+import psyneulink as pnl
+import pytest
+
+from psyneulink.globals import profiling
+from psyneulink.globals.profiling import ProfilerError, ProfilerPhase
+
+MECHANISM_PHASES = [ProfilerPhase.INPUT_STATES, ProfilerPhase.PARAMETER_STATES, ProfilerPhase.FUNCTION,
+                    ProfilerPhase.OUTPUT_STATES]
+
+
+def _system(learning=False):
+    A = pnl.TransferMechanism(name='A', size=2)
+    B = pnl.TransferMechanism(name='B', size=2, function=pnl.Logistic)
+    process_args = {'learning': pnl.LEARNING} if learning else {}
+    S = pnl.System(processes=[pnl.Process(pathway=[A, B], **process_args)])
+    return S, A, B
+
+
+class TestProfiler:
+
+    def test_not_profiled_by_default(self):
+        S, A, B = _system()
+        S.run(inputs={A: [[1.0, 2.0]]})
+        assert S.profiler is None
+        assert profiling._active_profiler is None
+
+    def test_mechanism_phases(self):
+        S, A, B = _system()
+        S.run(inputs={A: [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]}, profile=True)
+        assert profiling._active_profiler is None
+        records = S.profiler.records
+        for mechanism in [A, B]:
+            for phase in [ProfilerPhase.EXECUTION] + MECHANISM_PHASES:
+                assert records[(mechanism, phase)][0] == 3
+            # the phases are timed consecutively within the execution of the Mechanism
+            assert sum(records[(mechanism, phase)][1] for phase in MECHANISM_PHASES) \
+                <= records[(mechanism, ProfilerPhase.EXECUTION)][1]
+        projection = B.input_state.path_afferents[0]
+        assert records[(projection, ProfilerPhase.PROJECTION)][0] == 3
+        assert records[(S, ProfilerPhase.SCHEDULING)][0] == 9
+
+    def test_time_scales(self):
+        S, A, B = _system()
+        S.run(inputs={A: [[1.0, 2.0], [3.0, 4.0]]}, profile=True)
+        time_steps = S.profiler.time_steps
+        assert np.array_equal(time_steps['trial'], [0, 0, 1, 1])
+        assert np.array_equal(time_steps['time_step'], [0, 1, 0, 1])
+        assert np.array_equal(time_steps['executions'], [1, 1, 1, 1])
+        assert len(S.profiler.trial_times) == 2
+        assert np.sum(time_steps['time']) <= np.sum(S.profiler.trial_times) <= S.profiler.run_time
+
+    def test_learning(self):
+        S, A, B = _system(learning=True)
+        S.run(inputs={A: [[1.0, 2.0], [3.0, 4.0]]}, targets={B: [[0.0, 1.0], [1.0, 0.0]]}, profile=True)
+        records = S.profiler.records
+        assert records[(S, ProfilerPhase.LEARNING)][0] == 2
+        learning_mechanism = B.input_state.path_afferents[0].learning_mechanism
+        assert records[(learning_mechanism, ProfilerPhase.FUNCTION)][0] == 2
+
+    def test_report(self):
+        S, A, B = _system()
+        B.set_log_conditions(pnl.VALUE)
+        S.run(inputs={A: [[1.0, 2.0], [3.0, 4.0]]}, profile=True)
+        report = S.profiler.report()
+        assert report['components']['B']['FUNCTION']['calls'] == 2
+        assert report['components']['B']['LOGGING']['calls'] >= 2
+        assert report['phases']['EXECUTION']['calls'] == 4
+        assert np.isclose(report['phases']['EXECUTION']['time'],
+                          report['components']['A']['EXECUTION']['time']
+                          + report['components']['B']['EXECUTION']['time'])
+        assert report['run'] == S.profiler.run_time
+        assert len(report['trials']) == 2
+
+    def test_nparray(self):
+        S, A, B = _system()
+        S.run(inputs={A: [[1.0, 2.0]]}, profile=True)
+        records = S.profiler.nparray()
+        assert records.dtype.names == ('component', 'phase', 'calls', 'time')
+        assert len(records) == len(S.profiler.records)
+        function_records = records[(records['component'] == 'A') & (records['phase'] == 'FUNCTION')]
+        assert function_records['calls'] == [1]
+        assert function_records['time'] == [S.profiler.records[(A, ProfilerPhase.FUNCTION)][1]]
+
+    def test_new_profiler_for_each_run(self):
+        S, A, B = _system()
+        S.run(inputs={A: [[1.0, 2.0]]}, profile=True)
+        profiler = S.profiler
+        S.run(inputs={A: [[1.0, 2.0]]})
+        assert S.profiler is profiler
+        S.run(inputs={A: [[1.0, 2.0]]}, profile=True)
+        assert S.profiler is not profiler
+        assert S.profiler.records[(A, ProfilerPhase.EXECUTION)][0] == 1
+
+    def test_nested_profiled_run(self):
+        S, A, B = _system()
+        S2, C, D = _system()
+        with pytest.raises(ProfilerError) as error_text:
+            S.run(inputs={A: [[1.0, 2.0]]},
+                  call_before_trial=lambda: S2.run(inputs={C: [[1.0, 2.0]]}, profile=True),
+                  profile=True)
+        assert 'cannot be profiled while' in str(error_text.value)
+        assert profiling._active_profiler is None
+
+
+@pytest.mark.benchmark(group="Profiling")
+@pytest.mark.parametrize('profile', [False, True])
+def test_profiling_benchmark(benchmark, profile):
+    S, A, B = _system()
+    stimuli = np.random.random((50, 1, 2))
+    benchmark(S.run, inputs={A: stimuli}, profile=profile)
@@ -0,0 +1,91 @@
+import numpy as np
+import psyneulink as pnl
+import pytest
+
+from psyneulink.components.mechanisms.mechanism import MechanismRegistry
+from psyneulink.components.system import SystemError
+from psyneulink.globals.registry import clear_registry
+from psyneulink.globals.utilities import get_random_state
+
+
+def _noisy_system(seed=None, reverse=False):
+    # the random_states are derived from the names of the Mechanisms, so keep them from being renamed (e.g., to 'A-1')
+    clear_registry(MechanismRegistry)
+    specs = [('A', pnl.NormalDist()), ('B', pnl.UniformDist())]
+    if reverse:
+        specs.reverse()
+    mechanisms = {name: pnl.TransferMechanism(name=name, size=3, noise=noise) for name, noise in specs}
+    A, B = mechanisms['A'], mechanisms['B']
+    D = pnl.DDM(name='D', function=pnl.BogaczEtAl())
+    P = pnl.Process(pathway=[A, B, pnl.FULL_CONNECTIVITY_MATRIX, D])
+    S = pnl.System(processes=[P], seed=seed)
+    return S, A, B, D
+
+
+def _run(S, A, D, num_trials=5):
+    decisions = []
+    results = S.run(inputs={A: [[1, 2, 3]] * num_trials},
+                    call_after_trial=lambda: decisions.append(float(D.value[0])))
+    return np.array([np.concatenate([np.ravel(value) for value in result])
+                     for result in results[-num_trials:]]), decisions
+
+
+class TestSystemSeed:
+
+    def test_default_seed(self):
+        S, A, B, D = _noisy_system()
+        assert S.seed is None
+        assert A.random_state is np.random
+        assert A.function_object.random_state is np.random
+
+    def test_same_seed_same_results(self):
+        S_1, A_1, B_1, D_1 = _noisy_system(seed=7)
+        np.random.seed(1)
+        results_1, decisions_1 = _run(S_1, A_1, D_1)
+        S_2, A_2, B_2, D_2 = _noisy_system(seed=7)
+        np.random.seed(2)
+        results_2, decisions_2 = _run(S_2, A_2, D_2)
+        assert np.allclose(results_1, results_2)
+        assert decisions_1 == decisions_2
+
+    def test_different_seeds_differ(self):
+        S_1, A_1, B_1, D_1 = _noisy_system(seed=7)
+        S_2, A_2, B_2, D_2 = _noisy_system(seed=8)
+        results_1, _ = _run(S_1, A_1, D_1)
+        results_2, _ = _run(S_2, A_2, D_2)
+        assert not np.allclose(results_1, results_2)
+
+    def test_reassigning_seed_restarts_streams(self):
+        S, A, B, D = _noisy_system(seed=7)
+        results_1, decisions_1 = _run(S, A, D)
+        S.seed = 7
+        results_2, decisions_2 = _run(S, A, D)
+        assert np.allclose(results_1, results_2)
+        assert decisions_1 == decisions_2
+
+    def test_streams_independent_of_creation_order(self):
+        S_1, A_1, B_1, D_1 = _noisy_system(seed=7)
+        S_2, A_2, B_2, D_2 = _noisy_system(seed=7, reverse=True)
+        assert np.allclose(A_1.random_state.random_sample(5), A_2.random_state.random_sample(5))
+        assert np.allclose(B_1.random_state.random_sample(5), B_2.random_state.random_sample(5))
+
+    def test_mechanism_streams_differ(self):
+        S, A, B, D = _noisy_system(seed=7)
+        assert A.function_object.random_state is A.random_state
+        assert not np.allclose(A.random_state.random_sample(5), B.random_state.random_sample(5))
+
+    def test_unassign_seed(self):
+        S, A, B, D = _noisy_system(seed=7)
+        S.seed = None
+        assert A.random_state is np.random
+
+    def test_invalid_seed(self):
+        with pytest.raises(SystemError) as error_text:
+            _noisy_system(seed='seven')
+        assert 'must be an int' in str(error_text.value)
+
+
+def test_get_random_state():
+    assert np.allclose(get_random_state(0, 'A').random_sample(5), get_random_state(0, 'A').random_sample(5))
+    assert not np.allclose(get_random_state(0, 'A').random_sample(5), get_random_state(1, 'A').random_sample(5))
+    assert not np.allclose(get_random_state(0, 'A').random_sample(5), get_random_state(0, 'B').random_sample(5))
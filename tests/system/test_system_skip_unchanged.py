@@ -0,0 +1,121 @@
+import numpy as np
+import psyneulink as pnl
+import pytest
+
+CONTEXT = [[1.0, 2.0, 3.0]]
+STIMULI = [[0.0, 0.0, 1.0], [0.0, 0.0, 1.0], [1.0, 0.0, 0.0], [1.0, 0.0, 0.0]]
+
+
+def _system(skip_unchanged_mechanisms=True, **hidden_params):
+    context = pnl.TransferMechanism(name='context', size=3)
+    stimulus = pnl.TransferMechanism(name='stimulus', size=3)
+    hidden = pnl.TransferMechanism(name='hidden', size=3, function=pnl.Logistic, **hidden_params)
+    output = pnl.TransferMechanism(name='output', size=2)
+    S = pnl.System(processes=[pnl.Process(pathway=[context, hidden, output]),
+                              pnl.Process(pathway=[stimulus, hidden])],
+                   skip_unchanged_mechanisms=skip_unchanged_mechanisms)
+    return S, context, stimulus, hidden, output
+
+
+def _run(S, context, stimulus, stimuli=STIMULI, **kwargs):
+    results = S.run(inputs={context: CONTEXT * len(stimuli), stimulus: stimuli}, **kwargs)
+    return np.array(results[-len(stimuli):], dtype=float)
+
+
+def _skipped(S):
+    # (strip the suffix added to the name of a Mechanism created with the same name as an existing one, e.g. 'hidden-1')
+    return {mechanism.name.split('-')[0]: count for mechanism, count in S.skipped_executions.items()}
+
+
+class TestSkipUnchangedMechanisms:
+
+    def test_default(self):
+        S, context, stimulus, hidden, output = _system(skip_unchanged_mechanisms=False)
+        assert not S.skip_unchanged_mechanisms
+        _run(S, context, stimulus)
+        assert S.skipped_executions == {}
+
+    def test_results_match(self):
+        expected = _run(*_system(skip_unchanged_mechanisms=False)[:3])
+        S, context, stimulus, hidden, output = _system()
+        assert np.array_equal(_run(S, context, stimulus), expected)
+        assert _skipped(S) == {'context': 3, 'stimulus': 2, 'hidden': 2, 'output': 2}
+
+    def test_changed_parameter(self):
+        S, context, stimulus, hidden, output = _system()
+        _run(S, context, stimulus, stimuli=STIMULI[:1])
+        hidden.function_object.gain = 2.0
+        _run(S, context, stimulus, stimuli=STIMULI[:1])
+        # context and stimulus are skipped, but not hidden or output
+        assert _skipped(S) == {'context': 1, 'stimulus': 1}
+        expected = output.input_states[0].path_afferents[0].matrix.T.dot(1 / (1 + np.exp(-2.0 * np.array([1, 2, 4]))))
+        assert np.allclose(output.value, expected)
+
+    def test_changed_matrix(self):
+        S, context, stimulus, hidden, output = _system()
+        _run(S, context, stimulus, stimuli=STIMULI[:1])
+        output.input_states[0].path_afferents[0].matrix = np.full((3, 2), 2.0)
+        _run(S, context, stimulus, stimuli=STIMULI[:1])
+        assert _skipped(S) == {'context': 1, 'stimulus': 1, 'hidden': 1}
+        assert np.allclose(output.value, 2 * np.sum(hidden.value))
+
+    def test_integrator_mode(self):
+        S, context, stimulus, hidden, output = _system(integrator_mode=True, integration_rate=0.5)
+        # the integrator is reinitialized at the start of each trial, so that hidden is skipped for repeated stimuli
+        _run(S, context, stimulus)
+        assert _skipped(S)['hidden'] == 2
+
+        # otherwise, hidden continues to integrate its input, and so is not skipped
+        expected_system, context, stimulus, hidden, output = _system(skip_unchanged_mechanisms=False,
+                                                                     integrator_mode=True, integration_rate=0.5)
+        hidden.reinitialize_when = pnl.Never()
+        expected = _run(expected_system, context, stimulus)
+        S, context, stimulus, hidden, output = _system(integrator_mode=True, integration_rate=0.5)
+        hidden.reinitialize_when = pnl.Never()
+        assert np.array_equal(_run(S, context, stimulus), expected)
+        assert _skipped(S) == {'context': 3, 'stimulus': 2}
+
+    def test_random_mechanisms_are_executed(self):
+        S, context, stimulus, hidden, output = _system(noise=pnl.NormalDist().function)
+        _run(S, context, stimulus)
+        assert _skipped(S) == {'context': 3, 'stimulus': 2}
+
+    def test_runtime_params(self):
+        S, context, stimulus, hidden, output = _system()
+        _run(S, context, stimulus, stimuli=STIMULI[:2], runtime_params={hidden: {pnl.GAIN: 2.0}})
+        # hidden is executed again, but its value does not change, so output is skipped
+        assert _skipped(S) == {'context': 1, 'stimulus': 1, 'output': 1}
+
+    def test_recurrent_mechanism(self):
+        def run(skip_unchanged_mechanisms):
+            R = pnl.RecurrentTransferMechanism(size=2, auto=0.5, hetero=0, function=pnl.Linear)
+            S = pnl.System(processes=[pnl.Process(pathway=[R])], skip_unchanged_mechanisms=skip_unchanged_mechanisms)
+            results = S.run(inputs={R: [[1.0, 0.0]] * 60})
+            return np.array(results, dtype=float), S
+        expected, _ = run(False)
+        results, S = run(True)
+        assert np.array_equal(results, expected)
+        # R is skipped once its value stops changing (at the precision of a float)
+        assert 0 < list(S.skipped_executions.values())[0] < 60
+
+    def test_reassigning_resets(self):
+        S, context, stimulus, hidden, output = _system()
+        _run(S, context, stimulus)
+        S.skip_unchanged_mechanisms = True
+        assert S.skipped_executions == {}
+        _run(S, context, stimulus, stimuli=STIMULI[:1])
+        assert S.skipped_executions == {}
+
+
+@pytest.mark.benchmark(group="Skip unchanged Mechanisms")
+@pytest.mark.parametrize('skip_unchanged_mechanisms', [False, True])
+def test_skip_unchanged_mechanisms_benchmark(benchmark, skip_unchanged_mechanisms):
+    context = pnl.TransferMechanism(name='context', size=100)
+    contexts = [pnl.TransferMechanism(size=100, function=pnl.Logistic) for i in range(5)]
+    stimulus = pnl.TransferMechanism(name='stimulus', size=10)
+    output = pnl.TransferMechanism(name='output', size=10)
+    S = pnl.System(processes=[pnl.Process(pathway=[context] + contexts + [output]),
+                              pnl.Process(pathway=[stimulus, output])],
+                   skip_unchanged_mechanisms=skip_unchanged_mechanisms)
+    inputs = {context: np.ones((20, 100)), stimulus: np.random.random((20, 10))}
+    benchmark(S.run, inputs=inputs)